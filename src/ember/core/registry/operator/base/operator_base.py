@@ -37,8 +37,11 @@ architectures, treating computation as pure functions with explicit contracts.
 from __future__ import annotations
 
 import abc
+import contextvars
 import logging
-from typing import Any, Dict, Generic, TypeVar, Union, cast, Type, Optional, ClassVar
+from typing import (
+    Any, Callable, Dict, Generic, Mapping, TypeVar, Union, cast, Type, Optional, ClassVar
+)
 
 from pydantic import BaseModel
 
@@ -55,6 +58,18 @@ logger = logging.getLogger(__name__)
 T_in = TypeVar("T_in", bound=BaseModel)
 T_out = TypeVar("T_out", bound=BaseModel)
 
+# Returned by a call interceptor to let an operator call run as usual.
+CALL_NOT_INTERCEPTED = object()
+
+# Receives (operator, inputs, kwargs) for every operator call made in the current
+# context and returns the call's result, or CALL_NOT_INTERCEPTED. Set by
+# jit-compiled operators while they run, so that the sub-operator calls of their
+# forward() can be traced or served from results computed ahead of time (see
+# ember.xcs.tracer.tracer_decorator).
+operator_call_interceptor: contextvars.ContextVar[
+    Optional[Callable[["Operator", Any, Dict[str, Any]], Any]]
+] = contextvars.ContextVar("ember_operator_call_interceptor", default=None)
+
 
 class Operator(EmberModule, Generic[T_in, T_out], abc.ABC):
     """
@@ -175,6 +190,12 @@ class Operator(EmberModule, Generic[T_in, T_out], abc.ABC):
                                         or outputs fail validation against the output model.
             OperatorExecutionError: Wrapper for any exceptions occurring during forward execution.
         """
+        interceptor = operator_call_interceptor.get()
+        if interceptor is not None:
+            intercepted = interceptor(self, inputs, kwargs)
+            if intercepted is not CALL_NOT_INTERCEPTED:
+                return cast(T_out, intercepted)
+
         # Retrieve and validate the specification
         try:
             specification: Specification = self.specification
@@ -189,7 +210,7 @@ class Operator(EmberModule, Generic[T_in, T_out], abc.ABC):
                 # Traditional 'inputs' parameter provided
                 validated_inputs: T_in = (
                     specification.validate_inputs(inputs=inputs)
-                    if isinstance(inputs, dict)
+                    if isinstance(inputs, Mapping)
                     else inputs
                 )
             elif kwargs and specification.input_model:
@@ -30,6 +30,7 @@ from ember.core.registry.operator.base.operator_base import Operator
 
 from ember.core.registry.prompt_specification.specification import Specification
 from ember.core.registry.model.model_module.lm import LMModule
+from ember.xcs.engine.executor_pool import run_concurrently
 
 
 class EnsembleOperatorInputs(EmberModel):
@@ -85,8 +86,8 @@ class EnsembleOperator(Operator[EnsembleOperatorInputs, EnsembleOperatorOutputs]
     This enables multiple independent samples from language models, which can
     be used for robustness, consensus, or diversity of outputs.
     
-    The execution is implicitly parallel, with each model potentially running
-    concurrently depending on the implementation.
+    The models are queried concurrently on the shared XCS worker pool, so an
+    ensemble pays no thread start-up cost per call.
     """
 
     specification: Specification = Specification(
@@ -126,5 +127,8 @@ class EnsembleOperator(Operator[EnsembleOperatorInputs, EnsembleOperatorOutputs]
             the original lm_modules order.
         """
         rendered_prompt: str = self.specification.render_prompt(inputs=inputs)
-        responses: List[str] = [lm(prompt=rendered_prompt) for lm in self.lm_modules]
+        futures = run_concurrently(
+            fn=lambda lm: lm(prompt=rendered_prompt), items=self.lm_modules
+        )
+        responses: List[str] = [future.result() for future in futures]
         return {"responses": responses}
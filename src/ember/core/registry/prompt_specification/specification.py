@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Mapping, Optional, Type, TypeVar, Union
 import logging
 
 from pydantic import BaseModel, model_validator
@@ -166,7 +166,7 @@ class Specification(BaseModel, Generic[InputModelT, OutputModelT]):
             MismatchedModelError: If a BaseModel instance does not match the expected model.
             InvalidInputTypeError: If the data is neither a dict nor a Pydantic model.
         """
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             return model.model_validate(data)
         if isinstance(data, BaseModel):
             if not isinstance(data, model):
@@ -201,7 +201,7 @@ class Specification(BaseModel, Generic[InputModelT, OutputModelT]):
             return self._validate_data(
                 data=inputs, model=self.input_model, model_label="Input"
             )
-        if isinstance(inputs, (dict, BaseModel)):
+        if isinstance(inputs, (Mapping, BaseModel)):
             return inputs
         error_msg: str = (
             f"Inputs must be a dict or a Pydantic model, got {type(inputs).__name__}."
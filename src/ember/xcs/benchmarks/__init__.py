@@ -0,0 +1,49 @@
+"""Ember XCS Benchmarks Package.
+
+This package provides synthetic DAG generators and a benchmark runner that
+measures scheduling overhead of the XCS schedulers against JSON baselines.
+"""
+
+from ember.xcs.benchmarks.dag_generators import (
+    DAG_SHAPES,
+    deep_dag,
+    diamond_dag,
+    generate_dag,
+    random_dag,
+    SyntheticOperator,
+    SyntheticWork,
+    wide_dag,
+)
+from ember.xcs.benchmarks.scheduler_benchmark import (
+    BenchmarkResult,
+    compare_to_baseline,
+    default_schedulers,
+    format_results,
+    load_baseline,
+    Regression,
+    run_benchmark,
+    run_suite,
+    save_baseline,
+    SchedulerSpec,
+)
+
+__all__ = [
+    "BenchmarkResult",
+    "compare_to_baseline",
+    "DAG_SHAPES",
+    "deep_dag",
+    "default_schedulers",
+    "diamond_dag",
+    "format_results",
+    "generate_dag",
+    "load_baseline",
+    "random_dag",
+    "Regression",
+    "run_benchmark",
+    "run_suite",
+    "save_baseline",
+    "SchedulerSpec",
+    "SyntheticOperator",
+    "SyntheticWork",
+    "wide_dag",
+]
@@ -0,0 +1,102 @@
+"""
+Command-line entry point for the XCS scheduler benchmarks.
+
+Examples:
+    python -m ember.xcs.benchmarks --size 64 --sleep 0.001 --save baseline.json
+    python -m ember.xcs.benchmarks --size 64 --sleep 0.001 --baseline baseline.json
+
+With --baseline, the exit status is 1 if any metric regressed by more than
+the tolerance.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from ember.xcs.benchmarks.dag_generators import DAG_SHAPES, SyntheticWork
+from ember.xcs.benchmarks.scheduler_benchmark import (
+    compare_to_baseline,
+    default_schedulers,
+    format_results,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ember.xcs.benchmarks",
+        description="Measure XCS scheduler overhead on synthetic DAGs.",
+    )
+    parser.add_argument(
+        "--dags",
+        nargs="+",
+        choices=sorted(DAG_SHAPES),
+        default=list(DAG_SHAPES),
+        help="Graph shapes to run.",
+    )
+    parser.add_argument(
+        "--schedulers",
+        nargs="+",
+        choices=sorted(default_schedulers()),
+        default=None,
+        help="Schedulers to run (default: all).",
+    )
+    parser.add_argument("--size", type=int, default=32, help="Nodes per graph.")
+    parser.add_argument(
+        "--sleep", type=float, default=0.0, help="Seconds each node sleeps."
+    )
+    parser.add_argument(
+        "--cpu", type=int, default=0, help="Busy-loop iterations per node."
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=20, help="Measured runs per graph."
+    )
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured runs.")
+    parser.add_argument("--save", help="Write the results to this baseline file.")
+    parser.add_argument("--baseline", help="Compare the results to this file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Relative regression tolerated against the baseline.",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks and return the process exit status."""
+    args = build_parser().parse_args(argv)
+    results = run_suite(
+        shapes=args.dags,
+        schedulers=args.schedulers,
+        size=args.size,
+        work=SyntheticWork(sleep=args.sleep, cpu_iterations=args.cpu),
+        repeats=args.repeats,
+        warmup=args.warmup,
+    )
+    print(format_results(results))
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"\nSaved baseline to {args.save}")
+    if args.baseline:
+        regressions = compare_to_baseline(
+            results, load_baseline(args.baseline), tolerance=args.tolerance
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(
+                    f"  {regression.key} {regression.metric}: "
+                    f"{regression.baseline:.6g} -> {regression.current:.6g} "
+                    f"({regression.change:+.0%})"
+                )
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
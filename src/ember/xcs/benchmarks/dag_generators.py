@@ -0,0 +1,242 @@
+"""
+Synthetic DAG Generators for Scheduler Benchmarks
+
+Each generator builds an XCSGraph of a given shape whose nodes perform a fixed
+amount of synthetic work: sleeping, which stands in for a blocking provider
+call, and a busy loop, which stands in for CPU-bound post-processing. The
+shapes isolate different scheduling costs:
+
+- ``wide``: one source, a fan-out of independent nodes and one sink. Measures
+  dispatch throughput when everything is ready at once.
+- ``deep``: a single chain. Measures per-node handoff latency, since nothing
+  can overlap.
+- ``diamond``: layers of fan-out and fan-in, as in ensemble and judge pipelines.
+- ``random``: a random DAG with a fixed seed, for irregular dependency patterns.
+
+Operators are instances of a module-level class, so graphs can also run on the
+process and distributed schedulers.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+@dataclass(frozen=True)
+class SyntheticWork:
+    """Work performed by every node of a synthetic graph.
+
+    Attributes:
+        sleep: Seconds each node sleeps, releasing the GIL.
+        cpu_iterations: Iterations of a busy loop each node runs, holding the GIL.
+    """
+
+    sleep: float = 0.0
+    cpu_iterations: int = 0
+
+
+class SyntheticOperator:
+    """Operator that performs a node's synthetic work and returns a checksum."""
+
+    def __init__(self, work: SyntheticWork) -> None:
+        self.work = work
+
+    def __call__(self, *, inputs: Mapping[str, Any]) -> Dict[str, Any]:
+        if self.work.sleep:
+            time.sleep(self.work.sleep)
+        checksum = 0
+        for step in range(self.work.cpu_iterations):
+            checksum = (checksum * 31 + step) & 0xFFFFFFFF
+        return {"checksum": checksum}
+
+
+def _add_node(
+    graph: XCSGraph, node_id: str, work: SyntheticWork, hints: Mapping[str, Any]
+) -> None:
+    graph.add_node(operator=SyntheticOperator(work), node_id=node_id, **hints)
+
+
+def wide_dag(
+    *,
+    width: int,
+    work: SyntheticWork = SyntheticWork(),
+    hints: Optional[Mapping[str, Any]] = None,
+) -> XCSGraph:
+    """Build a source, ``width`` independent nodes and a sink.
+
+    Args:
+        width: Number of nodes between the source and the sink.
+        work: Work performed by every node.
+        hints: Scheduling hints attached to every node.
+
+    Returns:
+        A graph of ``width + 2`` nodes.
+    """
+    hints = hints or {}
+    graph = XCSGraph()
+    _add_node(graph, "source", work, hints)
+    _add_node(graph, "sink", work, hints)
+    for index in range(width):
+        node_id = f"n{index}"
+        _add_node(graph, node_id, work, hints)
+        graph.add_edge(from_id="source", to_id=node_id)
+        graph.add_edge(from_id=node_id, to_id="sink")
+    return graph
+
+
+def deep_dag(
+    *,
+    depth: int,
+    work: SyntheticWork = SyntheticWork(),
+    hints: Optional[Mapping[str, Any]] = None,
+) -> XCSGraph:
+    """Build a chain of ``depth`` nodes.
+
+    Args:
+        depth: Number of nodes in the chain.
+        work: Work performed by every node.
+        hints: Scheduling hints attached to every node.
+
+    Returns:
+        A graph of ``depth`` nodes.
+    """
+    hints = hints or {}
+    graph = XCSGraph()
+    for index in range(depth):
+        _add_node(graph, f"n{index}", work, hints)
+        if index:
+            graph.add_edge(from_id=f"n{index - 1}", to_id=f"n{index}")
+    return graph
+
+
+def diamond_dag(
+    *,
+    width: int,
+    layers: int,
+    work: SyntheticWork = SyntheticWork(),
+    hints: Optional[Mapping[str, Any]] = None,
+) -> XCSGraph:
+    """Build ``layers`` stacked diamonds, each fanning out to ``width`` nodes.
+
+    Args:
+        width: Number of parallel nodes in each diamond.
+        layers: Number of diamonds; each one's join is the next one's fork.
+        work: Work performed by every node.
+        hints: Scheduling hints attached to every node.
+
+    Returns:
+        A graph of ``layers * (width + 1) + 1`` nodes.
+    """
+    hints = hints or {}
+    graph = XCSGraph()
+    join = "join0"
+    _add_node(graph, join, work, hints)
+    for layer in range(layers):
+        fork, join = join, f"join{layer + 1}"
+        _add_node(graph, join, work, hints)
+        for index in range(width):
+            node_id = f"l{layer}n{index}"
+            _add_node(graph, node_id, work, hints)
+            graph.add_edge(from_id=fork, to_id=node_id)
+            graph.add_edge(from_id=node_id, to_id=join)
+    return graph
+
+
+def random_dag(
+    *,
+    nodes: int,
+    edge_probability: float = 0.1,
+    seed: int = 0,
+    work: SyntheticWork = SyntheticWork(),
+    hints: Optional[Mapping[str, Any]] = None,
+) -> XCSGraph:
+    """Build a random DAG in which each node may depend on any earlier node.
+
+    Args:
+        nodes: Number of nodes.
+        edge_probability: Probability of an edge between each earlier node and
+            a later one.
+        seed: Seed for the random number generator, so graphs are reproducible.
+        work: Work performed by every node.
+        hints: Scheduling hints attached to every node.
+
+    Returns:
+        A graph of ``nodes`` nodes.
+
+    Raises:
+        ValueError: If edge_probability is not in [0, 1].
+    """
+    if not 0.0 <= edge_probability <= 1.0:
+        raise ValueError("edge_probability must be in the interval [0, 1].")
+    hints = hints or {}
+    rng = random.Random(seed)
+    graph = XCSGraph()
+    for index in range(nodes):
+        node_id = f"n{index}"
+        _add_node(graph, node_id, work, hints)
+        for parent in range(index):
+            if rng.random() < edge_probability:
+                graph.add_edge(from_id=f"n{parent}", to_id=node_id)
+    return graph
+
+
+def _diamond_of_size(**kwargs: Any) -> XCSGraph:
+    size = kwargs.pop("size")
+    width = max(2, round(math.sqrt(size)))
+    return diamond_dag(width=width, layers=max(1, size // (width + 1)), **kwargs)
+
+
+DAG_SHAPES: Dict[str, Callable[..., XCSGraph]] = {
+    "wide": lambda *, size, **kwargs: wide_dag(width=max(1, size - 2), **kwargs),
+    "deep": lambda *, size, **kwargs: deep_dag(depth=size, **kwargs),
+    "diamond": _diamond_of_size,
+    "random": lambda *, size, **kwargs: random_dag(nodes=size, **kwargs),
+}
+
+
+def generate_dag(
+    shape: str,
+    *,
+    size: int,
+    work: SyntheticWork = SyntheticWork(),
+    hints: Optional[Mapping[str, Any]] = None,
+) -> XCSGraph:
+    """Build a graph of one of the named shapes with roughly ``size`` nodes.
+
+    Args:
+        shape: "wide", "deep", "diamond" or "random".
+        size: Approximate number of nodes.
+        work: Work performed by every node.
+        hints: Scheduling hints attached to every node.
+
+    Returns:
+        The generated graph.
+
+    Raises:
+        ValueError: If the shape is unknown or size is smaller than one.
+    """
+    if shape not in DAG_SHAPES:
+        raise ValueError(
+            f"Unknown DAG shape '{shape}'; expected one of {sorted(DAG_SHAPES)}."
+        )
+    if size < 1:
+        raise ValueError("size must be at least 1.")
+    return DAG_SHAPES[shape](size=size, work=work, hints=hints)
+
+
+__all__ = [
+    "DAG_SHAPES",
+    "SyntheticOperator",
+    "SyntheticWork",
+    "deep_dag",
+    "diamond_dag",
+    "generate_dag",
+    "random_dag",
+    "wide_dag",
+]
@@ -0,0 +1,425 @@
+"""
+Scheduler Benchmark Runner and JSON Baselines
+
+Runs synthetic graphs (see dag_generators) through the XCS schedulers and
+measures, per scheduler and graph shape:
+
+- ``nodes_per_second``: node executions completed per second of wall time.
+- ``p50_latency`` / ``p99_latency``: wall time of a whole graph run.
+- ``critical_path``: the ideal run time, i.e. the longest dependency chain of
+  the run's measured node run times, so the difference is scheduling cost.
+- ``overhead``: median latency divided by the critical path. 1.0 is a perfect
+  scheduler with unlimited workers.
+
+Results are saved as JSON baselines and later runs are compared against them:
+
+```python
+results = run_suite(size=64, work=SyntheticWork(sleep=0.001))
+save_baseline(results, "baseline.json")
+...
+regressions = compare_to_baseline(run_suite(...), load_baseline("baseline.json"))
+```
+
+The same is available from the command line; see ``python -m
+ember.xcs.benchmarks --help``. Baselines are only comparable on the machine
+that recorded them, so each file records its environment.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ember.xcs.benchmarks.dag_generators import DAG_SHAPES, SyntheticWork, generate_dag
+from ember.xcs.engine.execution_options import ExecutionOptions
+from ember.xcs.engine.xcs_engine import (
+    IScheduler,
+    XCSPlan,
+    compile_graph,
+    execute_graph_iter,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+BASELINE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SchedulerSpec:
+    """A scheduler to benchmark.
+
+    Attributes:
+        name: Name the scheduler's results are reported under.
+        factory: Creates the scheduler.
+        node_hints: Hints attached to every node of the benchmarked graphs, for
+            schedulers that only act on hinted nodes.
+    """
+
+    name: str
+    factory: Callable[[], IScheduler]
+    node_hints: Mapping[str, Any] = field(default_factory=dict)
+
+
+def default_schedulers() -> Dict[str, SchedulerSpec]:
+    """Return a spec for every scheduler available through execution_options.
+
+    The process scheduler's graphs carry ``executor="process"`` so that their
+    nodes actually run in worker processes.
+
+    Returns:
+        Specs by scheduler name.
+    """
+    options = ExecutionOptions()
+    specs = [
+        SchedulerSpec(name=name, factory=partial(options.create_scheduler, name))
+        for name in (
+            "parallel",
+            "sequential",
+            "auto",
+            "critical_path",
+            "async",
+            "distributed",
+        )
+    ]
+    specs.append(
+        SchedulerSpec(
+            name="process",
+            factory=partial(options.create_scheduler, "process"),
+            node_hints={"executor": "process"},
+        )
+    )
+    return {spec.name: spec for spec in specs}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurements of one scheduler on one graph.
+
+    Attributes:
+        scheduler: Name of the scheduler.
+        dag: Name of the graph shape.
+        nodes: Number of nodes in the graph.
+        runs: Number of measured runs.
+        nodes_per_second: Node executions completed per second of wall time.
+        p50_latency: Median seconds per graph run.
+        p99_latency: 99th-percentile seconds per graph run.
+        critical_path: Median ideal seconds per run, from measured node times.
+        overhead: p50_latency divided by critical_path, or None if the critical
+            path was too short to measure.
+    """
+
+    scheduler: str
+    dag: str
+    nodes: int
+    runs: int
+    nodes_per_second: float
+    p50_latency: float
+    p99_latency: float
+    critical_path: float
+    overhead: Optional[float]
+
+    @property
+    def key(self) -> str:
+        """Identifier used to match results against a baseline."""
+        return f"{self.dag}/{self.scheduler}"
+
+
+def run_benchmark(
+    *,
+    graph: XCSGraph,
+    scheduler: IScheduler,
+    repeats: int = 20,
+    warmup: int = 2,
+    dag: str = "custom",
+    scheduler_name: Optional[str] = None,
+) -> BenchmarkResult:
+    """Measure repeated runs of one graph on one scheduler.
+
+    Args:
+        graph: The graph to run.
+        scheduler: The scheduler to run it on.
+        repeats: Number of measured runs.
+        warmup: Number of unmeasured runs first, which start worker pools and
+            fill caches.
+        dag: Name the graph is reported under.
+        scheduler_name: Name the scheduler is reported under. Defaults to its
+            class name.
+
+    Returns:
+        The measurements.
+
+    Raises:
+        ValueError: If repeats is smaller than one.
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1.")
+    plan = compile_graph(graph=graph)
+    for _ in range(warmup):
+        for _ in execute_graph_iter(graph=plan, global_input={}, scheduler=scheduler):
+            pass
+    latencies: List[float] = []
+    critical_paths: List[float] = []
+    for _ in range(repeats):
+        run_times: Dict[str, float] = {}
+        start = time.perf_counter()
+        for completion in execute_graph_iter(
+            graph=plan, global_input={}, scheduler=scheduler
+        ):
+            run_times[completion.node_id] = completion.timing.run_time or 0.0
+        latencies.append(time.perf_counter() - start)
+        critical_paths.append(_critical_path(plan=plan, run_times=run_times))
+
+    latencies.sort()
+    p50 = _percentile(latencies, 0.5)
+    critical_path = _percentile(sorted(critical_paths), 0.5)
+    return BenchmarkResult(
+        scheduler=scheduler_name or type(scheduler).__name__,
+        dag=dag,
+        nodes=len(plan.node_ids),
+        runs=repeats,
+        nodes_per_second=len(plan.node_ids) * repeats / sum(latencies),
+        p50_latency=p50,
+        p99_latency=_percentile(latencies, 0.99),
+        critical_path=critical_path,
+        overhead=p50 / critical_path if critical_path > 0 else None,
+    )
+
+
+def run_suite(
+    *,
+    shapes: Iterable[str] = tuple(DAG_SHAPES),
+    schedulers: Optional[Iterable[str]] = None,
+    size: int = 32,
+    work: SyntheticWork = SyntheticWork(),
+    repeats: int = 20,
+    warmup: int = 2,
+    specs: Optional[Mapping[str, SchedulerSpec]] = None,
+) -> List[BenchmarkResult]:
+    """Run every requested graph shape on every requested scheduler.
+
+    Args:
+        shapes: Graph shapes to generate (see dag_generators.DAG_SHAPES).
+        schedulers: Names of the schedulers to run. Defaults to all of ``specs``.
+        size: Approximate number of nodes per graph.
+        work: Work performed by every node.
+        repeats: Number of measured runs per graph and scheduler.
+        warmup: Number of unmeasured runs first.
+        specs: Available schedulers. Defaults to default_schedulers().
+
+    Returns:
+        One result per scheduler and shape.
+
+    Raises:
+        ValueError: If a scheduler or shape name is unknown.
+    """
+    specs = specs if specs is not None else default_schedulers()
+    shapes = list(shapes)
+    names = list(schedulers) if schedulers is not None else list(specs)
+    unknown = [name for name in names if name not in specs]
+    if unknown:
+        raise ValueError(
+            f"Unknown scheduler(s) {unknown}; expected some of {sorted(specs)}."
+        )
+    results: List[BenchmarkResult] = []
+    for name in names:
+        spec = specs[name]
+        scheduler = spec.factory()
+        for shape in shapes:
+            graph = generate_dag(shape, size=size, work=work, hints=spec.node_hints)
+            results.append(
+                run_benchmark(
+                    graph=graph,
+                    scheduler=scheduler,
+                    repeats=repeats,
+                    warmup=warmup,
+                    dag=shape,
+                    scheduler_name=name,
+                )
+            )
+    return results
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Render results as a fixed-width table."""
+    lines = [
+        f"{'dag':<10} {'scheduler':<14} {'nodes':>6} {'nodes/s':>10} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'ideal ms':>9} {'overhead':>9}"
+    ]
+    for result in results:
+        overhead = f"{result.overhead:.2f}x" if result.overhead is not None else "-"
+        lines.append(
+            f"{result.dag:<10} {result.scheduler:<14} {result.nodes:>6} "
+            f"{result.nodes_per_second:>10.0f} {result.p50_latency * 1e3:>9.2f} "
+            f"{result.p99_latency * 1e3:>9.2f} {result.critical_path * 1e3:>9.2f} "
+            f"{overhead:>9}"
+        )
+    return "\n".join(lines)
+
+
+# ------------------------------------------------------------------------------
+# Baselines
+# ------------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than its baseline by more than the tolerance.
+
+    Attributes:
+        key: The result's "dag/scheduler" key.
+        metric: Name of the metric.
+        baseline: The baseline value.
+        current: The current value.
+        change: Relative change, positive meaning worse.
+    """
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+# Metrics compared against baselines, and whether higher values are better.
+COMPARED_METRICS: Dict[str, bool] = {
+    "nodes_per_second": True,
+    "p50_latency": False,
+    "p99_latency": False,
+}
+
+
+def save_baseline(
+    results: Sequence[BenchmarkResult], path: Union[str, "os.PathLike[str]"]
+) -> None:
+    """Write results, with a description of the environment, to a JSON file.
+
+    Args:
+        results: The results to save.
+        path: The file to write; parent directories are created.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": BASELINE_FORMAT_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Union[str, "os.PathLike[str]"]) -> List[BenchmarkResult]:
+    """Read results saved by save_baseline.
+
+    Args:
+        path: The baseline file.
+
+    Returns:
+        The saved results.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version.
+    """
+    document = json.loads(Path(path).read_text())
+    if document.get("version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported benchmark baseline version {document.get('version')!r}."
+        )
+    return [BenchmarkResult(**entry) for entry in document["results"]]
+
+
+def compare_to_baseline(
+    results: Sequence[BenchmarkResult],
+    baseline: Sequence[BenchmarkResult],
+    *,
+    tolerance: float = 0.25,
+    metrics: Optional[Iterable[str]] = None,
+) -> List[Regression]:
+    """Find metrics that regressed by more than ``tolerance`` against a baseline.
+
+    Results without a baseline entry for their key are not compared.
+
+    Args:
+        results: The current results.
+        baseline: The baseline results.
+        tolerance: Largest relative change, in the worse direction, tolerated.
+        metrics: Metrics to compare. Defaults to throughput, p50 and p99 latency.
+
+    Returns:
+        The regressions, in result order.
+    """
+    by_key = {entry.key: entry for entry in baseline}
+    compared = list(metrics) if metrics is not None else list(COMPARED_METRICS)
+    regressions: List[Regression] = []
+    for result in results:
+        reference = by_key.get(result.key)
+        if reference is None:
+            continue
+        for metric in compared:
+            before = getattr(reference, metric)
+            after = getattr(result, metric)
+            if not before:
+                continue
+            change = (after - before) / before
+            if COMPARED_METRICS.get(metric, False):
+                change = -change
+            if change > tolerance:
+                regressions.append(
+                    Regression(
+                        key=result.key,
+                        metric=metric,
+                        baseline=before,
+                        current=after,
+                        change=change,
+                    )
+                )
+    return regressions
+
+
+def _critical_path(*, plan: XCSPlan, run_times: Mapping[str, float]) -> float:
+    """Return the longest chain of measured node run times through a plan."""
+    finish = [0.0] * len(plan.node_ids)
+    for index, node_id in enumerate(plan.node_ids):
+        finish[index] = run_times.get(node_id, 0.0) + max(
+            (finish[parent] for parent in plan.parent_indices[index]), default=0.0
+        )
+    return max(finish, default=0.0)
+
+
+def _percentile(ordered: Sequence[float], quantile: float) -> float:
+    """Return the nearest-rank quantile of sorted values."""
+    index = min(len(ordered) - 1, max(0, math.ceil(quantile * len(ordered)) - 1))
+    return ordered[index]
+
+
+__all__ = [
+    "BenchmarkResult",
+    "Regression",
+    "SchedulerSpec",
+    "compare_to_baseline",
+    "default_schedulers",
+    "format_results",
+    "load_baseline",
+    "run_benchmark",
+    "run_suite",
+    "save_baseline",
+]
@@ -3,17 +3,130 @@
 This package provides the execution engine and scheduler interfaces for Ember XCS.
 """
 
+from ember.xcs.engine.coalescing import (
+    CoalescingStats,
+    configure_request_coalescing,
+    get_request_coalescer,
+    RequestCoalescer,
+)
 from ember.xcs.engine.execution_options import execution_options, ExecutionOptions
+from ember.xcs.engine.execution_policy import (
+    CancellationToken,
+    current_cancellation_token,
+    ExecutionPolicy,
+)
+from ember.xcs.engine.execution_journal import ExecutionJournal
+from ember.xcs.engine.execution_profiler import ExecutionProfiler
+from ember.xcs.engine.executor_pool import (
+    configure_shared_executor,
+    get_shared_executor,
+    shutdown_shared_executor,
+)
+from ember.xcs.engine.fusion import FusedChain, FusionResult, fuse_chains
+from ember.xcs.engine.graph_optimization import (
+    eliminate_common_subexpressions,
+    eliminate_dead_nodes,
+    non_deduplicable,
+    optimize_graph,
+    OptimizationResult,
+)
+from ember.xcs.engine.graph_partitioning import (
+    BoundaryEdge,
+    GraphPartition,
+    observed_output_sizes,
+    partition_graph,
+    PartitionResult,
+)
+from ember.xcs.engine.hedging import HedgingPolicy, HedgingStats
+from ember.xcs.engine.input_view import InputView
+from ember.xcs.engine.plan_serialization import (
+    load_graph,
+    load_plan,
+    register_operator,
+    save_graph,
+    save_plan,
+)
+from ember.xcs.engine.resource_limits import (
+    configure_resource_limits,
+    get_resource_limits,
+    ResourceLimits,
+)
+from ember.xcs.engine.worker_pool import (
+    get_shared_worker_pool,
+    LocalWorkerPool,
+    shutdown_shared_worker_pool,
+)
+from ember.xcs.engine.xcs_adaptive_scheduler import AdaptiveScheduler
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_distributed_scheduler import DistributedScheduler
 from ember.xcs.engine.xcs_engine import (
     execute_graph,
+    execute_graph_async,
+    execute_graph_iter,
+    execute_graph_iter_async,
+    get_plan_cache,
     IScheduler,
+    NodeCompletion,
+    NodeTiming,
     TopologicalSchedulerWithParallelDispatch,
+    XCSPlanCache,
 )
+from ember.xcs.engine.xcs_sequential_scheduler import SequentialScheduler
 
 __all__ = [
+    "AdaptiveScheduler",
+    "AsyncScheduler",
+    "BoundaryEdge",
+    "CancellationToken",
+    "CoalescingStats",
+    "configure_request_coalescing",
+    "configure_resource_limits",
+    "configure_shared_executor",
+    "current_cancellation_token",
+    "DistributedScheduler",
+    "eliminate_common_subexpressions",
+    "eliminate_dead_nodes",
     "execute_graph",
+    "execute_graph_async",
+    "execute_graph_iter",
+    "execute_graph_iter_async",
+    "ExecutionJournal",
     "execution_options",
     "ExecutionOptions",
+    "ExecutionPolicy",
+    "ExecutionProfiler",
+    "fuse_chains",
+    "FusedChain",
+    "FusionResult",
+    "get_plan_cache",
+    "GraphPartition",
+    "get_request_coalescer",
+    "get_resource_limits",
+    "get_shared_executor",
+    "get_shared_worker_pool",
+    "HedgingPolicy",
+    "HedgingStats",
+    "InputView",
     "IScheduler",
+    "load_graph",
+    "load_plan",
+    "LocalWorkerPool",
+    "NodeCompletion",
+    "NodeTiming",
+    "non_deduplicable",
+    "observed_output_sizes",
+    "OptimizationResult",
+    "optimize_graph",
+    "partition_graph",
+    "PartitionResult",
+    "register_operator",
+    "RequestCoalescer",
+    "ResourceLimits",
+    "save_graph",
+    "save_plan",
+    "SequentialScheduler",
+    "shutdown_shared_executor",
+    "shutdown_shared_worker_pool",
     "TopologicalSchedulerWithParallelDispatch",
+    "XCSPlanCache",
 ]
@@ -0,0 +1,327 @@
+"""
+Request Coalescing Across Concurrent Graph Executions
+
+When many users hit the same compiled pipeline at once, identical node
+invocations (the same operator object called with equal inputs) would each
+pay for their own provider call. With coalescing enabled, the first such
+invocation runs and every identical invocation that arrives while it is still
+in flight waits for it and shares its result, across any number of concurrent
+``execute_graph`` calls and schedulers:
+
+```python
+configure_request_coalescing(enabled=True)
+...
+stats = get_request_coalescer().stats
+print(f"{stats.hit_rate:.0%} of node executions shared an in-flight result")
+```
+
+Only in-flight work is shared; a result is forgotten as soon as it has been
+handed to the waiting invocations, so this is not a cache. Inputs are compared
+by a digest of their pickled form, and invocations whose inputs cannot be
+pickled always run on their own.
+
+Coalescing hands one result to several callers, so it is off by default and
+should only be enabled for pipelines whose operators are deterministic or
+whose callers accept a shared sample. Individual nodes opt out with the
+``coalesce`` hint:
+
+```python
+graph.add_node(operator=sample_answer, node_id="sample", coalesce=False)
+```
+
+If the invocation everyone waits for is cancelled, because its own run failed
+or timed out, the waiting invocations run the operator themselves instead of
+inheriting the cancellation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from ember.xcs.exceptions import ExecutionCancelledError
+
+COALESCE_HINT = "coalesce"
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    """Snapshot of a coalescer's counters.
+
+    Attributes:
+        lookups: Node invocations checked for an identical one in flight.
+        hits: Invocations that shared the result of an identical one.
+        fallbacks: Invocations that waited on a cancelled invocation and then
+            ran themselves.
+        unhashable: Invocations whose inputs could not be digested.
+    """
+
+    lookups: int = 0
+    hits: int = 0
+    fallbacks: int = 0
+    unhashable: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that shared an in-flight result."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class _LeaderAbandoned(Exception):
+    """Published to waiting invocations when the invocation they share is cancelled."""
+
+
+class CoalescingTicket:
+    """An invocation's place in a flight of identical invocations.
+
+    The leader runs the operator and must ``publish`` its outcome; followers
+    wait on ``shared``.
+
+    Attributes:
+        leader: Whether this invocation runs the operator.
+        shared: Future resolved with the leader's result or error.
+    """
+
+    __slots__ = ("leader", "shared", "_key")
+
+    def __init__(self, *, leader: bool, shared: Future, key: Hashable) -> None:
+        self.leader = leader
+        self.shared = shared
+        self._key = key
+
+    def abandoned(self) -> bool:
+        """Whether the leader gave up and a follower has to run the operator itself."""
+        return (
+            self.shared.done()
+            and not self.shared.cancelled()
+            and isinstance(self.shared.exception(), _LeaderAbandoned)
+        )
+
+
+class RequestCoalescer:
+    """Thread-safe registry of in-flight node invocations, with counters.
+
+    Schedulers consult it when ``enabled`` is set. By default every scheduler
+    shares the process-wide coalescer returned by ``get_request_coalescer``.
+    """
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            enabled: Whether schedulers using this coalescer coalesce invocations.
+        """
+        self.enabled = enabled
+        self._in_flight: Dict[Hashable, Tuple[Any, Future]] = {}
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._hits = 0
+        self._fallbacks = 0
+        self._unhashable = 0
+
+    def applies_to(self, node: Any) -> bool:
+        """Whether a node may be coalesced (it does not carry ``coalesce=False``)."""
+        return node is None or node.get_hint(COALESCE_HINT, True) is not False
+
+    def enter(
+        self, *, operator: Any, inputs: Mapping[str, Any]
+    ) -> Optional[CoalescingTicket]:
+        """Join the flight of an identical in-flight invocation, or start one.
+
+        Args:
+            operator: The node's operator.
+            inputs: The node's inputs.
+
+        Returns:
+            A ticket, or None if the inputs cannot be digested and the invocation
+            must run on its own.
+        """
+        try:
+            payload = pickle.dumps(dict(inputs), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            with self._lock:
+                self._unhashable += 1
+            return None
+        key = (id(operator), hashlib.blake2b(payload, digest_size=16).digest())
+        with self._lock:
+            self._lookups += 1
+            entry = self._in_flight.get(key)
+            # Entries hold their operator, so a live entry's id cannot be reused.
+            if entry is not None and entry[0] is operator:
+                self._hits += 1
+                return CoalescingTicket(leader=False, shared=entry[1], key=key)
+            shared: Future = Future()
+            self._in_flight[key] = (operator, shared)
+        return CoalescingTicket(leader=True, shared=shared, key=key)
+
+    def publish(
+        self,
+        ticket: CoalescingTicket,
+        *,
+        result: Any = None,
+        error: Optional[BaseException] = None,
+        cancelled: bool = False,
+    ) -> None:
+        """Hand a leader's outcome to its followers and end the flight.
+
+        Args:
+            ticket: The leader's ticket.
+            result: The operator's result.
+            error: The operator's exception, if it raised.
+            cancelled: Whether the leader was cancelled; followers then run the
+                operator themselves.
+        """
+        with self._lock:
+            entry = self._in_flight.get(ticket._key)
+            if entry is not None and entry[1] is ticket.shared:
+                del self._in_flight[ticket._key]
+        if cancelled or isinstance(error, ExecutionCancelledError):
+            ticket.shared.set_exception(_LeaderAbandoned())
+        elif error is not None:
+            ticket.shared.set_exception(error)
+        else:
+            ticket.shared.set_result(result)
+
+    def record_fallback(self) -> None:
+        """Count a follower that ran itself after its leader was cancelled."""
+        with self._lock:
+            self._fallbacks += 1
+
+    def submit(
+        self,
+        *,
+        operator: Any,
+        inputs: Mapping[str, Any],
+        start: Callable[[], Future],
+        on_shared: Optional[Callable[[Future], None]] = None,
+    ) -> Future:
+        """Start an invocation through the coalescer.
+
+        Args:
+            operator: The node's operator.
+            inputs: The node's inputs.
+            start: Starts the invocation and returns its future.
+            on_shared: Called with the leader's finished future just before a
+                follower adopts its outcome.
+
+        Returns:
+            The invocation's own future if it leads or cannot be coalesced,
+            otherwise a future mirroring the identical invocation in flight.
+        """
+        ticket = self.enter(operator=operator, inputs=inputs)
+        if ticket is None:
+            return start()
+        if ticket.leader:
+            try:
+                future = start()
+            except BaseException:
+                self.publish(ticket, cancelled=True)
+                raise
+            future.add_done_callback(lambda done: self._publish_future(ticket, done))
+            return future
+
+        mirror: Future = Future()
+
+        def relay(shared: Future) -> None:
+            if mirror.cancelled():
+                return
+            if ticket.abandoned():
+                self.record_fallback()
+                try:
+                    own = start()
+                except BaseException as error:
+                    _resolve(mirror, error=error)
+                    return
+                mirror.add_done_callback(
+                    lambda relayed: own.cancel() if relayed.cancelled() else None
+                )
+                own.add_done_callback(lambda done: _copy_outcome(done, mirror))
+                return
+            if on_shared is not None:
+                on_shared(shared)
+            _copy_outcome(shared, mirror)
+
+        ticket.shared.add_done_callback(relay)
+        return mirror
+
+    def _publish_future(self, ticket: CoalescingTicket, future: Future) -> None:
+        if future.cancelled():
+            self.publish(ticket, cancelled=True)
+        else:
+            error = future.exception()
+            self.publish(ticket, result=None if error else future.result(), error=error)
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return CoalescingStats(
+                lookups=self._lookups,
+                hits=self._hits,
+                fallbacks=self._fallbacks,
+                unhashable=self._unhashable,
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the counters. Invocations in flight are unaffected."""
+        with self._lock:
+            self._lookups = self._hits = self._fallbacks = self._unhashable = 0
+
+
+def _resolve(
+    future: Future, *, result: Any = None, error: Optional[BaseException] = None
+) -> None:
+    """Resolve a mirror future unless its caller has already cancelled it."""
+    if future.done():
+        return
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except Exception:
+        # Cancelled concurrently by the scheduler.
+        pass
+
+
+def _copy_outcome(source: Future, target: Future) -> None:
+    if source.cancelled():
+        target.cancel()
+        return
+    error = source.exception()
+    _resolve(target, result=None if error else source.result(), error=error)
+
+
+_REQUEST_COALESCER = RequestCoalescer(enabled=False)
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Return the process-wide coalescer used by schedulers by default."""
+    return _REQUEST_COALESCER
+
+
+def configure_request_coalescing(*, enabled: bool) -> RequestCoalescer:
+    """Turn coalescing on or off for every scheduler using the shared coalescer.
+
+    Args:
+        enabled: Whether identical in-flight invocations share results.
+
+    Returns:
+        The process-wide coalescer.
+    """
+    _REQUEST_COALESCER.enabled = enabled
+    return _REQUEST_COALESCER
+
+
+__all__ = [
+    "COALESCE_HINT",
+    "CoalescingStats",
+    "CoalescingTicket",
+    "RequestCoalescer",
+    "configure_request_coalescing",
+    "get_request_coalescer",
+]
@@ -0,0 +1,243 @@
+"""
+Checkpoint and Resume for Long Graph Executions
+
+An evaluation graph that runs for hours should not have to pay for every
+provider call again because the process died near the end. Passing a journal
+path to ``execute_graph`` persists each node's result as soon as the node
+completes; passing ``resume=True`` on the next attempt reloads the journal and
+runs only the nodes that had not completed:
+
+```python
+results = execute_graph(
+    graph=graph, global_input=inputs, journal="runs/eval.journal", resume=True
+)
+```
+
+The journal is a single append-only file of pickled records. The first record
+identifies the graph (node IDs and edges) and the global input it was recorded
+for, and resuming against anything else raises JournalMismatchError. Every
+record is flushed and fsynced before the run moves on, and a record torn by a
+crash is ignored on load, so the journal always reflects a prefix of the
+completed nodes.
+
+On resume, completed nodes are not called again: their recorded results are
+replayed to their downstream nodes and returned as part of the run's results.
+Results that cannot be pickled are not journaled, and their nodes run again on
+resume.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from typing import IO, Any, Dict, Mapping, Optional, Tuple, Union
+
+from ember.xcs.exceptions import JournalMismatchError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+
+def _digest(value: Any) -> str:
+    """Return a stable digest of a picklable value, falling back to its repr."""
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        payload = repr(value).encode("utf-8", "backslashreplace")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _graph_digest(graph: XCSGraph) -> str:
+    """Return a digest of a graph's node IDs and edges."""
+    return _digest(
+        [(node_id, list(node.inbound_edges)) for node_id, node in graph.nodes.items()]
+    )
+
+
+class ExecutionJournal:
+    """Append-only record of the nodes a graph run has completed.
+
+    A journal is tied to one file. ``start`` begins a run, either truncating the
+    file or loading its completed results; ``record`` appends a node's result;
+    ``close`` releases the file. execute_graph drives these calls itself when
+    given a journal.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """Initialize a journal without touching the file.
+
+        Args:
+            path: File the journal is written to. Parent directories are created
+                when the journal starts.
+        """
+        self.path = os.fspath(path)
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        *,
+        graph: XCSGraph,
+        global_input: Mapping[str, Any],
+        resume: bool,
+    ) -> Dict[str, Any]:
+        """Begin recording a run.
+
+        Args:
+            graph: The graph being executed.
+            global_input: The run's global input.
+            resume: Whether to keep the results already in the journal. If False,
+                or if the journal does not exist yet, it starts empty.
+
+        Returns:
+            Results of the nodes the journal records as completed, by node ID.
+
+        Raises:
+            JournalMismatchError: If resuming from a journal recorded for another
+                graph or global input.
+        """
+        header = {
+            "version": _FORMAT_VERSION,
+            "graph": _graph_digest(graph),
+            "input": _digest(dict(global_input)),
+        }
+        completed: Dict[str, Any] = {}
+        if resume and os.path.exists(self.path):
+            recorded_header, completed = self._load()
+            if recorded_header is not None and recorded_header != header:
+                raise JournalMismatchError(
+                    f"Journal '{self.path}' was recorded for a different graph or "
+                    "global input; remove it or run without resume."
+                )
+            unknown = completed.keys() - graph.nodes.keys()
+            if unknown:
+                raise JournalMismatchError(
+                    f"Journal '{self.path}' records unknown nodes: {sorted(unknown)}."
+                )
+            if recorded_header is not None:
+                self._file = open(self.path, "ab")
+                return completed
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._append(header)
+        return {}
+
+    def record(self, *, node_id: str, result: Any) -> None:
+        """Durably append a completed node's result.
+
+        Args:
+            node_id: ID of the completed node.
+            result: The node's result.
+        """
+        try:
+            payload = pickle.dumps((node_id, result), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            logger.warning(
+                "Result of node '%s' cannot be pickled (%s); it will run again on resume.",
+                node_id,
+                error,
+            )
+            return
+        with self._lock:
+            self._write(payload)
+
+    def close(self) -> None:
+        """Close the journal file. The journal can be started again afterwards."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> ExecutionJournal:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _append(self, record: Any) -> None:
+        with self._lock:
+            self._write(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _write(self, payload: bytes) -> None:
+        if self._file is None:
+            raise RuntimeError("The journal has not been started.")
+        self._file.write(payload)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _load(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """Read the header and completed results, dropping a torn final record."""
+        completed: Dict[str, Any] = {}
+        header: Optional[Dict[str, Any]] = None
+        valid_length = 0
+        with open(self.path, "rb") as file:
+            try:
+                header = pickle.load(file)
+                valid_length = file.tell()
+                while True:
+                    node_id, result = pickle.load(file)
+                    completed[node_id] = result
+                    valid_length = file.tell()
+            except EOFError:
+                pass
+            except Exception:
+                logger.warning(
+                    "Ignoring a truncated record at the end of journal '%s'.", self.path
+                )
+        if header is None:
+            return None, {}
+        if valid_length != os.path.getsize(self.path):
+            # Drop the torn tail so new records follow the last complete one.
+            with open(self.path, "r+b") as file:
+                file.truncate(valid_length)
+        return header, completed
+
+
+class _ReplayedResult:
+    """Operator that returns a journaled result instead of recomputing it."""
+
+    __slots__ = ("result",)
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+
+    def __call__(self, *, inputs: Mapping[str, Any]) -> Any:
+        return self.result
+
+
+def replay_graph(*, graph: XCSGraph, completed: Mapping[str, Any]) -> XCSGraph:
+    """Return a copy of a graph whose completed nodes replay their results.
+
+    Nodes that have not completed are shared with the original graph, so their
+    captured outputs are recorded there as usual. Completed nodes are copies;
+    the original nodes get the journaled results as their captured outputs.
+
+    Args:
+        graph: The graph being resumed.
+        completed: Journaled results by node ID.
+
+    Returns:
+        A graph with the same structure whose completed nodes do no work.
+    """
+    replayed = XCSGraph()
+    for node_id, node in graph.nodes.items():
+        if node_id in completed:
+            node.captured_outputs = completed[node_id]
+            node = copy.copy(node)
+            node.operator = _ReplayedResult(completed[node_id])
+        replayed.nodes[node_id] = node
+    replayed.entry_node = graph.entry_node
+    replayed.exit_node = graph.exit_node
+    return replayed
+
+
+__all__ = ["ExecutionJournal", "replay_graph"]
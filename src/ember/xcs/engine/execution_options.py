@@ -8,15 +8,33 @@ such as scheduler type and parallelism parameters.
 from __future__ import annotations
 
 import threading
+from concurrent.futures import Executor
 from contextlib import ContextDecorator
 from typing import Any, Dict, Optional, Type, Union
 
+from ember.xcs.engine.coalescing import RequestCoalescer
+from ember.xcs.engine.execution_policy import FAIL_FAST, ExecutionPolicy
+from ember.xcs.engine.hedging import HedgingPolicy
+from ember.xcs.engine.resource_limits import ResourceLimits
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
 from ember.xcs.engine.xcs_engine import (
     IScheduler,
     TopologicalSchedulerWithParallelDispatch,
 )
 
 
+# Names accepted by ExecutionOptions.create_scheduler.
+SCHEDULER_NAMES = (
+    "parallel",
+    "sequential",
+    "auto",
+    "critical_path",
+    "async",
+    "process",
+    "distributed",
+)
+
+
 class ExecutionOptions(ContextDecorator):
     """Context manager for configuring operator execution options.
 
@@ -25,8 +43,26 @@ class ExecutionOptions(ContextDecorator):
 
     Attributes:
         scheduler (Union[str, IScheduler]): The scheduler to use for execution.
-            Can be a string identifier ("parallel", "sequential") or an IScheduler instance.
+            Can be a string identifier ("parallel", "sequential", "auto",
+            "critical_path", "async", "process", "distributed") or an IScheduler
+            instance. "auto" picks sequential, threaded or async execution per
+            graph (see xcs_adaptive_scheduler).
         max_workers (Optional[int]): Maximum number of worker threads for parallel execution.
+        executor (Optional[Executor]): Caller-owned executor for parallel execution.
+        use_shared_executor (bool): Whether parallel execution reuses the process-wide
+            shared worker pool instead of creating a pool per run.
+        timeout (Optional[float]): Seconds a whole graph run may take.
+        node_timeout (Optional[float]): Default seconds each node may take; nodes
+            override it with a ``timeout`` hint.
+        failure_policy (str): "fail_fast" to stop at the first failing node, or
+            "continue" to run every unaffected node and report all failures.
+        resource_limits (Optional[ResourceLimits]): Per-resource-class capacities
+            enforced by the schedulers; None means the process-wide limits.
+        hedging (Optional[HedgingPolicy]): Policy for launching duplicates of
+            straggling nodes; None disables hedging.
+        coalescer (Optional[RequestCoalescer]): Registry through which identical
+            in-flight node invocations share results; None means the
+            process-wide coalescer.
     """
 
     _local = threading.local()
@@ -36,16 +72,49 @@ class ExecutionOptions(ContextDecorator):
         *,
         scheduler: Union[str, IScheduler] = "parallel",
         max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        use_shared_executor: bool = True,
+        timeout: Optional[float] = None,
+        node_timeout: Optional[float] = None,
+        failure_policy: str = FAIL_FAST,
+        resource_limits: Optional[ResourceLimits] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Initialize execution options.
 
         Args:
-            scheduler: Scheduler to use for execution. Can be a string ("parallel", "sequential")
-                or an IScheduler instance.
+            scheduler: Scheduler to use for execution. Can be a string ("parallel",
+                "sequential", "auto", "critical_path", "async", "process",
+                "distributed") or an IScheduler instance.
             max_workers: Maximum number of worker threads for parallel execution.
+            executor: Optional caller-owned executor to dispatch parallel work to.
+            use_shared_executor: Whether to reuse the process-wide shared worker pool
+                when no executor is given.
+            timeout: Seconds a whole graph run may take. None means no limit.
+            node_timeout: Default seconds each node may take. None means no limit.
+            failure_policy: "fail_fast" or "continue".
+            resource_limits: Capacities for nodes with a ``resource_class`` hint.
+                None means the process-wide limits (see configure_resource_limits).
+            hedging: Policy for launching duplicates of straggling nodes (see
+                hedging). None disables hedging.
+            coalescer: Registry through which identical in-flight node
+                invocations share results. None means the process-wide
+                coalescer (see configure_request_coalescing).
+
+        Raises:
+            ValueError: If the failure policy is unknown or a timeout is not positive.
         """
         self.scheduler = scheduler
         self.max_workers = max_workers
+        self.executor = executor
+        self.use_shared_executor = use_shared_executor
+        self.policy = ExecutionPolicy(
+            timeout=timeout, node_timeout=node_timeout, failure_policy=failure_policy
+        )
+        self.resource_limits = resource_limits
+        self.hedging = hedging
+        self.coalescer = coalescer
 
     def __enter__(self) -> ExecutionOptions:
         """Enter the execution options context.
@@ -92,16 +161,71 @@ class ExecutionOptions(ContextDecorator):
         """
         if isinstance(self.scheduler, IScheduler):
             return self.scheduler
+        return self.create_scheduler(self.scheduler)
+
+    def create_scheduler(self, name: str) -> IScheduler:
+        """Create a scheduler by name, configured with these options.
+
+        Args:
+            name: "parallel", "sequential", "auto", "critical_path", "async",
+                "process" or "distributed". Unknown names create the parallel
+                scheduler.
 
-        if self.scheduler == "sequential":
+        Returns:
+            A new IScheduler instance.
+        """
+        if name == "sequential":
             # Import here to avoid circular imports
-            from ember.xcs.engine.xcs_noop_scheduler import NoopScheduler
+            from ember.xcs.engine.xcs_sequential_scheduler import SequentialScheduler
 
-            return NoopScheduler()
-        else:  # Default to parallel
-            return TopologicalSchedulerWithParallelDispatch(
-                max_workers=self.max_workers
+            return SequentialScheduler(
+                policy=self.policy, resource_limits=self.resource_limits
             )
+        elif name == "auto":
+            # Import here to avoid circular imports
+            from ember.xcs.engine.xcs_adaptive_scheduler import AdaptiveScheduler
+
+            return AdaptiveScheduler(**self._dispatch_options())
+        elif name == "critical_path":
+            # Import here to avoid circular imports
+            from ember.xcs.engine.xcs_critical_path_scheduler import (
+                CriticalPathScheduler,
+            )
+
+            return CriticalPathScheduler(**self._dispatch_options())
+        elif name == "async":
+            return AsyncScheduler(**self._dispatch_options())
+        elif name == "process":
+            # Import here to avoid circular imports
+            from ember.xcs.engine.xcs_process_scheduler import ProcessPoolScheduler
+
+            return ProcessPoolScheduler(**self._dispatch_options())
+        elif name == "distributed":
+            # Import here to avoid circular imports
+            from ember.xcs.engine.xcs_distributed_scheduler import (
+                DistributedScheduler,
+            )
+
+            return DistributedScheduler(**self._dispatch_options())
+        else:  # Default to parallel
+            return TopologicalSchedulerWithParallelDispatch(**self._dispatch_options())
+
+    def _dispatch_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by the parallel scheduler family.
+
+        Returns:
+            Worker, executor, policy, resource-limit, hedging and coalescing
+            settings for a scheduler constructor.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "executor": self.executor,
+            "use_shared_executor": self.use_shared_executor,
+            "policy": self.policy,
+            "resource_limits": self.resource_limits,
+            "hedging": self.hedging,
+            "coalescer": self.coalescer,
+        }
 
     def _set_current(self, ctx: ExecutionOptions) -> None:
         """Set the current execution options context.
@@ -118,16 +242,50 @@ class ExecutionOptions(ContextDecorator):
 
 # Convenience function for use as context manager
 def execution_options(
-    *, scheduler: Union[str, IScheduler] = "parallel", max_workers: Optional[int] = None
+    *,
+    scheduler: Union[str, IScheduler] = "parallel",
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    use_shared_executor: bool = True,
+    timeout: Optional[float] = None,
+    node_timeout: Optional[float] = None,
+    failure_policy: str = FAIL_FAST,
+    resource_limits: Optional[ResourceLimits] = None,
+    hedging: Optional[HedgingPolicy] = None,
+    coalescer: Optional[RequestCoalescer] = None,
 ) -> ExecutionOptions:
     """Create an execution options context.
 
     Args:
-        scheduler: Scheduler to use for execution. Can be a string ("parallel", "sequential")
-            or an IScheduler instance.
+        scheduler: Scheduler to use for execution. Can be a string ("parallel",
+            "sequential", "auto", "critical_path", "async", "process",
+            "distributed") or an IScheduler instance.
         max_workers: Maximum number of worker threads for parallel execution.
+        executor: Optional caller-owned executor to dispatch parallel work to.
+        use_shared_executor: Whether to reuse the process-wide shared worker pool
+            when no executor is given.
+        timeout: Seconds a whole graph run may take. None means no limit.
+        node_timeout: Default seconds each node may take. None means no limit.
+        failure_policy: "fail_fast" or "continue".
+        resource_limits: Capacities for nodes with a ``resource_class`` hint.
+            None means the process-wide limits.
+        hedging: Policy for launching duplicates of straggling nodes. None
+            disables hedging.
+        coalescer: Registry through which identical in-flight node invocations
+            share results. None means the process-wide coalescer.
 
     Returns:
         An ExecutionOptions context manager.
     """
-    return ExecutionOptions(scheduler=scheduler, max_workers=max_workers)
+    return ExecutionOptions(
+        scheduler=scheduler,
+        max_workers=max_workers,
+        executor=executor,
+        use_shared_executor=use_shared_executor,
+        timeout=timeout,
+        node_timeout=node_timeout,
+        failure_policy=failure_policy,
+        resource_limits=resource_limits,
+        hedging=hedging,
+        coalescer=coalescer,
+    )
@@ -0,0 +1,201 @@
+"""
+Deadlines, Cancellation and Failure Handling for Graph Runs
+
+An ``ExecutionPolicy`` bounds how long a graph run and each of its nodes may
+take and decides what happens when a node fails:
+
+- ``"fail_fast"`` (the default) stops the run at the first failure: tasks that
+  have not started are cancelled, running nodes are asked to stop, and the
+  node's exception is raised.
+- ``"continue"`` keeps running every node that does not depend on a failed one
+  and raises a GraphExecutionError listing all failures at the end.
+
+Python threads cannot be interrupted, so cancellation is cooperative: a node
+that has not started yet is never run, while a running operator can poll the
+token returned by ``current_cancellation_token()`` (for example between
+provider calls) and stop early. A node that overruns its deadline is abandoned
+by the scheduler and its result, if it ever arrives, is discarded.
+
+Per-node deadlines come from the ``timeout`` node hint, falling back to the
+policy's ``node_timeout``:
+
+```python
+graph.add_node(operator=call_provider, node_id="answer", timeout=30.0)
+```
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from ember.xcs.exceptions import ExecutionCancelledError
+
+FAIL_FAST = "fail_fast"
+CONTINUE_ON_ERROR = "continue"
+FAILURE_POLICIES = (FAIL_FAST, CONTINUE_ON_ERROR)
+
+TIMEOUT_HINT = "timeout"
+
+
+@dataclass(frozen=True)
+class ExecutionPolicy:
+    """Deadlines and failure handling for a graph run.
+
+    Attributes:
+        timeout: Seconds the whole run may take. None means no limit.
+        node_timeout: Default seconds each node may take from the moment it is
+            dispatched. Nodes override it with the ``timeout`` hint. None means
+            no limit.
+        failure_policy: "fail_fast" or "continue".
+    """
+
+    timeout: Optional[float] = None
+    node_timeout: Optional[float] = None
+    failure_policy: str = FAIL_FAST
+
+    def __post_init__(self) -> None:
+        if self.failure_policy not in FAILURE_POLICIES:
+            raise ValueError(
+                f"Unknown failure policy '{self.failure_policy}'; "
+                f"expected one of {FAILURE_POLICIES}."
+            )
+        for name in ("timeout", "node_timeout"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}.")
+
+    @property
+    def fail_fast(self) -> bool:
+        """Whether the run stops at the first failure."""
+        return self.failure_policy == FAIL_FAST
+
+    def node_timeout_for(self, node: Any) -> Optional[float]:
+        """Return the deadline in seconds for a node, if it has one.
+
+        Args:
+            node: The XCSNode about to run, or None if unknown.
+
+        Returns:
+            The node's ``timeout`` hint, else the policy's node_timeout.
+        """
+        if node is not None:
+            hint = node.get_hint(TIMEOUT_HINT)
+            if hint is not None:
+                return float(hint)
+        return self.node_timeout
+
+    def merged_with(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        node_timeout: Optional[float] = None,
+        failure_policy: Optional[str] = None,
+    ) -> ExecutionPolicy:
+        """Return a copy of this policy with the given fields overridden.
+
+        Args:
+            timeout: New run deadline, or None to keep the current one.
+            node_timeout: New default node deadline, or None to keep the current one.
+            failure_policy: New failure policy, or None to keep the current one.
+
+        Returns:
+            The updated policy.
+        """
+        return ExecutionPolicy(
+            timeout=self.timeout if timeout is None else timeout,
+            node_timeout=self.node_timeout if node_timeout is None else node_timeout,
+            failure_policy=failure_policy or self.failure_policy,
+        )
+
+
+DEFAULT_EXECUTION_POLICY = ExecutionPolicy()
+
+
+class CancellationToken:
+    """Thread-safe flag telling running nodes that their work is no longer needed.
+
+    A token may have a parent; it then also counts as cancelled once the parent
+    is. Schedulers give each node a token whose parent is the run's token, so a
+    single node can be abandoned on timeout while failing fast cancels them all.
+    """
+
+    def __init__(self, *, parent: Optional[CancellationToken] = None) -> None:
+        """Initialize an uncancelled token.
+
+        Args:
+            parent: Optional token whose cancellation also cancels this one.
+        """
+        self._event = threading.Event()
+        self._parent = parent
+
+    def cancel(self) -> None:
+        """Cancel this token and every token derived from it."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether this token or one of its ancestors has been cancelled."""
+        token: Optional[CancellationToken] = self
+        while token is not None:
+            if token._event.is_set():
+                return True
+            token = token._parent
+        return False
+
+    def raise_if_cancelled(self) -> None:
+        """Raise ExecutionCancelledError if the token has been cancelled."""
+        if self.cancelled:
+            raise ExecutionCancelledError("Graph execution was cancelled.")
+
+
+_NEVER_CANCELLED = CancellationToken()
+
+# A context variable rather than a thread-local, so that coroutine operators
+# sharing the event loop thread each see their own node's token.
+_current_token: contextvars.ContextVar[CancellationToken] = contextvars.ContextVar(
+    "xcs_cancellation_token", default=_NEVER_CANCELLED
+)
+
+
+def current_cancellation_token() -> CancellationToken:
+    """Return the cancellation token of the node currently running.
+
+    Outside of a scheduled node this returns a token that is never cancelled, so
+    operators can call it unconditionally.
+
+    Returns:
+        The running node's token.
+    """
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Make ``token`` the current cancellation token while the block runs.
+
+    Args:
+        token: Token to install.
+
+    Yields:
+        The installed token.
+    """
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+__all__ = [
+    "CONTINUE_ON_ERROR",
+    "CancellationToken",
+    "DEFAULT_EXECUTION_POLICY",
+    "ExecutionPolicy",
+    "FAIL_FAST",
+    "cancellation_scope",
+    "current_cancellation_token",
+]
@@ -0,0 +1,434 @@
+"""
+Execution Profiling and Chrome Trace Export
+
+``ExecutionProfiler`` records, for every graph run started while it is active,
+when each node was submitted, when it started and finished, and which worker
+thread ran it. The recording can be exported as Chrome trace-event JSON and
+opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing:
+
+```python
+with ExecutionProfiler() as profiler:
+    execute_graph(graph=graph, global_input=inputs)
+profiler.export_chrome_trace("run.json")
+```
+
+In the trace, each worker thread gets a track showing the nodes it ran, the
+thread that drove each run shows the run as a whole, and the time every node
+spent waiting for a worker appears as a separate "queued" slice. Idle gaps on
+worker tracks and long queued slices point at scheduling bottlenecks.
+
+Profiling is opt-in and scoped: a profiler only sees runs started in the
+context (thread or task) that entered it, and runs outside any profiler pay a
+single context-variable lookup. Nested graphs started from inside a node run on
+a worker thread and are therefore not recorded.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from ember.xcs.exceptions import ExecutionCancelledError, NodeTimeoutError
+
+NODE_OK = "ok"
+NODE_ERROR = "error"
+NODE_TIMEOUT = "timeout"
+NODE_CANCELLED = "cancelled"
+NODE_ABANDONED = "abandoned"
+
+RUN_OK = "ok"
+RUN_INCOMPLETE = "incomplete"
+
+
+@dataclass(frozen=True)
+class NodeTraceRecord:
+    """Timing of one node execution in a profiled run.
+
+    Timestamps come from time.perf_counter(). ``started`` is None for nodes that
+    never reached a worker.
+
+    Attributes:
+        run_id: ID of the run the node belonged to.
+        node_id: ID of the node.
+        submitted: When the node was handed to an executor.
+        started: When its operator began running, if it did.
+        finished: When it finished, or when the scheduler stopped waiting for it.
+        thread_id: Identifier of the thread that ran it, if known.
+        thread_name: Name of the thread or worker process that ran it, if known.
+        status: "ok", "error", "timeout", "cancelled" or "abandoned".
+    """
+
+    run_id: int
+    node_id: str
+    submitted: float
+    started: Optional[float]
+    finished: float
+    thread_id: Optional[int]
+    thread_name: Optional[str]
+    status: str
+
+
+@dataclass(frozen=True)
+class RunTraceRecord:
+    """Timing of one profiled graph run.
+
+    Attributes:
+        run_id: ID of the run, unique within its profiler.
+        scheduler: Class name of the scheduler that executed it.
+        started: When the run started (time.perf_counter()).
+        finished: When the run ended.
+        thread_id: Identifier of the thread that drove the run.
+        thread_name: Name of that thread.
+        node_count: Number of nodes in the plan.
+        status: "ok", or "incomplete" if the run raised or was stopped early.
+    """
+
+    run_id: int
+    scheduler: str
+    started: float
+    finished: float
+    thread_id: int
+    thread_name: str
+    node_count: int
+    status: str
+
+
+class ExecutionProfiler:
+    """Collects node and run timings from the schedulers while active.
+
+    The profiler is a context manager; while entered, runs started in the same
+    context are recorded. It may be entered several times to accumulate runs,
+    and is safe to share between threads, which enter and leave it
+    independently.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty profiler."""
+        self._lock = threading.Lock()
+        self._nodes: List[NodeTraceRecord] = []
+        self._runs: List[RunTraceRecord] = []
+        self._run_ids = itertools.count()
+        self._origin = time.perf_counter()
+
+    def __enter__(self) -> ExecutionProfiler:
+        # Tokens are kept per context: a token can only be reset in the
+        # context that created it, and other threads enter their own.
+        token = _active_profiler.set(self)
+        _entry_tokens.set(_entry_tokens.get() + (token,))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[Any],
+    ) -> None:
+        tokens = _entry_tokens.get()
+        _entry_tokens.set(tokens[:-1])
+        _active_profiler.reset(tokens[-1])
+
+    @property
+    def nodes(self) -> List[NodeTraceRecord]:
+        """Node records, in the order nodes finished."""
+        with self._lock:
+            return list(self._nodes)
+
+    @property
+    def runs(self) -> List[RunTraceRecord]:
+        """Run records, in the order runs finished."""
+        with self._lock:
+            return list(self._runs)
+
+    def start_run(self, *, scheduler: str, node_count: int) -> RunTrace:
+        """Begin recording a run. Called by schedulers.
+
+        Args:
+            scheduler: Class name of the scheduler.
+            node_count: Number of nodes in the plan.
+
+        Returns:
+            The recorder for the run's nodes.
+        """
+        return RunTrace(
+            profiler=self,
+            run_id=next(self._run_ids),
+            scheduler=scheduler,
+            node_count=node_count,
+        )
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build the recording as a Chrome trace-event document.
+
+        Returns:
+            A JSON-serializable dictionary in the Trace Event Format.
+        """
+        nodes, runs = self.nodes, self.runs
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "ph": "M",
+                "name": "process_name",
+                "pid": pid,
+                "tid": 0,
+                "args": {"name": "ember.xcs"},
+            }
+        ]
+        thread_names: Dict[int, str] = {}
+        synthetic_tids: Dict[str, int] = {}
+
+        def tid_for(thread_id: Optional[int], thread_name: Optional[str]) -> int:
+            if thread_id is None:
+                # Worker processes have no thread of ours; give each a track.
+                name = thread_name or "unknown worker"
+                thread_id = synthetic_tids.setdefault(name, -1 - len(synthetic_tids))
+                thread_name = name
+            if thread_name is not None:
+                thread_names.setdefault(thread_id, thread_name)
+            return thread_id
+
+        slices: List[Dict[str, Any]] = []
+        for run in runs:
+            slices.append(
+                {
+                    "name": f"graph run {run.run_id} ({run.scheduler})",
+                    "cat": "run",
+                    "ts": self._micros(run.started),
+                    "dur": self._micros(run.finished) - self._micros(run.started),
+                    "pid": pid,
+                    "tid": tid_for(run.thread_id, run.thread_name),
+                    "args": {"nodes": run.node_count, "status": run.status},
+                }
+            )
+        for node in nodes:
+            queued_until = node.started if node.started is not None else node.finished
+            flow_id = f"{node.run_id}:{node.node_id}"
+            events.extend(
+                self._async_slice(
+                    name=f"{node.node_id} (queued)",
+                    cat="queue",
+                    flow_id=flow_id,
+                    pid=pid,
+                    start=node.submitted,
+                    end=queued_until,
+                    args={"run": node.run_id},
+                )
+            )
+            if node.started is None:
+                continue
+            slices.append(
+                {
+                    "name": node.node_id,
+                    "cat": "node",
+                    "ts": self._micros(node.started),
+                    "dur": self._micros(node.finished) - self._micros(node.started),
+                    "pid": pid,
+                    "tid": tid_for(node.thread_id, node.thread_name),
+                    "id": flow_id,
+                    "args": {"run": node.run_id, "status": node.status},
+                }
+            )
+        events.extend(self._place_slices(slices))
+        for tid, name in thread_names.items():
+            events.append(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Write the recording as Chrome trace-event JSON.
+
+        Args:
+            path: File to write; open it in Perfetto or chrome://tracing.
+        """
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+    def _record_node(self, record: NodeTraceRecord) -> None:
+        with self._lock:
+            self._nodes.append(record)
+
+    def _record_run(self, record: RunTraceRecord) -> None:
+        with self._lock:
+            self._runs.append(record)
+
+    def _micros(self, timestamp: float) -> int:
+        return int((timestamp - self._origin) * 1e6)
+
+    def _async_slice(
+        self,
+        *,
+        name: str,
+        cat: str,
+        flow_id: str,
+        pid: int,
+        start: float,
+        end: float,
+        args: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        common = {"name": name, "cat": cat, "id": flow_id, "pid": pid, "tid": 0}
+        return [
+            dict(common, ph="b", ts=self._micros(start), args=args),
+            dict(common, ph="e", ts=self._micros(end)),
+        ]
+
+    def _place_slices(self, slices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Emit slices as complete events, or as async slices where they overlap.
+
+        Complete ("X") events on one thread must nest. Nodes that share a thread
+        without nesting, such as coroutine operators interleaved on an event
+        loop, are emitted as async slices instead so the viewer keeps them all.
+        """
+        events: List[Dict[str, Any]] = []
+        open_ends: Dict[int, List[int]] = {}
+        for event in sorted(slices, key=lambda e: (e["tid"], e["ts"], -e["dur"])):
+            stack = open_ends.setdefault(event["tid"], [])
+            end = event["ts"] + event["dur"]
+            while stack and stack[-1] <= event["ts"]:
+                stack.pop()
+            if stack and end > stack[-1]:
+                flow_id = event.pop("id", f"{event['tid']}:{event['ts']}")
+                common = {
+                    "name": event["name"],
+                    "cat": event["cat"],
+                    "id": flow_id,
+                    "pid": event["pid"],
+                    "tid": event["tid"],
+                }
+                events.append(dict(common, ph="b", ts=event["ts"], args=event["args"]))
+                events.append(dict(common, ph="e", ts=end))
+                continue
+            stack.append(end)
+            event.pop("id", None)
+            events.append(dict(event, ph="X"))
+        return events
+
+
+class RunTrace:
+    """Records the nodes of a single profiled run. Created by start_run."""
+
+    def __init__(
+        self,
+        *,
+        profiler: ExecutionProfiler,
+        run_id: int,
+        scheduler: str,
+        node_count: int,
+    ) -> None:
+        self._profiler = profiler
+        self._run_id = run_id
+        self._scheduler = scheduler
+        self._node_count = node_count
+        self._started = time.perf_counter()
+        thread = threading.current_thread()
+        self._thread_id = threading.get_ident()
+        self._thread_name = thread.name
+
+    def record_node(
+        self,
+        *,
+        node_id: str,
+        timing: Any,
+        error: Optional[BaseException] = None,
+        abandoned: bool = False,
+    ) -> None:
+        """Record a node the scheduler is done with.
+
+        Args:
+            node_id: ID of the node.
+            timing: The node's NodeTiming.
+            error: The error the node ended with, if any.
+            abandoned: Whether the run stopped while the node was still pending.
+        """
+        if abandoned:
+            status = NODE_ABANDONED
+        elif error is None:
+            status = NODE_OK
+        elif isinstance(error, NodeTimeoutError):
+            status = NODE_TIMEOUT
+        elif isinstance(error, ExecutionCancelledError):
+            status = NODE_CANCELLED
+        else:
+            status = NODE_ERROR
+        finished = timing.finished
+        if finished is None or (
+            timing.started is not None and finished < timing.started
+        ):
+            finished = time.perf_counter()
+        self._profiler._record_node(
+            NodeTraceRecord(
+                run_id=self._run_id,
+                node_id=node_id,
+                submitted=timing.submitted,
+                started=timing.started,
+                finished=finished,
+                thread_id=timing.thread_id,
+                thread_name=timing.thread_name,
+                status=status,
+            )
+        )
+
+    def finish(self, *, completed: bool) -> None:
+        """Record the end of the run.
+
+        Args:
+            completed: Whether every node ran and the run returned normally.
+        """
+        self._profiler._record_run(
+            RunTraceRecord(
+                run_id=self._run_id,
+                scheduler=self._scheduler,
+                started=self._started,
+                finished=time.perf_counter(),
+                thread_id=self._thread_id,
+                thread_name=self._thread_name,
+                node_count=self._node_count,
+                status=RUN_OK if completed else RUN_INCOMPLETE,
+            )
+        )
+
+
+_active_profiler: contextvars.ContextVar[Optional[ExecutionProfiler]] = (
+    contextvars.ContextVar("xcs_execution_profiler", default=None)
+)
+
+# Tokens of the profilers entered in the current context, innermost last.
+_entry_tokens: contextvars.ContextVar[Tuple[contextvars.Token, ...]] = (
+    contextvars.ContextVar("xcs_execution_profiler_tokens", default=())
+)
+
+
+def start_profiled_run(*, scheduler: Any, node_count: int) -> Optional[RunTrace]:
+    """Begin recording a run if a profiler is active. Called by schedulers.
+
+    Args:
+        scheduler: The scheduler executing the run.
+        node_count: Number of nodes in the plan.
+
+    Returns:
+        The run's recorder, or None when no profiler is active.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return None
+    return profiler.start_run(scheduler=type(scheduler).__name__, node_count=node_count)
+
+
+__all__ = [
+    "ExecutionProfiler",
+    "NodeTraceRecord",
+    "RunTrace",
+    "RunTraceRecord",
+    "start_profiled_run",
+]
@@ -0,0 +1,356 @@
+"""
+Shared Worker Pool for XCS Execution
+
+This module owns a single, long-lived, process-wide thread pool that the XCS
+schedulers and the parallel transforms (pmap, mesh_sharded) as well as the
+EnsembleOperator reuse across executions. Creating and joining a fresh
+ThreadPoolExecutor on every graph run costs thread spin-up and teardown on each
+request; sharing one pool amortizes that cost over the lifetime of the process.
+
+The pool is created lazily on first use, sized by the ``XCS_SHARED_POOL_WORKERS``
+environment variable (falling back to the ThreadPoolExecutor default), and shut
+down automatically at interpreter exit. Forked children drop the inherited pool
+and lazily create their own.
+
+A companion process pool, used for CPU-bound nodes that would otherwise
+serialize on the GIL, follows the same lazy, process-wide lifecycle. Its workers
+are started with the "spawn" method so that they never inherit the parent's
+threads or locks.
+
+Because every component shares the same bounded pool, code that waits on work
+submitted to it from inside a pool thread could exhaust the pool and deadlock.
+Callers therefore use ``is_shared_worker_thread`` to detect nesting, and
+``run_concurrently`` lets the calling thread participate in the work so that
+nested fan-out always makes progress.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_POOL_SIZE_ENV_VAR = "XCS_SHARED_POOL_WORKERS"
+_THREAD_NAME_PREFIX = "xcs-worker"
+
+
+def _default_pool_size() -> int:
+    """Determine the size of the shared pool.
+
+    Mirrors ThreadPoolExecutor's own default (which the schedulers used before
+    the pool was shared), with an override via the ``XCS_SHARED_POOL_WORKERS``
+    environment variable.
+
+    Returns:
+        The maximum number of worker threads for the shared pool.
+    """
+    pool_size: int = min(32, (os.cpu_count() or 1) + 4)
+    env_value: Optional[str] = os.environ.get(_POOL_SIZE_ENV_VAR)
+    if env_value is not None:
+        try:
+            env_workers: int = int(env_value)
+            if env_workers > 0:
+                pool_size = env_workers
+        except ValueError:
+            logger.warning(
+                "Invalid value for %s ('%s'); using default: %d",
+                _POOL_SIZE_ENV_VAR,
+                env_value,
+                pool_size,
+            )
+    return pool_size
+
+
+class SharedExecutorPool:
+    """Lazily created, process-wide thread pool with explicit lifecycle control.
+
+    The pool is thread-safe: concurrent first calls to ``get_executor`` create a
+    single executor. Threads belonging to the pool are tagged so that callers can
+    detect when they are already running on a pool worker.
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None) -> None:
+        """Initialize the pool without starting any threads.
+
+        Args:
+            max_workers: Maximum number of worker threads. None means the default
+                from ``XCS_SHARED_POOL_WORKERS`` or the ThreadPoolExecutor default.
+        """
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._thread_marker = threading.local()
+
+    @property
+    def max_workers(self) -> int:
+        """The configured maximum number of worker threads."""
+        return self._max_workers or _default_pool_size()
+
+    def _mark_worker_thread(self) -> None:
+        """Thread initializer tagging the current thread as a pool worker."""
+        self._thread_marker.is_worker = True
+
+    def is_worker_thread(self) -> bool:
+        """Return True when called from one of this pool's worker threads."""
+        return getattr(self._thread_marker, "is_worker", False)
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared executor, creating it on first use.
+
+        Returns:
+            The process-wide ThreadPoolExecutor.
+        """
+        executor = self._executor
+        if executor is not None:
+            return executor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=_THREAD_NAME_PREFIX,
+                    initializer=self._mark_worker_thread,
+                )
+            return self._executor
+
+    def configure(self, *, max_workers: Optional[int] = None) -> None:
+        """Change the pool size, replacing the current executor if one exists.
+
+        Work already submitted to the previous executor runs to completion; new
+        work goes to a pool of the requested size.
+
+        Args:
+            max_workers: New maximum number of worker threads. None restores the default.
+        """
+        with self._lock:
+            previous = self._executor
+            self._executor = None
+            self._max_workers = max_workers
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down the pool. A later ``get_executor`` call starts a new one.
+
+        Args:
+            wait: Whether to block until all submitted work has finished.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _reset_after_fork(self) -> None:
+        """Forget the inherited executor; its threads do not exist in a forked child."""
+        self._executor = None
+        self._lock = threading.Lock()
+        self._thread_marker = threading.local()
+
+
+class SharedProcessPool:
+    """Lazily created, process-wide pool of worker processes.
+
+    Starting interpreter processes is far more expensive than starting threads,
+    so the pool is created once and reused by every process-based scheduler.
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None) -> None:
+        """Initialize the pool without starting any processes.
+
+        Args:
+            max_workers: Maximum number of worker processes. None means the
+                number of CPUs.
+        """
+        self._max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        """Return the shared process executor, creating it on first use.
+
+        Returns:
+            The process-wide ProcessPoolExecutor.
+        """
+        executor = self._executor
+        if executor is not None:
+            return executor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def configure(self, *, max_workers: Optional[int] = None) -> None:
+        """Change the pool size, replacing the current executor if one exists.
+
+        Args:
+            max_workers: New maximum number of worker processes. None restores the default.
+        """
+        with self._lock:
+            previous = self._executor
+            self._executor = None
+            self._max_workers = max_workers
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down the pool. A later ``get_executor`` call starts a new one.
+
+        Args:
+            wait: Whether to block until all submitted work has finished.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _reset_after_fork(self) -> None:
+        """Forget the inherited executor; its management thread does not exist in a forked child."""
+        self._executor = None
+        self._lock = threading.Lock()
+
+
+_SHARED_POOL = SharedExecutorPool()
+_SHARED_PROCESS_POOL = SharedProcessPool()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor shared by XCS components.
+
+    Returns:
+        The shared ThreadPoolExecutor, created on first use.
+    """
+    return _SHARED_POOL.get_executor()
+
+
+def is_shared_worker_thread() -> bool:
+    """Return True when the calling thread belongs to the shared pool."""
+    return _SHARED_POOL.is_worker_thread()
+
+
+def shared_pool_size() -> int:
+    """Return the maximum number of worker threads in the shared pool."""
+    return _SHARED_POOL.max_workers
+
+
+def configure_shared_executor(*, max_workers: Optional[int] = None) -> None:
+    """Resize the shared pool.
+
+    Args:
+        max_workers: New maximum number of worker threads. None restores the default.
+    """
+    _SHARED_POOL.configure(max_workers=max_workers)
+
+
+def shutdown_shared_executor(*, wait: bool = True) -> None:
+    """Shut down the shared pool. Registered to run automatically at exit.
+
+    Args:
+        wait: Whether to block until all submitted work has finished.
+    """
+    _SHARED_POOL.shutdown(wait=wait)
+
+
+def get_shared_process_executor() -> ProcessPoolExecutor:
+    """Return the process-wide pool of worker processes.
+
+    Returns:
+        The shared ProcessPoolExecutor, created on first use.
+    """
+    return _SHARED_PROCESS_POOL.get_executor()
+
+
+def configure_shared_process_executor(*, max_workers: Optional[int] = None) -> None:
+    """Resize the shared process pool.
+
+    Args:
+        max_workers: New maximum number of worker processes. None restores the default.
+    """
+    _SHARED_PROCESS_POOL.configure(max_workers=max_workers)
+
+
+def shutdown_shared_process_executor(*, wait: bool = True) -> None:
+    """Shut down the shared process pool. Registered to run automatically at exit.
+
+    Args:
+        wait: Whether to block until all submitted work has finished.
+    """
+    _SHARED_PROCESS_POOL.shutdown(wait=wait)
+
+
+def run_concurrently(
+    *,
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    max_concurrency: Optional[int] = None,
+) -> List[Future[R]]:
+    """Apply ``fn`` to every item using the shared pool and return completed futures.
+
+    The calling thread takes part in the work: helpers are submitted to the shared
+    pool and every participant, caller included, pulls the next unclaimed item
+    until none remain. If the pool is saturated (for example when this is called
+    from inside a pool worker), the caller simply processes the items itself, so
+    nested fan-out cannot deadlock.
+
+    Args:
+        fn: Function applied to each item.
+        items: Items to process.
+        max_concurrency: Maximum number of items processed at once, caller
+            included. None means one participant per item.
+
+    Returns:
+        Completed futures, in the same order as ``items``. Exceptions raised by
+        ``fn`` are stored on the corresponding future rather than raised.
+    """
+    futures: List[Future[R]] = [Future() for _ in items]
+    if not futures:
+        return futures
+
+    next_index = 0
+    index_lock = threading.Lock()
+
+    def drain() -> None:
+        nonlocal next_index
+        while True:
+            with index_lock:
+                index = next_index
+                if index >= len(futures):
+                    return
+                next_index += 1
+            future = futures[index]
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(items[index]))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    participants = min(max_concurrency or len(futures), len(futures))
+    executor = get_shared_executor()
+    helpers = [executor.submit(drain) for _ in range(participants - 1)]
+    drain()
+    wait(futures)
+    # Helpers that started after the work ran out exit immediately; helpers that
+    # have not started yet find nothing to do, so there is no need to wait for them.
+    for helper in helpers:
+        helper.cancel()
+    return futures
+
+
+atexit.register(shutdown_shared_executor)
+atexit.register(shutdown_shared_process_executor)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SHARED_POOL._reset_after_fork)
+    os.register_at_fork(after_in_child=_SHARED_PROCESS_POOL._reset_after_fork)
@@ -0,0 +1,232 @@
+"""
+Linear-Chain Fusion for XCS Graphs
+
+Graphs built by the tracer and hand-written pipelines often contain long
+chains of cheap nodes (formatting, extraction, selection) in which every node
+has exactly one producer and one consumer. Each of those nodes pays a
+scheduler round trip: a dispatch to the worker pool, a completion callback and
+input gathering. ``fuse_chains`` rewrites such chains into a single node that
+runs the chain's operators back to back on one worker:
+
+```python
+fused = fuse_chains(graph=graph)
+results = execute_graph(graph=fused.graph, global_input=inputs)
+```
+
+or, equivalently, ``compile_graph(graph=graph, fuse=True)``.
+
+Semantics are preserved for the chain's output: every fused operator sees the
+same inputs it would have seen as its own node (the previous node's output
+layered over the global input, plus its own ``node_attributes``), and the fused
+node keeps the ID of the chain's last node, so downstream edges and that node's
+entry in the results are unchanged. The results of the other nodes in a chain
+are not reported separately; pass ``capture_outputs=True`` to record each of
+them on the original graph's nodes (``captured_outputs``) for debugging.
+
+Nodes are never fused when they carry scheduling hints (``timeout``,
+``resource_class``, ``executor``, ``expected_duration``), when their operator
+is a coroutine function, or when they set the ``fuse`` hint to False.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ember.xcs.engine.execution_policy import TIMEOUT_HINT
+from ember.xcs.engine.input_view import InputView
+from ember.xcs.engine.resource_limits import RESOURCE_CLASS_HINT
+from ember.xcs.engine.xcs_async_scheduler import _is_coroutine_operator
+from ember.xcs.engine.xcs_critical_path_scheduler import EXPECTED_DURATION_HINT
+from ember.xcs.engine.xcs_process_scheduler import EXECUTOR_HINT
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode
+
+FUSE_HINT = "fuse"
+
+# Hints that give a node its own scheduling treatment; such nodes stay separate.
+_SCHEDULING_HINTS = (
+    TIMEOUT_HINT,
+    RESOURCE_CLASS_HINT,
+    EXECUTOR_HINT,
+    EXPECTED_DURATION_HINT,
+)
+
+
+class FusedChain:
+    """Operator that runs the operators of a linear chain of nodes in order.
+
+    Attributes:
+        nodes: The original nodes of the chain, first to last.
+        capture_outputs: Whether each node's output is stored on the original
+            node's captured_outputs as the chain runs.
+    """
+
+    def __init__(
+        self, *, nodes: Sequence[XCSNode], capture_outputs: bool = False
+    ) -> None:
+        """Initialize the fused operator.
+
+        Args:
+            nodes: The chain's nodes, first to last. Each node's only consumer is
+                the next node, and each node's only producer is the previous one.
+            capture_outputs: Whether to record each node's output on the node.
+        """
+        self.nodes: Tuple[XCSNode, ...] = tuple(nodes)
+        self.capture_outputs = capture_outputs
+
+    @property
+    def node_ids(self) -> Tuple[str, ...]:
+        """IDs of the fused nodes, first to last."""
+        return tuple(node.node_id for node in self.nodes)
+
+    def __call__(self, *, inputs: Mapping[str, Any]) -> Any:
+        """Run the chain.
+
+        Args:
+            inputs: The first node's inputs, as gathered by the scheduler.
+
+        Returns:
+            The last node's output.
+        """
+        # Later nodes see the previous output over the global input only, not
+        # over the outputs feeding the head of the chain. Schedulers that run
+        # the chain in another process ship the view with its layers intact.
+        global_input = inputs.base if isinstance(inputs, InputView) else inputs
+        result: Any = None
+        for position, node in enumerate(self.nodes):
+            if position:
+                inputs = InputView.from_parts(
+                    global_input=global_input,
+                    parent_outputs=[result] if isinstance(result, Mapping) else [],
+                    node_attributes=node.attributes,
+                )
+            try:
+                result = node.operator(inputs=inputs)
+            except Exception as error:
+                error.add_note(
+                    f"Raised by node '{node.node_id}' of fused chain "
+                    f"{list(self.node_ids)}."
+                )
+                raise
+            if self.capture_outputs:
+                node.captured_outputs = result
+        return result
+
+    def __repr__(self) -> str:
+        return f"FusedChain({list(self.node_ids)!r})"
+
+
+class FusionResult(NamedTuple):
+    """Outcome of a fusion pass.
+
+    Attributes:
+        graph: The rewritten graph. The input graph is left untouched.
+        chains: Original node IDs of each fused node, first to last, keyed by
+            the fused node's ID (the ID of the chain's last node).
+        original_node_count: Number of nodes before fusion.
+    """
+
+    graph: XCSGraph
+    chains: Dict[str, Tuple[str, ...]]
+    original_node_count: int
+
+    @property
+    def removed_node_count(self) -> int:
+        """How many nodes, and so scheduler round trips, fusion saved."""
+        return self.original_node_count - len(self.graph.nodes)
+
+
+def fuse_chains(*, graph: XCSGraph, capture_outputs: bool = False) -> FusionResult:
+    """Fuse single-producer, single-consumer chains of nodes into single nodes.
+
+    Args:
+        graph: The graph to optimize.
+        capture_outputs: Whether fused operators record each original node's
+            output on that node's captured_outputs.
+
+    Returns:
+        The rewritten graph and a description of the fused chains.
+    """
+    nodes = graph.nodes
+    chains: List[List[str]] = []
+    for node_id, node in nodes.items():
+        if not _is_fusible(node) or _continues_chain(graph=graph, node=node):
+            continue
+        chain = [node_id]
+        current = node
+        while len(current.outbound_edges) == 1:
+            child = nodes.get(current.outbound_edges[0])
+            if child is None or not _continues_chain(graph=graph, node=child):
+                break
+            chain.append(child.node_id)
+            current = child
+        if len(chain) > 1:
+            chains.append(chain)
+
+    # Every node of a chain is represented by the chain's last node.
+    fused_id: Dict[str, str] = {
+        node_id: chain[-1] for chain in chains for node_id in chain
+    }
+    heads = {chain[0]: chain for chain in chains}
+
+    fused = XCSGraph()
+    for node_id, node in nodes.items():
+        if node_id in heads:
+            chain = heads[node_id]
+            tail = nodes[chain[-1]]
+            new_node = XCSNode(
+                operator=FusedChain(
+                    nodes=[nodes[member] for member in chain],
+                    capture_outputs=capture_outputs,
+                ),
+                node_id=tail.node_id,
+            )
+            # The scheduler hands the head's attributes to the first operator.
+            new_node.attributes = dict(node.attributes)
+            inbound, outbound = node.inbound_edges, tail.outbound_edges
+        elif node_id in fused_id:
+            continue
+        else:
+            new_node = XCSNode(operator=node.operator, node_id=node_id)
+            new_node.attributes = dict(node.attributes)
+            inbound, outbound = node.inbound_edges, node.outbound_edges
+        new_node.inbound_edges = [fused_id.get(edge, edge) for edge in inbound]
+        new_node.outbound_edges = [fused_id.get(edge, edge) for edge in outbound]
+        fused.nodes[new_node.node_id] = new_node
+
+    fused.entry_node = _renamed(graph.entry_node, fused_id)
+    fused.exit_node = _renamed(graph.exit_node, fused_id)
+    return FusionResult(
+        graph=fused,
+        chains={chain[-1]: tuple(chain) for chain in chains},
+        original_node_count=len(nodes),
+    )
+
+
+def _is_fusible(node: XCSNode) -> bool:
+    """Whether a node may be merged into a chain at all."""
+    if node.get_hint(FUSE_HINT, True) is False:
+        return False
+    if any(node.get_hint(hint) is not None for hint in _SCHEDULING_HINTS):
+        return False
+    return not _is_coroutine_operator(node.operator)
+
+
+def _continues_chain(*, graph: XCSGraph, node: XCSNode) -> bool:
+    """Whether a node can be fused onto the end of its only producer's chain."""
+    if len(node.inbound_edges) != 1 or not _is_fusible(node):
+        return False
+    parent = graph.nodes.get(node.inbound_edges[0])
+    return (
+        parent is not None
+        and parent is not node
+        and len(parent.outbound_edges) == 1
+        and _is_fusible(parent)
+    )
+
+
+def _renamed(node_id: Optional[str], fused_id: Dict[str, str]) -> Optional[str]:
+    return fused_id.get(node_id, node_id) if node_id is not None else None
+
+
+__all__ = ["FUSE_HINT", "FusedChain", "FusionResult", "fuse_chains"]
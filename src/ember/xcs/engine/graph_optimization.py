@@ -0,0 +1,246 @@
+"""
+Dead-Node and Common-Subexpression Elimination for XCS Graphs
+
+Composed pipelines often compute more than they need. Two branches may render
+the same prompt against the same model, and a node may feed only branches
+that were later disconnected from the graph's exit. Two passes remove that work:
+
+- ``eliminate_dead_nodes`` drops every node whose output cannot reach
+  ``exit_node`` (or one of the extra nodes to keep).
+- ``eliminate_common_subexpressions`` merges nodes that run the very same
+  operator object, with the same attributes, on the same inbound sources in
+  the same order. Such nodes see identical inputs, so one of them can stand in
+  for the others. Merges cascade: the consumers of merged nodes may become
+  identical in turn.
+
+```python
+optimized = optimize_graph(graph=graph)
+results = execute_graph(graph=optimized.graph, global_input=inputs)
+```
+
+or, equivalently, ``compile_graph(graph=graph, optimize=True)``.
+
+Merging assumes an operator returns the same output for the same inputs.
+Operators that sample (temperature above zero, random choices) must not be
+merged: mark the operator or its class with ``non_deduplicable``, or set the
+``deduplicate`` hint to False on the node.
+
+The input graph is left untouched. Results are not reported for removed nodes;
+``OptimizationResult.merged`` maps each merged node to the node whose result
+stands in for it.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode
+
+DEDUPLICATE_HINT = "deduplicate"
+
+# Operator attribute set by non_deduplicable.
+_DEDUPLICATE_ATTRIBUTE = "__xcs_deduplicate__"
+
+OperatorT = TypeVar("OperatorT")
+
+
+def non_deduplicable(operator: OperatorT) -> OperatorT:
+    """Marks an operator, or an operator class, as unsafe to merge.
+
+    Usable as a decorator on functions and classes. Marking a class marks all
+    of its instances.
+
+    Args:
+        operator: Function, callable object or class to mark.
+
+    Returns:
+        The operator itself.
+    """
+    setattr(operator, _DEDUPLICATE_ATTRIBUTE, False)
+    return operator
+
+
+class OptimizationResult(NamedTuple):
+    """Outcome of one or more optimization passes.
+
+    Attributes:
+        graph: The rewritten graph. The input graph is left untouched.
+        removed: IDs of the nodes dropped because their output reaches no exit.
+        merged: For every node merged away, the ID of the node that replaces it.
+        original_node_count: Number of nodes before optimization.
+    """
+
+    graph: XCSGraph
+    removed: Tuple[str, ...]
+    merged: Dict[str, str]
+    original_node_count: int
+
+    @property
+    def removed_node_count(self) -> int:
+        """How many nodes, dead or merged, the passes removed."""
+        return self.original_node_count - len(self.graph.nodes)
+
+
+def eliminate_dead_nodes(
+    *, graph: XCSGraph, keep: Iterable[str] = ()
+) -> OptimizationResult:
+    """Removes the nodes whose output cannot reach the exit node.
+
+    Args:
+        graph: Graph to optimize.
+        keep: IDs of further nodes whose results are needed, along with
+            everything they depend on.
+
+    Returns:
+        The graph without dead nodes. Without an exit node or nodes to keep,
+        nothing is considered dead.
+
+    Raises:
+        ValueError: If a node to keep is not in the graph.
+    """
+    roots = [graph.exit_node] if graph.exit_node is not None else []
+    for node_id in keep:
+        if node_id not in graph.nodes:
+            raise ValueError(f"Node with ID '{node_id}' is not present in the graph.")
+        roots.append(node_id)
+    if not roots:
+        return _rebuild(graph=graph, live=set(graph.nodes), merged={})
+
+    live: Set[str] = set(roots)
+    pending = deque(roots)
+    while pending:
+        for parent in graph.nodes[pending.popleft()].inbound_edges:
+            if parent not in live:
+                live.add(parent)
+                pending.append(parent)
+    return _rebuild(graph=graph, live=live, merged={})
+
+
+def eliminate_common_subexpressions(*, graph: XCSGraph) -> OptimizationResult:
+    """Merges nodes that would compute the same result.
+
+    Of each group of identical nodes, the first in topological order (level by
+    level, in insertion order within a level) is kept.
+
+    Args:
+        graph: Graph to optimize.
+
+    Returns:
+        The graph with duplicate nodes merged.
+
+    Raises:
+        ValueError: If the graph contains a cycle.
+    """
+    merged: Dict[str, str] = {}
+    candidates: Dict[Tuple[int, Tuple[str, ...]], List[XCSNode]] = {}
+    for node_id in graph.topological_sort():
+        node = graph.nodes[node_id]
+        if not _is_deduplicable(node):
+            continue
+        parents = _redirected_parents(node=node, merged=merged)
+        group = candidates.setdefault((id(node.operator), parents), [])
+        for kept in group:
+            if kept.attributes == node.attributes:
+                merged[node_id] = kept.node_id
+                break
+        else:
+            group.append(node)
+    return _rebuild(graph=graph, live=set(graph.nodes), merged=merged)
+
+
+def optimize_graph(
+    *, graph: XCSGraph, keep: Iterable[str] = (), deduplicate: bool = True
+) -> OptimizationResult:
+    """Runs dead-node elimination and then common-subexpression elimination.
+
+    Args:
+        graph: Graph to optimize.
+        keep: IDs of further nodes whose results are needed.
+        deduplicate: Whether to merge duplicate nodes.
+
+    Returns:
+        The optimized graph, with the nodes each pass removed.
+    """
+    pruned = eliminate_dead_nodes(graph=graph, keep=keep)
+    if not deduplicate:
+        return pruned
+    deduplicated = eliminate_common_subexpressions(graph=pruned.graph)
+    return OptimizationResult(
+        graph=deduplicated.graph,
+        removed=pruned.removed,
+        merged=deduplicated.merged,
+        original_node_count=pruned.original_node_count,
+    )
+
+
+def _is_deduplicable(node: XCSNode) -> bool:
+    if node.get_hint(DEDUPLICATE_HINT, True) is False:
+        return False
+    return getattr(node.operator, _DEDUPLICATE_ATTRIBUTE, True) is not False
+
+
+def _redirected_parents(*, node: XCSNode, merged: Dict[str, str]) -> Tuple[str, ...]:
+    """A node's parents with merged ones replaced by the node they merged into.
+
+    Parent outputs are layered in inbound order, later parents winning, so a
+    parent that now appears more than once keeps its last position.
+    """
+    redirected = [merged.get(parent, parent) for parent in node.inbound_edges]
+    return tuple(reversed(dict.fromkeys(reversed(redirected))))
+
+
+def _rebuild(
+    *, graph: XCSGraph, live: Set[str], merged: Dict[str, str]
+) -> OptimizationResult:
+    """Copy the live, unmerged nodes of a graph, redirecting edges of merged ones."""
+    rebuilt = XCSGraph()
+    for node_id, node in graph.nodes.items():
+        if node_id not in live or node_id in merged:
+            continue
+        new_node = XCSNode(operator=node.operator, node_id=node_id)
+        new_node.attributes = dict(node.attributes)
+        new_node.inbound_edges = list(_redirected_parents(node=node, merged=merged))
+        rebuilt.nodes[node_id] = new_node
+    for node_id, node in rebuilt.nodes.items():
+        for parent in node.inbound_edges:
+            rebuilt.nodes[parent].outbound_edges.append(node_id)
+
+    rebuilt.entry_node = _surviving(graph.entry_node, rebuilt, merged)
+    if rebuilt.entry_node is None:
+        rebuilt.entry_node = next(
+            (node.node_id for node in rebuilt if not node.inbound_edges), None
+        )
+    rebuilt.exit_node = _surviving(graph.exit_node, rebuilt, merged)
+    return OptimizationResult(
+        graph=rebuilt,
+        removed=tuple(node_id for node_id in graph.nodes if node_id not in live),
+        merged=merged,
+        original_node_count=len(graph.nodes),
+    )
+
+
+def _surviving(
+    node_id: Optional[str], graph: XCSGraph, merged: Dict[str, str]
+) -> Optional[str]:
+    node_id = merged.get(node_id, node_id) if node_id is not None else None
+    return node_id if node_id in graph.nodes else None
+
+
+__all__ = [
+    "DEDUPLICATE_HINT",
+    "OptimizationResult",
+    "eliminate_common_subexpressions",
+    "eliminate_dead_nodes",
+    "non_deduplicable",
+    "optimize_graph",
+]
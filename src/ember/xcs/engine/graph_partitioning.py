@@ -0,0 +1,425 @@
+"""
+Graph Partitioning for Multi-Worker Execution
+
+A graph too large for one worker process is split into ``k`` subgraphs, one per
+worker. A good split keeps the estimated work of every partition close to the
+average and ships as little data between partitions as possible:
+
+```python
+result = partition_graph(graph=graph, partitions=4)
+shipped: Dict[str, Any] = {}
+for partition in result.partitions:  # or in parallel, following depends_on
+    graph = partition.bind_imports(results=shipped)
+    outputs = execute_graph(graph=graph, global_input=inputs)
+    shipped.update((node_id, outputs[node_id]) for node_id in partition.exports)
+```
+
+Node costs default to the estimates of the process-wide cost model shared with
+the critical-path scheduler: observed durations, then ``expected_duration``
+hints, then the mean. An edge weighs as much as the output its source ships
+across it, measured as the pickled size of the source's captured outputs from
+an earlier run, or the mean measured size when the source has none.
+
+Partitions are numbered in dependency order. Every cross-partition edge runs
+from a lower to a higher partition, so no two partitions wait on each other.
+The partitioner cuts a depth-first topological order into contiguous
+cost-balanced ranges, which keeps independent chains together, and then moves
+single nodes between partitions while that lowers the cut weight, or evens out
+the load without raising it, and keeps every partition within the balance
+tolerance.
+"""
+
+from __future__ import annotations
+
+import pickle
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from ember.xcs.engine.execution_journal import replay_graph
+from ember.xcs.engine.xcs_critical_path_scheduler import get_default_cost_model
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode
+
+# Upper bound on the refinement passes over all nodes.
+_MAX_REFINEMENT_PASSES = 8
+
+
+class BoundaryEdge(NamedTuple):
+    """An edge whose endpoints were assigned to different partitions.
+
+    Attributes:
+        from_id: ID of the node whose output is shipped.
+        to_id: ID of the node consuming it.
+        from_partition: Partition of the source node.
+        to_partition: Partition of the consuming node, always higher than
+            from_partition.
+        weight: Weight of the edge, the estimated size of the shipped output.
+    """
+
+    from_id: str
+    to_id: str
+    from_partition: int
+    to_partition: int
+    weight: float
+
+
+class GraphPartition(NamedTuple):
+    """One partition of a graph, with what it receives from and sends to others.
+
+    Attributes:
+        index: Position of the partition in dependency order.
+        graph: Subgraph with the partition's nodes and, for each imported node, a
+            boundary node without inbound edges that stands in for it. Run it
+            through bind_imports.
+        node_ids: IDs of the nodes the partition computes, in graph order.
+        cost: Sum of the estimated costs of those nodes.
+        imports: For every node whose output the partition needs from another
+            partition, the index of the partition that computes it.
+        exports: For every node whose output other partitions need, the
+            indices of those partitions.
+    """
+
+    index: int
+    graph: XCSGraph
+    node_ids: Tuple[str, ...]
+    cost: float
+    imports: Dict[str, int]
+    exports: Dict[str, Tuple[int, ...]]
+
+    @property
+    def depends_on(self) -> Tuple[int, ...]:
+        """Indices of the partitions that must finish first, in ascending order."""
+        return tuple(sorted(set(self.imports.values())))
+
+    def bind_imports(self, *, results: Mapping[str, Any]) -> XCSGraph:
+        """Return the partition's graph with its boundary nodes filled in.
+
+        Boundary nodes return the shipped results instead of running, and are
+        reported alongside the partition's own nodes when the graph executes.
+
+        Args:
+            results: Outputs of other partitions, by node ID. Entries other
+                than the partition's imports are ignored.
+
+        Returns:
+            A graph ready to execute.
+
+        Raises:
+            ValueError: If the result of an imported node is missing.
+        """
+        missing = [node_id for node_id in self.imports if node_id not in results]
+        if missing:
+            raise ValueError(
+                f"Partition {self.index} is missing the results of imported "
+                f"nodes: {', '.join(missing)}."
+            )
+        return replay_graph(
+            graph=self.graph,
+            completed={node_id: results[node_id] for node_id in self.imports},
+        )
+
+
+class PartitionResult(NamedTuple):
+    """Outcome of partitioning a graph.
+
+    Attributes:
+        partitions: The partitions, in dependency order. Some may be empty when
+            there are fewer nodes than partitions.
+        assignment: Partition index of every node.
+        boundary: Edges between partitions, in graph order.
+        costs: Estimated cost of every node.
+    """
+
+    partitions: Tuple[GraphPartition, ...]
+    assignment: Dict[str, int]
+    boundary: Tuple[BoundaryEdge, ...]
+    costs: Dict[str, float]
+
+    @property
+    def cut_weight(self) -> float:
+        """Total weight of the edges between partitions."""
+        return sum(edge.weight for edge in self.boundary)
+
+    @property
+    def imbalance(self) -> float:
+        """Cost of the most loaded partition relative to the average."""
+        loads = [partition.cost for partition in self.partitions]
+        mean = sum(loads) / len(loads)
+        return max(loads) / mean if mean > 0 else 1.0
+
+
+def observed_output_sizes(*, graph: XCSGraph) -> Dict[str, float]:
+    """Estimate the size of every node's output from an earlier run.
+
+    Args:
+        graph: Graph whose nodes hold captured outputs from a previous execution.
+
+    Returns:
+        Pickled size in bytes of each node's captured outputs. Nodes without
+        captured outputs, or with outputs that cannot be pickled, get the mean
+        of the measured sizes, or 1.0 if nothing was measured.
+    """
+    sizes: Dict[str, float] = {}
+    unknown: List[str] = []
+    for node_id, node in graph.nodes.items():
+        if node.captured_outputs is None:
+            unknown.append(node_id)
+            continue
+        try:
+            sizes[node_id] = float(len(pickle.dumps(node.captured_outputs)))
+        except Exception:
+            unknown.append(node_id)
+    default = sum(sizes.values()) / len(sizes) if sizes else 1.0
+    for node_id in unknown:
+        sizes[node_id] = default
+    return sizes
+
+
+def partition_graph(
+    *,
+    graph: XCSGraph,
+    partitions: int,
+    costs: Optional[Mapping[str, float]] = None,
+    output_sizes: Optional[Mapping[str, float]] = None,
+    balance: float = 0.1,
+) -> PartitionResult:
+    """Split a graph into partitions of similar cost with few edges between them.
+
+    Args:
+        graph: Graph to partition. It is left untouched.
+        partitions: Number of partitions to produce.
+        costs: Estimated cost of each node. Defaults to the estimates of the
+            shared cost model. Missing nodes cost 1.0.
+        output_sizes: Estimated output size of each node, the weight of each of
+            its outbound edges. Defaults to observed_output_sizes. Missing
+            nodes weigh 1.0.
+        balance: How far, as a fraction of the average, a partition's cost may
+            exceed the average. Partitions holding a single node costlier than
+            that are allowed.
+
+    Returns:
+        The partitions, every node's assignment and the boundary edges.
+
+    Raises:
+        ValueError: If partitions is below one, balance is negative, or the
+            graph contains a cycle.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1.")
+    if balance < 0:
+        raise ValueError("balance must not be negative.")
+    if costs is None:
+        costs = get_default_cost_model().estimate_costs(graph=graph)
+    if output_sizes is None:
+        output_sizes = observed_output_sizes(graph=graph)
+    node_costs = {node_id: float(costs.get(node_id, 1.0)) for node_id in graph.nodes}
+    weights = {
+        node_id: float(output_sizes.get(node_id, 1.0)) for node_id in graph.nodes
+    }
+
+    order = _depth_first_order(graph)
+    assignment = _initial_assignment(order, node_costs, partitions)
+    total = sum(node_costs.values())
+    capacity = max(
+        (1.0 + balance) * total / partitions, max(node_costs.values(), default=0.0)
+    )
+    _refine(graph, order, assignment, node_costs, weights, partitions, capacity)
+    return _build_result(graph, assignment, node_costs, weights, partitions)
+
+
+def _depth_first_order(graph: XCSGraph) -> List[str]:
+    """Topological order that finishes the most recently enabled branch first."""
+    remaining = {
+        node_id: len(set(node.inbound_edges)) for node_id, node in graph.nodes.items()
+    }
+    ready = [node_id for node_id, count in remaining.items() if count == 0]
+    ready.reverse()
+    order: List[str] = []
+    while ready:
+        node_id = ready.pop()
+        order.append(node_id)
+        enabled = []
+        for child in dict.fromkeys(graph.nodes[node_id].outbound_edges):
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                enabled.append(child)
+        ready.extend(reversed(enabled))
+    if len(order) != len(graph.nodes):
+        raise ValueError("Graph contains a cycle or is not a valid DAG.")
+    return order
+
+
+def _initial_assignment(
+    order: List[str], costs: Dict[str, float], partitions: int
+) -> Dict[str, int]:
+    """Cut the order into contiguous ranges of roughly equal cost."""
+    total = sum(costs.values())
+    if total <= 0:
+        # Without costs to balance, balance node counts instead.
+        return {
+            node_id: position * partitions // len(order)
+            for position, node_id in enumerate(order)
+        }
+    assignment: Dict[str, int] = {}
+    before = 0.0
+    for node_id in order:
+        midpoint = before + costs[node_id] / 2
+        assignment[node_id] = min(partitions - 1, int(midpoint * partitions / total))
+        before += costs[node_id]
+    return assignment
+
+
+def _refine(
+    graph: XCSGraph,
+    order: List[str],
+    assignment: Dict[str, int],
+    costs: Dict[str, float],
+    weights: Dict[str, float],
+    partitions: int,
+    capacity: float,
+) -> None:
+    """Greedily move single nodes to neighbouring partitions, in place.
+
+    A node may only move to partitions between the highest partition of its
+    parents and the lowest partition of its children, which keeps every
+    boundary edge pointing to a higher partition. A move is taken when it lowers
+    the cut weight, or when it keeps the cut weight and evens out the two
+    partitions involved, and the destination stays within capacity.
+    """
+    loads = [0.0] * partitions
+    for node_id, index in assignment.items():
+        loads[index] += costs[node_id]
+
+    for _ in range(_MAX_REFINEMENT_PASSES):
+        moved = False
+        for node_id in order:
+            node = graph.nodes[node_id]
+            current = assignment[node_id]
+            low = max((assignment[p] for p in node.inbound_edges), default=0)
+            high = min(
+                (assignment[c] for c in node.outbound_edges), default=partitions - 1
+            )
+            if low == high:
+                continue
+            connection: Dict[int, float] = {}
+            for parent in dict.fromkeys(node.inbound_edges):
+                index = assignment[parent]
+                connection[index] = connection.get(index, 0.0) + weights[parent]
+            own_weight = weights[node_id]
+            for child in dict.fromkeys(node.outbound_edges):
+                index = assignment[child]
+                connection[index] = connection.get(index, 0.0) + own_weight
+
+            cost = costs[node_id]
+            best, best_gain = current, 0.0
+            best_load = loads[current] - cost
+            for index in range(low, high + 1):
+                if index == current or loads[index] + cost > capacity:
+                    continue
+                gain = connection.get(index, 0.0) - connection.get(current, 0.0)
+                if gain > best_gain or (gain == best_gain and loads[index] < best_load):
+                    best, best_gain, best_load = index, gain, loads[index]
+            if best != current:
+                assignment[node_id] = best
+                loads[current] -= cost
+                loads[best] += cost
+                moved = True
+        if not moved:
+            break
+
+
+def _build_result(
+    graph: XCSGraph,
+    assignment: Dict[str, int],
+    costs: Dict[str, float],
+    weights: Dict[str, float],
+    partitions: int,
+) -> PartitionResult:
+    members: List[List[str]] = [[] for _ in range(partitions)]
+    imports: List[Dict[str, int]] = [{} for _ in range(partitions)]
+    exports: List[Dict[str, List[int]]] = [{} for _ in range(partitions)]
+    boundary: List[BoundaryEdge] = []
+    for node_id, node in graph.nodes.items():
+        index = assignment[node_id]
+        members[index].append(node_id)
+        for child in dict.fromkeys(node.outbound_edges):
+            target = assignment[child]
+            if target == index:
+                continue
+            boundary.append(
+                BoundaryEdge(node_id, child, index, target, weights[node_id])
+            )
+            imports[target][node_id] = index
+            destinations = exports[index].setdefault(node_id, [])
+            if target not in destinations:
+                destinations.append(target)
+
+    result = tuple(
+        GraphPartition(
+            index=index,
+            graph=_subgraph(graph, members[index], imports[index]),
+            node_ids=tuple(members[index]),
+            cost=sum(costs[node_id] for node_id in members[index]),
+            imports=imports[index],
+            exports={
+                node_id: tuple(sorted(targets))
+                for node_id, targets in exports[index].items()
+            },
+        )
+        for index in range(partitions)
+    )
+    return PartitionResult(
+        partitions=result,
+        assignment=assignment,
+        boundary=tuple(boundary),
+        costs=costs,
+    )
+
+
+def _subgraph(graph: XCSGraph, members: List[str], imports: Dict[str, int]) -> XCSGraph:
+    """Copy a partition's nodes, with boundary nodes standing in for imports."""
+    owned = set(members)
+    subgraph = XCSGraph()
+    for node_id, node in graph.nodes.items():
+        if node_id in owned:
+            copied = XCSNode(operator=node.operator, node_id=node_id)
+            copied.attributes = dict(node.attributes)
+            copied.inbound_edges = list(node.inbound_edges)
+            copied.outbound_edges = [
+                child for child in node.outbound_edges if child in owned
+            ]
+        elif node_id in imports:
+            copied = XCSNode(operator=_UnboundImport(node_id), node_id=node_id)
+            copied.outbound_edges = [
+                child for child in node.outbound_edges if child in owned
+            ]
+        else:
+            continue
+        subgraph.nodes[node_id] = copied
+    if graph.entry_node in owned:
+        subgraph.entry_node = graph.entry_node
+    if graph.exit_node in owned:
+        subgraph.exit_node = graph.exit_node
+    return subgraph
+
+
+class _UnboundImport:
+    """Operator of a boundary node whose shipped result was not bound."""
+
+    __slots__ = ("node_id",)
+
+    def __init__(self, node_id: str) -> None:
+        self.node_id = node_id
+
+    def __call__(self, *, inputs: Mapping[str, Any]) -> Any:
+        raise ValueError(
+            f"The result of node '{self.node_id}' comes from another partition; "
+            "bind it with GraphPartition.bind_imports."
+        )
+
+
+__all__ = [
+    "BoundaryEdge",
+    "GraphPartition",
+    "PartitionResult",
+    "observed_output_sizes",
+    "partition_graph",
+]
@@ -0,0 +1,237 @@
+"""
+Running Hedged Nodes
+
+The hedging policy (see hedging) decides when a straggling node gets a
+duplicate attempt. This module runs those attempts for the thread-pool
+schedulers: ``HedgedExecution`` launches a node's primary attempt, arms the
+hedge timer, and relays the first attempt to succeed while cancelling the
+other. The event-loop scheduler races its attempts itself but shares
+``HedgeAttempt`` and ``adopt_timing``.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+from ember.xcs.engine.execution_policy import CancellationToken
+from ember.xcs.engine.hedging import HedgingPolicy, schedule_hedge
+
+if TYPE_CHECKING:
+    from ember.xcs.engine.xcs_engine import NodeTiming
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class HedgeAttempt:
+    """One attempt at running a hedged node."""
+
+    __slots__ = ("timing", "token", "is_hedge", "future")
+
+    def __init__(
+        self, *, timing: NodeTiming, token: CancellationToken, is_hedge: bool
+    ) -> None:
+        self.timing = timing
+        self.token = token
+        self.is_hedge = is_hedge
+        self.future: Optional[Future[Any]] = None
+
+
+class HedgedExecution:
+    """
+    Runs a node as a primary attempt plus, if it straggles, one duplicate.
+
+    The relay future resolves with the first attempt to succeed, and the other
+    attempt is then cancelled. It fails only once no attempt is left running,
+    with the first error raised, so a duplicate that fails fast does not sink
+    a primary that is still making progress. Cancelling the relay cancels
+    every attempt.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: HedgingPolicy,
+        key: str,
+        timing: NodeTiming,
+        token: CancellationToken,
+        submit: Callable[..., Future[Any]],
+        reserve_hedge: Callable[[], bool],
+        release_hedge: Callable[[], None],
+    ) -> None:
+        """
+        Initialize a hedged execution.
+
+        Args:
+            policy: The hedging policy to learn from and account to
+            key: The node's latency key
+            timing: The node's timing record, filled in from the winning attempt
+            token: The node's cancellation token; attempts derive theirs from it
+            submit: Starts an attempt given its timing and token
+            reserve_hedge: Reserves budget and capacity for a duplicate
+            release_hedge: Returns the capacity reserved for a duplicate
+        """
+        self.relay: Future[Any] = Future()
+        self._policy = policy
+        self._key = key
+        self._timing = timing
+        self._token = token
+        self._submit = submit
+        self._reserve_hedge = reserve_hedge
+        self._release_hedge = release_hedge
+        self._lock = threading.Lock()
+        self._attempts: List[HedgeAttempt] = []
+        self._running = 0
+        self._settled = False
+        self._abandoned = False
+        self._error: Optional[BaseException] = None
+
+    def start(self, *, delay: Optional[float]) -> Future[Any]:
+        """
+        Launches the primary attempt and arms the hedge timer.
+
+        Args:
+            delay: Seconds after dispatch at which to launch a duplicate, or None
+                to run the primary attempt alone
+
+        Returns:
+            The relay future
+        """
+        self._launch(is_hedge=False)
+        self.relay.add_done_callback(self._on_relay_done)
+        if delay is not None:
+            schedule_hedge(self._timing.submitted + delay, self._hedge)
+        return self.relay
+
+    def _launch(self, *, is_hedge: bool) -> HedgeAttempt:
+        attempt = HedgeAttempt(
+            # A fresh record of the node timing's type, which xcs_engine defines.
+            timing=type(self._timing)(submitted=time.perf_counter()),
+            token=CancellationToken(parent=self._token),
+            is_hedge=is_hedge,
+        )
+        with self._lock:
+            self._attempts.append(attempt)
+            self._running += 1
+        try:
+            attempt.future = self._submit(timing=attempt.timing, token=attempt.token)
+        except BaseException:
+            with self._lock:
+                self._attempts.remove(attempt)
+                self._running -= 1
+            raise
+        attempt.future.add_done_callback(
+            functools.partial(self._on_attempt_done, attempt)
+        )
+        if self._settled:
+            # The node finished while this attempt was being submitted.
+            attempt.token.cancel()
+            attempt.future.cancel()
+        return attempt
+
+    def _hedge(self) -> None:
+        """Timer callback: launch a duplicate if the node is still running."""
+        with self._lock:
+            if self._settled or self._running == 0:
+                return
+        if not self._reserve_hedge():
+            return
+        try:
+            hedge = self._launch(is_hedge=True)
+        except Exception as error:
+            self._release_hedge()
+            logger.debug("Could not launch a hedge for %s: %r", self._key, error)
+            return
+        hedge.future.add_done_callback(lambda _: self._release_hedge())
+
+    def _on_attempt_done(self, attempt: HedgeAttempt, future: Future[Any]) -> None:
+        cancelled = future.cancelled()
+        error = None if cancelled else future.exception()
+        succeeded = not cancelled and error is None
+        if succeeded and attempt.timing.finished is not None:
+            self._policy.observe(
+                self._key, attempt.timing.finished - attempt.timing.submitted
+            )
+        with self._lock:
+            self._running -= 1
+            lost = self._settled
+            if not lost and error is not None and self._error is None:
+                self._error = error
+            # The node is decided by its first success, or by its last failure.
+            decided = not lost and (succeeded or self._running == 0)
+            if decided:
+                self._settled = True
+            first_error = self._error
+            others = [other for other in self._attempts if other is not attempt]
+        if lost:
+            if not self._abandoned:
+                self._policy.record_waste(attempt.timing.run_time or 0.0)
+            return
+        if not decided:
+            return
+        adopt_timing(target=self._timing, source=attempt.timing)
+        if succeeded:
+            if attempt.is_hedge:
+                self._policy.record_hedge_win()
+            for other in others:
+                other.token.cancel()
+                if other.future is not None:
+                    other.future.cancel()
+            self._settle(result=future.result())
+        elif first_error is not None:
+            self._settle(error=first_error)
+        else:
+            self.relay.cancel()
+
+    def _settle(
+        self, *, result: Any = None, error: Optional[BaseException] = None
+    ) -> None:
+        try:
+            if error is not None:
+                self.relay.set_exception(error)
+            else:
+                self.relay.set_result(result)
+        except InvalidStateError:
+            # The scheduler gave up on the node while the attempts ran.
+            pass
+
+    def _on_relay_done(self, relay: Future[Any]) -> None:
+        if not relay.cancelled():
+            return
+        with self._lock:
+            self._settled = True
+            self._abandoned = True
+            attempts = list(self._attempts)
+        for attempt in attempts:
+            attempt.token.cancel()
+            if attempt.future is not None:
+                attempt.future.cancel()
+
+
+def adopt_timing(*, target: NodeTiming, source: NodeTiming) -> None:
+    """Copies an attempt's start, finish and thread into its node's timing."""
+    target.started = source.started
+    target.finished = source.finished
+    target.thread_id = source.thread_id
+    target.thread_name = source.thread_name
+
+
+def observe_latency(
+    policy: HedgingPolicy, key: str, timing: NodeTiming, future: "Future[Any]"
+) -> None:
+    """Done callback teaching a hedging policy the latency of a successful node."""
+    if timing.finished is None or future.cancelled() or future.exception() is not None:
+        return
+    policy.observe(key, timing.finished - timing.submitted)
+
+
+__all__ = [
+    "HedgeAttempt",
+    "HedgedExecution",
+    "adopt_timing",
+    "observe_latency",
+]
@@ -0,0 +1,260 @@
+"""
+Hedged Execution for Straggler Nodes
+
+Provider latency has a heavy tail: most calls finish near the median, but a few
+take many times longer and hold up everything downstream of them. Hedging
+launches a duplicate of a node once it has run longer than almost all of its
+past executions, takes whichever attempt finishes first and cancels the other:
+
+```python
+hedging = HedgingPolicy(percentile=0.95, max_hedge_rate=0.05)
+scheduler = TopologicalSchedulerWithParallelDispatch(hedging=hedging)
+...
+print(hedging.stats.hedge_rate, hedging.stats.wasted_seconds)
+```
+
+Latencies are learned per key: the node's ``resource_class`` hint when it has
+one, so every call to the same model shares a distribution, and otherwise its
+node ID. A node is hedged only once its key has ``min_samples`` observations,
+and never more than one duplicate per execution. ``max_hedge_rate`` caps the
+extra load: a duplicate is only launched while hedges stay below that fraction
+of executions, and when the node has a resource class, only if the class has a
+free slot.
+
+Hedging is only safe for idempotent operators. Nodes whose operators have side
+effects opt out with the ``hedge`` hint:
+
+```python
+graph.add_node(operator=write_row, node_id="store", hedge=False)
+```
+
+Duplicates are launched from a single shared timer thread; the schedulers
+handle the attempts themselves (see hedged_execution).
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ember.xcs.engine.resource_limits import RESOURCE_CLASS_HINT
+
+HEDGE_HINT = "hedge"
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """Snapshot of a hedging policy's counters.
+
+    Attributes:
+        executions: Node executions the policy applied to.
+        hedges: Duplicate attempts launched.
+        hedge_wins: Duplicates that finished before their primary attempt.
+        wasted_seconds: Time the losing attempts ran before they finished or
+            were cancelled.
+    """
+
+    executions: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    wasted_seconds: float = 0.0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of executions that launched a duplicate."""
+        return self.hedges / self.executions if self.executions else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of duplicates that beat their primary attempt."""
+        return self.hedge_wins / self.hedges if self.hedges else 0.0
+
+
+class HedgingPolicy:
+    """Learned hedge delays, a hedge budget and counters, shared across runs.
+
+    A policy may be shared by any number of schedulers and runs; it is
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 256,
+        min_delay: float = 0.0,
+        max_hedge_rate: Optional[float] = 0.1,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile: Latency quantile, in (0, 1), after which a duplicate is
+                launched.
+            min_samples: Observations a key needs before its nodes are hedged.
+            window: Number of most recent latencies kept per key.
+            min_delay: Lower bound on the hedge delay, in seconds.
+            max_hedge_rate: Maximum fraction of executions that may launch a
+                duplicate. None means unbounded.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be in the interval (0, 1).")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("min_samples must be at least 1 and at most window.")
+        if max_hedge_rate is not None and max_hedge_rate < 0:
+            raise ValueError("max_hedge_rate must not be negative.")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_hedge_rate = max_hedge_rate
+        self._window = window
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._wasted = 0.0
+
+    def applies_to(self, node: Any) -> bool:
+        """Whether a node may be hedged (it does not carry ``hedge=False``)."""
+        return node is None or node.get_hint(HEDGE_HINT, True) is not False
+
+    @staticmethod
+    def key_for(*, node_id: str, node: Any) -> str:
+        """Return the key a node's latencies are learned under."""
+        if node is not None:
+            resource_class = node.get_hint(RESOURCE_CLASS_HINT)
+            if resource_class is not None:
+                return str(resource_class)
+        return node_id
+
+    def begin(self, key: str) -> Optional[float]:
+        """Count an execution and return its hedge delay.
+
+        Args:
+            key: The node's latency key.
+
+        Returns:
+            Seconds after dispatch at which to launch a duplicate, or None if the
+            key has too few observations to hedge yet.
+        """
+        with self._lock:
+            self._executions += 1
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, key: str, seconds: float) -> None:
+        """Record how long a successful execution took from dispatch."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def try_hedge(self) -> bool:
+        """Reserve a duplicate within the hedge budget."""
+        with self._lock:
+            if (
+                self.max_hedge_rate is not None
+                and self._hedges + 1 > self.max_hedge_rate * self._executions
+            ):
+                return False
+            self._hedges += 1
+            return True
+
+    def record_hedge_win(self) -> None:
+        """Record that a duplicate finished before its primary attempt."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def record_waste(self, seconds: float) -> None:
+        """Add the time a losing attempt ran before it finished or was cancelled."""
+        with self._lock:
+            self._wasted += seconds
+
+    @property
+    def stats(self) -> HedgingStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return HedgingStats(
+                executions=self._executions,
+                hedges=self._hedges,
+                hedge_wins=self._hedge_wins,
+                wasted_seconds=self._wasted,
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the counters, keeping the learned latencies."""
+        with self._lock:
+            self._executions = self._hedges = self._hedge_wins = 0
+            self._wasted = 0.0
+
+
+class _HedgeTimer:
+    """Single daemon thread that runs callbacks at perf_counter deadlines."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, when: float, callback: Callable[[], None]) -> None:
+        with self._condition:
+            heapq.heappush(self._heap, (when, next(self._sequence), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="xcs-hedge-timer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.perf_counter():
+                    timeout = (
+                        self._heap[0][0] - time.perf_counter() if self._heap else None
+                    )
+                    self._condition.wait(timeout)
+                _, _, callback = heapq.heappop(self._heap)
+            callback()
+
+
+_TIMER = _HedgeTimer()
+
+
+def schedule_hedge(when: float, callback: Callable[[], None]) -> None:
+    """Run ``callback`` on the hedge timer thread at perf_counter time ``when``.
+
+    Callbacks must be quick and must not raise; they typically check whether
+    the primary attempt is still running and submit a duplicate.
+    """
+    _TIMER.schedule(when, callback)
+
+
+def _reset_after_fork() -> None:
+    """Replace the timer; its thread does not exist in a forked child."""
+    global _TIMER
+    _TIMER = _HedgeTimer()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+__all__ = ["HEDGE_HINT", "HedgingPolicy", "HedgingStats", "schedule_hedge"]
@@ -0,0 +1,179 @@
+"""
+Copy-Free Node Inputs for XCS Execution
+
+Every node in a graph sees the global input merged with the outputs of its
+parents. Materializing that merge as a fresh dictionary per node copies the
+global input once per node, which is wasteful when the global input carries
+long documents or large candidate lists and the graph has hundreds of nodes.
+
+``InputView`` is a layered mapping that presents the same merged view without
+copying: lookups walk a short list of layers, highest priority first, and fall
+through to the shared global input. Operators use it like any other mapping
+(``inputs["query"]``, ``inputs.get(...)``, ``**inputs``, ``dict(inputs)``).
+Views are copy-on-write: an operator that assigns or deletes keys gets a
+private merged dictionary on its first write, so the global input and its
+parents' outputs are never modified. Views flatten like dictionaries in the
+XCS tree utilities.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from ember.xcs.utils.tree_util import (
+    AuxType,
+    register_tree,
+    tree_flatten,
+    tree_unflatten,
+)
+
+_MISSING = object()
+
+
+class InputView(MutableMapping):
+    """Copy-on-write mapping that overlays several mappings without copying them.
+
+    Layers are searched in order, so a key in an earlier layer shadows the same
+    key in later layers. Until it is first written to, the view holds references
+    to its layers and reflects their current contents; the first write replaces
+    the layers with a private merged dictionary. The layers themselves are never
+    modified.
+    """
+
+    __slots__ = ("_layers", "_owned")
+
+    def __init__(self, *layers: Mapping) -> None:
+        """Initialize the view.
+
+        Args:
+            *layers: Mappings to overlay, highest priority first.
+        """
+        self._layers: Tuple[Mapping, ...] = layers
+        self._owned = False
+
+    @classmethod
+    def from_parts(
+        cls,
+        *,
+        global_input: Mapping,
+        parent_outputs: Sequence[Mapping],
+        node_attributes: Any = None,
+    ) -> InputView:
+        """Build the input view for a node.
+
+        Parent outputs take precedence over the global input, later parents over
+        earlier ones, and the node's attributes, if any, are exposed under the
+        "node_attributes" key. A single parent's output is referenced directly;
+        several are flattened into one small layer so that lookups stay cheap on
+        nodes with wide fan-in. The global input is never copied.
+
+        Args:
+            global_input: Input shared by every node in the graph.
+            parent_outputs: Mapping outputs of the node's parents, in merge order.
+            node_attributes: The node's attributes, or None/empty to omit them.
+
+        Returns:
+            The node's input view.
+        """
+        layers = []
+        if node_attributes:
+            layers.append({"node_attributes": node_attributes})
+        if len(parent_outputs) == 1:
+            layers.append(parent_outputs[0])
+        elif parent_outputs:
+            merged: Dict[str, Any] = {}
+            for output in parent_outputs:
+                merged.update(output)
+            layers.append(merged)
+        layers.append(global_input)
+        return cls(*layers)
+
+    @property
+    def base(self) -> Mapping:
+        """The lowest layer: the global input, for unwritten views from from_parts."""
+        return self._layers[-1] if self._layers else {}
+
+    def __getitem__(self, key: Any) -> Any:
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[Any]:
+        if len(self._layers) == 1:
+            return iter(self._layers[0])
+        # Keys come out in the order a dict built by successive updates from
+        # the lowest layer to the highest would produce.
+        seen = set()
+        keys = []
+        for layer in reversed(self._layers):
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    keys.append(key)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        if len(self._layers) == 1:
+            return len(self._layers[0])
+        return len(set().union(*self._layers))
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._own()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self._own()[key]
+
+    def _own(self) -> Dict[str, Any]:
+        """Return the view's private dictionary, merging the layers on first use."""
+        if not self._owned:
+            self._layers = (self.copy(),)
+            self._owned = True
+        return self._layers[0]
+
+    def copy(self) -> Dict[str, Any]:
+        """Return the merged contents as a new, mutable dictionary.
+
+        Returns:
+            A shallow copy of the view's contents.
+        """
+        merged: Dict[str, Any] = {}
+        for layer in reversed(self._layers):
+            merged.update(layer)
+        return merged
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickle as a flat dictionary so that views cross process boundaries
+        # without dragging the layers' other contents along.
+        return (dict, (self.copy(),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.copy()!r})"
+
+
+def _flatten_view(view: InputView) -> Tuple[List[Any], AuxType]:
+    """Flatten a view exactly as its merged dictionary would flatten."""
+    return tree_flatten(tree=view.copy())
+
+
+def _unflatten_view(aux: AuxType, children: List[Any]) -> Dict[str, Any]:
+    """Rebuild a flattened view as a plain dictionary."""
+    return tree_unflatten(aux=aux, children=children)
+
+
+register_tree(cls=InputView, flatten_func=_flatten_view, unflatten_func=_unflatten_view)
+
+
+__all__ = ["InputView"]
@@ -0,0 +1,397 @@
+"""
+Saving and Loading Graphs and Compiled Plans
+
+A serving process should not have to trace and compile its pipelines again on
+every restart. ``save_plan`` writes a compiled plan to disk and ``load_plan``
+restores it ready to execute, without sorting the graph again:
+
+```python
+save_plan(compile_graph(graph=graph), "plans/qa.xcs.json")
+
+# At startup:
+plan = load_plan("plans/qa.xcs.json")
+results = execute_graph(graph=plan, global_input=inputs)
+```
+
+``save_graph`` and ``load_graph`` do the same for an uncompiled graph.
+
+Operators are stored by reference, never pickled. An operator is referenced by
+the key it was registered under with ``register_operator``, or otherwise by
+its importable ``module:qualname`` name, which covers module-level functions
+and classes. Operator instances (for example a configured ensemble) must be
+registered under the same key in the loading process before the file is
+loaded. Fused chains (see fusion.py) are stored as their member nodes.
+
+The file is JSON. Node IDs are stored once and edges refer to nodes by index,
+operators shared by several nodes are stored once, and only nodes that carry
+attributes store them. Attributes must therefore be JSON-serializable; tuples
+come back as lists. Each node's inbound edges keep their order, which
+determines how parent outputs are merged. Captured inputs and outputs are not
+saved.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from ember.xcs.engine.fusion import FusedChain
+from ember.xcs.engine.xcs_engine import XCSPlan, XCSPlanTask
+from ember.xcs.exceptions import GraphSerializationError
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode
+
+_FORMAT = "ember.xcs"
+_FORMAT_VERSION = 1
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_registry_lock = threading.Lock()
+_operators_by_key: Dict[str, Callable[..., Any]] = {}
+_keys_by_operator: Dict[int, str] = {}
+
+
+def register_operator(key: str, operator: Callable[..., Any]) -> Callable[..., Any]:
+    """Registers an operator under a stable key for saving and loading graphs.
+
+    Register every operator that has no importable name, in both the process
+    that saves a graph and the processes that load it.
+
+    Args:
+        key: Name the operator is stored under.
+        operator: The operator.
+
+    Returns:
+        The operator, so the call can wrap its construction.
+
+    Raises:
+        ValueError: If key is already registered to a different operator.
+    """
+    with _registry_lock:
+        registered = _operators_by_key.get(key)
+        if registered is not None and registered is not operator:
+            raise ValueError(f"Operator key '{key}' is already registered.")
+        _operators_by_key[key] = operator
+        _keys_by_operator[id(operator)] = key
+    return operator
+
+
+def save_graph(graph: XCSGraph, path: PathLike) -> None:
+    """Writes a graph to a file.
+
+    Args:
+        graph: Graph to save.
+        path: Destination file. It is replaced atomically.
+
+    Raises:
+        GraphSerializationError: If an operator cannot be referenced or an
+            attribute is not JSON-serializable.
+    """
+    _write(_encode_graph(graph, kind="graph"), path)
+
+
+def load_graph(path: PathLike, *, graph_type: Type[Any] = XCSGraph) -> Any:
+    """Reads a graph saved by save_graph, or the graph of a saved plan.
+
+    Args:
+        path: File to read.
+        graph_type: Graph class to build, such as XCSGraph or CompactXCSGraph.
+
+    Returns:
+        The restored graph.
+
+    Raises:
+        GraphSerializationError: If the file is not a saved graph or plan, or an
+            operator cannot be resolved.
+    """
+    graph, _ = _decode_graph(_read(path), graph_type=graph_type)
+    return graph
+
+
+def save_plan(plan: XCSPlan, path: PathLike) -> None:
+    """Writes a compiled plan to a file.
+
+    The plan's graph (the fused graph, for a plan compiled with fuse=True) is
+    saved together with its topological levels.
+
+    Args:
+        plan: Plan to save.
+        path: Destination file. It is replaced atomically.
+
+    Raises:
+        GraphSerializationError: If an operator cannot be referenced or an
+            attribute is not JSON-serializable.
+    """
+    document = _encode_graph(plan.original_graph, kind="plan")
+    index_of = {node_id: index for index, node_id in enumerate(document["node_ids"])}
+    document["levels"] = [
+        [index_of[node_id] for node_id in level] for level in plan.levels
+    ]
+    _write(document, path)
+
+
+def load_plan(path: PathLike, *, graph_type: Type[Any] = XCSGraph) -> XCSPlan:
+    """Reads a plan saved by save_plan.
+
+    A file written by save_graph is accepted too; its graph is compiled.
+
+    Args:
+        path: File to read.
+        graph_type: Graph class to build for the plan's original_graph.
+
+    Returns:
+        A plan ready to pass to execute_graph or a scheduler.
+
+    Raises:
+        GraphSerializationError: If the file is not a saved graph or plan, or an
+            operator cannot be resolved.
+    """
+    document = _read(path)
+    graph, node_ids = _decode_graph(document, graph_type=graph_type)
+    tasks = {
+        node.node_id: XCSPlanTask(
+            node_id=node.node_id,
+            operator=node.operator,
+            inbound_nodes=list(node.inbound_edges),
+        )
+        for node in graph.nodes.values()
+    }
+    levels = document.get("levels")
+    try:
+        return XCSPlan(
+            tasks=tasks,
+            original_graph=graph,
+            levels=(
+                tuple(tuple(node_ids[index] for index in level) for level in levels)
+                if levels is not None
+                else None
+            ),
+        )
+    except (ValueError, KeyError, IndexError, TypeError) as error:
+        raise GraphSerializationError(
+            f"'{os.fspath(path)}' does not hold a valid plan: {error}"
+        ) from error
+
+
+# ------------------------------------------------------------------------------
+# Encoding
+# ------------------------------------------------------------------------------
+
+
+class _OperatorTable:
+    """Operator references of a file, each stored once."""
+
+    def __init__(self) -> None:
+        self.references: List[Any] = []
+        self._index_of: Dict[int, int] = {}
+
+    def index(self, operator: Callable[..., Any], *, node_id: str) -> int:
+        index = self._index_of.get(id(operator))
+        if index is None:
+            reference = self._reference(operator, node_id=node_id)
+            index = self._index_of[id(operator)] = len(self.references)
+            self.references.append(reference)
+        return index
+
+    def _reference(self, operator: Callable[..., Any], *, node_id: str) -> Any:
+        with _registry_lock:
+            key = _keys_by_operator.get(id(operator))
+            if key is not None and _operators_by_key.get(key) is not operator:
+                key = None
+        if key is not None:
+            return {"key": key}
+        if isinstance(operator, FusedChain):
+            return {
+                "chain": [
+                    [
+                        member.node_id,
+                        self.index(member.operator, node_id=member.node_id),
+                        member.attributes or None,
+                    ]
+                    for member in operator.nodes
+                ],
+                "capture_outputs": operator.capture_outputs,
+            }
+        name = _importable_name(operator)
+        if name is None:
+            raise GraphSerializationError(
+                f"Operator {operator!r} of node '{node_id}' has no importable name; "
+                "register it with register_operator before saving."
+            )
+        return name
+
+
+def _importable_name(operator: Any) -> Optional[str]:
+    """Return ``module:qualname`` if importing that name yields the operator."""
+    module = getattr(operator, "__module__", None)
+    qualname = getattr(operator, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        return None
+    if "<" in qualname:
+        return None
+    name = f"{module}:{qualname}"
+    try:
+        resolved = _import(name)
+    except GraphSerializationError:
+        return None
+    return name if resolved is operator else None
+
+
+def _encode_graph(graph: XCSGraph, *, kind: str) -> Dict[str, Any]:
+    operators = _OperatorTable()
+    node_ids: List[str] = []
+    node_operators: List[int] = []
+    attributes: List[List[Any]] = []
+    for index, (node_id, node) in enumerate(graph.nodes.items()):
+        node_ids.append(node_id)
+        node_operators.append(operators.index(node.operator, node_id=node_id))
+        if node.attributes:
+            attributes.append([index, node.attributes])
+
+    index_of = {node_id: index for index, node_id in enumerate(node_ids)}
+    inbound = [
+        [index_of[parent] for parent in graph.nodes[node_id].inbound_edges]
+        for node_id in node_ids
+    ]
+    return {
+        "format": _FORMAT,
+        "version": _FORMAT_VERSION,
+        "kind": kind,
+        "operators": operators.references,
+        "node_ids": node_ids,
+        "node_operators": node_operators,
+        "attributes": attributes,
+        "inbound": inbound,
+        "entry": index_of.get(graph.entry_node) if graph.entry_node else None,
+        "exit": index_of.get(graph.exit_node) if graph.exit_node else None,
+    }
+
+
+def _write(document: Dict[str, Any], path: PathLike) -> None:
+    try:
+        payload = json.dumps(document, separators=(",", ":"))
+    except (TypeError, ValueError) as error:
+        node_ids = document["node_ids"]
+        for index, node_attributes in document["attributes"]:
+            try:
+                json.dumps(node_attributes)
+            except (TypeError, ValueError):
+                raise GraphSerializationError(
+                    f"Attributes of node '{node_ids[index]}' are not "
+                    f"JSON-serializable: {error}"
+                ) from error
+        raise GraphSerializationError(f"Cannot serialize graph: {error}") from error
+
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(payload)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+
+# ------------------------------------------------------------------------------
+# Decoding
+# ------------------------------------------------------------------------------
+
+
+def _read(path: PathLike) -> Dict[str, Any]:
+    path = os.fspath(path)
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            document = json.load(file)
+        except ValueError as error:
+            raise GraphSerializationError(
+                f"'{path}' is not a saved graph or plan: {error}"
+            ) from error
+    if not isinstance(document, dict) or document.get("format") != _FORMAT:
+        raise GraphSerializationError(f"'{path}' is not a saved graph or plan.")
+    if document.get("version") != _FORMAT_VERSION:
+        raise GraphSerializationError(
+            f"'{path}' uses format version {document.get('version')}; "
+            f"expected {_FORMAT_VERSION}."
+        )
+    return document
+
+
+def _import(name: str) -> Any:
+    module_name, _, qualname = name.partition(":")
+    try:
+        value: Any = importlib.import_module(module_name)
+        for attribute in qualname.split("."):
+            value = getattr(value, attribute)
+    except (ImportError, AttributeError, ValueError) as error:
+        raise GraphSerializationError(
+            f"Cannot import operator '{name}': {error}"
+        ) from error
+    return value
+
+
+def _resolve(reference: Any, operators: List[Any]) -> Any:
+    if isinstance(reference, str):
+        return _import(reference)
+    if "key" in reference:
+        with _registry_lock:
+            operator = _operators_by_key.get(reference["key"])
+        if operator is None:
+            raise GraphSerializationError(
+                f"No operator is registered under '{reference['key']}'; "
+                "call register_operator before loading."
+            )
+        return operator
+    members = []
+    for node_id, operator_index, node_attributes in reference["chain"]:
+        member = XCSNode(operator=operators[operator_index], node_id=node_id)
+        member.attributes = node_attributes or {}
+        members.append(member)
+    return FusedChain(nodes=members, capture_outputs=reference["capture_outputs"])
+
+
+def _decode_graph(
+    document: Dict[str, Any], *, graph_type: Type[Any]
+) -> Tuple[Any, List[str]]:
+    operators: List[Any] = []
+    for reference in document["operators"]:
+        operators.append(_resolve(reference, operators))
+
+    node_ids: List[str] = document["node_ids"]
+    graph = graph_type()
+    for node_id, operator_index in zip(node_ids, document["node_operators"]):
+        graph.add_node(operator=operators[operator_index], node_id=node_id)
+    for index, node_attributes in document["attributes"]:
+        graph.nodes[node_ids[index]].attributes = node_attributes
+    if type(graph) is XCSGraph:
+        # Saved edges are already validated and free of duplicates, so the
+        # edge lists are filled in directly rather than through add_edge.
+        nodes = [graph.nodes[node_id] for node_id in node_ids]
+        for node, parents in zip(nodes, document["inbound"]):
+            node.inbound_edges = [node_ids[parent] for parent in parents]
+            for parent in parents:
+                nodes[parent].outbound_edges.append(node.node_id)
+    else:
+        for node_id, parents in zip(node_ids, document["inbound"]):
+            for parent in parents:
+                graph.add_edge(from_id=node_ids[parent], to_id=node_id)
+
+    entry, exit_ = document["entry"], document["exit"]
+    graph.entry_node = node_ids[entry] if entry is not None else None
+    graph.exit_node = node_ids[exit_] if exit_ is not None else None
+    return graph, node_ids
+
+
+__all__ = [
+    "load_graph",
+    "load_plan",
+    "register_operator",
+    "save_graph",
+    "save_plan",
+]
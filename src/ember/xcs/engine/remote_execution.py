@@ -0,0 +1,148 @@
+"""
+Out-of-Process Node Execution Helpers
+
+Schedulers that run nodes in other processes (see xcs_process_scheduler and
+xcs_distributed_scheduler) pickle each node's operator and inputs, hand them to
+a worker, and relay the worker's report back to the dispatch loop. This module
+holds the parts they share, so that serialization errors, timing and captured
+outputs behave the same whichever pool runs the node.
+
+Inputs gathered as an InputView arrive in the worker as an InputView of two
+layers, the global input and everything layered over it, so that operators
+which tell the two apart (such as fused chains) see them as on a thread.
+"""
+
+from __future__ import annotations
+
+import pickle
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Dict, Mapping, Tuple
+
+from ember.xcs.engine.input_view import InputView
+from ember.xcs.engine.xcs_engine import NodeTiming
+from ember.xcs.exceptions import OperatorNotPicklableError
+from ember.xcs.graph.xcs_graph import XCSNode
+
+
+def serialize_node(
+    *,
+    node_id: str,
+    operator: Any,
+    input_data: Mapping[str, Any],
+    placement: str,
+    remedy: str = "",
+) -> Tuple[bytes, bytes]:
+    """Pickle a node's operator and inputs with a descriptive error.
+
+    Args:
+        node_id: ID of the node being dispatched.
+        operator: The node's operator.
+        input_data: The node's gathered inputs.
+        placement: Why the node leaves the process, completing "Node 'x' ...".
+        remedy: Alternative offered when the operator cannot be pickled,
+            appended to the advice to use a module-level function.
+
+    Returns:
+        The pickled operator and the pickled inputs.
+
+    Raises:
+        OperatorNotPicklableError: If the operator or its inputs cannot be pickled.
+    """
+    try:
+        operator_payload = pickle.dumps(operator)
+    except Exception as exc:
+        raise OperatorNotPicklableError(
+            f"Node '{node_id}' {placement}, but its operator {operator!r} cannot "
+            f"be pickled ({exc}). Use a module-level function or class "
+            f"instance{remedy}."
+        ) from exc
+    try:
+        if isinstance(input_data, InputView):
+            return operator_payload, pickle.dumps(_LayeredInputs(input_data))
+        return operator_payload, pickle.dumps(dict(input_data))
+    except Exception as exc:
+        raise OperatorNotPicklableError(
+            f"Node '{node_id}' {placement}, but its inputs cannot be pickled ({exc})."
+        ) from exc
+
+
+class _LayeredInputs:
+    """Pickles as an InputView of a view's global input and the layers above it.
+
+    InputViews themselves pickle flat, which would merge the global input into
+    the node's parent outputs and attributes.
+    """
+
+    __slots__ = ("above", "base")
+
+    def __init__(self, view: InputView) -> None:
+        self.base: Dict[str, Any] = dict(view.base)
+        self.above: Dict[str, Any] = {
+            key: value
+            for key, value in view.items()
+            if key not in self.base or self.base[key] is not value
+        }
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (InputView, (self.above, self.base))
+
+
+def failed_future(error: BaseException) -> Future[Any]:
+    """A future that has already failed, so the failure policy sees the error."""
+    future: Future[Any] = Future()
+    future.set_exception(error)
+    return future
+
+
+def relay_remote_result(
+    *, remote: Future[Any], node: XCSNode, timing: NodeTiming, worker_name: str
+) -> Future[Any]:
+    """Relay a worker's (result, duration, pid) report as the node's result.
+
+    The node's outputs are captured and its timing filled in before the
+    returned future resolves. Cancelling the returned future withdraws the
+    work if no worker has picked it up yet.
+
+    Args:
+        remote: Future of the worker's report.
+        node: The node being executed.
+        timing: The node's timing record.
+        worker_name: Prefix of the worker's name in the timing record; the
+            worker's process ID is appended.
+
+    Returns:
+        A future resolving with the operator's result or exception.
+    """
+    future: Future[Any] = Future()
+    future.add_done_callback(
+        lambda relay: remote.cancel() if relay.cancelled() else None
+    )
+
+    def capture(done: Future[Any]) -> None:
+        timing.finished = time.perf_counter()
+        if done.cancelled():
+            future.cancel()
+            return
+        try:
+            error = done.exception()
+            if error is not None:
+                future.set_exception(error)
+                return
+            result, run_time, worker_pid = done.result()
+            # Clocks are not comparable across processes; only the duration is.
+            timing.started = timing.finished - run_time
+            timing.thread_name = f"{worker_name}-{worker_pid}"
+            # Captured before the node is reported complete, so whoever sees
+            # the result also sees it on the graph.
+            node.captured_outputs = result
+            future.set_result(result)
+        except InvalidStateError:
+            # The scheduler gave up on the node while it ran remotely.
+            pass
+
+    remote.add_done_callback(capture)
+    return future
+
+
+__all__ = ["failed_future", "relay_remote_result", "serialize_node"]
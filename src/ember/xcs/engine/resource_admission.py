@@ -0,0 +1,109 @@
+"""
+Dispatch Admission Under Resource-Class Limits
+
+Schedulers hold back ready nodes whose resource class is at capacity (see
+resource_limits) without tying up a worker. ``ResourceAdmission`` sits between
+a run's ready queue and its dispatch loop: it hands out the next task whose
+class has a free slot, reserving that slot, parks the others in arrival order,
+and releases each slot when its task's future finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple, Union
+
+from ember.xcs.engine.resource_limits import RESOURCE_CLASS_HINT, ResourceLimits
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+if TYPE_CHECKING:
+    from ember.xcs.engine.xcs_engine import ReadyQueue
+
+
+class ResourceAdmission:
+    """
+    Releases ready tasks for dispatch while their resource classes have capacity.
+
+    Tasks whose class is at its limit are parked, in the order the ready queue
+    produced them, and are offered again before newer tasks of the same class
+    once a slot frees up. Tasks without a resource class are never held back.
+    """
+
+    def __init__(
+        self, *, ready: ReadyQueue, graph: XCSGraph, limits: ResourceLimits
+    ) -> None:
+        """
+        Initialize admission for a single run.
+
+        Args:
+            ready: The run's ready queue
+            graph: Original graph containing node definitions
+            limits: Capacities to enforce. If none are configured when the run
+                starts, resource classes are ignored for the whole run.
+        """
+        self._ready = ready
+        self._graph = graph
+        self._limits = limits
+        self.enabled = limits.active
+        self._parked: Dict[str, Deque[str]] = {}
+
+    @property
+    def waiting(self) -> bool:
+        """Whether tasks are parked until capacity frees up."""
+        return bool(self._parked)
+
+    def next_task(self) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Returns the next task that may be dispatched, reserving its slot.
+
+        Returns:
+            The task ID and the resource class the caller must release once the
+            task finishes (None if it has none), or None if no task can run now
+        """
+        for resource_class, parked in self._parked.items():
+            if self._limits.try_acquire(resource_class):
+                task_id = parked.popleft()
+                if not parked:
+                    del self._parked[resource_class]
+                return task_id, resource_class
+        while self._ready:
+            task_id = self._ready.pop()
+            resource_class = self._resource_class(task_id)
+            if resource_class is None:
+                return task_id, None
+            if resource_class not in self._parked and self._limits.try_acquire(
+                resource_class
+            ):
+                return task_id, resource_class
+            self._parked.setdefault(resource_class, deque()).append(task_id)
+        return None
+
+    def release_when_done(
+        self,
+        future: Union["Future[Any]", "asyncio.Future[Any]"],
+        resource_class: Optional[str],
+    ) -> None:
+        """
+        Returns a task's slot once its future finishes, however it finishes.
+
+        Args:
+            future: The task's future
+            resource_class: The class reserved by next_task, or None
+        """
+        if resource_class is not None:
+            limits = self._limits
+            future.add_done_callback(lambda _: limits.release(resource_class))
+
+    def _resource_class(self, task_id: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        node = self._graph.nodes.get(task_id)
+        if node is None:
+            return None
+        resource_class = node.get_hint(RESOURCE_CLASS_HINT)
+        return str(resource_class) if resource_class is not None else None
+
+
+__all__ = ["ResourceAdmission"]
@@ -0,0 +1,217 @@
+"""
+Resource-Class Concurrency Limits for XCS Execution
+
+A wide graph can launch hundreds of simultaneous calls against one provider and
+trip its rate limits while other providers sit idle. Capping ``max_workers``
+throttles every node alike; resource classes throttle only the nodes that share
+a bottleneck.
+
+A node declares its class with the ``resource_class`` hint:
+
+```python
+graph.add_node(operator=ask_gpt, node_id="a", resource_class="openai:gpt-4o")
+graph.add_node(operator=ask_claude, node_id="b", resource_class="anthropic:claude-3")
+```
+
+and ``ResourceLimits`` holds the capacity of each class:
+
+```python
+configure_resource_limits({"openai": 16, "openai:gpt-4o": 4, "anthropic": 8})
+```
+
+Classes are hierarchical on ``":"``: a node of class ``"openai:gpt-4o"`` counts
+against both the ``"openai:gpt-4o"`` and the ``"openai"`` limits, so a provider
+can be capped as a whole while individual models get tighter caps. Classes
+without a configured limit are unbounded.
+
+Schedulers enforce limits when dispatching: a ready node whose class is at
+capacity waits in the scheduler, not on a worker thread, so saturated providers
+never tie up workers that other providers could use. By default every scheduler
+shares the process-wide limits returned by ``get_resource_limits``, so capacity
+is respected across concurrent graph runs as well as within one.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RESOURCE_CLASS_HINT = "resource_class"
+_SEPARATOR = ":"
+
+
+class ResourceLimits:
+    """Thread-safe per-class capacity counters shared by schedulers.
+
+    Schedulers call ``try_acquire`` before dispatching a node of a class and
+    ``release`` once the node has finished. Listeners registered with
+    ``add_listener`` are called after every release so that a scheduler holding
+    back nodes can retry them.
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, int]] = None) -> None:
+        """Initialize the limits.
+
+        Args:
+            limits: Maximum number of concurrently running nodes per class.
+
+        Raises:
+            ValueError: If a limit is smaller than one.
+        """
+        self._lock = threading.Lock()
+        self._limits: Dict[str, int] = {}
+        self._in_use: Dict[str, int] = {}
+        self._scopes: Dict[str, Tuple[str, ...]] = {}
+        self._listeners: List[Callable[[], None]] = []
+        for resource_class, limit in (limits or {}).items():
+            self.set_limit(resource_class, limit)
+
+    def set_limit(self, resource_class: str, limit: Optional[int]) -> None:
+        """Set or remove the capacity of a class.
+
+        Lowering a limit never interrupts running nodes; it only holds back new
+        ones until usage drops below it.
+
+        Args:
+            resource_class: The class to limit, e.g. "openai" or "openai:gpt-4o".
+            limit: Maximum number of concurrently running nodes, or None to
+                remove the limit.
+
+        Raises:
+            ValueError: If the limit is smaller than one.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(
+                f"Limit for resource class '{resource_class}' must be at least 1, "
+                f"got {limit}."
+            )
+        with self._lock:
+            if limit is None:
+                self._limits.pop(resource_class, None)
+            else:
+                self._limits[resource_class] = limit
+        self._notify()
+
+    def limit(self, resource_class: str) -> Optional[int]:
+        """Return the capacity configured for a class, if any."""
+        with self._lock:
+            return self._limits.get(resource_class)
+
+    def in_use(self, resource_class: str) -> int:
+        """Return how many running nodes count against a class."""
+        with self._lock:
+            return self._in_use.get(resource_class, 0)
+
+    @property
+    def active(self) -> bool:
+        """Whether any limit is configured."""
+        return bool(self._limits)
+
+    def try_acquire(self, resource_class: str) -> bool:
+        """Reserve a slot for a node of the given class without blocking.
+
+        Args:
+            resource_class: The node's class.
+
+        Returns:
+            True if the class and all of its parent classes had capacity and a
+            slot was reserved, False if any of them is at its limit.
+        """
+        scopes = self._scopes_of(resource_class)
+        with self._lock:
+            for scope in scopes:
+                limit = self._limits.get(scope)
+                if limit is not None and self._in_use.get(scope, 0) >= limit:
+                    return False
+            for scope in scopes:
+                self._in_use[scope] = self._in_use.get(scope, 0) + 1
+        return True
+
+    def release(self, resource_class: str) -> None:
+        """Return a slot reserved by try_acquire and wake waiting schedulers.
+
+        Args:
+            resource_class: The class the slot was reserved for.
+        """
+        with self._lock:
+            for scope in self._scopes_of(resource_class):
+                self._in_use[scope] -= 1
+        self._notify()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callable to run, on the releasing thread, after each release.
+
+        Args:
+            listener: Callable taking no arguments. It must be fast and must not
+                call back into this object's acquire or release methods.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """Unregister a listener added with add_listener."""
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def _scopes_of(self, resource_class: str) -> Tuple[str, ...]:
+        """Return the class and its parent classes, e.g. ("a:b:c", "a:b", "a")."""
+        scopes = self._scopes.get(resource_class)
+        if scopes is None:
+            parts = resource_class.split(_SEPARATOR)
+            scopes = tuple(
+                _SEPARATOR.join(parts[:end]) for end in range(len(parts), 0, -1)
+            )
+            self._scopes[resource_class] = scopes
+        return scopes
+
+    def _notify(self) -> None:
+        """Call every listener, logging rather than propagating their errors."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener()
+            except Exception:
+                logger.exception("Resource limit listener failed")
+
+
+_RESOURCE_LIMITS = ResourceLimits()
+
+
+def get_resource_limits() -> ResourceLimits:
+    """Return the process-wide resource limits shared by default by all schedulers.
+
+    Returns:
+        The shared ResourceLimits instance.
+    """
+    return _RESOURCE_LIMITS
+
+
+def configure_resource_limits(limits: Mapping[str, Optional[int]]) -> ResourceLimits:
+    """Set capacities on the process-wide resource limits.
+
+    Classes not mentioned keep their current limits; pass None to remove one.
+
+    Args:
+        limits: Maximum number of concurrently running nodes per class.
+
+    Returns:
+        The shared ResourceLimits instance.
+
+    Raises:
+        ValueError: If a limit is smaller than one.
+    """
+    for resource_class, limit in limits.items():
+        _RESOURCE_LIMITS.set_limit(resource_class, limit)
+    return _RESOURCE_LIMITS
+
+
+__all__ = [
+    "RESOURCE_CLASS_HINT",
+    "ResourceLimits",
+    "configure_resource_limits",
+    "get_resource_limits",
+]
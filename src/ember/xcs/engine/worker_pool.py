@@ -0,0 +1,410 @@
+"""
+Local Worker Daemons for Distributed XCS Execution
+
+``LocalWorkerPool`` starts a fixed number of long-lived worker processes and
+talks to each over its own local socket pair (``multiprocessing.Pipe``); no
+external services are involved. Tasks are pickled operator/input pairs, and
+workers send back pickled results or exceptions.
+
+Unlike ``concurrent.futures.ProcessPoolExecutor``, which becomes unusable as
+soon as one worker dies, the pool survives worker failure: a worker that
+crashes (segfault, ``os._exit``, out-of-memory kill) is restarted and the task
+it was running is retried, up to ``max_retries`` times, before the task fails
+with WorkerCrashedError. Exceptions raised by operators are not retried.
+
+Each worker keeps a small cache of unpickled operators keyed by a digest of
+their pickled form, so a stream of runs of the same graph ships and unpickles
+every operator once per worker rather than once per task.
+
+Every worker is served by a parent-side thread that feeds it one task at a
+time from a shared queue, so idle workers pick up the next task as soon as they
+are free.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, List, Optional, Set, Tuple
+
+from ember.xcs.exceptions import WorkerCrashedError
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_RUN = "run"
+_STOP = "stop"
+_OK = "ok"
+_ERROR = "error"
+_NEED_OPERATOR = "need_operator"
+
+_OPERATOR_CACHE_SIZE = 256
+
+
+def operator_digest(operator_payload: bytes) -> bytes:
+    """Return the cache key workers use for a pickled operator."""
+    return hashlib.blake2b(operator_payload, digest_size=16).digest()
+
+
+def _dump_error(error: BaseException) -> bytes:
+    """Pickle an exception raised in a worker, falling back to a description."""
+    error.add_note("Remote traceback:\n" + "".join(traceback.format_exception(error)))
+    try:
+        payload = pickle.dumps(error)
+        pickle.loads(payload)
+        return payload
+    except Exception:
+        return pickle.dumps(RuntimeError(f"{type(error).__name__}: {error}"))
+
+
+def _worker_main(conn: Any) -> None:
+    """Worker-process loop: run tasks received on ``conn`` until told to stop.
+
+    Args:
+        conn: The worker's end of its pipe to the parent.
+    """
+    operators: "OrderedDict[bytes, Any]" = OrderedDict()
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] == _STOP:
+            return
+        _, key, operator_payload, inputs_payload = message
+        operator = operators.get(key)
+        started = time.perf_counter()
+        try:
+            if operator is None:
+                if operator_payload is None:
+                    conn.send((_NEED_OPERATOR,))
+                    continue
+                operator = pickle.loads(operator_payload)
+                operators[key] = operator
+                if len(operators) > _OPERATOR_CACHE_SIZE:
+                    operators.popitem(last=False)
+            else:
+                operators.move_to_end(key)
+            started = time.perf_counter()
+            result = operator(inputs=pickle.loads(inputs_payload))
+            reply = (_OK, pickle.dumps(result), time.perf_counter() - started)
+        except BaseException as error:
+            reply = (_ERROR, _dump_error(error), time.perf_counter() - started)
+        conn.send(reply)
+
+
+class _Job:
+    """A task waiting for or running on a worker."""
+
+    __slots__ = ("future", "key", "operator_payload", "inputs_payload", "attempts")
+
+    def __init__(
+        self,
+        *,
+        future: Future,
+        key: bytes,
+        operator_payload: bytes,
+        inputs_payload: bytes,
+    ) -> None:
+        self.future = future
+        self.key = key
+        self.operator_payload = operator_payload
+        self.inputs_payload = inputs_payload
+        self.attempts = 0
+
+
+class _WorkerSlot:
+    """Parent-side handle on one worker process and the operators it holds."""
+
+    def __init__(self, *, context: Any, index: int) -> None:
+        self._context = context
+        self.index = index
+        self.process: Any = None
+        self.conn: Any = None
+        self.loaded: Set[bytes] = set()
+        self.start()
+
+    def start(self) -> None:
+        parent_conn, child_conn = self._context.Pipe(duplex=True)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name=f"xcs-worker-process-{self.index}",
+            daemon=True,
+        )
+        process.start()
+        # Close our copy of the child's end so a dead worker reads as EOF.
+        child_conn.close()
+        self.process, self.conn = process, parent_conn
+        self.loaded = set()
+
+    def restart(self) -> None:
+        self.stop(wait=False)
+        self.start()
+
+    def stop(self, *, wait: bool) -> None:
+        try:
+            self.conn.send((_STOP,))
+        except (OSError, ValueError):
+            pass
+        if wait:
+            self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+    def call(self, job: _Job) -> Tuple[str, bytes, float]:
+        """Run a job on this worker and return its raw reply.
+
+        Raises:
+            EOFError, OSError: If the worker died.
+        """
+        send_operator = job.key not in self.loaded
+        self.conn.send(
+            (
+                _RUN,
+                job.key,
+                job.operator_payload if send_operator else None,
+                job.inputs_payload,
+            )
+        )
+        reply = self.conn.recv()
+        if reply[0] == _NEED_OPERATOR:
+            # The worker evicted the operator from its cache; ship it again.
+            self.conn.send((_RUN, job.key, job.operator_payload, job.inputs_payload))
+            reply = self.conn.recv()
+        self.loaded.add(job.key)
+        return reply
+
+
+class LocalWorkerPool:
+    """Pool of local worker processes with restart-and-retry on worker failure.
+
+    Workers are started on first use. The pool is a context manager; leaving
+    the context shuts the workers down.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        max_retries: int = 2,
+        start_method: str = "spawn",
+    ) -> None:
+        """Initialize the pool without starting any processes.
+
+        Args:
+            workers: Number of worker processes. None means the number of CPUs.
+            max_retries: How many times a task is retried on a fresh worker when
+                the worker running it dies.
+            start_method: multiprocessing start method. "spawn" keeps workers
+                free of the parent's threads and locks.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}.")
+        self._size = workers or os.cpu_count() or 1
+        self._max_retries = max_retries
+        self._context = multiprocessing.get_context(start_method)
+        self._jobs: "queue.SimpleQueue[Optional[_Job]]" = queue.SimpleQueue()
+        self._slots: List[_WorkerSlot] = []
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self.restarts = 0
+
+    @property
+    def size(self) -> int:
+        """Number of worker processes."""
+        return self._size
+
+    @property
+    def worker_pids(self) -> List[int]:
+        """Process IDs of the running workers, once started."""
+        return [slot.process.pid for slot in self._slots]
+
+    def submit(self, *, operator_payload: bytes, inputs_payload: bytes) -> Future:
+        """Queue a pickled operator call.
+
+        Args:
+            operator_payload: The pickled operator.
+            inputs_payload: The pickled input dictionary.
+
+        Returns:
+            A future resolving to (result, seconds the operator ran, worker pid),
+            or to the operator's exception. Cancelling it withdraws the task if
+            no worker has picked it up yet.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+        """
+        self._ensure_started()
+        future: Future = Future()
+        self._jobs.put(
+            _Job(
+                future=future,
+                key=operator_digest(operator_payload),
+                operator_payload=operator_payload,
+                inputs_payload=inputs_payload,
+            )
+        )
+        return future
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the workers. Queued tasks that have not started are cancelled.
+
+        Args:
+            wait: Whether to wait for running tasks and worker processes to finish.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            started = self._started
+        if not started:
+            return
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job.future.cancel()
+        for _ in self._threads:
+            self._jobs.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> LocalWorkerPool:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def _ensure_started(self) -> None:
+        if self._started:
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit tasks to a pool that was shut down.")
+            if self._started:
+                return
+            for index in range(self._size):
+                slot = _WorkerSlot(context=self._context, index=index)
+                thread = threading.Thread(
+                    target=self._serve,
+                    args=(slot,),
+                    name=f"xcs-worker-feeder-{index}",
+                    daemon=True,
+                )
+                self._slots.append(slot)
+                self._threads.append(thread)
+                thread.start()
+            self._started = True
+
+    def _serve(self, slot: _WorkerSlot) -> None:
+        """Feed queued jobs to one worker until the pool shuts down."""
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                if job.future.set_running_or_notify_cancel():
+                    self._run(slot, job)
+        finally:
+            slot.stop(wait=True)
+
+    def _run(self, slot: _WorkerSlot, job: _Job) -> None:
+        """Run a job, restarting the worker and retrying if the worker dies."""
+        while True:
+            try:
+                status, payload, run_time = slot.call(job)
+            except (EOFError, OSError):
+                job.attempts += 1
+                with self._lock:
+                    self.restarts += 1
+                logger.warning(
+                    "Worker process %s died (exit code %s); restarting it.",
+                    slot.process.pid,
+                    slot.process.exitcode,
+                )
+                slot.restart()
+                if job.attempts > self._max_retries:
+                    job.future.set_exception(
+                        WorkerCrashedError(
+                            f"Worker process died {job.attempts} time(s) while "
+                            "running the task."
+                        )
+                    )
+                    return
+                continue
+            pid = slot.process.pid
+            try:
+                if status == _OK:
+                    job.future.set_result((pickle.loads(payload), run_time, pid))
+                else:
+                    job.future.set_exception(pickle.loads(payload))
+            except Exception as error:
+                job.future.set_exception(error)
+            return
+
+
+_SHARED_WORKER_POOL: Optional[LocalWorkerPool] = None
+_SHARED_WORKER_POOL_LOCK = threading.Lock()
+
+
+def get_shared_worker_pool() -> LocalWorkerPool:
+    """Return the process-wide worker pool, creating it on first use.
+
+    Returns:
+        The shared LocalWorkerPool, sized to the number of CPUs.
+    """
+    global _SHARED_WORKER_POOL
+    with _SHARED_WORKER_POOL_LOCK:
+        if _SHARED_WORKER_POOL is None:
+            _SHARED_WORKER_POOL = LocalWorkerPool()
+        return _SHARED_WORKER_POOL
+
+
+def shutdown_shared_worker_pool(*, wait: bool = True) -> None:
+    """Shut down the shared worker pool. Registered to run automatically at exit.
+
+    Args:
+        wait: Whether to wait for running tasks to finish.
+    """
+    global _SHARED_WORKER_POOL
+    with _SHARED_WORKER_POOL_LOCK:
+        pool, _SHARED_WORKER_POOL = _SHARED_WORKER_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def _reset_after_fork() -> None:
+    """Forget the inherited pool; its feeder threads do not exist in a forked child."""
+    global _SHARED_WORKER_POOL, _SHARED_WORKER_POOL_LOCK
+    _SHARED_WORKER_POOL = None
+    _SHARED_WORKER_POOL_LOCK = threading.Lock()
+
+
+atexit.register(shutdown_shared_worker_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+__all__ = [
+    "LocalWorkerPool",
+    "get_shared_worker_pool",
+    "operator_digest",
+    "shutdown_shared_worker_pool",
+]
@@ -0,0 +1,269 @@
+"""
+Adaptive Scheduler Selection for XCS
+
+No single scheduler is best for every graph. A pure chain, or a handful of
+cheap nodes, runs fastest inline on the calling thread; a wide fan-out of
+provider calls needs the thread pool; graphs of coroutine operators belong on
+an event loop. The scheduler in this module inspects each compiled plan and
+hands the run to the scheduler that fits it:
+
+```python
+with execution_options(scheduler="auto"):
+    results = execute_graph(graph=graph, global_input=inputs)
+```
+
+Selection works as follows, first match wins:
+
+1. Any coroutine operator: the AsyncScheduler, the only one that awaits them.
+2. Any node hinted ``executor="process"``: the ProcessPoolScheduler.
+3. Run or node deadlines, a hedging policy or enabled request coalescing:
+   the parallel scheduler, since enforcing these needs a dispatching thread.
+4. Fewer than ``min_parallel_width`` nodes on every topological level (a chain
+   or a single node): the zero-thread SequentialScheduler.
+5. Expected durations known for every node, and running them one after
+   another costs less than dispatching each to a worker would save over the
+   plan's critical path: the SequentialScheduler.
+6. Otherwise the parallel scheduler.
+
+Expected durations are node durations observed on earlier runs of the same
+graph, from the process-wide cost model shared with the critical-path
+scheduler, falling back to the ``expected_duration`` hint. Graphs whose
+durations are unknown are assumed to be worth parallelizing; after a run the
+observed durations let later runs choose again.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from ember.xcs.engine.execution_policy import ExecutionPolicy
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler, _is_coroutine_operator
+from ember.xcs.engine.xcs_critical_path_scheduler import (
+    EXPECTED_DURATION_HINT,
+    NodeCostModel,
+    get_default_cost_model,
+)
+from ember.xcs.engine.xcs_engine import (
+    NodeCompletion,
+    TopologicalSchedulerWithParallelDispatch,
+    XCSPlan,
+)
+from ember.xcs.engine.xcs_process_scheduler import (
+    EXECUTOR_HINT,
+    PROCESS_EXECUTOR,
+    ProcessPoolScheduler,
+)
+from ember.xcs.engine.xcs_sequential_scheduler import SequentialScheduler
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SEQUENTIAL = "sequential"
+PARALLEL = "parallel"
+ASYNC = "async"
+PROCESS = "process"
+
+
+class AdaptiveScheduler(TopologicalSchedulerWithParallelDispatch):
+    """Scheduler that picks sequential, threaded or async execution per plan.
+
+    The schedulers it delegates to are created once, share this scheduler's
+    settings and are reused across runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_parallel_width: int = 2,
+        dispatch_overhead: float = 1e-4,
+        cost_model: Optional[NodeCostModel] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            min_parallel_width: Smallest number of nodes on one topological level
+                for which parallel execution is considered.
+            dispatch_overhead: Estimated seconds a worker handoff adds to each
+                node, weighed against the time parallel execution saves.
+            cost_model: Cost model to learn node durations in. Defaults to the
+                process-wide model shared with the critical-path scheduler.
+            **kwargs: Further options forwarded to the schedulers delegated to
+                (see TopologicalSchedulerWithParallelDispatch).
+
+        Raises:
+            ValueError: If min_parallel_width is smaller than two or
+                dispatch_overhead is negative.
+        """
+        if min_parallel_width < 2:
+            raise ValueError("min_parallel_width must be at least 2.")
+        if dispatch_overhead < 0:
+            raise ValueError("dispatch_overhead must not be negative.")
+        super().__init__(**kwargs)
+        self.min_parallel_width = min_parallel_width
+        self.dispatch_overhead = dispatch_overhead
+        self._cost_model = cost_model or get_default_cost_model()
+        self._options = kwargs
+        self._delegates: Dict[str, TopologicalSchedulerWithParallelDispatch] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cost_model(self) -> NodeCostModel:
+        """The cost model durations are learned in."""
+        return self._cost_model
+
+    def choose(
+        self,
+        *,
+        plan: XCSPlan,
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> str:
+        """Decide how a plan should run.
+
+        Args:
+            plan: The compiled execution plan.
+            graph: The graph the plan was compiled from.
+            policy: The run's policy. Defaults to the scheduler's policy.
+
+        Returns:
+            "sequential", "parallel", "async" or "process".
+        """
+        policy = policy or self.policy
+        nodes = [graph.nodes.get(node_id) for node_id in plan.node_ids]
+        if any(
+            node is not None and _is_coroutine_operator(node.operator) for node in nodes
+        ):
+            return ASYNC
+        if any(
+            node is not None and node.get_hint(EXECUTOR_HINT) == PROCESS_EXECUTOR
+            for node in nodes
+        ):
+            return PROCESS
+        if (
+            policy.timeout is not None
+            or any(policy.node_timeout_for(node) is not None for node in nodes)
+            or self.hedging is not None
+            or self.coalescer.enabled
+        ):
+            return PARALLEL
+        width = max((len(level) for level in plan.levels), default=0)
+        if width < self.min_parallel_width:
+            return SEQUENTIAL
+        costs = self._known_costs(plan=plan, graph=graph)
+        if costs is not None:
+            finish = [0.0] * len(plan.node_ids)
+            for index in range(len(plan.node_ids)):
+                finish[index] = costs[index] + max(
+                    (finish[parent] for parent in plan.parent_indices[index]),
+                    default=0.0,
+                )
+            saved = sum(costs) - max(finish, default=0.0)
+            if saved <= self.dispatch_overhead * len(plan.node_ids):
+                return SEQUENTIAL
+        return PARALLEL
+
+    def select(
+        self,
+        *,
+        plan: XCSPlan,
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> TopologicalSchedulerWithParallelDispatch:
+        """Return the scheduler a plan will run on.
+
+        Args:
+            plan: The compiled execution plan.
+            graph: The graph the plan was compiled from.
+            policy: The run's policy. Defaults to the scheduler's policy.
+
+        Returns:
+            The scheduler chosen for the plan.
+        """
+        kind = self.choose(plan=plan, graph=graph, policy=policy)
+        logger.debug(
+            "Running %d-node plan with the %s scheduler.", len(plan.node_ids), kind
+        )
+        with self._lock:
+            delegate = self._delegates.get(kind)
+            if delegate is None:
+                delegate = self._delegates[kind] = self._create_delegate(kind)
+        return delegate
+
+    def run_plan(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Dict[str, Any]:
+        return {
+            completion.node_id: completion.result
+            for completion in self.iter_plan(
+                plan=plan, global_input=global_input, graph=graph, policy=policy
+            )
+        }
+
+    def iter_plan(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Iterator[NodeCompletion]:
+        """Executes a plan on the scheduler chosen for it, learning node durations.
+
+        Args:
+            plan: The compiled execution plan.
+            global_input: Input data available to all nodes in the graph.
+            graph: The original graph containing node definitions and attributes.
+            policy: Deadlines and failure handling for this run. Defaults to the
+                scheduler's policy.
+
+        Yields:
+            A NodeCompletion for every successful node, in completion order.
+        """
+        policy = policy or self.policy
+        delegate = self.select(plan=plan, graph=graph, policy=policy)
+        for completion in delegate.iter_plan(
+            plan=plan, global_input=global_input, graph=graph, policy=policy
+        ):
+            run_time = completion.timing.run_time
+            if run_time is not None:
+                self._cost_model.record(
+                    graph=graph, node_id=completion.node_id, duration=run_time
+                )
+            yield completion
+
+    def _known_costs(self, *, plan: XCSPlan, graph: XCSGraph) -> Optional[List[float]]:
+        """Return every node's expected duration by plan index, if all are known."""
+        observed = self._cost_model.observed(graph=graph)
+        costs: List[float] = []
+        for node_id in plan.node_ids:
+            cost = observed.get(node_id)
+            if cost is None:
+                node = graph.nodes.get(node_id)
+                hint = node.get_hint(EXPECTED_DURATION_HINT) if node else None
+                if not isinstance(hint, (int, float)):
+                    return None
+                cost = float(hint)
+            costs.append(cost)
+        return costs
+
+    def _create_delegate(self, kind: str) -> TopologicalSchedulerWithParallelDispatch:
+        if kind == SEQUENTIAL:
+            return SequentialScheduler(
+                policy=self.policy, resource_limits=self.resource_limits
+            )
+        if kind == ASYNC:
+            return AsyncScheduler(**self._options)
+        if kind == PROCESS:
+            return ProcessPoolScheduler(**self._options)
+        return TopologicalSchedulerWithParallelDispatch(**self._options)
+
+
+__all__ = ["AdaptiveScheduler"]
@@ -0,0 +1,639 @@
+"""
+Event-Loop Scheduling for XCS
+
+Graphs dominated by provider calls spend nearly all of their time waiting on
+I/O. The scheduler in this module runs a plan on an asyncio event loop:
+coroutine operators are awaited directly, so thousands of calls can be in
+flight without a thread each, and synchronous operators are offloaded to a
+bounded thread pool. Dependency tracking, input gathering, execution policies,
+resource limits, hedging and request coalescing behave as in the parallel
+scheduler it extends.
+
+Plans can be run from synchronous code, on a private loop, or awaited from a
+running loop through execute_graph_async and execute_graph_iter_async.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional
+
+from ember.xcs.engine.coalescing import RequestCoalescer
+from ember.xcs.engine.execution_policy import (
+    CancellationToken,
+    ExecutionPolicy,
+    cancellation_scope,
+)
+from ember.xcs.engine.execution_profiler import start_profiled_run
+from ember.xcs.engine.hedged_execution import HedgeAttempt, adopt_timing
+from ember.xcs.engine.hedging import HedgingPolicy
+from ember.xcs.engine.resource_admission import ResourceAdmission
+from ember.xcs.engine.resource_limits import ResourceLimits
+from ember.xcs.engine.xcs_engine import (
+    NodeCompletion,
+    NodeTiming,
+    TopologicalSchedulerWithParallelDispatch,
+    XCSPlan,
+    _adopt_shared_result,
+    _finish_trace,
+    _InFlightTask,
+    _raise_collected_errors,
+    _task_error,
+)
+from ember.xcs.exceptions import (
+    ExecutionCancelledError,
+    GraphTimeoutError,
+    NodeTimeoutError,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode
+
+
+def _is_coroutine_operator(operator: Callable[..., Any]) -> bool:
+    """
+    Determines whether calling an operator produces a coroutine.
+
+    Args:
+        operator: A plain function, bound method, partial, or callable object
+
+    Returns:
+        True if the operator (or its __call__ method) is declared with async def
+    """
+    if inspect.iscoroutinefunction(operator):
+        return True
+    call = getattr(operator, "__call__", None)
+    return call is not None and inspect.iscoroutinefunction(call)
+
+
+class AsyncScheduler(TopologicalSchedulerWithParallelDispatch):
+    """
+    Event-loop scheduler for graphs dominated by asynchronous I/O.
+
+    Coroutine operators (async def functions or objects with an async __call__,
+    such as a wrapper around ModelService.invoke_model_async) are awaited
+    directly on the event loop, so thousands of provider calls can be in flight
+    without a thread each. Synchronous operators are offloaded to a bounded
+    thread pool, by default the process-wide shared pool.
+
+    Dependency tracking, input gathering and ready-task ordering are shared with
+    TopologicalSchedulerWithParallelDispatch. Completed nodes post themselves to
+    a completion queue, and newly ready children are started immediately.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        use_shared_executor: bool = True,
+        policy: Optional[ExecutionPolicy] = None,
+        resource_limits: Optional[ResourceLimits] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of nodes in flight at once, coroutine
+                and synchronous alike. None means unbounded.
+            max_workers: Maximum number of synchronous operators running on
+                threads at once. None means the size of the thread pool.
+            executor: Optional caller-owned executor for synchronous operators.
+            use_shared_executor: Whether synchronous operators run on the
+                process-wide shared pool when no executor is given.
+            policy: Deadlines and failure handling applied to every run unless a
+                run passes its own.
+            resource_limits: Per-class capacities for nodes with a resource_class
+                hint. Defaults to the process-wide limits.
+            hedging: Optional policy under which straggling nodes get a
+                duplicate attempt. None disables hedging.
+            coalescer: Registry through which identical node invocations in
+                flight share one execution. Defaults to the process-wide one.
+        """
+        super().__init__(
+            max_workers=max_workers,
+            executor=executor,
+            use_shared_executor=use_shared_executor,
+            policy=policy,
+            resource_limits=resource_limits,
+            hedging=hedging,
+            coalescer=coalescer,
+        )
+        self._max_concurrency = max_concurrency
+
+    def run_plan(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes a plan on a private event loop and blocks until it completes.
+
+        Raises:
+            RuntimeError: If called from a thread that is already running an event
+                loop; use run_plan_async or execute_graph_async there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.run_plan_async(
+                    plan=plan, global_input=global_input, graph=graph, policy=policy
+                )
+            )
+        raise RuntimeError(
+            "AsyncScheduler.run_plan cannot be called from a running event loop; "
+            "await execute_graph_async or run_plan_async instead."
+        )
+
+    def iter_plan(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Iterator[NodeCompletion]:
+        """
+        Executes a plan on a private event loop, yielding results as they complete.
+
+        The loop only runs while the caller waits for the next result; operators
+        already running on threads keep running in between.
+
+        Raises:
+            RuntimeError: If called from a thread that is already running an event
+                loop; use iter_plan_async or execute_graph_iter_async there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "AsyncScheduler.iter_plan cannot be called from a running event "
+                "loop; use execute_graph_iter_async or iter_plan_async instead."
+            )
+        loop = asyncio.new_event_loop()
+        completions = self.iter_plan_async(
+            plan=plan, global_input=global_input, graph=graph, policy=policy
+        )
+        try:
+            while True:
+                try:
+                    completion = loop.run_until_complete(completions.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield completion
+        finally:
+            loop.run_until_complete(completions.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def run_plan_async(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Dict[str, Any]:
+        """
+        Executes a plan on the running event loop.
+
+        Args:
+            plan: The compiled execution plan containing tasks and their dependencies.
+            global_input: Input data available to all nodes in the graph.
+            graph: The original graph containing node definitions and attributes.
+            policy: Deadlines and failure handling for this run. Defaults to the
+                scheduler's policy.
+
+        Returns:
+            A dictionary mapping node IDs to their execution results.
+        """
+        return {
+            completion.node_id: completion.result
+            async for completion in self.iter_plan_async(
+                plan=plan, global_input=global_input, graph=graph, policy=policy
+            )
+        }
+
+    async def iter_plan_async(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> AsyncIterator[NodeCompletion]:
+        """
+        Executes a plan on the running event loop, yielding results as they complete.
+
+        Coroutine operators are cancelled outright when their node overruns its
+        deadline or the run stops early; synchronous operators already running
+        on a thread see their cancellation token set.
+
+        Args:
+            plan: The compiled execution plan containing tasks and their dependencies.
+            global_input: Input data available to all nodes in the graph.
+            graph: The original graph containing node definitions and attributes.
+            policy: Deadlines and failure handling for this run. Defaults to the
+                scheduler's policy.
+
+        Yields:
+            A NodeCompletion for every successful node, in completion order.
+
+        Raises:
+            NodeTimeoutError: If a node overruns its deadline under fail-fast.
+            GraphTimeoutError: If the run overruns its deadline.
+            GraphExecutionError: At the end of a "continue" run in which nodes failed.
+        """
+        policy = policy or self.policy
+        remaining, available_tasks = self._prepare_run(plan=plan, graph=graph)
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        run_token = CancellationToken()
+        run_deadline = time.perf_counter() + policy.timeout if policy.timeout else None
+        completed: "asyncio.Queue[Optional[asyncio.Future[Any]]]" = asyncio.Queue()
+        future_to_task: Dict["asyncio.Future[Any]", _InFlightTask] = {}
+        thread_slots = (
+            asyncio.Semaphore(self._max_workers) if self._max_workers else None
+        )
+        admission = ResourceAdmission(
+            ready=available_tasks, graph=graph, limits=self.resource_limits
+        )
+        loop = asyncio.get_running_loop()
+        trace = start_profiled_run(scheduler=self, node_count=len(plan.node_ids))
+        completed_run = False
+
+        # Slots may be freed by other runs on other threads.
+        def wake() -> None:
+            try:
+                loop.call_soon_threadsafe(completed.put_nowait, None)
+            except RuntimeError:
+                pass  # The loop has already closed.
+
+        with self._executor_scope() as executor:
+
+            def submit_available() -> None:
+                while (
+                    self._max_concurrency is None
+                    or len(future_to_task) < self._max_concurrency
+                ):
+                    admitted = admission.next_task()
+                    if admitted is None:
+                        break
+                    task_id, resource_class = admitted
+                    input_data = self._gather_inputs(
+                        node_id=task_id,
+                        results=results,
+                        global_input=global_input,
+                        graph=graph,
+                        recipe=plan.input_recipes[plan.index_of[task_id]],
+                    )
+                    timing = NodeTiming(submitted=time.perf_counter())
+                    token = CancellationToken(parent=run_token)
+                    run_attempt = functools.partial(
+                        self._exec_operator_async,
+                        node_id=task_id,
+                        input_data=input_data,
+                        graph=graph,
+                        executor=executor,
+                        thread_slots=thread_slots,
+                    )
+                    node = graph.nodes.get(task_id)
+                    if self.hedging is not None and self.hedging.applies_to(node):
+                        run_node = functools.partial(
+                            self._exec_hedged_async,
+                            run_attempt=run_attempt,
+                            node_id=task_id,
+                            graph=graph,
+                            timing=timing,
+                            token=token,
+                            resource_class=resource_class,
+                        )
+                    else:
+                        run_node = functools.partial(
+                            run_attempt, timing=timing, token=token
+                        )
+                    if (
+                        self.coalescer.enabled
+                        and node is not None
+                        and self.coalescer.applies_to(node)
+                    ):
+                        execution = self._exec_coalesced_async(
+                            run_node=run_node,
+                            node=node,
+                            input_data=input_data,
+                            timing=timing,
+                        )
+                    else:
+                        execution = run_node()
+                    node_timeout = policy.node_timeout_for(graph.nodes.get(task_id))
+                    if node_timeout is not None:
+                        execution = _with_node_deadline(
+                            execution, node_id=task_id, timeout=node_timeout
+                        )
+                    future = asyncio.ensure_future(execution)
+                    future_to_task[future] = _InFlightTask(task_id, timing, token)
+                    admission.release_when_done(future, resource_class)
+                    future.add_done_callback(completed.put_nowait)
+
+            if admission.enabled:
+                self.resource_limits.add_listener(wake)
+            try:
+                submit_available()
+                while future_to_task or admission.waiting:
+                    wait_for = (
+                        None
+                        if run_deadline is None
+                        else max(0.0, run_deadline - time.perf_counter())
+                    )
+                    try:
+                        future = await asyncio.wait_for(completed.get(), wait_for)
+                    except asyncio.TimeoutError:
+                        raise GraphTimeoutError(
+                            f"Graph execution did not finish within its deadline; "
+                            f"{len(future_to_task)} node(s) still running."
+                        ) from None
+                    if future is None:
+                        submit_available()
+                        continue
+                    if future not in future_to_task:
+                        continue
+                    task_id, timing, token = future_to_task.pop(future)
+                    error = _task_error(future=future, task_id=task_id, timed_out=False)
+                    if trace is not None:
+                        trace.record_node(node_id=task_id, timing=timing, error=error)
+                    if error is not None:
+                        if policy.fail_fast:
+                            raise error
+                        errors[task_id] = error
+                        submit_available()
+                        continue
+                    result = future.result()
+                    results[task_id] = result
+                    for child in plan.child_indices[plan.index_of[task_id]]:
+                        remaining[child] -= 1
+                        if remaining[child] == 0:
+                            available_tasks.push(plan.node_ids[child])
+                    submit_available()
+                    yield NodeCompletion(node_id=task_id, result=result, timing=timing)
+                _raise_collected_errors(plan=plan, results=results, errors=errors)
+                completed_run = True
+            finally:
+                if admission.enabled:
+                    self.resource_limits.remove_listener(wake)
+                # On failure, early exit or outer cancellation, stop the nodes
+                # still in flight.
+                run_token.cancel()
+                for future in future_to_task:
+                    future.cancel()
+                if trace is not None:
+                    _finish_trace(
+                        trace=trace, in_flight=future_to_task, completed=completed_run
+                    )
+
+    async def _exec_coalesced_async(
+        self,
+        *,
+        run_node: Callable[[], Awaitable[Any]],
+        node: XCSNode,
+        input_data: Mapping[str, Any],
+        timing: NodeTiming,
+    ) -> Any:
+        """
+        Executes a node unless an identical invocation is in flight, in which
+        case it waits for that invocation and shares its result.
+
+        Args:
+            run_node: Executes the node
+            node: The node being executed
+            input_data: Input data for the node
+            timing: Timing record to fill in with start and finish times
+
+        Returns:
+            The node's result
+        """
+        coalescer = self.coalescer
+        ticket = coalescer.enter(operator=node.operator, inputs=input_data)
+        if ticket is None:
+            return await run_node()
+        if ticket.leader:
+            try:
+                result = await run_node()
+            except asyncio.CancelledError:
+                coalescer.publish(ticket, cancelled=True)
+                raise
+            except BaseException as error:
+                coalescer.publish(ticket, error=error)
+                raise
+            coalescer.publish(ticket, result=result)
+            return result
+        try:
+            # Shielded: a follower that is cancelled must not cancel the flight.
+            result = await asyncio.shield(asyncio.wrap_future(ticket.shared))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if ticket.abandoned():
+                coalescer.record_fallback()
+                return await run_node()
+            _adopt_shared_result(node, timing, ticket.shared)
+            raise
+        _adopt_shared_result(node, timing, ticket.shared)
+        return result
+
+    async def _exec_hedged_async(
+        self,
+        *,
+        run_attempt: Callable[..., Awaitable[Any]],
+        node_id: str,
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+        resource_class: Optional[str],
+    ) -> Any:
+        """
+        Executes a node, launching a duplicate attempt if it straggles.
+
+        The first attempt to succeed wins and the other is cancelled. The node
+        fails only once no attempt is left running, with the first error raised.
+
+        Args:
+            run_attempt: Runs one attempt given its timing and token
+            node_id: ID of the node to execute
+            graph: Original graph containing node definitions
+            timing: The node's timing record, filled in from the winning attempt
+            token: The node's cancellation token; attempts derive theirs from it
+            resource_class: The node's resource class, if limits apply to it
+
+        Returns:
+            Result of the winning attempt
+        """
+        hedging = self.hedging
+        assert hedging is not None
+        key = hedging.key_for(node_id=node_id, node=graph.nodes.get(node_id))
+        delay = hedging.begin(key)
+        attempts: Dict["asyncio.Future[Any]", HedgeAttempt] = {}
+
+        def launch(*, is_hedge: bool) -> "asyncio.Future[Any]":
+            attempt = HedgeAttempt(
+                timing=NodeTiming(submitted=time.perf_counter()),
+                token=CancellationToken(parent=token),
+                is_hedge=is_hedge,
+            )
+            future = asyncio.ensure_future(
+                run_attempt(timing=attempt.timing, token=attempt.token)
+            )
+            attempts[future] = attempt
+            return future
+
+        pending = {launch(is_hedge=False)}
+        first_error: Optional[BaseException] = None
+        settled = False
+        try:
+            while pending:
+                wait_for = None
+                if delay is not None:
+                    wait_for = max(0.0, timing.submitted + delay - time.perf_counter())
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    delay = None
+                    if self._reserve_hedge(resource_class):
+                        hedge = launch(is_hedge=True)
+                        hedge.add_done_callback(
+                            lambda _: self._release_hedge(resource_class)
+                        )
+                        pending.add(hedge)
+                    continue
+                for future in done:
+                    attempt = attempts[future]
+                    if future.cancelled():
+                        continue
+                    error = future.exception()
+                    if error is None:
+                        hedging.observe(
+                            key, attempt.timing.finished - attempt.timing.submitted
+                        )
+                        if attempt.is_hedge:
+                            hedging.record_hedge_win()
+                        adopt_timing(target=timing, source=attempt.timing)
+                        settled = True
+                        return future.result()
+                    first_error = first_error or error
+                    adopt_timing(target=timing, source=attempt.timing)
+                # A failed attempt is not retried by a later hedge.
+                delay = None
+            settled = True
+            raise first_error or ExecutionCancelledError(
+                f"Node '{node_id}' was cancelled."
+            )
+        finally:
+            for future in pending:
+                attempt = attempts[future]
+                attempt.token.cancel()
+                future.cancel()
+                if settled:
+                    # Count the loser's run time once its cancellation lands.
+                    future.add_done_callback(
+                        lambda _, loser=attempt: hedging.record_waste(
+                            loser.timing.run_time or 0.0
+                        )
+                    )
+
+    async def _exec_operator_async(
+        self,
+        *,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        executor: Executor,
+        thread_slots: Optional[asyncio.Semaphore],
+        timing: NodeTiming,
+        token: CancellationToken,
+    ) -> Any:
+        """
+        Executes a node's operator without blocking the event loop.
+
+        Args:
+            node_id: ID of the node to execute
+            input_data: Input data for the node
+            graph: Original graph containing node definitions
+            executor: Thread pool used for synchronous operators
+            thread_slots: Optional semaphore bounding concurrent synchronous operators
+            timing: Timing record to fill in with start and finish times
+            token: Cancellation token for the node
+
+        Returns:
+            Result of the operator execution
+        """
+        node = graph.get_node(node_id=node_id)
+        try:
+            if _is_coroutine_operator(node.operator):
+                timing.mark_started()
+                with cancellation_scope(token):
+                    result = await node.operator(inputs=input_data)
+            else:
+                loop = asyncio.get_running_loop()
+
+                def call() -> Any:
+                    token.raise_if_cancelled()
+                    timing.mark_started()
+                    with cancellation_scope(token):
+                        return node.operator(inputs=input_data)
+
+                if thread_slots is None:
+                    result = await loop.run_in_executor(executor, call)
+                else:
+                    async with thread_slots:
+                        result = await loop.run_in_executor(executor, call)
+                # Synchronous wrappers may still hand back an awaitable.
+                if inspect.isawaitable(result):
+                    result = await result
+        except asyncio.CancelledError:
+            # Tell an operator still running on a thread that it is abandoned.
+            token.cancel()
+            raise
+        finally:
+            timing.finished = time.perf_counter()
+        node.captured_outputs = result
+        return result
+
+
+async def _with_node_deadline(
+    execution: Awaitable[Any], *, node_id: str, timeout: float
+) -> Any:
+    """
+    Awaits a node's execution, failing it if it overruns its deadline.
+
+    Args:
+        execution: The node's execution coroutine.
+        node_id: ID of the node.
+        timeout: Seconds the node may take.
+
+    Returns:
+        The node's result.
+
+    Raises:
+        NodeTimeoutError: If the deadline passes first; the execution is cancelled.
+    """
+    try:
+        return await asyncio.wait_for(execution, timeout)
+    except asyncio.TimeoutError:
+        raise NodeTimeoutError(
+            f"Node '{node_id}' did not finish within its deadline.", node_id=node_id
+        ) from None
+
+
+__all__ = ["AsyncScheduler"]
@@ -0,0 +1,236 @@
+"""
+Critical-Path Priority Scheduling for XCS
+
+The default parallel scheduler dispatches ready tasks last-in, first-out with no
+notion of cost, so a long chain of slow nodes (for example sequential LLM calls)
+can start late and dominate end-to-end latency. The scheduler in this module
+instead ranks every ready task by the length of the longest remaining path from
+that task to the end of the graph and dispatches the highest-ranked task first,
+the classic critical-path (upward rank) list-scheduling heuristic.
+
+Path lengths are computed from per-node cost estimates. In order of preference, a
+node's cost is:
+1. The duration observed on previous executions of the same graph
+2. An ``expected_duration`` hint (in seconds) attached to the node
+3. The mean known cost of the graph's other nodes, or 1.0 if nothing is known
+
+Observed durations persist in a process-wide NodeCostModel keyed weakly by graph,
+so schedulers created per call by execution_options(scheduler="critical_path")
+keep learning across runs.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ember.xcs.engine.xcs_engine import (
+    ReadyQueue,
+    TopologicalSchedulerWithParallelDispatch,
+    XCSPlan,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+EXPECTED_DURATION_HINT = "expected_duration"
+
+
+class NodeCostModel:
+    """Learns per-node execution durations across runs of the same graph.
+
+    Each observation is folded into an exponential moving average so that
+    estimates track drifting provider latency without being dominated by a
+    single outlier.
+    """
+
+    def __init__(self, *, smoothing: float = 0.5) -> None:
+        """Initialize an empty cost model.
+
+        Args:
+            smoothing: Weight given to the newest observation, in (0, 1].
+        """
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be in the interval (0, 1].")
+        self._smoothing = smoothing
+        self._durations: "weakref.WeakKeyDictionary[XCSGraph, Dict[str, float]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def record(self, *, graph: XCSGraph, node_id: str, duration: float) -> None:
+        """Record an observed execution duration.
+
+        Args:
+            graph: Graph the node belongs to.
+            node_id: ID of the executed node.
+            duration: Wall-clock execution time in seconds.
+        """
+        with self._lock:
+            durations = self._durations.setdefault(graph, {})
+            previous = durations.get(node_id)
+            if previous is None:
+                durations[node_id] = duration
+            else:
+                durations[node_id] = (
+                    self._smoothing * duration + (1.0 - self._smoothing) * previous
+                )
+
+    def observed(self, *, graph: XCSGraph) -> Dict[str, float]:
+        """Return a snapshot of the observed durations for a graph.
+
+        Args:
+            graph: Graph whose durations to return.
+
+        Returns:
+            Mapping from node ID to smoothed duration in seconds.
+        """
+        with self._lock:
+            return dict(self._durations.get(graph, {}))
+
+    def estimate_costs(self, *, graph: XCSGraph) -> Dict[str, float]:
+        """Estimate the cost of every node in a graph.
+
+        Args:
+            graph: Graph whose nodes to estimate.
+
+        Returns:
+            Mapping from node ID to estimated cost in seconds.
+        """
+        observed = self.observed(graph=graph)
+        costs: Dict[str, float] = {}
+        unknown: List[str] = []
+        for node_id, node in graph.nodes.items():
+            if node_id in observed:
+                costs[node_id] = observed[node_id]
+                continue
+            hint = node.get_hint(EXPECTED_DURATION_HINT)
+            if isinstance(hint, (int, float)):
+                costs[node_id] = float(hint)
+            else:
+                unknown.append(node_id)
+        default = sum(costs.values()) / len(costs) if costs else 1.0
+        for node_id in unknown:
+            costs[node_id] = default
+        return costs
+
+
+_DEFAULT_COST_MODEL = NodeCostModel()
+
+
+def get_default_cost_model() -> NodeCostModel:
+    """Return the process-wide cost model shared by critical-path schedulers."""
+    return _DEFAULT_COST_MODEL
+
+
+def compute_critical_path_ranks(
+    *, plan: XCSPlan, costs: Dict[str, float]
+) -> Dict[str, float]:
+    """Compute each task's remaining critical-path length.
+
+    The rank of a task is its own cost plus the largest rank among the tasks that
+    depend on it, i.e. the length of the longest path from the task to a sink.
+
+    Args:
+        plan: Plan whose tasks to rank.
+        costs: Estimated cost of each task.
+
+    Returns:
+        Mapping from task ID to remaining critical-path length.
+    """
+    # Plan indices are topologically ordered, so walking them backwards ranks
+    # every task after all of its children.
+    ranks: List[float] = [0.0] * len(plan.node_ids)
+    for index in range(len(plan.node_ids) - 1, -1, -1):
+        longest_tail = max(
+            (ranks[child] for child in plan.child_indices[index]), default=0.0
+        )
+        ranks[index] = costs.get(plan.node_ids[index], 1.0) + longest_tail
+    return dict(zip(plan.node_ids, ranks))
+
+
+class PriorityReadyQueue(ReadyQueue):
+    """Ready queue that pops the task with the longest remaining critical path.
+
+    Ties are broken in insertion order, so equally ranked tasks run first-come,
+    first-served.
+    """
+
+    def __init__(self, *, ranks: Dict[str, float]) -> None:
+        """Initialize an empty queue.
+
+        Args:
+            ranks: Remaining critical-path length of each task.
+        """
+        super().__init__()
+        self._ranks = ranks
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def push(self, task_id: str) -> None:
+        heapq.heappush(
+            self._heap, (-self._ranks.get(task_id, 0.0), next(self._counter), task_id)
+        )
+
+    def pop(self) -> str:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class CriticalPathScheduler(TopologicalSchedulerWithParallelDispatch):
+    """Parallel scheduler that dispatches ready tasks in critical-path order.
+
+    Execution semantics are identical to TopologicalSchedulerWithParallelDispatch;
+    only the order in which ready tasks are submitted differs. The priority order
+    matters most when ready tasks outnumber available workers (see max_workers),
+    which is exactly when a poor choice delays the critical path.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        cost_model: Optional[NodeCostModel] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of concurrent workers. None means auto.
+            cost_model: Cost model to learn from and rank with. Defaults to the
+                process-wide model so learned durations survive across schedulers.
+            **kwargs: Further options forwarded to TopologicalSchedulerWithParallelDispatch.
+        """
+        super().__init__(max_workers=max_workers, **kwargs)
+        self._cost_model = cost_model or get_default_cost_model()
+
+    @property
+    def cost_model(self) -> NodeCostModel:
+        """The cost model used for ranking."""
+        return self._cost_model
+
+    def _create_ready_queue(self, *, plan: XCSPlan, graph: XCSGraph) -> ReadyQueue:
+        costs = self._cost_model.estimate_costs(graph=graph)
+        return PriorityReadyQueue(
+            ranks=compute_critical_path_ranks(plan=plan, costs=costs)
+        )
+
+    def _exec_operator(
+        self,
+        *,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+    ) -> Any:
+        start = time.perf_counter()
+        result = super()._exec_operator(
+            node_id=node_id, input_data=input_data, graph=graph
+        )
+        self._cost_model.record(
+            graph=graph, node_id=node_id, duration=time.perf_counter() - start
+        )
+        return result
@@ -0,0 +1,96 @@
+"""
+Distributed Scheduling Across Local Worker Processes
+
+``DistributedScheduler`` runs every node of a graph on a pool of local worker
+processes (see worker_pool), so a single graph, or a stream of graphs sharing
+the pool, scales beyond one Python interpreter and its GIL:
+
+```python
+with LocalWorkerPool(workers=8) as pool:
+    scheduler = DistributedScheduler(pool=pool)
+    for request in requests:
+        execute_graph(graph=graph, global_input=request, scheduler=scheduler)
+```
+
+The dispatch loop, dependency tracking, deadlines, failure policies and
+resource limits are those of TopologicalSchedulerWithParallelDispatch; only
+node execution moves out of process. Operators, their inputs and their outputs
+must therefore be picklable, and operators run on copies of their inputs; a
+node that cannot be pickled fails with OperatorNotPicklableError under the
+run's failure policy. A worker that dies mid-task is restarted and the task retried on it; exceptions
+raised by operators are returned to the caller unchanged.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from typing import Any, Mapping, Optional
+
+from ember.xcs.engine.execution_policy import CancellationToken
+from ember.xcs.engine.remote_execution import (
+    failed_future,
+    relay_remote_result,
+    serialize_node,
+)
+from ember.xcs.engine.worker_pool import LocalWorkerPool, get_shared_worker_pool
+from ember.xcs.engine.xcs_engine import (
+    NodeTiming,
+    TopologicalSchedulerWithParallelDispatch,
+)
+from ember.xcs.exceptions import OperatorNotPicklableError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+class DistributedScheduler(TopologicalSchedulerWithParallelDispatch):
+    """Parallel scheduler that runs every node on local worker processes."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        pool: Optional[LocalWorkerPool] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of this run's nodes in flight at once.
+                None means every ready node is queued on the pool immediately.
+            pool: Caller-owned worker pool. Defaults to the process-wide pool,
+                which has one worker per CPU.
+            **kwargs: Further options forwarded to TopologicalSchedulerWithParallelDispatch.
+        """
+        super().__init__(max_workers=max_workers, **kwargs)
+        self._pool = pool
+
+    def _submit_task(
+        self,
+        *,
+        executor: Executor,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+    ) -> Future[Any]:
+        node = graph.get_node(node_id=node_id)
+        try:
+            operator_payload, inputs_payload = serialize_node(
+                node_id=node_id,
+                operator=node.operator,
+                input_data=input_data,
+                placement="runs on a worker process",
+            )
+        except OperatorNotPicklableError as error:
+            # Fail the node like any other, so the failure policy applies.
+            return failed_future(error)
+        pool = self._pool or get_shared_worker_pool()
+        remote = pool.submit(
+            operator_payload=operator_payload, inputs_payload=inputs_payload
+        )
+        return relay_remote_result(
+            remote=remote, node=node, timing=timing, worker_name="xcs-worker-process"
+        )
+
+
+__all__ = ["DistributedScheduler"]
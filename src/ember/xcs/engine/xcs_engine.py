@@ -20,14 +20,65 @@ All functions and classes leverage strong typing, immutable data structures wher
 and named parameter invocation for clarity and safety.
 """
 
+import asyncio
+import copy
+import functools
+import heapq
+import itertools
 import logging
+import math
+import os
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Final, Union, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    AsyncIterator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Final,
+    Tuple,
+    Union,
+    TypeVar,
+)
 
 from ..graph.xcs_graph import XCSGraph
 from ember.core.types.xcs_types import XCSNode, XCSGraph, XCSPlan as XCSPlanProtocol
+from ember.xcs.engine.executor_pool import get_shared_executor, is_shared_worker_thread
+from ember.xcs.engine.execution_policy import (
+    DEFAULT_EXECUTION_POLICY,
+    CancellationToken,
+    ExecutionPolicy,
+    cancellation_scope,
+)
+from ember.xcs.engine.execution_journal import ExecutionJournal, replay_graph
+from ember.xcs.engine.execution_profiler import RunTrace, start_profiled_run
+from ember.xcs.engine.coalescing import RequestCoalescer, get_request_coalescer
+from ember.xcs.engine.hedged_execution import HedgedExecution, observe_latency
+from ember.xcs.engine.hedging import HedgingPolicy
+from ember.xcs.engine.input_view import InputView
+from ember.xcs.engine.resource_admission import ResourceAdmission
+from ember.xcs.engine.resource_limits import ResourceLimits, get_resource_limits
+from ember.xcs.exceptions import (
+    ExecutionCancelledError,
+    GraphExecutionError,
+    GraphTimeoutError,
+    NodeTimeoutError,
+)
+
+if TYPE_CHECKING:
+    from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
 
 # Type for results from node execution
 XCSResult = TypeVar("XCSResult")
@@ -66,6 +117,21 @@ class XCSPlanTask:
     inbound_nodes: List[str] = field(default_factory=list)
 
 
+class InputRecipe(NamedTuple):
+    """
+    Precomputed instructions for assembling one node's inputs.
+
+    Attributes:
+        parent_ids: IDs of the nodes whose outputs are merged over the global
+            input, in merge order (later parents win on key conflicts).
+        node_attributes: The node's attributes, forwarded as "node_attributes"
+            when non-empty, or None if the node is unknown.
+    """
+
+    parent_ids: Tuple[str, ...]
+    node_attributes: Optional[Dict[str, Any]]
+
+
 class XCSPlan:
     """
     Immutable execution plan compiled from an XCSGraph.
@@ -77,23 +143,73 @@ class XCSPlan:
     The execution plan is immutable by design, ensuring thread safety and consistent
     behavior during parallel execution. This immutability also allows the plan to be
     shared and reused across multiple executions with different inputs.
+
+    Besides the tasks themselves, a plan precomputes everything a scheduler needs
+    on every run: an integer index for each task in topological order, the
+    parents and children of each task by index, in-degrees, topological levels
+    and input-merge recipes. Schedulers therefore do no per-run graph analysis.
     
     The plan maintains a reference to its original graph to enable introspection,
     debugging, and execution-time optimizations that may need to reference the
     original graph structure or node attributes.
     """
 
-    def __init__(self, tasks: Dict[str, XCSPlanTask], original_graph: XCSGraph) -> None:
+    def __init__(
+        self,
+        tasks: Dict[str, XCSPlanTask],
+        original_graph: XCSGraph,
+        *,
+        levels: Optional[Tuple[Tuple[str, ...], ...]] = None,
+    ) -> None:
         """
         Initialize an execution plan.
 
         Args:
             tasks: Dictionary mapping node IDs to plan tasks
             original_graph: The original graph this plan was compiled from
+            levels: Topological levels computed when the plan was first compiled,
+                as restored from a saved plan. Skips sorting the tasks again.
+
+        Raises:
+            ValueError: If a task depends on an unknown task, the dependencies
+                contain a cycle, or levels do not cover every task exactly once.
         """
         self._tasks = tasks
         self.original_graph = original_graph
 
+        restored = levels is not None
+        if levels is None:
+            node_ids, levels = self._sort_tasks(tasks)
+        else:
+            node_ids = tuple(node_id for level in levels for node_id in level)
+            if len(node_ids) != len(tasks) or set(node_ids) != tasks.keys():
+                raise ValueError("Plan levels do not match the plan's tasks.")
+        index_of = {node_id: index for index, node_id in enumerate(node_ids)}
+        parent_indices = tuple(
+            tuple(index_of[parent] for parent in tasks[node_id].inbound_nodes)
+            for node_id in node_ids
+        )
+        children: List[List[int]] = [[] for _ in node_ids]
+        for index, parents in enumerate(parent_indices):
+            if restored and parents and max(parents) >= index:
+                raise ValueError(
+                    f"Task '{node_ids[index]}' is ordered before its dependencies."
+                )
+            for parent in parents:
+                children[parent].append(index)
+
+        self.node_ids: Tuple[str, ...] = node_ids
+        self.index_of: Dict[str, int] = index_of
+        self.parent_indices: Tuple[Tuple[int, ...], ...] = parent_indices
+        self.child_indices: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(task_children) for task_children in children
+        )
+        self.in_degree: Tuple[int, ...] = tuple(len(p) for p in parent_indices)
+        self.levels: Tuple[Tuple[str, ...], ...] = levels
+        self.input_recipes: Tuple[InputRecipe, ...] = self._build_recipes(
+            graph=original_graph
+        )
+
     @property
     def tasks(self) -> Dict[str, XCSPlanTask]:
         """
@@ -104,8 +220,130 @@ class XCSPlan:
         """
         return self._tasks
 
+    def get_execution_order(self) -> List[str]:
+        """
+        Get a topologically sorted execution order of the tasks.
+
+        Returns:
+            Task IDs ordered level by level, so every task follows its dependencies
+        """
+        return list(self.node_ids)
+
+    def bind(self, *, graph: XCSGraph) -> "XCSPlan":
+        """
+        Returns a plan sharing this plan's topology but attached to another graph.
+
+        Used when a structurally identical graph (same node IDs, edges and
+        operators) is executed: the topology is reused and only the references
+        to the new graph's nodes are refreshed. The same applies to the original
+        graph once a node's attributes dictionary has been replaced.
+
+        Args:
+            graph: A graph with the same structure as this plan's original graph
+
+        Returns:
+            A plan whose original_graph and input recipes refer to graph
+        """
+        if graph is self.original_graph and self._recipes_match(graph=graph):
+            return self
+        bound = copy.copy(self)
+        bound.original_graph = graph
+        bound.input_recipes = bound._build_recipes(graph=graph)
+        return bound
+
+    def _recipes_match(self, *, graph: XCSGraph) -> bool:
+        """
+        Checks that the input recipes refer to graph's current node attributes.
+
+        Args:
+            graph: Graph the plan is about to run against
+
+        Returns:
+            Whether every recipe holds the attributes object of its node
+        """
+        nodes = graph.nodes
+        for node_id, recipe in zip(self.node_ids, self.input_recipes):
+            node = nodes.get(node_id)
+            attributes = node.attributes if node is not None else None
+            if attributes is not recipe.node_attributes:
+                return False
+        return True
+
+    @staticmethod
+    def _sort_tasks(
+        tasks: Dict[str, XCSPlanTask]
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...]]:
+        """
+        Sorts tasks into topological levels.
+
+        Level 0 holds the tasks without dependencies, and every other task sits
+        one level below its deepest dependency. Within a level, tasks keep their
+        insertion order.
+
+        Args:
+            tasks: Tasks to sort
+
+        Returns:
+            All task IDs in level order, and the task IDs of each level
+
+        Raises:
+            ValueError: If a task depends on an unknown task or the dependencies
+                contain a cycle.
+        """
+        remaining: Dict[str, int] = {}
+        children: Dict[str, List[str]] = {node_id: [] for node_id in tasks}
+        for node_id, task in tasks.items():
+            remaining[node_id] = len(task.inbound_nodes)
+            for parent in task.inbound_nodes:
+                if parent not in children:
+                    raise ValueError(
+                        f"Task '{node_id}' depends on unknown task '{parent}'."
+                    )
+                children[parent].append(node_id)
+
+        levels: List[Tuple[str, ...]] = []
+        level = [node_id for node_id, count in remaining.items() if count == 0]
+        while level:
+            levels.append(tuple(level))
+            next_level: List[str] = []
+            for node_id in level:
+                for child in children[node_id]:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        next_level.append(child)
+            level = next_level
+
+        node_ids = tuple(node_id for level in levels for node_id in level)
+        if len(node_ids) != len(tasks):
+            raise ValueError("Graph contains a cycle or is not a valid DAG.")
+        return node_ids, tuple(levels)
+
+    def _build_recipes(self, *, graph: XCSGraph) -> Tuple[InputRecipe, ...]:
+        """
+        Builds the input-merge recipe of every task, in index order.
+
+        Args:
+            graph: Graph whose node attributes the recipes refer to
+
+        Returns:
+            One recipe per task
+        """
+        nodes = graph.nodes
+        recipes: List[InputRecipe] = []
+        for node_id in self.node_ids:
+            node = nodes.get(node_id)
+            recipes.append(
+                InputRecipe(
+                    parent_ids=tuple(self._tasks[node_id].inbound_nodes),
+                    node_attributes=node.attributes if node is not None else None,
+                )
+            )
+        return tuple(recipes)
+
 
-def compile_graph(*, graph: XCSGraph) -> XCSPlan:
+def compile_graph(
+    *, graph: XCSGraph, fuse: bool = False, optimize: bool = False
+) -> XCSPlan:
     """
     Transforms an XCSGraph into an optimized, immutable execution plan.
 
@@ -115,15 +353,31 @@ def compile_graph(*, graph: XCSGraph) -> XCSPlan:
     1. Extracts essential execution information from each node
     2. Preserves dependency relationships from the original graph
     3. Creates immutable task objects for thread-safe concurrent execution
-    4. Maintains a reference to the original graph for introspection
+    4. Precomputes the topology and input recipes the schedulers run from
+    5. Maintains a reference to the original graph for introspection
     
     The resulting XCSPlan is optimized for the scheduler implementation and
     guarantees that all dependency relationships from the original graph are
     preserved. This transformation follows the principle of separating the
     "what" (graph) from the "how" (execution plan).
 
+    Every call compiles a fresh plan; execute_graph goes through the plan cache
+    (see get_plan_cache) so that repeat executions skip compilation.
+
+    With fuse=True, single-producer, single-consumer chains of nodes are first
+    fused into single tasks (see fusion.fuse_chains). The plan then refers to
+    the fused graph, and results are reported for the last node of each chain
+    only.
+
+    With optimize=True, nodes whose output cannot reach the exit node are
+    dropped and duplicate nodes are merged first (see
+    graph_optimization.optimize_graph). Results are not reported for the
+    removed nodes.
+
     Args:
         graph: The source XCSGraph to compile into an execution plan.
+        fuse: Whether to fuse linear chains of nodes before compiling.
+        optimize: Whether to eliminate dead and duplicate nodes before compiling.
 
     Returns:
         An immutable XCSPlan ready for efficient execution.
@@ -131,6 +385,17 @@ def compile_graph(*, graph: XCSGraph) -> XCSPlan:
     Raises:
         ValueError: If the graph contains duplicate node IDs or other structural issues.
     """
+    if optimize:
+        # Import here to avoid circular imports
+        from ember.xcs.engine.graph_optimization import optimize_graph
+
+        graph = optimize_graph(graph=graph).graph
+    if fuse:
+        # Import here to avoid circular imports
+        from ember.xcs.engine.fusion import fuse_chains
+
+        graph = fuse_chains(graph=graph).graph
+
     tasks: Dict[str, XCSPlanTask] = {}
     for node in graph.nodes.values():
         node_id: str = node.node_id
@@ -140,12 +405,166 @@ def compile_graph(*, graph: XCSGraph) -> XCSPlan:
         task = XCSPlanTask(
             node_id=node_id,
             operator=node.operator,
-            inbound_nodes=node.inbound_edges,
+            inbound_nodes=list(node.inbound_edges),
         )
         tasks[node_id] = task
     return XCSPlan(tasks=tasks, original_graph=graph)
 
 
+GraphFingerprint = Tuple[Tuple[str, int, Tuple[str, ...]], ...]
+
+
+def graph_fingerprint(*, graph: XCSGraph) -> GraphFingerprint:
+    """
+    Computes a structural key for a graph.
+
+    Two graphs with equal fingerprints have the same node IDs in the same order,
+    the same edges, and the very same operator objects, so they compile to the
+    same plan. Node attributes are not part of the key; plans refer to them by
+    reference and XCSPlan.bind refreshes them when a dictionary is replaced.
+
+    Args:
+        graph: Graph to fingerprint.
+
+    Returns:
+        A hashable key describing the graph's structure.
+    """
+    return tuple(
+        (node_id, id(node.operator), tuple(node.inbound_edges))
+        for node_id, node in graph.nodes.items()
+    )
+
+
+class XCSPlanCache:
+    """
+    Thread-safe LRU cache of compiled plans keyed by graph fingerprint.
+
+    Cached plans hold references to their operators, so the operator identities
+    recorded in a fingerprint cannot be reused by other objects while the entry
+    is alive. Mutating a graph (adding nodes or edges, or swapping an operator)
+    changes its fingerprint, so stale plans are never returned.
+    """
+
+    def __init__(self, *, max_size: int = 256) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of plans kept before the least recently used
+                one is evicted.
+        """
+        self._max_size = max_size
+        self._plans: "OrderedDict[GraphFingerprint, XCSPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, *, graph: XCSGraph) -> XCSPlan:
+        """
+        Returns the cached plan for a graph, compiling and caching it on a miss.
+
+        Args:
+            graph: Graph to execute.
+
+        Returns:
+            A plan for graph.
+        """
+        key = graph_fingerprint(graph=graph)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+        if plan is not None:
+            return plan.bind(graph=graph)
+
+        plan = compile_graph(graph=graph)
+        with self._lock:
+            self.misses += 1
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self._max_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        """Drops all cached plans and resets the hit and miss counters."""
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+_PLAN_CACHE = XCSPlanCache()
+
+
+def get_plan_cache() -> XCSPlanCache:
+    """Return the process-wide plan cache used by execute_graph."""
+    return _PLAN_CACHE
+
+
+@dataclass
+class NodeTiming:
+    """
+    Wall-clock timing of a single node execution.
+
+    All timestamps come from time.perf_counter() in the scheduling process, so
+    they are comparable with each other within a run but not across processes.
+
+    Attributes:
+        submitted: When the node was handed to an executor.
+        started: When the node's operator began running, if known.
+        finished: When the node's operator returned or raised, if known.
+        thread_id: threading.get_ident() of the thread that ran the operator,
+            or None if it ran in another process or has not started.
+        thread_name: Name of the thread, or of the worker process, that ran it.
+    """
+
+    submitted: float
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    thread_id: Optional[int] = None
+    thread_name: Optional[str] = None
+
+    def mark_started(self) -> None:
+        """Records that the operator is starting on the current thread."""
+        self.thread_id = threading.get_ident()
+        self.thread_name = threading.current_thread().name
+        self.started = time.perf_counter()
+
+    @property
+    def queue_time(self) -> Optional[float]:
+        """Seconds spent waiting for a worker, if known."""
+        if self.started is None:
+            return None
+        return self.started - self.submitted
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds spent running the operator, if known."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class NodeCompletion(NamedTuple):
+    """
+    A node result produced by a streaming execution.
+
+    Attributes:
+        node_id: ID of the completed node.
+        result: The node's output.
+        timing: When the node was submitted, started and finished.
+    """
+
+    node_id: str
+    result: Any
+    timing: NodeTiming
+
+
 # ------------------------------------------------------------------------------
 # Scheduler Interface and Implementation
 # ------------------------------------------------------------------------------
@@ -198,6 +617,51 @@ class IScheduler(ABC):
         pass
 
 
+class ReadyQueue:
+    """
+    Last-in, first-out queue of task IDs that are ready for dispatch.
+
+    Schedulers that dispatch in a different order provide a subclass with the
+    same push/pop interface from _create_ready_queue.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._items: List[str] = []
+
+    def push(self, task_id: str) -> None:
+        """
+        Adds a ready task.
+
+        Args:
+            task_id: ID of the task whose dependencies are satisfied
+        """
+        self._items.append(task_id)
+
+    def pop(self) -> str:
+        """
+        Removes and returns the next task to dispatch.
+
+        Returns:
+            The ID of the most recently added task
+        """
+        return self._items.pop()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def _adopt_shared_result(
+    node: XCSNode, timing: NodeTiming, shared: "Future[Any]"
+) -> None:
+    """Records a node that waited for an identical invocation instead of running."""
+    timing.started = timing.submitted
+    timing.finished = time.perf_counter()
+    timing.thread_name = "xcs-coalesced"
+    if not shared.cancelled() and shared.exception() is None:
+        node.captured_outputs = shared.result()
+
+
 class TopologicalSchedulerWithParallelDispatch(IScheduler):
     """
     High-performance scheduler with dependency-based parallel execution.
@@ -212,18 +676,93 @@ class TopologicalSchedulerWithParallelDispatch(IScheduler):
     - Automatic deadlock detection and prevention
     - Efficient result propagation between dependent tasks
     
+    By default tasks run on the process-wide shared pool (see executor_pool), so
+    repeated executions do not pay thread spin-up and join costs. In that mode
+    max_workers caps the number of this run's tasks in flight at once rather
+    than sizing a dedicated pool. When the scheduler is itself invoked from a
+    shared pool worker (a graph nested inside a graph node), it falls back to a
+    private pool so that the nested run cannot starve the shared one.
+    
+    Nodes carrying a ``resource_class`` hint are also held to the capacity of
+    their class (see resource_limits); a node whose class is saturated waits in
+    the scheduler without occupying a worker.
+
+    With a hedging policy, a node that straggles past its learned latency
+    percentile gets a duplicate attempt, and the first attempt to succeed wins.
+
+    With request coalescing enabled, a node invocation identical to one already
+    in flight, in this run or any other, waits for it and shares its result.
+    
     The scheduler maintains minimal state and leverages immutable data structures
     where possible for thread safety during concurrent execution.
     """
 
-    def __init__(self, *, max_workers: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        use_shared_executor: bool = True,
+        policy: Optional[ExecutionPolicy] = None,
+        resource_limits: Optional[ResourceLimits] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ) -> None:
         """
         Initialize the scheduler.
 
         Args:
             max_workers: Maximum number of concurrent workers. None means auto.
+            executor: Optional caller-owned executor to dispatch tasks to. The
+                scheduler never shuts it down.
+            use_shared_executor: Whether to dispatch to the process-wide shared
+                pool when no executor is given. When False, a private pool is
+                created and joined for every run.
+            policy: Deadlines and failure handling applied to every run unless a
+                run passes its own. Defaults to fail-fast without deadlines.
+            resource_limits: Per-class capacities for nodes with a resource_class
+                hint. Defaults to the process-wide limits, which are shared with
+                every other scheduler.
+            hedging: Optional policy under which nodes that run longer than
+                their learned latency percentile get a duplicate attempt (see
+                hedging). None disables hedging.
+            coalescer: Registry through which identical node invocations in
+                flight at the same time share one execution (see coalescing).
+                Defaults to the process-wide coalescer, which is shared with
+                every other scheduler and disabled until configured.
         """
         self._max_workers = max_workers
+        self._executor = executor
+        self._use_shared_executor = use_shared_executor
+        self.policy = policy or DEFAULT_EXECUTION_POLICY
+        self.resource_limits = (
+            resource_limits if resource_limits is not None else get_resource_limits()
+        )
+        self.hedging = hedging
+        self.coalescer = coalescer if coalescer is not None else get_request_coalescer()
+
+    @contextmanager
+    def _executor_scope(self) -> Iterator[Executor]:
+        """
+        Provides the executor for a single run.
+
+        Yields:
+            The caller-supplied executor, the shared pool, or a private pool that
+            is shut down when the scope exits.
+        """
+        if self._executor is not None:
+            yield self._executor
+        elif self._use_shared_executor and not is_shared_worker_thread():
+            yield get_shared_executor()
+        else:
+            executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            try:
+                yield executor
+            except BaseException:
+                # Do not wait for abandoned or cancelled nodes on the way out.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown(wait=True)
 
     def run_plan(
         self,
@@ -231,59 +770,203 @@ class TopologicalSchedulerWithParallelDispatch(IScheduler):
         plan: XCSPlan,
         global_input: Dict[str, Any],
         graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
     ) -> Dict[str, Any]:
-        # Build dependency counts and reverse dependency mapping.
-        dependency_count: Dict[str, int] = {}
-        reverse_dependencies: Dict[str, List[str]] = {}
-        for task_id, task in plan.tasks.items():
-            dependency_count[task_id] = len(task.inbound_nodes)
-            for parent in task.inbound_nodes:
-                reverse_dependencies.setdefault(parent, []).append(task_id)
+        return {
+            completion.node_id: completion.result
+            for completion in self.iter_plan(
+                plan=plan, global_input=global_input, graph=graph, policy=policy
+            )
+        }
+
+    def iter_plan(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Iterator[NodeCompletion]:
+        """
+        Executes a plan, yielding each node's result as soon as it completes.
+
+        Children of a completed node are submitted before its completion is
+        yielded, so a slow consumer does not hold back dependent work. When the
+        run stops early, because a node failed under the fail-fast policy, a
+        deadline passed or the consumer stopped iterating, tasks that have not
+        started are cancelled and running nodes see their cancellation token set.
 
-        # Initialize tasks with zero dependencies.
-        available_tasks: List[str] = [
-            tid for tid, count in dependency_count.items() if count == 0
-        ]
+        Args:
+            plan: The compiled execution plan containing tasks and their dependencies.
+            global_input: Input data available to all nodes in the graph.
+            graph: The original graph containing node definitions and attributes.
+            policy: Deadlines and failure handling for this run. Defaults to the
+                scheduler's policy.
+
+        Yields:
+            A NodeCompletion for every successful node, in completion order.
+
+        Raises:
+            NodeTimeoutError: If a node overruns its deadline under fail-fast.
+            GraphTimeoutError: If the run overruns its deadline.
+            GraphExecutionError: At the end of a "continue" run in which nodes failed.
+        """
+        policy = policy or self.policy
+        remaining, available_tasks = self._prepare_run(plan=plan, graph=graph)
         results: Dict[str, Any] = {}
-        pending_futures: List[Future[Any]] = []
-        future_to_task: Dict[Future[Any], str] = {}
-
-        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-            while available_tasks or pending_futures:
-                # Submit all currently available tasks.
-                while available_tasks:
-                    task_id = available_tasks.pop()
+        errors: Dict[str, BaseException] = {}
+        run_token = CancellationToken()
+        run_deadline = (
+            time.perf_counter() + policy.timeout if policy.timeout else None
+        )
+        # Futures post themselves to this queue when they finish, so the dispatch
+        # loop wakes up once per completed task and submits newly-ready children
+        # immediately instead of waiting for a batch of futures to drain.
+        completed: "queue.SimpleQueue[Optional[Future[Any]]]" = queue.SimpleQueue()
+        future_to_task: Dict[Future[Any], _InFlightTask] = {}
+        node_deadlines: List[Tuple[float, int, Future[Any]]] = []
+        sequence = itertools.count()
+        admission = ResourceAdmission(
+            ready=available_tasks, graph=graph, limits=self.resource_limits
+        )
+        trace = start_profiled_run(scheduler=self, node_count=len(plan.node_ids))
+        completed_run = False
+
+        # Wake the dispatch loop when any run frees a resource slot.
+        def wake() -> None:
+            completed.put(None)
+
+        with self._executor_scope() as executor:
+
+            def submit_available() -> None:
+                # Submit available tasks, up to the per-run concurrency limit.
+                while (
+                    self._max_workers is None
+                    or len(future_to_task) < self._max_workers
+                ):
+                    admitted = admission.next_task()
+                    if admitted is None:
+                        break
+                    task_id, resource_class = admitted
                     input_data = self._gather_inputs(
                         node_id=task_id,
                         results=results,
                         global_input=global_input,
                         graph=graph,
+                        recipe=plan.input_recipes[plan.index_of[task_id]],
                     )
-                    future = executor.submit(
-                        self._exec_operator,
+                    timing = NodeTiming(submitted=time.perf_counter())
+                    token = CancellationToken(parent=run_token)
+                    future = self._submit_node(
+                        executor=executor,
                         node_id=task_id,
                         input_data=input_data,
                         graph=graph,
+                        timing=timing,
+                        token=token,
+                        resource_class=resource_class,
                     )
-                    pending_futures.append(future)
-                    future_to_task[future] = task_id
-
-                # Process tasks as they complete.
-                for future in as_completed(pending_futures.copy()):
-                    pending_futures.remove(future)
-                    task_id = future_to_task.pop(future)
-                    try:
-                        result = future.result()
-                        results[task_id] = result
-                        # Mark dependent tasks as available when all dependencies are satisfied.
-                        for child in reverse_dependencies.get(task_id, []):
-                            dependency_count[child] -= 1
-                            if dependency_count[child] == 0:
-                                available_tasks.append(child)
-                    except Exception as e:
-                        logger.exception("Task %s failed: %r", task_id, e)
-                        raise e
-        return results
+                    future_to_task[future] = _InFlightTask(task_id, timing, token)
+                    node_timeout = policy.node_timeout_for(graph.nodes.get(task_id))
+                    if node_timeout is not None:
+                        heapq.heappush(
+                            node_deadlines,
+                            (timing.submitted + node_timeout, next(sequence), future),
+                        )
+                    # Release the slot before the completion is posted, so the
+                    # loop sees the freed capacity when it handles it.
+                    admission.release_when_done(future, resource_class)
+                    future.add_done_callback(completed.put)
+
+            if admission.enabled:
+                self.resource_limits.add_listener(wake)
+            try:
+                submit_available()
+                while future_to_task or admission.waiting:
+                    # Process the next task to complete or overrun its deadline.
+                    future, timed_out = _next_finished(
+                        completed=completed,
+                        in_flight=future_to_task,
+                        node_deadlines=node_deadlines,
+                        run_deadline=run_deadline,
+                    )
+                    if future is None:
+                        # A resource slot was freed; parked tasks may fit now.
+                        submit_available()
+                        continue
+                    task_id, timing, token = future_to_task.pop(future)
+                    error = _task_error(
+                        future=future, task_id=task_id, timed_out=timed_out
+                    )
+                    if trace is not None:
+                        trace.record_node(node_id=task_id, timing=timing, error=error)
+                    if error is not None:
+                        token.cancel()
+                        future.cancel()
+                        if policy.fail_fast:
+                            raise error
+                        errors[task_id] = error
+                        submit_available()
+                        continue
+                    result = future.result()
+                    results[task_id] = result
+                    # Mark dependent tasks as available when all dependencies are satisfied.
+                    for child in plan.child_indices[plan.index_of[task_id]]:
+                        remaining[child] -= 1
+                        if remaining[child] == 0:
+                            available_tasks.push(plan.node_ids[child])
+                    submit_available()
+                    yield NodeCompletion(node_id=task_id, result=result, timing=timing)
+                _raise_collected_errors(plan=plan, results=results, errors=errors)
+                completed_run = True
+            finally:
+                if admission.enabled:
+                    self.resource_limits.remove_listener(wake)
+                # If the run stops early, drop work that has not started yet and
+                # ask running nodes to stop.
+                run_token.cancel()
+                for future in future_to_task:
+                    future.cancel()
+                if trace is not None:
+                    _finish_trace(
+                        trace=trace, in_flight=future_to_task, completed=completed_run
+                    )
+
+    def _prepare_run(
+        self, *, plan: XCSPlan, graph: XCSGraph
+    ) -> Tuple[List[int], ReadyQueue]:
+        """
+        Builds the per-run dependency bookkeeping for a plan.
+
+        Args:
+            plan: The plan about to be executed
+            graph: Original graph containing node definitions
+
+        Returns:
+            The number of unfinished dependencies of each task, by plan index,
+            and a ready queue seeded with the tasks that have no dependencies
+        """
+        remaining = list(plan.in_degree)
+        available_tasks = self._create_ready_queue(plan=plan, graph=graph)
+        for node_id in plan.levels[0] if plan.levels else ():
+            available_tasks.push(node_id)
+        return remaining, available_tasks
+
+    def _create_ready_queue(self, *, plan: XCSPlan, graph: XCSGraph) -> ReadyQueue:
+        """
+        Creates the queue holding tasks whose dependencies are all satisfied.
+
+        Subclasses override this to change the order in which ready tasks are
+        dispatched. The default is last-in, first-out.
+
+        Args:
+            plan: The plan about to be executed
+            graph: Original graph containing node definitions
+
+        Returns:
+            An empty ready queue for a single run
+        """
+        return ReadyQueue()
 
     def _gather_inputs(
         self,
@@ -292,34 +975,259 @@ class TopologicalSchedulerWithParallelDispatch(IScheduler):
         results: Dict[str, Any],
         global_input: Dict[str, Any],
         graph: XCSGraph,
-    ) -> Dict[str, Any]:
+        recipe: Optional[InputRecipe] = None,
+    ) -> Mapping[str, Any]:
         """
-        Gathers inputs for a node by merging global input with outputs from upstream tasks.
+        Gathers inputs for a node by layering upstream outputs over the global input.
+
+        The result is a copy-on-write InputView rather than a merged copy, so the
+        global input is shared by every node instead of being copied per node.
 
         Args:
             node_id: ID of the node to gather inputs for
             results: Results from previously executed nodes
             global_input: Input data available to all nodes
             graph: Original graph containing node definitions
+            recipe: The node's precompiled input recipe. If omitted, the node's
+                parents and attributes are looked up in the graph.
 
         Returns:
-            Dictionary of input data for the node
+            Copy-on-write mapping of input data for the node
         """
-        inputs = dict(global_input)
-        node = graph.get_node(node_id=node_id)
-        for parent in node.inbound_edges:
-            parent_output = results.get(parent, {})
-            if isinstance(parent_output, dict):
-                inputs.update(parent_output)
-        if node.attributes:
-            inputs["node_attributes"] = node.attributes
-        return inputs
+        if recipe is None:
+            node = graph.get_node(node_id=node_id)
+            recipe = InputRecipe(
+                parent_ids=tuple(node.inbound_edges),
+                node_attributes=node.attributes,
+            )
+        parent_outputs = []
+        for parent in recipe.parent_ids:
+            parent_output = results.get(parent)
+            if isinstance(parent_output, Mapping):
+                parent_outputs.append(parent_output)
+        return InputView.from_parts(
+            global_input=global_input,
+            parent_outputs=parent_outputs,
+            node_attributes=recipe.node_attributes,
+        )
+
+    def _submit_node(
+        self,
+        *,
+        executor: Executor,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+        resource_class: Optional[str],
+    ) -> Future[Any]:
+        """
+        Submits a node, sharing the result of an identical invocation in flight
+        when request coalescing is enabled.
+
+        Args:
+            executor: The executor for this run
+            node_id: ID of the node to execute
+            input_data: Input data for the node
+            graph: Original graph containing node definitions
+            timing: Timing record to fill in with start and finish times
+            token: Cancellation token for the node
+            resource_class: The resource class slot reserved for the node, if any
+
+        Returns:
+            A future resolving to the node's result
+        """
+        start = functools.partial(
+            self._start_node,
+            executor=executor,
+            node_id=node_id,
+            input_data=input_data,
+            graph=graph,
+            timing=timing,
+            token=token,
+            resource_class=resource_class,
+        )
+        coalescer = self.coalescer
+        if coalescer.enabled:
+            node = graph.nodes.get(node_id)
+            if node is not None and coalescer.applies_to(node):
+                return coalescer.submit(
+                    operator=node.operator,
+                    inputs=input_data,
+                    start=start,
+                    on_shared=functools.partial(_adopt_shared_result, node, timing),
+                )
+        return start()
+
+    def _start_node(
+        self,
+        *,
+        executor: Executor,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+        resource_class: Optional[str],
+    ) -> Future[Any]:
+        """
+        Starts a node, hedging it when the scheduler has a hedging policy.
+
+        Args:
+            executor: The executor for this run
+            node_id: ID of the node to execute
+            input_data: Input data for the node
+            graph: Original graph containing node definitions
+            timing: Timing record to fill in with start and finish times
+            token: Cancellation token for the node
+            resource_class: The resource class slot reserved for the node, if any
+
+        Returns:
+            A future resolving to the node's result
+        """
+        hedging = self.hedging
+        node = graph.nodes.get(node_id) if hedging is not None else None
+        if hedging is None or not hedging.applies_to(node):
+            return self._submit_task(
+                executor=executor,
+                node_id=node_id,
+                input_data=input_data,
+                graph=graph,
+                timing=timing,
+                token=token,
+            )
+        key = hedging.key_for(node_id=node_id, node=node)
+        submit = functools.partial(
+            self._submit_task,
+            executor=executor,
+            node_id=node_id,
+            input_data=input_data,
+            graph=graph,
+        )
+        delay = hedging.begin(key)
+        if delay is None:
+            # Too few observations to hedge yet; only learn from this run.
+            future = submit(timing=timing, token=token)
+            future.add_done_callback(
+                functools.partial(observe_latency, hedging, key, timing)
+            )
+            return future
+        return HedgedExecution(
+            policy=hedging,
+            key=key,
+            timing=timing,
+            token=token,
+            submit=submit,
+            reserve_hedge=functools.partial(self._reserve_hedge, resource_class),
+            release_hedge=functools.partial(self._release_hedge, resource_class),
+        ).start(delay=delay)
+
+    def _reserve_hedge(self, resource_class: Optional[str]) -> bool:
+        """
+        Reserves hedge budget and, for a node with a resource class, a slot.
+
+        Args:
+            resource_class: The node's resource class, if limits apply to it
+
+        Returns:
+            True if a duplicate attempt may be launched
+        """
+        if resource_class is not None and not self.resource_limits.try_acquire(
+            resource_class
+        ):
+            return False
+        if self.hedging is not None and self.hedging.try_hedge():
+            return True
+        self._release_hedge(resource_class)
+        return False
+
+    def _release_hedge(self, resource_class: Optional[str]) -> None:
+        """Returns the slot reserved for a duplicate attempt, if any."""
+        if resource_class is not None:
+            self.resource_limits.release(resource_class)
+
+    def _submit_task(
+        self,
+        *,
+        executor: Executor,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+    ) -> Future[Any]:
+        """
+        Starts executing a node and returns a future for its result.
+
+        Subclasses override this to route individual nodes elsewhere, for example
+        to worker processes. The returned future must not have any callbacks
+        that depend on its result being recorded in the graph first.
+
+        Args:
+            executor: The executor for this run
+            node_id: ID of the node to execute
+            input_data: Input data for the node
+            graph: Original graph containing node definitions
+            timing: Timing record to fill in with start and finish times
+            token: Cancellation token for the node
+
+        Returns:
+            A future resolving to the node's result
+        """
+        return executor.submit(
+            self._exec_timed,
+            node_id=node_id,
+            input_data=input_data,
+            graph=graph,
+            timing=timing,
+            token=token,
+        )
+
+    def _exec_timed(
+        self,
+        *,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+    ) -> Any:
+        """
+        Executes a node's operator, recording when it starts and finishes.
+
+        The node is skipped if its run was cancelled while it waited for a
+        worker, and the token is installed as the current cancellation token
+        while the operator runs.
+
+        Args:
+            node_id: ID of the node to execute
+            input_data: Input data for the node
+            graph: Original graph containing node definitions
+            timing: Timing record to fill in
+            token: Cancellation token for the node
+
+        Returns:
+            Result of the operator execution
+
+        Raises:
+            ExecutionCancelledError: If the node was cancelled before it started.
+        """
+        token.raise_if_cancelled()
+        timing.mark_started()
+        try:
+            with cancellation_scope(token):
+                return self._exec_operator(
+                    node_id=node_id, input_data=input_data, graph=graph
+                )
+        finally:
+            timing.finished = time.perf_counter()
 
     def _exec_operator(
         self,
         *,
         node_id: str,
-        input_data: Dict[str, Any],
+        input_data: Mapping[str, Any],
         graph: XCSGraph,
     ) -> Any:
         """
@@ -340,17 +1248,241 @@ class TopologicalSchedulerWithParallelDispatch(IScheduler):
         return result
 
 
+class _InFlightTask(NamedTuple):
+    """Bookkeeping for a dispatched node."""
+
+    node_id: str
+    timing: NodeTiming
+    token: CancellationToken
+
+
+def _next_finished(
+    *,
+    completed: "queue.SimpleQueue[Optional[Future[Any]]]",
+    in_flight: Dict[Future[Any], _InFlightTask],
+    node_deadlines: List[Tuple[float, int, Future[Any]]],
+    run_deadline: Optional[float],
+) -> Tuple[Optional[Future[Any]], bool]:
+    """
+    Waits for the next in-flight task to complete or overrun its deadline.
+
+    Completions of tasks that are no longer tracked (abandoned after a timeout)
+    are discarded.
+
+    Args:
+        completed: Queue that finished futures are posted to, and None when a
+            resource slot is freed.
+        in_flight: Futures of the tasks still running.
+        node_deadlines: Heap of (deadline, sequence, future) for tasks with deadlines.
+        run_deadline: perf_counter time by which the whole run must finish, if any.
+
+    Returns:
+        The future and whether it timed out rather than finished, or (None,
+        False) if the wait was ended by a freed resource slot.
+
+    Raises:
+        GraphTimeoutError: If the run deadline passes first.
+    """
+    while True:
+        while node_deadlines and node_deadlines[0][2] not in in_flight:
+            heapq.heappop(node_deadlines)
+        wake_at = min(
+            node_deadlines[0][0] if node_deadlines else math.inf,
+            run_deadline if run_deadline is not None else math.inf,
+        )
+        try:
+            if wake_at == math.inf:
+                future = completed.get()
+            else:
+                future = completed.get(
+                    timeout=max(0.0, wake_at - time.perf_counter())
+                )
+        except queue.Empty:
+            now = time.perf_counter()
+            if run_deadline is not None and now >= run_deadline:
+                raise GraphTimeoutError(
+                    f"Graph execution did not finish within its deadline; "
+                    f"{len(in_flight)} node(s) still running."
+                ) from None
+            if node_deadlines and node_deadlines[0][0] <= now:
+                return heapq.heappop(node_deadlines)[2], True
+            continue
+        if future is None or future in in_flight:
+            return future, False
+
+
+def _task_error(
+    *, future: "Future[Any]", task_id: str, timed_out: bool
+) -> Optional[BaseException]:
+    """
+    Returns the error a finished or timed-out task ended with, logging it.
+
+    Args:
+        future: The task's future.
+        task_id: ID of the task.
+        timed_out: Whether the task overran its deadline.
+
+    Returns:
+        The task's exception, a NodeTimeoutError, or None if it succeeded.
+    """
+    if timed_out:
+        error: Optional[BaseException] = NodeTimeoutError(
+            f"Node '{task_id}' did not finish within its deadline.", node_id=task_id
+        )
+    elif future.cancelled():
+        error = ExecutionCancelledError(f"Node '{task_id}' was cancelled.")
+    else:
+        error = future.exception()
+    if error is not None:
+        logger.error("Task %s failed: %r", task_id, error, exc_info=error)
+    return error
+
+
+def _raise_collected_errors(
+    *, plan: XCSPlan, results: Dict[str, Any], errors: Dict[str, BaseException]
+) -> None:
+    """
+    Raises a GraphExecutionError if a "continue" run collected node failures.
+
+    Args:
+        plan: The plan that was executed.
+        results: Results of the successful nodes.
+        errors: Exception raised by each failed node.
+
+    Raises:
+        GraphExecutionError: If any node failed.
+    """
+    if not errors:
+        return
+    skipped = [
+        node_id
+        for node_id in plan.node_ids
+        if node_id not in results and node_id not in errors
+    ]
+    raise GraphExecutionError(
+        f"{len(errors)} node(s) failed ({', '.join(errors)}); "
+        f"{len(skipped)} dependent node(s) skipped.",
+        errors=errors,
+        results=results,
+        skipped=skipped,
+    )
+
+
+def _finish_trace(
+    *, trace: RunTrace, in_flight: Dict[Any, _InFlightTask], completed: bool
+) -> None:
+    """
+    Records the end of a profiled run, including the nodes it left behind.
+
+    Args:
+        trace: The run's profiler recorder.
+        in_flight: Tasks still pending or running when the run ended.
+        completed: Whether the run finished normally.
+    """
+    for task in in_flight.values():
+        trace.record_node(node_id=task.node_id, timing=task.timing, abandoned=True)
+    trace.finish(completed=completed)
+
+
 # ------------------------------------------------------------------------------
 # Top-Level API
 # ------------------------------------------------------------------------------
 
 
+def _resolve_plan(*, graph: Union[XCSGraph, XCSPlan]) -> Tuple[XCSPlan, XCSGraph]:
+    """
+    Compiles a graph if necessary, via the plan cache, and returns the plan with
+    its source graph.
+
+    Args:
+        graph: Either an XCSGraph to be compiled or a pre-compiled XCSPlan.
+
+    Returns:
+        The execution plan and the graph it was compiled from.
+    """
+    if hasattr(graph, "nodes"):
+        return get_plan_cache().get_or_compile(graph=graph), graph
+    return graph, graph.original_graph
+
+
+def _scheduler_from_options(name: Optional[str] = None) -> IScheduler:
+    """
+    Returns the scheduler configured by the active execution_options context.
+
+    Args:
+        name: Optional scheduler name ("auto", "sequential", ...) to create
+            instead of the configured scheduler, using the context's other
+            settings.
+
+    Returns:
+        The configured or named scheduler, or a default parallel scheduler
+        outside of a context.
+
+    Raises:
+        ValueError: If name is not a known scheduler name.
+    """
+    # Import here to avoid circular imports
+    from ember.xcs.engine.execution_options import SCHEDULER_NAMES, ExecutionOptions
+
+    options = ExecutionOptions.get_current()
+    if name is not None:
+        if name not in SCHEDULER_NAMES:
+            raise ValueError(
+                f"Unknown scheduler {name!r}; expected one of "
+                f"{', '.join(map(repr, SCHEDULER_NAMES))}."
+            )
+        return (options or ExecutionOptions()).create_scheduler(name)
+    if options is not None:
+        return options.get_scheduler()
+    return TopologicalSchedulerWithParallelDispatch()
+
+
+def _policy_overrides(
+    *,
+    scheduler: IScheduler,
+    timeout: Optional[float],
+    node_timeout: Optional[float],
+    failure_policy: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Builds the per-run policy argument for execute_graph's deadline options.
+
+    Args:
+        scheduler: The scheduler the run will use.
+        timeout: Seconds the whole run may take, or None to keep the scheduler's.
+        node_timeout: Default seconds per node, or None to keep the scheduler's.
+        failure_policy: "fail_fast" or "continue", or None to keep the scheduler's.
+
+    Returns:
+        Keyword arguments to pass to run_plan/iter_plan; empty if nothing is overridden.
+
+    Raises:
+        ValueError: If overrides are given for a scheduler that does not support them.
+    """
+    if timeout is None and node_timeout is None and failure_policy is None:
+        return {}
+    if not isinstance(scheduler, TopologicalSchedulerWithParallelDispatch):
+        raise ValueError(
+            f"{type(scheduler).__name__} does not support timeouts or failure policies."
+        )
+    return {
+        "policy": scheduler.policy.merged_with(
+            timeout=timeout, node_timeout=node_timeout, failure_policy=failure_policy
+        )
+    }
+
+
 def execute_graph(
     *,
     graph: Union[XCSGraph, XCSPlan],
     global_input: Dict[str, Any],
-    scheduler: Optional[IScheduler] = None,
+    scheduler: Optional[Union[IScheduler, str]] = None,
     concurrency: bool = True,
+    timeout: Optional[float] = None,
+    node_timeout: Optional[float] = None,
+    failure_policy: Optional[str] = None,
+    journal: Optional[Union[str, "os.PathLike[str]", ExecutionJournal]] = None,
+    resume: bool = False,
 ) -> Dict[str, Any]:
     """
     Executes a computational graph with the specified inputs and configuration.
@@ -358,7 +1490,8 @@ def execute_graph(
     This function serves as the primary entry point for XCS graph execution.
     It handles the complete execution lifecycle:
     
-    1. Compilation - If given an XCSGraph, compiles it to an execution plan
+    1. Compilation - If given an XCSGraph, compiles it to an execution plan, reusing
+       a cached plan when a structurally identical graph was compiled before
     2. Scheduler selection - Uses the provided scheduler or creates a default one
     3. Execution - Dispatches the plan to the scheduler for execution
     4. Result collection - Aggregates and returns the execution results
@@ -372,10 +1505,29 @@ def execute_graph(
     Args:
         graph: Either an XCSGraph to be compiled or a pre-compiled XCSPlan.
         global_input: Dictionary of input values available to all nodes in the graph.
-        scheduler: Optional custom scheduler implementation. If not provided,
-                  a default TopologicalSchedulerWithParallelDispatch is used.
+        scheduler: Optional custom scheduler implementation, or the name of one
+                  ("auto" picks sequential, threaded or async execution from
+                  the plan's shape; see execution_options). If not provided,
+                  the scheduler configured by the active execution_options
+                  context is used, or a default
+                  TopologicalSchedulerWithParallelDispatch outside of one.
         concurrency: Whether to execute nodes concurrently. Set to False for
                     sequential, deterministic execution (useful for debugging).
+        timeout: Seconds the whole run may take. Overrides the scheduler's policy.
+        node_timeout: Default seconds each node may take from dispatch; nodes
+                     override it with a ``timeout`` hint. Overrides the
+                     scheduler's policy.
+        failure_policy: "fail_fast" to stop at the first failing node and cancel
+                       outstanding work, or "continue" to run every node that
+                       does not depend on a failure and raise a
+                       GraphExecutionError listing all failures at the end.
+                       Overrides the scheduler's policy.
+        journal: Path of a journal file, or an ExecutionJournal, in which each
+                node's result is recorded as soon as the node completes (see
+                execution_journal).
+        resume: Whether to resume from the journal: nodes it records as
+               completed return their recorded results instead of running again.
+               Without resume, an existing journal is overwritten.
 
     Returns:
         A dictionary mapping node IDs to their execution results.
@@ -383,29 +1535,425 @@ def execute_graph(
     Raises:
         ExecutionError: If execution fails due to errors in node execution.
         CompilationError: If graph compilation fails due to structural issues.
+        NodeTimeoutError: If a node overruns its deadline under fail-fast.
+        GraphTimeoutError: If the run overruns its deadline.
+        GraphExecutionError: If nodes failed under the "continue" policy.
+        ValueError: If the scheduler is named but unknown, if deadlines or a
+            failure policy are requested for a scheduler that does not support
+            them, or with concurrency=False, or if resume is requested without
+            a journal.
+        JournalMismatchError: If resuming from a journal recorded for a
+            different graph or global input.
     """
-    if hasattr(graph, "nodes"):
-        plan = compile_graph(graph=graph)
-        orig_graph = graph
-    else:
-        plan = graph
-        orig_graph = plan.original_graph
-    if scheduler is None:
-        scheduler = TopologicalSchedulerWithParallelDispatch()
+    plan, orig_graph = _resolve_plan(graph=graph)
+    if scheduler is None or isinstance(scheduler, str):
+        scheduler = _scheduler_from_options(scheduler)
+    overrides = _policy_overrides(
+        scheduler=scheduler,
+        timeout=timeout,
+        node_timeout=node_timeout,
+        failure_policy=failure_policy,
+    )
+    if overrides and not concurrency:
+        raise ValueError(
+            "Timeouts and failure policies require concurrent execution."
+        )
+    if resume and journal is None:
+        raise ValueError("resume=True requires a journal.")
+    if journal is not None:
+        return _execute_journaled(
+            journal=journal,
+            resume=resume,
+            plan=plan,
+            graph=orig_graph,
+            global_input=global_input,
+            scheduler=scheduler,
+            concurrency=concurrency,
+            overrides=overrides,
+        )
     if concurrency:
-        results = scheduler.run_plan(
-            plan=plan, global_input=global_input, graph=orig_graph
+        return scheduler.run_plan(
+            plan=plan, global_input=global_input, graph=orig_graph, **overrides
         )
-        return results
-    else:
-        results: Dict[str, Any] = {}
-        # Iterate over task values instead of keys; use node_id and operator.
-        for task in plan.tasks.values():
-            input_data = scheduler._gather_inputs(
-                node_id=task.node_id,
-                results=results,
+    return dict(
+        _iter_sequential(
+            scheduler=scheduler, plan=plan, global_input=global_input, graph=orig_graph
+        )
+    )
+
+
+def _iter_sequential(
+    *,
+    scheduler: IScheduler,
+    plan: XCSPlan,
+    global_input: Dict[str, Any],
+    graph: XCSGraph,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Runs a plan's tasks one at a time on the calling thread, in topological order.
+
+    Args:
+        scheduler: Scheduler whose input gathering the run uses.
+        plan: The plan to execute.
+        global_input: Input data available to all nodes in the graph.
+        graph: The graph the plan was compiled from.
+
+    Yields:
+        (node_id, result) pairs as nodes complete.
+    """
+    results: Dict[str, Any] = {}
+    trace = start_profiled_run(scheduler=scheduler, node_count=len(plan.node_ids))
+    for index, node_id in enumerate(plan.node_ids):
+        input_data = scheduler._gather_inputs(
+            node_id=node_id,
+            results=results,
+            global_input=global_input,
+            graph=graph,
+            recipe=plan.input_recipes[index],
+        )
+        if trace is None:
+            results[node_id] = plan.tasks[node_id].operator(inputs=input_data)
+            yield node_id, results[node_id]
+            continue
+        timing = NodeTiming(submitted=time.perf_counter())
+        timing.mark_started()
+        try:
+            results[node_id] = plan.tasks[node_id].operator(inputs=input_data)
+        except BaseException as error:
+            timing.finished = time.perf_counter()
+            trace.record_node(node_id=node_id, timing=timing, error=error)
+            trace.finish(completed=False)
+            raise
+        timing.finished = time.perf_counter()
+        trace.record_node(node_id=node_id, timing=timing)
+        yield node_id, results[node_id]
+    if trace is not None:
+        trace.finish(completed=True)
+
+
+def _execute_journaled(
+    *,
+    journal: Union[str, "os.PathLike[str]", ExecutionJournal],
+    resume: bool,
+    plan: XCSPlan,
+    graph: XCSGraph,
+    global_input: Dict[str, Any],
+    scheduler: IScheduler,
+    concurrency: bool,
+    overrides: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Runs a plan while recording completed nodes in a journal.
+
+    Nodes the journal already records as completed, when resuming, replay their
+    recorded results instead of running again.
+
+    Args:
+        journal: The journal, or the path of its file.
+        resume: Whether to reuse the results already in the journal.
+        plan: The plan to execute.
+        graph: The graph the plan was compiled from.
+        global_input: Input data available to all nodes in the graph.
+        scheduler: The scheduler to execute the plan with.
+        concurrency: Whether to execute nodes concurrently.
+        overrides: Extra keyword arguments for the scheduler, such as a policy.
+
+    Returns:
+        A dictionary mapping node IDs to their execution results.
+    """
+    if not isinstance(journal, ExecutionJournal):
+        journal = ExecutionJournal(journal)
+    completed = journal.start(graph=graph, global_input=global_input, resume=resume)
+    if completed:
+        # Compiled directly: replay operators are unique to this run, so caching
+        # the plan would only evict useful entries.
+        plan = compile_graph(graph=replay_graph(graph=graph, completed=completed))
+        graph = plan.original_graph
+        logger.info(
+            "Resuming from journal '%s': %d of %d nodes already completed.",
+            journal.path,
+            len(completed),
+            len(plan.node_ids),
+        )
+    if concurrency:
+        completions: Iterator[Tuple[str, Any]] = (
+            (completion.node_id, completion.result)
+            for completion in _iter_completions(
+                scheduler=scheduler,
+                plan=plan,
                 global_input=global_input,
-                graph=orig_graph,
+                graph=graph,
+                overrides=overrides,
             )
-            results[task.node_id] = task.operator(inputs=input_data)
-        return results
+        )
+    else:
+        completions = _iter_sequential(
+            scheduler=scheduler, plan=plan, global_input=global_input, graph=graph
+        )
+    results: Dict[str, Any] = {}
+    try:
+        for node_id, result in completions:
+            results[node_id] = result
+            if node_id not in completed:
+                journal.record(node_id=node_id, result=result)
+    finally:
+        completions.close()
+        journal.close()
+    return results
+
+
+async def execute_graph_async(
+    *,
+    graph: Union[XCSGraph, XCSPlan],
+    global_input: Dict[str, Any],
+    scheduler: Optional[IScheduler] = None,
+    timeout: Optional[float] = None,
+    node_timeout: Optional[float] = None,
+    failure_policy: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Executes a computational graph from within a running event loop.
+
+    Coroutine operators are awaited directly on the caller's loop and synchronous
+    operators run on a bounded thread pool, so a single process can keep
+    thousands of provider calls in flight. This is the asynchronous counterpart
+    of execute_graph and accepts the same graph or plan argument.
+
+    Args:
+        graph: Either an XCSGraph to be compiled or a pre-compiled XCSPlan.
+        global_input: Dictionary of input values available to all nodes in the graph.
+        scheduler: Optional scheduler. An AsyncScheduler runs on the caller's loop;
+                  any other IScheduler runs in a worker thread so the loop is not
+                  blocked. If not provided, the AsyncScheduler configured by the
+                  active execution_options context is used, or a default one.
+        timeout: Seconds the whole run may take. Overrides the scheduler's policy.
+        node_timeout: Default seconds each node may take. Overrides the
+                     scheduler's policy.
+        failure_policy: "fail_fast" or "continue". Overrides the scheduler's policy.
+
+    Returns:
+        A dictionary mapping node IDs to their execution results.
+    """
+    # Import here to avoid circular imports
+    from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+
+    plan, orig_graph = _resolve_plan(graph=graph)
+    if scheduler is None:
+        scheduler = _async_scheduler_from_options()
+    overrides = _policy_overrides(
+        scheduler=scheduler,
+        timeout=timeout,
+        node_timeout=node_timeout,
+        failure_policy=failure_policy,
+    )
+    if isinstance(scheduler, AsyncScheduler):
+        return await scheduler.run_plan_async(
+            plan=plan, global_input=global_input, graph=orig_graph, **overrides
+        )
+    return await asyncio.to_thread(
+        functools.partial(
+            scheduler.run_plan,
+            plan=plan,
+            global_input=global_input,
+            graph=orig_graph,
+            **overrides,
+        )
+    )
+
+
+def _async_scheduler_from_options() -> "AsyncScheduler":
+    """
+    Returns an AsyncScheduler honoring the active execution_options context.
+
+    Returns:
+        The configured scheduler if it is an AsyncScheduler, otherwise a default
+        AsyncScheduler carrying the configured policy, hedging policy and
+        coalescer.
+    """
+    # Import here to avoid circular imports
+    from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+
+    scheduler = _scheduler_from_options()
+    if isinstance(scheduler, AsyncScheduler):
+        return scheduler
+    return AsyncScheduler(
+        policy=getattr(scheduler, "policy", None),
+        hedging=getattr(scheduler, "hedging", None),
+        coalescer=getattr(scheduler, "coalescer", None),
+    )
+
+
+def _iter_completions(
+    *,
+    scheduler: IScheduler,
+    plan: XCSPlan,
+    global_input: Dict[str, Any],
+    graph: XCSGraph,
+    overrides: Dict[str, Any],
+) -> Iterator[NodeCompletion]:
+    """
+    Streams a plan through a scheduler, falling back to run_plan if it cannot stream.
+
+    Schedulers without an iter_plan method run the whole plan first and their
+    results are then yielded in plan order, stamped with the run's start and end
+    times.
+
+    Args:
+        scheduler: The scheduler to execute the plan with.
+        plan: The plan to execute.
+        global_input: Input data available to all nodes in the graph.
+        graph: The graph the plan was compiled from.
+        overrides: Extra keyword arguments for iter_plan, such as a policy.
+
+    Yields:
+        A NodeCompletion for every node.
+    """
+    iter_plan = getattr(scheduler, "iter_plan", None)
+    if iter_plan is not None:
+        yield from iter_plan(
+            plan=plan, global_input=global_input, graph=graph, **overrides
+        )
+        return
+    submitted = time.perf_counter()
+    results = scheduler.run_plan(
+        plan=plan, global_input=global_input, graph=graph, **overrides
+    )
+    finished = time.perf_counter()
+    for node_id, result in results.items():
+        yield NodeCompletion(
+            node_id=node_id,
+            result=result,
+            timing=NodeTiming(submitted=submitted, finished=finished),
+        )
+
+
+def execute_graph_iter(
+    *,
+    graph: Union[XCSGraph, XCSPlan],
+    global_input: Dict[str, Any],
+    scheduler: Optional[Union[IScheduler, str]] = None,
+    timeout: Optional[float] = None,
+    node_timeout: Optional[float] = None,
+    failure_policy: Optional[str] = None,
+) -> Iterator[NodeCompletion]:
+    """
+    Executes a computational graph, yielding each node's result as it completes.
+
+    This is the streaming counterpart of execute_graph: instead of waiting for
+    the whole graph, callers can start post-processing, logging or streaming a
+    partial response as soon as each node finishes. Dependencies are honored
+    exactly as in execute_graph, and the children of a node are dispatched
+    before its result is handed to the caller, so a slow consumer does not delay
+    downstream work. Breaking out of the loop stops nodes that have not started.
+
+    ```python
+    for node_id, result, timing in execute_graph_iter(graph=graph, global_input=inputs):
+        print(node_id, f"{timing.run_time:.3f}s")
+    ```
+
+    Args:
+        graph: Either an XCSGraph to be compiled or a pre-compiled XCSPlan.
+        global_input: Dictionary of input values available to all nodes in the graph.
+        scheduler: Optional scheduler, or the name of one such as "auto". If not
+                  provided, the scheduler configured by the active
+                  execution_options context is used, or a default
+                  TopologicalSchedulerWithParallelDispatch outside of one.
+        timeout: Seconds the whole run may take. Overrides the scheduler's policy.
+        node_timeout: Default seconds each node may take. Overrides the
+                     scheduler's policy.
+        failure_policy: "fail_fast" or "continue". Overrides the scheduler's policy.
+
+    Yields:
+        NodeCompletion tuples of (node_id, result, timing), in completion order.
+
+    Raises:
+        ValueError: If the scheduler is named but unknown.
+    """
+    plan, orig_graph = _resolve_plan(graph=graph)
+    if scheduler is None or isinstance(scheduler, str):
+        scheduler = _scheduler_from_options(scheduler)
+    overrides = _policy_overrides(
+        scheduler=scheduler,
+        timeout=timeout,
+        node_timeout=node_timeout,
+        failure_policy=failure_policy,
+    )
+    yield from _iter_completions(
+        scheduler=scheduler,
+        plan=plan,
+        global_input=global_input,
+        graph=orig_graph,
+        overrides=overrides,
+    )
+
+
+async def execute_graph_iter_async(
+    *,
+    graph: Union[XCSGraph, XCSPlan],
+    global_input: Dict[str, Any],
+    scheduler: Optional[IScheduler] = None,
+    timeout: Optional[float] = None,
+    node_timeout: Optional[float] = None,
+    failure_policy: Optional[str] = None,
+) -> AsyncIterator[NodeCompletion]:
+    """
+    Executes a computational graph from within a running event loop, yielding
+    each node's result as it completes.
+
+    Args:
+        graph: Either an XCSGraph to be compiled or a pre-compiled XCSPlan.
+        global_input: Dictionary of input values available to all nodes in the graph.
+        scheduler: Optional scheduler. An AsyncScheduler runs on the caller's loop;
+                  any other IScheduler runs in a worker thread and its results are
+                  relayed to the loop. If not provided, the AsyncScheduler
+                  configured by the active execution_options context is used, or a
+                  default one.
+        timeout: Seconds the whole run may take. Overrides the scheduler's policy.
+        node_timeout: Default seconds each node may take. Overrides the
+                     scheduler's policy.
+        failure_policy: "fail_fast" or "continue". Overrides the scheduler's policy.
+
+    Yields:
+        NodeCompletion tuples of (node_id, result, timing), in completion order.
+    """
+    # Import here to avoid circular imports
+    from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+
+    plan, orig_graph = _resolve_plan(graph=graph)
+    if scheduler is None:
+        scheduler = _async_scheduler_from_options()
+    overrides = _policy_overrides(
+        scheduler=scheduler,
+        timeout=timeout,
+        node_timeout=node_timeout,
+        failure_policy=failure_policy,
+    )
+    if isinstance(scheduler, AsyncScheduler):
+        async for completion in scheduler.iter_plan_async(
+            plan=plan, global_input=global_input, graph=orig_graph, **overrides
+        ):
+            yield completion
+        return
+
+    # Drive the blocking iterator one step at a time on a worker thread.
+    completions = _iter_completions(
+        scheduler=scheduler,
+        plan=plan,
+        global_input=global_input,
+        graph=orig_graph,
+        overrides=overrides,
+    )
+    sentinel = object()
+    try:
+        while True:
+            completion = await asyncio.to_thread(next, completions, sentinel)
+            if completion is sentinel:
+                return
+            yield completion
+    finally:
+        try:
+            completions.close()
+        except ValueError:
+            # Cancelled while a step was still running on the worker thread; the
+            # generator finishes that step and is then garbage collected.
+            pass
@@ -0,0 +1,132 @@
+"""
+Process-Pool Scheduling for CPU-Bound XCS Nodes
+
+Threads are the right tool for nodes that wait on provider calls, but CPU-bound
+nodes (answer normalization, code-execution checks, regex extraction over long
+outputs, embedding math) serialize on the GIL when run on threads. The scheduler
+in this module keeps I/O nodes on threads and routes nodes marked with the
+``executor="process"`` hint to a pool of worker processes:
+
+```python
+graph.add_node(operator=normalize_answers, node_id="normalize", executor="process")
+```
+
+Process nodes have their operator and inputs pickled and sent to a worker, so
+the operator must be importable by reference (a module-level function or an
+instance of a module-level class) and its inputs and outputs must be picklable.
+Serialization is checked before dispatch; a node that cannot be serialized
+fails with OperatorNotPicklableError naming it, under the run's failure policy.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Mapping, Optional, Tuple
+
+from ember.xcs.engine.executor_pool import get_shared_process_executor
+from ember.xcs.engine.execution_policy import CancellationToken
+from ember.xcs.engine.remote_execution import (
+    failed_future,
+    relay_remote_result,
+    serialize_node,
+)
+from ember.xcs.engine.xcs_engine import (
+    NodeTiming,
+    TopologicalSchedulerWithParallelDispatch,
+)
+from ember.xcs.exceptions import OperatorNotPicklableError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+EXECUTOR_HINT = "executor"
+PROCESS_EXECUTOR = "process"
+
+
+def _run_pickled_operator(
+    operator_payload: bytes, inputs_payload: bytes
+) -> Tuple[Any, float, int]:
+    """Worker-process entry point: unpickle an operator and its inputs and run it.
+
+    Args:
+        operator_payload: The pickled operator.
+        inputs_payload: The pickled input dictionary.
+
+    Returns:
+        The operator's result, the seconds it took to run and the worker's
+        process ID. Clocks are not comparable across processes, so only the
+        duration is reported.
+    """
+    operator = pickle.loads(operator_payload)
+    inputs = pickle.loads(inputs_payload)
+    started = time.perf_counter()
+    result = operator(inputs=inputs)
+    return result, time.perf_counter() - started, os.getpid()
+
+
+class ProcessPoolScheduler(TopologicalSchedulerWithParallelDispatch):
+    """Parallel scheduler that runs hinted nodes in worker processes.
+
+    Nodes whose ``executor`` hint is ``"process"`` run on a process pool (the
+    process-wide shared one unless an explicit pool is given); all other nodes
+    run on threads exactly as with TopologicalSchedulerWithParallelDispatch.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        process_executor: Optional[Executor] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_workers: Maximum number of concurrent nodes. None means auto.
+            process_executor: Optional caller-owned process pool for process
+                nodes. Defaults to the shared process pool.
+            **kwargs: Further options forwarded to TopologicalSchedulerWithParallelDispatch.
+        """
+        super().__init__(max_workers=max_workers, **kwargs)
+        self._process_executor = process_executor
+
+    def _submit_task(
+        self,
+        *,
+        executor: Executor,
+        node_id: str,
+        input_data: Mapping[str, Any],
+        graph: XCSGraph,
+        timing: NodeTiming,
+        token: CancellationToken,
+    ) -> Future[Any]:
+        node = graph.get_node(node_id=node_id)
+        if node.get_hint(EXECUTOR_HINT) != PROCESS_EXECUTOR:
+            return super()._submit_task(
+                executor=executor,
+                node_id=node_id,
+                input_data=input_data,
+                graph=graph,
+                timing=timing,
+                token=token,
+            )
+
+        try:
+            operator_payload, inputs_payload = serialize_node(
+                node_id=node_id,
+                operator=node.operator,
+                input_data=input_data,
+                placement=f"is marked {EXECUTOR_HINT}='{PROCESS_EXECUTOR}'",
+                remedy=", or remove the hint to run the node on a thread",
+            )
+        except OperatorNotPicklableError as error:
+            # Fail the node like any other, so the failure policy applies.
+            return failed_future(error)
+        process_executor = self._process_executor or get_shared_process_executor()
+        remote = process_executor.submit(
+            _run_pickled_operator, operator_payload, inputs_payload
+        )
+        return relay_remote_result(
+            remote=remote, node=node, timing=timing, worker_name="xcs-process"
+        )
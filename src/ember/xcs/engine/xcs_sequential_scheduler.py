@@ -0,0 +1,229 @@
+"""
+Zero-Thread Sequential Scheduling for XCS
+
+Small graphs and pure chains gain nothing from a thread pool: each node waits
+for its parent anyway, so dispatching it to a worker only adds a handoff and a
+wake-up per node. The scheduler in this module runs every node on the calling
+thread, one at a time in topological order, and otherwise behaves like the
+parallel scheduler: nodes see their parents' outputs layered over the global
+input, results are captured on the graph, runs are profiled, and execution
+policies and resource limits apply.
+
+Because a running node cannot be interrupted or abandoned without a second
+thread, deadlines are checked when a node returns: a node that overran its
+deadline fails with NodeTimeoutError and its result is discarded, and a run
+that overran its deadline stops before the next node. Operators that poll
+``current_cancellation_token()`` see the run's cancellation once it stops.
+Hedging and request coalescing need concurrent attempts and are not applied.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from ember.xcs.engine.execution_policy import CancellationToken, ExecutionPolicy
+from ember.xcs.engine.execution_profiler import start_profiled_run
+from ember.xcs.engine.resource_limits import RESOURCE_CLASS_HINT, ResourceLimits
+from ember.xcs.engine.xcs_engine import (
+    NodeCompletion,
+    NodeTiming,
+    TopologicalSchedulerWithParallelDispatch,
+    XCSPlan,
+    _raise_collected_errors,
+)
+from ember.xcs.exceptions import GraphTimeoutError, NodeTimeoutError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class SequentialScheduler(TopologicalSchedulerWithParallelDispatch):
+    """
+    Dependency-correct scheduler that runs every node on the calling thread.
+
+    Nodes run in the plan's topological order. Under the "continue" failure
+    policy, nodes downstream of a failure are skipped and every failure is
+    reported at the end, as with the parallel scheduler. Nodes carrying a
+    ``resource_class`` hint wait for a free slot of their class before running,
+    so sequential runs respect limits shared with concurrent runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: Optional[ExecutionPolicy] = None,
+        resource_limits: Optional[ResourceLimits] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            policy: Deadlines and failure handling applied to every run unless a
+                run passes its own. Defaults to fail-fast without deadlines.
+            resource_limits: Per-class capacities for nodes with a resource_class
+                hint. Defaults to the process-wide limits.
+        """
+        super().__init__(max_workers=1, policy=policy, resource_limits=resource_limits)
+
+    def iter_plan(
+        self,
+        *,
+        plan: XCSPlan,
+        global_input: Dict[str, Any],
+        graph: XCSGraph,
+        policy: Optional[ExecutionPolicy] = None,
+    ) -> Iterator[NodeCompletion]:
+        """
+        Executes a plan on the calling thread, yielding each node's result.
+
+        Args:
+            plan: The compiled execution plan.
+            global_input: Input data available to all nodes in the graph.
+            graph: The original graph containing node definitions and attributes.
+            policy: Deadlines and failure handling for this run. Defaults to the
+                scheduler's policy.
+
+        Yields:
+            A NodeCompletion for every successful node, in topological order.
+
+        Raises:
+            NodeTimeoutError: If a node overruns its deadline under fail-fast.
+            GraphTimeoutError: If the run overruns its deadline.
+            GraphExecutionError: At the end of a "continue" run in which nodes failed.
+        """
+        policy = policy or self.policy
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        run_token = CancellationToken()
+        run_deadline = time.perf_counter() + policy.timeout if policy.timeout else None
+        trace = start_profiled_run(scheduler=self, node_count=len(plan.node_ids))
+        completed_run = False
+        try:
+            for index, node_id in enumerate(plan.node_ids):
+                recipe = plan.input_recipes[index]
+                if errors and any(
+                    parent not in results for parent in recipe.parent_ids
+                ):
+                    # Downstream of a failure under the "continue" policy.
+                    continue
+                _check_run_deadline(run_deadline, remaining=len(plan.node_ids) - index)
+                node = graph.nodes.get(node_id)
+                resource_class = self._acquire_slot(
+                    node=node, run_deadline=run_deadline
+                )
+                input_data = self._gather_inputs(
+                    node_id=node_id,
+                    results=results,
+                    global_input=global_input,
+                    graph=graph,
+                    recipe=recipe,
+                )
+                timing = NodeTiming(submitted=time.perf_counter())
+                error: Optional[BaseException] = None
+                try:
+                    result = self._exec_timed(
+                        node_id=node_id,
+                        input_data=input_data,
+                        graph=graph,
+                        timing=timing,
+                        token=CancellationToken(parent=run_token),
+                    )
+                except Exception as exc:
+                    error = exc
+                finally:
+                    if resource_class is not None:
+                        self.resource_limits.release(resource_class)
+                node_timeout = policy.node_timeout_for(node)
+                if (
+                    error is None
+                    and node_timeout is not None
+                    and timing.finished - timing.submitted > node_timeout
+                ):
+                    error = NodeTimeoutError(
+                        f"Node '{node_id}' did not finish within its deadline.",
+                        node_id=node_id,
+                    )
+                if trace is not None:
+                    trace.record_node(node_id=node_id, timing=timing, error=error)
+                if error is not None:
+                    logger.error("Task %s failed: %r", node_id, error, exc_info=error)
+                    if policy.fail_fast:
+                        raise error
+                    errors[node_id] = error
+                    continue
+                _check_run_deadline(
+                    run_deadline, remaining=len(plan.node_ids) - index - 1
+                )
+                results[node_id] = result
+                yield NodeCompletion(node_id=node_id, result=result, timing=timing)
+            _raise_collected_errors(plan=plan, results=results, errors=errors)
+            completed_run = True
+        finally:
+            run_token.cancel()
+            if trace is not None:
+                trace.finish(completed=completed_run)
+
+    def _acquire_slot(
+        self, *, node: Any, run_deadline: Optional[float]
+    ) -> Optional[str]:
+        """
+        Waits for a free slot of the node's resource class, if it has a limited one.
+
+        Args:
+            node: The node about to run, or None if unknown.
+            run_deadline: perf_counter time by which the run must finish, if any.
+
+        Returns:
+            The resource class to release after the node ran, or None.
+
+        Raises:
+            GraphTimeoutError: If the run deadline passes while waiting.
+        """
+        limits = self.resource_limits
+        if node is None or not limits.active:
+            return None
+        hint = node.get_hint(RESOURCE_CLASS_HINT)
+        if hint is None:
+            return None
+        resource_class = str(hint)
+        if limits.try_acquire(resource_class):
+            return resource_class
+        freed = threading.Event()
+        limits.add_listener(freed.set)
+        try:
+            while not limits.try_acquire(resource_class):
+                timeout = (
+                    max(0.0, run_deadline - time.perf_counter())
+                    if run_deadline is not None
+                    else None
+                )
+                if not freed.wait(timeout):
+                    raise GraphTimeoutError(
+                        "Graph execution did not finish within its deadline; "
+                        f"still waiting for resource class '{resource_class}'."
+                    )
+                freed.clear()
+        finally:
+            limits.remove_listener(freed.set)
+        return resource_class
+
+
+def _check_run_deadline(run_deadline: Optional[float], *, remaining: int) -> None:
+    """
+    Raises GraphTimeoutError if a sequential run has overrun its deadline.
+
+    Args:
+        run_deadline: perf_counter time by which the run must finish, if any.
+        remaining: Number of nodes not yet run.
+    """
+    if run_deadline is not None and time.perf_counter() >= run_deadline:
+        raise GraphTimeoutError(
+            f"Graph execution did not finish within its deadline; "
+            f"{remaining} node(s) not run."
+        )
+
+
+__all__ = ["SequentialScheduler"]
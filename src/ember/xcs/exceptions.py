@@ -0,0 +1,91 @@
+"""Exceptions raised by the XCS execution engine."""
+
+from typing import Any, Dict, List, Optional
+
+from ember.core.exceptions import EmberError
+
+
+class XCSError(EmberError):
+    """Base class for errors raised by the XCS engine."""
+
+    pass
+
+
+class OperatorNotPicklableError(XCSError):
+    """Raised when a node routed to a worker process cannot be serialized."""
+
+    pass
+
+
+class WorkerCrashedError(XCSError):
+    """Raised when a worker process keeps dying while running a task."""
+
+    pass
+
+
+class JournalMismatchError(XCSError):
+    """Raised when resuming from a journal recorded for a different graph or input."""
+
+    pass
+
+
+class GraphSerializationError(XCSError):
+    """Raised when a graph or plan cannot be saved to or loaded from disk."""
+
+    pass
+
+
+class ExecutionCancelledError(XCSError):
+    """Raised inside a node when the graph run it belongs to has been cancelled."""
+
+    pass
+
+
+class NodeTimeoutError(XCSError):
+    """Raised when a node does not finish within its deadline."""
+
+    def __init__(self, message: str, *, node_id: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.node_id = node_id
+
+
+class GraphTimeoutError(XCSError):
+    """Raised when a whole graph run does not finish within its deadline."""
+
+    pass
+
+
+class GraphExecutionError(XCSError):
+    """Raised at the end of a run that collected node errors instead of failing fast.
+
+    Attributes:
+        errors: Exception raised by each failed node.
+        results: Results of the nodes that completed successfully.
+        skipped: Nodes that did not run because an upstream node failed.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        errors: Dict[str, BaseException],
+        results: Dict[str, Any],
+        skipped: List[str],
+    ) -> None:
+        super().__init__(message)
+        self.errors = errors
+        self.results = results
+        self.skipped = skipped
+
+
+__all__ = [
+    "XCSError",
+    "OperatorNotPicklableError",
+    "WorkerCrashedError",
+    "JournalMismatchError",
+    "GraphSerializationError",
+    "ExecutionCancelledError",
+    "NodeTimeoutError",
+    "GraphTimeoutError",
+    "GraphExecutionError",
+]
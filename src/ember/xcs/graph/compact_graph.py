@@ -0,0 +1,723 @@
+"""
+Compact Array-Backed XCS Graph
+
+XCSGraph keeps every node as a Python object holding two edge lists, an
+attributes dictionary and captured input and output dictionaries. That is
+convenient for small hand-built graphs, but for graphs of tens of thousands
+of nodes, such as those generated from batch traces, the per-node objects
+dominate memory and the linear duplicate checks in add_edge dominate build
+time.
+
+CompactXCSGraph is an XCSGraph subclass with the same public API and a
+columnar layout:
+
+- Nodes are numbered in insertion order. Operators, attributes and captured
+  data are kept in parallel lists indexed by that number.
+- Edges are appended to two integer arrays. Adjacency is materialized as
+  compressed sparse rows (an offsets array and a targets array) for each
+  direction on the first read, which also drops repeated edges from the
+  arrays, so building a graph costs constant time per edge. Edges added after
+  that are checked for duplicates, as XCSGraph.add_edge does, and indexed per
+  node alongside the rows until there are as many of them as built edges;
+  only then are the rows rebuilt, so reads between edits stay cheap.
+- Attributes and captured inputs are created on first access; most nodes of a
+  generated graph never carry either.
+- ``graph.nodes`` is a mapping of lightweight ``__slots__`` views that read
+  from and write to the graph's columns. Storing an XCSNode in it copies the
+  node into the graph, along with those of its edges whose other end is
+  already in the graph; nodes cannot be removed.
+
+Example:
+    graph = CompactXCSGraph()
+    graph.add_node(operator=fetch, node_id="fetch")
+    graph.add_node(operator=parse, node_id="parse", resource_class="cpu")
+    graph.add_edge(from_id="fetch", to_id="parse")
+    results = execute_graph(graph=graph, global_input={"url": url})
+
+Edge lists returned by a node view are fresh lists in insertion order, just as
+XCSNode keeps them; add edges through the graph rather than by mutating those
+lists. Copying a node view (for example with copy.copy) detaches it into a
+standalone XCSNode.
+"""
+
+from __future__ import annotations
+
+import uuid
+from array import array
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ember.core.types.xcs_types import XCSNodeAttributes
+from ember.xcs.graph.xcs_graph import (
+    CapturedInputs,
+    I,
+    O,
+    XCSGraph,
+    XCSNode,
+    _build_node_attributes,
+)
+
+# Compressed sparse rows: row i spans targets[offsets[i]:offsets[i + 1]].
+_Rows = Tuple[array, array]
+
+# Edges added since the rows were built are folded into them once they
+# outnumber the built edges, or this many, whichever is larger.
+_MIN_PENDING_EDGES = 1024
+
+
+class CompactXCSNode(Generic[I, O]):
+    """View of one node of a CompactXCSGraph.
+
+    Views hold only the graph and the node's index; every attribute reads
+    from or writes to the graph's columns, so two views of the same node are
+    interchangeable.
+    """
+
+    __slots__ = ("_graph", "_index")
+
+    def __init__(self, graph: "CompactXCSGraph[I, O]", index: int) -> None:
+        self._graph = graph
+        self._index = index
+
+    @property
+    def node_id(self) -> str:
+        return self._graph._ids[self._index]
+
+    @node_id.setter
+    def node_id(self, node_id: str) -> None:
+        self._graph._rename(self._index, node_id)
+
+    @property
+    def operator(self) -> Callable[[I], O]:
+        return self._graph._operators[self._index]
+
+    @operator.setter
+    def operator(self, operator: Callable[[I], O]) -> None:
+        self._graph._operators[self._index] = operator
+
+    @property
+    def inbound_edges(self) -> List[str]:
+        return self._graph._neighbor_ids(self._index, inbound=True)
+
+    @property
+    def outbound_edges(self) -> List[str]:
+        return self._graph._neighbor_ids(self._index, inbound=False)
+
+    @property
+    def attributes(self) -> XCSNodeAttributes:
+        columns = self._graph._attributes
+        attributes = columns[self._index]
+        if attributes is None:
+            attributes = columns[self._index] = {}
+        return attributes
+
+    @attributes.setter
+    def attributes(self, attributes: XCSNodeAttributes) -> None:
+        self._graph._attributes[self._index] = attributes
+
+    @property
+    def attrs(self) -> XCSNodeAttributes:
+        """Alias for attributes, for compatibility with tracing code."""
+        return self.attributes
+
+    @property
+    def captured_inputs(self) -> CapturedInputs:
+        columns = self._graph._captured_inputs
+        captured = columns[self._index]
+        if captured is None:
+            captured = columns[self._index] = {"prompts": None}
+        return captured
+
+    @captured_inputs.setter
+    def captured_inputs(self, captured: CapturedInputs) -> None:
+        self._graph._captured_inputs[self._index] = captured
+
+    @property
+    def captured_outputs(self) -> Optional[O]:
+        return self._graph._captured_outputs[self._index]
+
+    @captured_outputs.setter
+    def captured_outputs(self, outputs: Optional[O]) -> None:
+        self._graph._captured_outputs[self._index] = outputs
+
+    def add_inbound_edge(self, *, from_id: str) -> None:
+        """Adds an edge from the specified node to this one.
+
+        Args:
+            from_id: The identifier of the source node.
+        """
+        self._graph.add_edge(from_id=from_id, to_id=self.node_id)
+
+    def add_outbound_edge(self, *, to_id: str) -> None:
+        """Adds an edge from this node to the specified node.
+
+        Args:
+            to_id: The identifier of the destination node.
+        """
+        self._graph.add_edge(from_id=self.node_id, to_id=to_id)
+
+    def get_hint(self, key: str, default: object = None) -> object:
+        """Looks up a scheduling hint attached to this node.
+
+        Same lookup as XCSNode.get_hint, without creating the attributes of a
+        node that has none.
+
+        Args:
+            key: Name of the hint.
+            default: Value returned when the hint is not set.
+
+        Returns:
+            The hint value, or default if the node does not carry it.
+        """
+        attributes = self._graph._attributes[self._index]
+        if not attributes:
+            return default
+        if key in attributes:
+            return attributes[key]  # type: ignore[literal-required]
+        metadata = attributes.get("metadata")
+        if metadata:
+            custom_data = metadata.get("custom_data")
+            if custom_data and key in custom_data:
+                return custom_data[key]
+        return default
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactXCSNode):
+            return NotImplemented
+        return self._graph is other._graph and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._graph), self._index))
+
+    def __copy__(self) -> XCSNode[I, O]:
+        node: XCSNode[I, O] = XCSNode(operator=self.operator, node_id=self.node_id)
+        node.inbound_edges = self.inbound_edges
+        node.outbound_edges = self.outbound_edges
+        node.attributes = dict(self.attributes)
+        node.captured_inputs = dict(self.captured_inputs)  # type: ignore[assignment]
+        node.captured_outputs = self.captured_outputs
+        return node
+
+    def __repr__(self) -> str:
+        return f"CompactXCSNode(node_id={self.node_id!r})"
+
+
+class _NodeMapping(MutableMapping[str, CompactXCSNode]):
+    """Mapping from node ID to node view, in insertion order."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "CompactXCSGraph") -> None:
+        self._graph = graph
+
+    def __getitem__(self, node_id: str) -> CompactXCSNode:
+        return CompactXCSNode(self._graph, self._graph._index[node_id])
+
+    def __setitem__(self, node_id: str, node: XCSNode) -> None:
+        self._graph._store(node_id, node)
+
+    def __delitem__(self, node_id: str) -> None:
+        raise TypeError("Nodes cannot be removed from a CompactXCSGraph.")
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._graph._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph._ids)
+
+    def __len__(self) -> int:
+        return len(self._graph._ids)
+
+
+class CompactXCSGraph(XCSGraph[I, O]):
+    """
+    Array-backed XCSGraph with the same public API.
+
+    Usable wherever an XCSGraph is. Use it for large generated graphs; for
+    small graphs the difference is negligible.
+
+    Attributes:
+        nodes: Mapping of node IDs to node views.
+        entry_node: ID of the designated entry point for execution.
+        exit_node: ID of the designated final node from which to collect results.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty CompactXCSGraph."""
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._operators: List[Callable[[I], O]] = []
+        self._attributes: List[Optional[XCSNodeAttributes]] = []
+        self._captured_inputs: List[Optional[CapturedInputs]] = []
+        self._captured_outputs: List[Optional[O]] = []
+        # Every edge in insertion order; once the rows exist, every edge once.
+        self._edge_sources = array("i")
+        self._edge_targets = array("i")
+        # Rows over the edges present when they were last built (None until the
+        # first read), and the edges added since, by source and by target node.
+        self._outbound: Optional[_Rows] = None
+        self._inbound: Optional[_Rows] = None
+        self._pending_out: Dict[int, List[int]] = {}
+        self._pending_in: Dict[int, List[int]] = {}
+        self._pending_edges = 0
+        self._depths: Optional[array] = None  # type: ignore[assignment]
+        self._levels: Optional[Tuple[Tuple[str, ...], ...]] = None
+        nodes: MutableMapping[str, CompactXCSNode[I, O]] = _NodeMapping(self)
+        self.nodes = nodes  # type: ignore[assignment]
+        self.entry_node: Optional[str] = None
+        self.exit_node: Optional[str] = None
+
+    @classmethod
+    def from_graph(cls, graph: XCSGraph[I, O]) -> "CompactXCSGraph[I, O]":
+        """Builds a compact copy of a graph.
+
+        Operators, attributes and captured outputs are shared with the source
+        graph, and both edge lists of every node keep their order. (Adding
+        edges afterwards rebuilds outbound lists in the order of the inbound
+        ones, which can change tie-breaking in topological_sort.)
+
+        Args:
+            graph: Graph to copy.
+
+        Returns:
+            A compact graph with the same nodes, edges, entry and exit.
+        """
+        compact: CompactXCSGraph[I, O] = cls()
+        for node_id, node in graph.nodes.items():
+            compact._append(node_id, node.operator, node.attributes or None)
+            compact._captured_outputs[-1] = node.captured_outputs
+        index = compact._index
+        sources, targets = array("i"), array("i")
+        for node_id, node in graph.nodes.items():
+            target = index[node_id]
+            for parent_id in dict.fromkeys(node.inbound_edges):
+                compact._edge_sources.append(index[parent_id])
+                compact._edge_targets.append(target)
+            source = index[node_id]
+            for child_id in dict.fromkeys(node.outbound_edges):
+                sources.append(source)
+                targets.append(index[child_id])
+        count = len(compact._ids)
+        compact._outbound = _build_rows(sources, targets, count)
+        compact._inbound = _build_rows(
+            compact._edge_targets, compact._edge_sources, count
+        )
+        compact.entry_node = graph.entry_node
+        compact.exit_node = graph.exit_node
+        return compact
+
+    def add_node(
+        self,
+        operator: Callable[[I], O],
+        node_id: Optional[str] = None,
+        name: Optional[str] = None,
+        **attributes: object,
+    ) -> str:
+        """
+        Adds a new node to the graph.
+
+        Behaves like XCSGraph.add_node: the first node becomes the entry node,
+        each new node becomes the exit node, and extra keyword arguments are
+        stored as attributes.
+
+        Args:
+            operator: The operator (callable) to attach to this node.
+            node_id: Optional unique identifier for the node.
+            name: Optional name for the node, used as the node_id if none is given.
+            **attributes: Additional attributes to attach to the node.
+
+        Returns:
+            The unique identifier for the newly added node.
+
+        Raises:
+            ValueError: If a node with the provided node_id already exists.
+        """
+        if name is not None and node_id is None:
+            node_id = name
+        if node_id is None:
+            node_id = str(uuid.uuid4())[:8]
+        if node_id in self._index:
+            raise ValueError(f"Node with ID '{node_id}' already exists.")
+
+        node_attributes = _build_node_attributes(attributes) if attributes else None
+        self._append(node_id, operator, node_attributes)
+
+        if self.entry_node is None:
+            self.entry_node = node_id
+        self.exit_node = node_id
+        return node_id
+
+    def add_edge(
+        self, from_id: str, to_id: Optional[str] = None, **kwargs: str
+    ) -> None:
+        """Adds a directed edge from one node to another.
+
+        Adding an edge that already exists has no effect.
+
+        Args:
+            from_id: The source node's identifier.
+            to_id: The destination node's identifier.
+                If not provided, it must be specified via kwargs.
+            **kwargs: Alternative way to provide source/destination IDs.
+
+        Raises:
+            ValueError: If either the source or destination node does not exist.
+        """
+        if to_id is None:
+            if "from_id" in kwargs and "to_id" in kwargs:
+                from_id = kwargs["from_id"]
+                to_id = kwargs["to_id"]
+            else:
+                raise ValueError(
+                    "Missing destination node ID. Use add_edge(from_id, to_id) "
+                    "or add_edge(from_id=id1, to_id=id2)"
+                )
+
+        source = self._index.get(from_id)
+        if source is None:
+            raise ValueError(f"Source node with ID '{from_id}' does not exist.")
+        target = self._index.get(to_id)
+        if target is None:
+            raise ValueError(f"Destination node with ID '{to_id}' does not exist.")
+
+        outbound = self._outbound
+        if outbound is None:
+            # Repeats are dropped when the rows are first built.
+            self._edge_sources.append(source)
+            self._edge_targets.append(target)
+            self._depths = self._levels = None
+            return
+
+        pending_children = self._pending_out.get(source)
+        if pending_children is None:
+            if target in _row(outbound, source):
+                return
+            self._pending_out[source] = [target]
+        else:
+            if target in pending_children or target in _row(outbound, source):
+                return
+            pending_children.append(target)
+        pending_parents = self._pending_in.get(target)
+        if pending_parents is None:
+            self._pending_in[target] = [source]
+        else:
+            pending_parents.append(source)
+        self._edge_sources.append(source)
+        self._edge_targets.append(target)
+        self._depths = self._levels = None
+        self._pending_edges += 1
+        built_edges = len(self._edge_sources) - self._pending_edges
+        if self._pending_edges > max(_MIN_PENDING_EDGES, built_edges):
+            self._build_all_rows()
+
+    def get_node(
+        self, node_id: Optional[str] = None, **kwargs: str
+    ) -> CompactXCSNode[I, O]:
+        """Retrieves the node with the specified identifier.
+
+        Args:
+            node_id: The identifier of the node to retrieve.
+                If not provided, it must be specified via kwargs.
+            **kwargs: Alternative way to provide node_id.
+
+        Returns:
+            A view of the node.
+
+        Raises:
+            ValueError: If the node is not present in the graph.
+        """
+        if node_id is None:
+            if "node_id" in kwargs:
+                node_id = kwargs["node_id"]
+            else:
+                raise ValueError(
+                    "Missing node ID. Use get_node(node_id) or get_node(node_id=id)"
+                )
+        return CompactXCSNode(self, self._require(node_id))
+
+    def all_node_ids(self) -> List[str]:
+        """Returns a list of all node IDs present in the graph.
+
+        Returns:
+            A list containing all node identifiers.
+        """
+        return list(self._ids)
+
+    def topological_sort(self) -> List[str]:
+        """Performs a topological sort on the graph.
+
+        Produces the same order as XCSGraph.topological_sort for the same
+        sequence of add_node and add_edge calls: level by level, in insertion
+        order within a level.
+
+        Returns:
+            A list of node IDs in topologically sorted order.
+
+        Raises:
+            ValueError: If the graph contains a cycle or is otherwise not a valid DAG.
+        """
+        return [node_id for level in self.levels() for node_id in level]
+
+    def levels(self) -> Tuple[Tuple[str, ...], ...]:
+        """Groups the nodes into dependency levels, as XCSGraph.levels does.
+
+        The levels are cached until the next add_node or add_edge.
+
+        Returns:
+            The node IDs of each level.
+
+        Raises:
+            ValueError: If the graph contains a cycle or is otherwise not a valid DAG.
+        """
+        levels = self._levels
+        if levels is None:
+            depths = self._current_depths()
+            buckets: List[List[str]] = [[] for _ in range(max(depths, default=-1) + 1)]
+            for node_id, depth in zip(self._ids, depths):
+                buckets[depth].append(node_id)
+            levels = self._levels = tuple(tuple(bucket) for bucket in buckets)
+        return levels
+
+    def level_of(self, node_id: str) -> int:
+        """Returns the dependency level of a node (see levels).
+
+        Args:
+            node_id: ID of the node.
+
+        Returns:
+            The node's level, 0 for nodes without inbound edges.
+
+        Raises:
+            ValueError: If the node does not exist or the graph contains a cycle.
+        """
+        return self._current_depths()[self._require(node_id)]
+
+    def invalidate_topology(self) -> None:
+        """Drops the cached levels and order."""
+        self._depths = None
+        self._levels = None
+
+    def _current_depths(self) -> array:  # type: ignore[override]
+        depths = self._depths
+        if depths is None:
+            depths = self._depths = self._compute_depths()
+        return depths
+
+    def _compute_depths(self) -> array:  # type: ignore[override]
+        inbound = self._inbound
+        if (
+            inbound is None
+            or self._pending_edges
+            or len(inbound[0]) != len(self._ids) + 1
+        ):
+            self._build_all_rows()
+        in_offsets, _ = self._inbound
+        out_offsets, out_targets = self._outbound
+        count = len(self._ids)
+        remaining = array(
+            "i", (in_offsets[index + 1] - in_offsets[index] for index in range(count))
+        )
+        depths = array("i", [-1]) * count
+        level = [index for index in range(count) if remaining[index] == 0]
+        depth = visited = 0
+        while level:
+            next_level: List[int] = []
+            for current in level:
+                depths[current] = depth
+                for position in range(out_offsets[current], out_offsets[current + 1]):
+                    neighbor = out_targets[position]
+                    remaining[neighbor] -= 1
+                    if remaining[neighbor] == 0:
+                        next_level.append(neighbor)
+            visited += len(level)
+            level = next_level
+            depth += 1
+
+        if visited != count:
+            raise ValueError("Graph contains a cycle or is not a valid DAG.")
+        return depths
+
+    def get_predecessors(self, node_id: str) -> Set[str]:
+        """Get all immediate predecessors of a node.
+
+        Args:
+            node_id: ID of the node whose predecessors to find
+
+        Returns:
+            Set of node IDs that are immediate predecessors
+
+        Raises:
+            ValueError: If node with given ID doesn't exist
+        """
+        return set(self._neighbor_ids(self._require(node_id), inbound=True))
+
+    def get_successors(self, node_id: str) -> Set[str]:
+        """Get all immediate successors of a node.
+
+        Args:
+            node_id: ID of the node whose successors to find
+
+        Returns:
+            Set of node IDs that are immediate successors
+
+        Raises:
+            ValueError: If node with given ID doesn't exist
+        """
+        return set(self._neighbor_ids(self._require(node_id), inbound=False))
+
+    def __iter__(self) -> Iterator[CompactXCSNode[I, O]]:
+        """Iterate over all nodes in the graph.
+
+        Returns:
+            Iterator over node views
+        """
+        return (CompactXCSNode(self, index) for index in range(len(self._ids)))
+
+    def _append(
+        self,
+        node_id: str,
+        operator: Callable[[I], O],
+        attributes: Optional[XCSNodeAttributes],
+    ) -> None:
+        self.invalidate_topology()
+        self._index[node_id] = len(self._ids)
+        self._ids.append(node_id)
+        self._operators.append(operator)
+        self._attributes.append(attributes)
+        self._captured_inputs.append(None)
+        self._captured_outputs.append(None)
+
+    def _store(self, node_id: str, node: XCSNode[I, O]) -> None:
+        """Copy a node into the graph, with its edges to nodes already present."""
+        if node_id not in self._index:
+            self._append(node_id, node.operator, node.attributes or None)
+        index = self._index[node_id]
+        self._operators[index] = node.operator
+        self._attributes[index] = node.attributes or None
+        self._captured_inputs[index] = node.captured_inputs
+        self._captured_outputs[index] = node.captured_outputs
+        for parent_id in node.inbound_edges:
+            if parent_id in self._index:
+                self.add_edge(from_id=parent_id, to_id=node_id)
+        for child_id in node.outbound_edges:
+            if child_id in self._index:
+                self.add_edge(from_id=node_id, to_id=child_id)
+
+    def _rename(self, index: int, node_id: str) -> None:
+        """Give the node at index a new ID, keeping its edges."""
+        old_id = self._ids[index]
+        if node_id == old_id:
+            return
+        if node_id in self._index:
+            raise ValueError(f"Node with ID '{node_id}' already exists.")
+        del self._index[old_id]
+        self._index[node_id] = index
+        self._ids[index] = node_id
+        if self.entry_node == old_id:
+            self.entry_node = node_id
+        if self.exit_node == old_id:
+            self.exit_node = node_id
+        self._levels = None
+
+    def _require(self, node_id: str) -> int:
+        index = self._index.get(node_id)
+        if index is None:
+            raise ValueError(f"Node with ID '{node_id}' is not present in the graph.")
+        return index
+
+    def _build_all_rows(self) -> None:
+        """Rebuild both directions' rows over every edge."""
+        count = len(self._ids)
+        if self._outbound is None:
+            _drop_repeated_edges(self._edge_sources, self._edge_targets, count)
+        self._outbound = _build_rows(self._edge_sources, self._edge_targets, count)
+        self._inbound = _build_rows(self._edge_targets, self._edge_sources, count)
+        self._pending_out.clear()
+        self._pending_in.clear()
+        self._pending_edges = 0
+
+    def _neighbor_ids(self, index: int, *, inbound: bool) -> List[str]:
+        if self._outbound is None:
+            self._build_all_rows()
+        if inbound:
+            rows, pending = self._inbound, self._pending_in
+        else:
+            rows, pending = self._outbound, self._pending_out
+        ids = self._ids
+        neighbors = [ids[neighbor] for neighbor in _row(rows, index)]
+        pending_neighbors = pending.get(index)
+        if pending_neighbors:
+            neighbors.extend(ids[neighbor] for neighbor in pending_neighbors)
+        return neighbors
+
+
+def _row(rows: _Rows, index: int) -> array:
+    """Return row index of rows; rows built before the node was added are empty."""
+    offsets, targets = rows
+    if index + 1 >= len(offsets):
+        return targets[:0]
+    return targets[offsets[index] : offsets[index + 1]]
+
+
+def _drop_repeated_edges(sources: array, targets: array, count: int) -> None:
+    """Removes repeated edges from the edge arrays, keeping first occurrences.
+
+    Args:
+        sources: Source node index of every edge.
+        targets: Target node index of every edge.
+        count: Number of nodes.
+    """
+    offsets, positions = _build_rows(targets, array("i", range(len(targets))), count)
+    last_row = array("i", [-1]) * count
+    keep = bytearray(len(targets))
+    kept = 0
+    for row in range(count):
+        for position in positions[offsets[row] : offsets[row + 1]]:
+            source = sources[position]
+            if last_row[source] != row:
+                last_row[source] = row
+                keep[position] = 1
+                kept += 1
+    if kept == len(targets):
+        return
+    sources[:] = array("i", (value for value, flag in zip(sources, keep) if flag))
+    targets[:] = array("i", (value for value, flag in zip(targets, keep) if flag))
+
+
+def _build_rows(keys: array, values: array, count: int) -> _Rows:
+    """Groups edge values by key into compressed sparse rows.
+
+    A stable counting sort keeps each row in insertion order.
+
+    Args:
+        keys: Row index of every edge.
+        values: Column index of every edge.
+        count: Number of rows.
+
+    Returns:
+        The offsets and targets arrays.
+    """
+    offsets = array("i", bytes(4 * (count + 1)))
+    for key in keys:
+        offsets[key + 1] += 1
+    for index in range(count):
+        offsets[index + 1] += offsets[index]
+
+    slots = array("i", offsets)
+    targets = array("i", bytes(4 * len(values)))
+    for key, value in zip(keys, values):
+        targets[slots[key]] = value
+        slots[key] += 1
+    return offsets, targets
+
+
+__all__ = ["CompactXCSGraph", "CompactXCSNode"]
@@ -0,0 +1,237 @@
+"""
+Bulk Graph Construction and Namespaced Merging
+
+Building a graph from thousands of trace records one ``add_node`` and
+``add_edge`` call at a time pays for validation on every call: each edge
+checks both endpoints and scans two edge lists for duplicates.
+XCSGraphBuilder collects nodes and edges from iterables and validates them
+once, in ``freeze()``, which returns the finished XCSGraph:
+
+```python
+builder = XCSGraphBuilder()
+builder.add_nodes((record.id, record.operator) for record in records)
+builder.add_edges((record.parent, record.id) for record in records if record.parent)
+graph = builder.freeze()
+```
+
+Edges may name nodes that are added later. Duplicate edges are dropped and
+unknown endpoints or duplicate node IDs are reported when freezing.
+
+``merge_graphs`` combines two graphs into a new one without modifying either,
+renaming the nodes of the second graph (and the edges between them) in a
+single pass.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode, _build_node_attributes
+
+# (node_id, operator) or (node_id, operator, attributes), where attributes are
+# what add_node would receive as keyword arguments.
+NodeSpec = Union[
+    Tuple[str, Callable[..., object]],
+    Tuple[str, Callable[..., object], Mapping[str, object]],
+]
+
+
+class XCSGraphBuilder:
+    """Collects nodes and edges in bulk and builds an XCSGraph in one pass.
+
+    Attributes:
+        entry_node: Entry node of the built graph. Defaults to the first node.
+        exit_node: Exit node of the built graph. Defaults to the last node.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty builder."""
+        self._nodes: List[NodeSpec] = []
+        self._edges: List[Tuple[str, str]] = []
+        self._frozen = False
+        self.entry_node: Optional[str] = None
+        self.exit_node: Optional[str] = None
+
+    def add_node(
+        self,
+        operator: Callable[..., object],
+        node_id: Optional[str] = None,
+        **attributes: object,
+    ) -> str:
+        """Adds a single node.
+
+        Args:
+            operator: The operator (callable) to attach to this node.
+            node_id: Optional unique identifier for the node.
+            **attributes: Additional attributes, as accepted by XCSGraph.add_node.
+
+        Returns:
+            The node's identifier.
+        """
+        self._check_open()
+        if node_id is None:
+            node_id = str(uuid.uuid4())[:8]
+        self._nodes.append((node_id, operator, attributes))
+        return node_id
+
+    def add_nodes(self, nodes: Iterable[NodeSpec]) -> None:
+        """Adds nodes from an iterable of ``(node_id, operator[, attributes])``.
+
+        Args:
+            nodes: Node specifications, in insertion order.
+        """
+        self._check_open()
+        self._nodes.extend(nodes)
+
+    def add_edge(self, from_id: str, to_id: str) -> None:
+        """Adds a directed edge. Its endpoints are checked when freezing.
+
+        Args:
+            from_id: The source node's identifier.
+            to_id: The destination node's identifier.
+        """
+        self._check_open()
+        self._edges.append((from_id, to_id))
+
+    def add_edges(self, edges: Iterable[Tuple[str, str]]) -> None:
+        """Adds directed edges from an iterable of ``(from_id, to_id)`` pairs.
+
+        Args:
+            edges: Edges, in insertion order. Their endpoints are checked when
+                freezing.
+        """
+        self._check_open()
+        self._edges.extend(edges)
+
+    def freeze(self) -> XCSGraph:
+        """Validates the collected nodes and edges and builds the graph.
+
+        The builder cannot be used after freezing.
+
+        Returns:
+            A graph equivalent to adding the same nodes and edges one by one.
+
+        Raises:
+            ValueError: If a node ID is used twice, or an edge names an unknown
+                node.
+        """
+        self._check_open()
+        self._frozen = True
+
+        graph = XCSGraph()
+        nodes: Dict[str, XCSNode] = graph.nodes
+        for spec in self._nodes:
+            node_id = spec[0]
+            if node_id in nodes:
+                raise ValueError(f"Node with ID '{node_id}' already exists.")
+            node = nodes[node_id] = XCSNode(operator=spec[1], node_id=node_id)
+            if len(spec) > 2 and spec[2]:
+                node.attributes = _build_node_attributes(spec[2])
+
+        seen: Set[Tuple[str, str]] = set()
+        for edge in self._edges:
+            if edge in seen:
+                continue
+            seen.add(edge)
+            from_id, to_id = edge
+            source, destination = nodes.get(from_id), nodes.get(to_id)
+            if source is None:
+                raise ValueError(f"Source node with ID '{from_id}' does not exist.")
+            if destination is None:
+                raise ValueError(f"Destination node with ID '{to_id}' does not exist.")
+            source.outbound_edges.append(to_id)
+            destination.inbound_edges.append(from_id)
+
+        if nodes:
+            node_ids = list(nodes)
+            graph.entry_node = self.entry_node or node_ids[0]
+            graph.exit_node = self.exit_node or node_ids[-1]
+        for role, node_id in (("Entry", graph.entry_node), ("Exit", graph.exit_node)):
+            if node_id is not None and node_id not in nodes:
+                raise ValueError(f"{role} node with ID '{node_id}' does not exist.")
+        self._nodes, self._edges = [], []
+        return graph
+
+    def _check_open(self) -> None:
+        if self._frozen:
+            raise ValueError("The graph builder has already been frozen.")
+
+
+def merge_graphs(
+    *,
+    base: XCSGraph,
+    additional: XCSGraph,
+    namespace: Optional[str] = None,
+    connect: bool = True,
+) -> XCSGraph:
+    """
+    Merges two graphs into a new graph, leaving both inputs untouched.
+
+    Nodes of the additional graph are renamed to ``{namespace}_{node_id}``, and
+    a ``_dup`` suffix is appended to any name still taken by a base node, as
+    merge_xcs_graphs does. Edges between additional nodes follow the renaming.
+
+    With connect=True the additional graph runs first: its exit node feeds the
+    base graph's entry node, and the merged graph's entry node is the
+    additional graph's.
+
+    Args:
+        base: Graph whose node IDs are kept.
+        additional: Graph whose node IDs are namespaced.
+        namespace: Optional prefix for node IDs from the additional graph.
+        connect: Whether to add an edge from the additional graph's exit node to
+            the base graph's entry node.
+
+    Returns:
+        A new graph with copies of the nodes of both graphs. Operators are
+        shared; attributes are copied.
+    """
+    prefix = f"{namespace}_" if namespace else ""
+    taken: Set[str] = set(base.nodes)
+    renamed: Dict[str, str] = {}
+    for node_id in additional.nodes:
+        new_id = f"{prefix}{node_id}"
+        while new_id in taken:
+            new_id += "_dup"
+        taken.add(new_id)
+        renamed[node_id] = new_id
+
+    merged = XCSGraph()
+    for node_id, node in base.nodes.items():
+        merged.nodes[node_id] = _copy_node(node, node_id, lambda edge: edge)
+    for node_id, node in additional.nodes.items():
+        merged.nodes[renamed[node_id]] = _copy_node(
+            node, renamed[node_id], renamed.__getitem__
+        )
+
+    additional_entry = renamed.get(additional.entry_node or "")
+    additional_exit = renamed.get(additional.exit_node or "")
+    merged.entry_node = base.entry_node or additional_entry
+    merged.exit_node = base.exit_node or additional_exit
+    if connect and additional_exit is not None:
+        if base.entry_node is not None:
+            merged.add_edge(from_id=additional_exit, to_id=base.entry_node)
+        merged.entry_node = additional_entry
+    return merged
+
+
+def _copy_node(node: XCSNode, node_id: str, rename: Callable[[str], str]) -> XCSNode:
+    copied = XCSNode(operator=node.operator, node_id=node_id)
+    copied.attributes = dict(node.attributes)
+    copied.inbound_edges = [rename(edge) for edge in node.inbound_edges]
+    copied.outbound_edges = [rename(edge) for edge in node.outbound_edges]
+    return copied
+
+
+__all__ = ["NodeSpec", "XCSGraphBuilder", "merge_graphs"]
@@ -17,6 +17,7 @@ Single Responsibility Principle by focusing exclusively on graph structure
 and properties, delegating execution concerns to the engine module.
 """
 
+import itertools
 import uuid
 import logging
 from typing import (
@@ -29,7 +30,11 @@ from typing import (
     Mapping, 
     cast,
     Set,
-    Iterator
+    Iterable,
+    Iterator,
+    SupportsIndex,
+    Tuple,
+    Any,
 )
 from typing_extensions import TypedDict, NotRequired
 
@@ -47,6 +52,77 @@ I = TypeVar('I', bound=Mapping[str, object])
 O = TypeVar('O', bound=Mapping[str, object])
 
 
+# Stamp of the latest edit to any node's edge list. Graphs compare it with the
+# stamp their cached topology was computed under, so edits made directly to
+# node edge lists, rather than through add_edge, are never missed.
+_edge_stamps = itertools.count(1)
+_edge_stamp = 0
+
+
+def _current_edge_stamp() -> int:
+    """Returns the stamp of the latest edge-list edit."""
+    return _edge_stamp
+
+
+def _stamp_edge_edit() -> None:
+    global _edge_stamp
+    _edge_stamp = next(_edge_stamps)
+
+
+class _EdgeList(List[str]):
+    """Node edge list that stamps every edit, so graph caches can detect it."""
+
+    __slots__ = ()
+
+    def append(self, node_id: str) -> None:
+        _stamp_edge_edit()
+        list.append(self, node_id)
+
+    def extend(self, node_ids: Iterable[str]) -> None:
+        _stamp_edge_edit()
+        list.extend(self, node_ids)
+
+    def insert(self, index: SupportsIndex, node_id: str) -> None:
+        _stamp_edge_edit()
+        list.insert(self, index, node_id)
+
+    def remove(self, node_id: str) -> None:
+        _stamp_edge_edit()
+        list.remove(self, node_id)
+
+    def pop(self, index: SupportsIndex = -1) -> str:
+        _stamp_edge_edit()
+        return list.pop(self, index)
+
+    def clear(self) -> None:
+        _stamp_edge_edit()
+        list.clear(self)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        _stamp_edge_edit()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self) -> None:
+        _stamp_edge_edit()
+        list.reverse(self)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        _stamp_edge_edit()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        _stamp_edge_edit()
+        list.__delitem__(self, index)
+
+    def __iadd__(self, node_ids: Iterable[str]) -> "_EdgeList":  # type: ignore[override]
+        _stamp_edge_edit()
+        return list.__iadd__(self, node_ids)  # type: ignore[return-value]
+
+    def __imul__(self, count: SupportsIndex) -> "_EdgeList":
+        _stamp_edge_edit()
+        return list.__imul__(self, count)  # type: ignore[return-value]
+
+
 class CapturedInputs(TypedDict, total=False):
     """TypedDict for captured inputs during execution."""
     
@@ -93,12 +169,30 @@ class XCSNode(Generic[I, O]):
             node_id = str(uuid.uuid4())[:8]
         self.node_id: str = node_id
         self.operator: Callable[[I], O] = operator
-        self.inbound_edges: List[str] = []
-        self.outbound_edges: List[str] = []
+        self._inbound_edges = _EdgeList()
+        self._outbound_edges = _EdgeList()
         self.attributes: XCSNodeAttributes = {}
         self.captured_inputs: CapturedInputs = {"prompts": None}
         self.captured_outputs: Optional[O] = None
 
+    @property
+    def inbound_edges(self) -> List[str]:
+        return self._inbound_edges
+
+    @inbound_edges.setter
+    def inbound_edges(self, node_ids: Iterable[str]) -> None:
+        _stamp_edge_edit()
+        self._inbound_edges = _EdgeList(node_ids)
+
+    @property
+    def outbound_edges(self) -> List[str]:
+        return self._outbound_edges
+
+    @outbound_edges.setter
+    def outbound_edges(self, node_ids: Iterable[str]) -> None:
+        _stamp_edge_edit()
+        self._outbound_edges = _EdgeList(node_ids)
+
     def add_inbound_edge(self, *, from_id: str) -> None:
         """Adds an inbound edge from the specified node.
 
@@ -122,6 +216,118 @@ class XCSNode(Generic[I, O]):
         """Alias for attributes, for compatibility with tracing code."""
         return self.attributes
 
+    def get_hint(self, key: str, default: object = None) -> object:
+        """Looks up a scheduling hint attached to this node.
+
+        Hints may be set directly on the attributes dictionary or passed as extra
+        keyword arguments to XCSGraph.add_node, which stores them under
+        metadata.custom_data.
+
+        Args:
+            key: Name of the hint.
+            default: Value returned when the hint is not set.
+
+        Returns:
+            The hint value, or default if the node does not carry it.
+        """
+        if key in self.attributes:
+            return self.attributes[key]  # type: ignore[literal-required]
+        metadata = self.attributes.get("metadata")
+        if metadata:
+            custom_data = metadata.get("custom_data")
+            if custom_data and key in custom_data:
+                return custom_data[key]
+        return default
+
+
+# add_node keywords stored as typed attributes rather than as custom hints.
+_TYPED_ATTRIBUTE_KEYS = frozenset({"name", "description", "tags", "metadata"})
+
+
+def _build_node_attributes(attributes: Mapping[str, object]) -> XCSNodeAttributes:
+    """Builds a node's attributes from the keyword arguments given to add_node.
+
+    Name, description, tags and metadata are stored as typed attributes; any
+    other key is stored under metadata.custom_data, where get_hint finds it.
+
+    Args:
+        attributes: Extra keyword arguments passed to add_node.
+
+    Returns:
+        The attributes dictionary for the new node.
+    """
+    if not attributes:
+        return {}
+    if _TYPED_ATTRIBUTE_KEYS.isdisjoint(attributes):
+        # Only hints: they all go to metadata.custom_data, no coercion needed.
+        return {
+            "metadata": {
+                "custom_data": {str(key): value for key, value in attributes.items()}
+            }
+        }
+    node_attributes: XCSNodeAttributes = {}
+    for key, value in attributes.items():
+        if key == "name":
+            node_attributes["name"] = str(value)
+        elif key == "description":
+            node_attributes["description"] = str(value)
+        elif key == "tags" and isinstance(value, list):
+            node_attributes["tags"] = [str(tag) for tag in value]
+        elif key == "metadata" and isinstance(value, dict):
+            # Create a properly typed metadata dictionary from scratch
+            typed_metadata: NodeMetadata = {}
+
+            # Handle known fields
+            source_file = value.get("source_file")
+            if source_file is not None:
+                typed_metadata["source_file"] = str(source_file)
+
+            source_line = value.get("source_line")
+            if source_line is not None and isinstance(source_line, int):
+                typed_metadata["source_line"] = source_line
+
+            author = value.get("author")
+            if author is not None:
+                typed_metadata["author"] = str(author)
+
+            version = value.get("version")
+            if version is not None:
+                typed_metadata["version"] = str(version)
+
+            created_at = value.get("created_at")
+            if created_at is not None:
+                typed_metadata["created_at"] = str(created_at)
+
+            updated_at = value.get("updated_at")
+            if updated_at is not None:
+                typed_metadata["updated_at"] = str(updated_at)
+
+            description = value.get("description")
+            if description is not None:
+                typed_metadata["description"] = str(description)
+
+            # Collect custom data for any other keys
+            custom_data = value.get("custom_data", {})
+            if isinstance(custom_data, dict) and custom_data:
+                typed_metadata["custom_data"] = dict(custom_data)
+            node_attributes["metadata"] = typed_metadata
+        else:
+            # For any other attributes, store them in metadata.custom_data
+            str_key = str(key)
+
+            # Initialize metadata with custom_data
+            if "metadata" not in node_attributes:
+                node_attributes["metadata"] = {"custom_data": {str_key: value}}
+            else:
+                # Ensure there's a custom_data dictionary
+                metadata = node_attributes["metadata"]
+                if "custom_data" not in metadata:
+                    metadata["custom_data"] = {str_key: value}
+                else:
+                    # Add to existing custom_data - use indexing to satisfy type checker
+                    metadata["custom_data"][str_key] = value
+    return node_attributes
+
 
 class XCSGraph(Generic[I, O]):
     """
@@ -153,6 +359,12 @@ class XCSGraph(Generic[I, O]):
         self.nodes: Dict[str, XCSNode[I, O]] = {}
         self.entry_node: Optional[str] = None
         self.exit_node: Optional[str] = None
+        # Depth of every node, kept up to date by add_node and add_edge, and the
+        # levels derived from it. None when they must be recomputed. Both are
+        # valid for the edge-list stamp they were last updated under.
+        self._depths: Optional[Dict[str, int]] = {}
+        self._levels: Optional[Tuple[Tuple[str, ...], ...]] = None
+        self._edge_stamp = _current_edge_stamp()
 
     def add_node(
         self, 
@@ -184,73 +396,20 @@ class XCSGraph(Generic[I, O]):
         if name is not None and node_id is None:
             node_id = name
             
+        tracked = self._topology_is_current()
         node = XCSNode(operator=operator, node_id=node_id)
         if node.node_id in self.nodes:
             raise ValueError(f"Node with ID '{node.node_id}' already exists.")
             
-        # Add provided attributes
-        for key, value in attributes.items():
-            if key == "name":
-                node.attributes["name"] = str(value)
-            elif key == "description":
-                node.attributes["description"] = str(value)
-            elif key == "tags" and isinstance(value, list):
-                node.attributes["tags"] = [str(tag) for tag in value]
-            elif key == "metadata" and isinstance(value, dict):
-                # Create a properly typed metadata dictionary from scratch
-                typed_metadata: NodeMetadata = {}
-                
-                # Handle known fields
-                source_file = value.get("source_file")
-                if source_file is not None:
-                    typed_metadata["source_file"] = str(source_file)
-                    
-                source_line = value.get("source_line")
-                if source_line is not None and isinstance(source_line, int):
-                    typed_metadata["source_line"] = source_line
-                    
-                author = value.get("author")
-                if author is not None:
-                    typed_metadata["author"] = str(author)
-                    
-                version = value.get("version")
-                if version is not None:
-                    typed_metadata["version"] = str(version)
-                    
-                created_at = value.get("created_at")
-                if created_at is not None:
-                    typed_metadata["created_at"] = str(created_at)
-                    
-                updated_at = value.get("updated_at")
-                if updated_at is not None:
-                    typed_metadata["updated_at"] = str(updated_at)
-                    
-                description = value.get("description")
-                if description is not None:
-                    typed_metadata["description"] = str(description)
-                
-                # Collect custom data for any other keys
-                custom_data = value.get("custom_data", {})
-                if isinstance(custom_data, dict) and custom_data:
-                    typed_metadata["custom_data"] = dict(custom_data)
-                node.attributes["metadata"] = typed_metadata
-            else:
-                # For any other attributes, store them in metadata.custom_data
-                str_key = str(key)
-                
-                # Initialize metadata with custom_data
-                if "metadata" not in node.attributes:
-                    node.attributes["metadata"] = {"custom_data": {str_key: value}}
-                else:
-                    # Ensure there's a custom_data dictionary
-                    metadata = node.attributes["metadata"]
-                    if "custom_data" not in metadata:
-                        metadata["custom_data"] = {str_key: value}
-                    else:
-                        # Add to existing custom_data - use indexing to satisfy type checker
-                        metadata["custom_data"][str_key] = value
-                
+        node.attributes = _build_node_attributes(attributes)
+
         self.nodes[node.node_id] = node
+        if tracked:
+            self._depths[node.node_id] = 0
+            self._edge_stamp = _current_edge_stamp()
+        else:
+            self._depths = None
+        self._levels = None
 
         if self.entry_node is None:
             self.entry_node = node.node_id
@@ -289,8 +448,14 @@ class XCSGraph(Generic[I, O]):
             raise ValueError(f"Destination node with ID '{to_id}' does not exist.")
             
         # Add bidirectional references for the edge
+        tracked = self._topology_is_current()
         self.nodes[from_id].add_outbound_edge(to_id=to_id)
         self.nodes[to_id].add_inbound_edge(from_id=from_id)
+        if tracked:
+            self._edge_stamp = _current_edge_stamp()
+            self._deepen(from_id=from_id, to_id=to_id)
+        else:
+            self.invalidate_topology()
 
     def get_node(self, node_id: Optional[str] = None, **kwargs: str) -> XCSNode[I, O]:
         """Retrieves the node with the specified identifier.
@@ -329,7 +494,8 @@ class XCSGraph(Generic[I, O]):
         """Performs a topological sort on the graph.
 
         This sorting ensures that for every directed edge from node A to node B, 
-        node A appears before node B in the ordering.
+        node A appears before node B in the ordering. Nodes are listed level by
+        level (see levels), so the order is cached along with the levels.
 
         Returns:
             A list of node IDs in topologically sorted order.
@@ -337,27 +503,120 @@ class XCSGraph(Generic[I, O]):
         Raises:
             ValueError: If the graph contains a cycle or is otherwise not a valid DAG.
         """
-        in_degree: Dict[str, int] = {
+        return [node_id for level in self.levels() for node_id in level]
+
+    def levels(self) -> Tuple[Tuple[str, ...], ...]:
+        """Groups the nodes into dependency levels, for wavefront execution.
+
+        Level 0 holds the nodes without inbound edges, and every other node sits
+        one level below its deepest predecessor, so the nodes of a level only
+        depend on earlier levels. Within a level, nodes keep their insertion
+        order.
+
+        The levels are cached. add_node and add_edge keep node depths up to date
+        incrementally, so most edits only re-bucket the nodes. Edits made
+        directly to node edge lists, or to the nodes dictionary, are detected
+        and cause a full recomputation.
+
+        Returns:
+            The node IDs of each level.
+
+        Raises:
+            ValueError: If the graph contains a cycle or is otherwise not a valid DAG.
+        """
+        depths = self._current_depths()
+        levels = self._levels
+        if levels is None:
+            depth_count = max(depths.values(), default=-1) + 1
+            buckets: List[List[str]] = [[] for _ in range(depth_count)]
+            for node_id in self.nodes:
+                buckets[depths[node_id]].append(node_id)
+            levels = self._levels = tuple(tuple(bucket) for bucket in buckets)
+        return levels
+
+    def level_of(self, node_id: str) -> int:
+        """Returns the dependency level of a node (see levels).
+
+        Args:
+            node_id: ID of the node.
+
+        Returns:
+            The node's level, 0 for nodes without inbound edges.
+
+        Raises:
+            ValueError: If the node does not exist or the graph contains a cycle.
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"Node with ID '{node_id}' is not present in the graph.")
+        return self._current_depths()[node_id]
+
+    def invalidate_topology(self) -> None:
+        """Drops the cached levels and order, forcing their recomputation."""
+        self._depths = None
+        self._levels = None
+
+    def _topology_is_current(self) -> bool:
+        """Whether the cached depths reflect every node and edge of the graph."""
+        depths = self._depths
+        return (
+            depths is not None
+            and self._edge_stamp == _current_edge_stamp()
+            # Nodes stored into self.nodes directly change the count.
+            and len(depths) == len(self.nodes)
+        )
+
+    def _current_depths(self) -> Dict[str, int]:
+        """Returns every node's depth, recomputing it if it may be stale."""
+        if not self._topology_is_current():
+            stamp = _current_edge_stamp()
+            self._depths = self._compute_depths()
+            self._levels = None
+            self._edge_stamp = stamp
+        return self._depths
+
+    def _compute_depths(self) -> Dict[str, int]:
+        remaining: Dict[str, int] = {
             node_id: len(node.inbound_edges) for node_id, node in self.nodes.items()
         }
-        ready: List[str] = [
-            node_id for node_id, degree in in_degree.items() if degree == 0
-        ]
-        sorted_list: List[str] = []
-
-        while ready:
-            current: str = ready.pop()
-            sorted_list.append(current)
-            for neighbor_id in self.nodes[current].outbound_edges:
-                in_degree[neighbor_id] -= 1
-                if in_degree[neighbor_id] == 0:
-                    ready.append(neighbor_id)
-
-        if len(sorted_list) != len(self.nodes):
+        depths: Dict[str, int] = {}
+        level = [node_id for node_id, degree in remaining.items() if degree == 0]
+        depth = 0
+        while level:
+            next_level: List[str] = []
+            for node_id in level:
+                depths[node_id] = depth
+                for neighbor_id in self.nodes[node_id].outbound_edges:
+                    remaining[neighbor_id] -= 1
+                    if remaining[neighbor_id] == 0:
+                        next_level.append(neighbor_id)
+            level = next_level
+            depth += 1
+
+        if len(depths) != len(self.nodes):
             raise ValueError("Graph contains a cycle or is not a valid DAG.")
+        return depths
+
+    def _deepen(self, *, from_id: str, to_id: str) -> None:
+        """Updates cached depths for a new edge, pushing descendants down as needed."""
+        depths = self._depths
+        required = depths[from_id] + 1
+        if depths[to_id] >= required:
+            return
+        depths[to_id] = required
+        self._levels = None
+        pending = [to_id]
+        while pending:
+            node_id = pending.pop()
+            child_depth = depths[node_id] + 1
+            for child_id in self.nodes[node_id].outbound_edges:
+                if child_id == from_id:
+                    # The new edge closed a cycle; levels() will report it.
+                    self.invalidate_topology()
+                    return
+                if depths.get(child_id, child_depth) < child_depth:
+                    depths[child_id] = child_depth
+                    pending.append(child_id)
 
-        return sorted_list
-        
     def get_predecessors(self, node_id: str) -> Set[str]:
         """Get all immediate predecessors of a node.
         
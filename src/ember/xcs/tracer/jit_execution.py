@@ -0,0 +1,329 @@
+"""
+Engine Execution of Jit-Compiled Operators
+
+A jit-compiled operator is traced on its first call: every sub-operator call
+its forward() makes is observed, and the calls that depend only on the
+operator's own inputs, or on the output of another such call, become the nodes
+of an XCSGraph. Later calls run that graph through the XCS engine first, so
+that independent sub-operators execute concurrently, and then run forward() as
+usual, with each sub-operator call served from the engine's results:
+
+```python
+@jit
+class Pipeline(Operator):
+    def forward(self, *, inputs):
+        a = self.branch_a(inputs=inputs)   # independent of branch_b
+        b = self.branch_b(inputs=inputs)
+        return self.judge(inputs={"responses": [a.answer, b.answer]})
+```
+
+Here ``branch_a`` and ``branch_b`` run side by side; ``judge``, whose inputs are
+assembled inside forward(), runs in forward() itself.
+
+Calls are matched to results by operator and by the identity of their inputs,
+so forward() keeps full control over which results it uses. A call with no
+matching result simply runs, as does one whose inputs forward() changed after
+the engine ran it; such a call is dropped from the graph. If forward() leaves precomputed results unused,
+its call pattern depends on its inputs: the unused calls are trimmed from the
+graph, and once the rest offers no concurrency the operator is executed
+directly. If sub-operators fail in the engine, the calls that completed are
+still served and only the failed or skipped ones run again, inside forward(),
+where a persistent failure is raised as a direct call would raise it.
+Operators must be free of side effects, as the Operator contract requires, for
+results to be computed ahead of their call.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ember.core.registry.operator.base.operator_base import (
+    CALL_NOT_INTERCEPTED,
+    Operator,
+    operator_call_interceptor,
+)
+from ember.xcs.exceptions import GraphExecutionError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+logger = logging.getLogger(__name__)
+
+# Key of the global input entry holding the jit-compiled operator's inputs.
+_INPUTS_KEY = "__xcs_jit_inputs__"
+
+# Snapshot of inputs that could not be copied, equal to no inputs.
+_UNCOMPARABLE = object()
+
+
+def call_directly(
+    operator: Callable[..., Any], inputs: Any, kwargs: Optional[Dict[str, Any]] = None
+) -> Any:
+    """Call an operator without intercepting it, or the calls it makes.
+
+    Args:
+        operator: Operator to call.
+        inputs: Its inputs.
+        kwargs: Keyword inputs, used when inputs is None.
+
+    Returns:
+        The operator's output.
+    """
+    token = operator_call_interceptor.set(None)
+    try:
+        return operator(inputs=inputs, **(kwargs or {}))
+    finally:
+        operator_call_interceptor.reset(token)
+
+
+class SubOperatorCall:
+    """Graph node operator that repeats one traced sub-operator call.
+
+    Attributes:
+        operator: The sub-operator.
+        node_id: ID of the node, the key of the node's output.
+        source: ID of the node whose output the call takes as inputs, or None if
+            it takes the jit-compiled operator's inputs.
+    """
+
+    __slots__ = ("operator", "node_id", "source")
+
+    def __init__(
+        self, *, operator: Operator, node_id: str, source: Optional[str]
+    ) -> None:
+        self.operator = operator
+        self.node_id = node_id
+        self.source = source
+
+    def __call__(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        value = inputs[_INPUTS_KEY if self.source is None else self.source]
+        return {self.node_id: call_directly(self.operator, value)}
+
+
+class _CallRecorder:
+    """Interceptor that builds the sub-operator graph while forward() runs."""
+
+    def __init__(self, *, owner: Operator, inputs: Any) -> None:
+        self.owner = owner
+        self.graph = XCSGraph()
+        # Node producing each object usable as inputs; None for the owner's inputs.
+        self._sources: Dict[int, Optional[str]] = {id(inputs): None}
+        # Keeps recorded objects alive so that their IDs are not reused.
+        self._objects: List[Any] = [inputs]
+
+    def __call__(self, operator: Operator, inputs: Any, kwargs: Dict[str, Any]) -> Any:
+        if operator is self.owner:
+            return CALL_NOT_INTERCEPTED
+        output = call_directly(operator, inputs, kwargs)
+        if kwargs or inputs is None or id(inputs) not in self._sources:
+            return output
+        source = self._sources[id(inputs)]
+        name = getattr(operator, "name", type(operator).__name__)
+        node_id = f"{name}_{len(self.graph.nodes)}"
+        self.graph.add_node(
+            operator=SubOperatorCall(operator=operator, node_id=node_id, source=source),
+            node_id=node_id,
+        )
+        if source is not None:
+            self.graph.add_edge(from_id=source, to_id=node_id)
+        if output is not None:
+            self._sources[id(output)] = node_id
+            self._objects.append(output)
+        return output
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy of a call's inputs, to tell later whether they were changed."""
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return _UNCOMPARABLE
+
+
+def _unchanged(value: Any, snapshot: Any) -> bool:
+    """Whether a call's inputs still equal their snapshot."""
+    if snapshot is _UNCOMPARABLE:
+        return False
+    try:
+        return bool(value == snapshot)
+    except Exception:
+        return False
+
+
+class _PrecomputedCalls:
+    """Interceptor that serves forward()'s sub-operator calls from engine results.
+
+    Results are queued per (operator ID, inputs ID) as (node ID, value,
+    snapshot of the inputs) triples, and the IDs of the nodes whose results
+    were served are collected in used. A result is served only while its
+    inputs equal their snapshot; otherwise the call runs directly.
+    """
+
+    def __init__(
+        self,
+        *,
+        owner: Operator,
+        results: Dict[Tuple[int, int], Deque[Tuple[str, Any, Any]]],
+    ) -> None:
+        self.owner = owner
+        self.results = results
+        self.used: Set[str] = set()
+
+    def __call__(self, operator: Operator, inputs: Any, kwargs: Dict[str, Any]) -> Any:
+        if operator is self.owner:
+            return CALL_NOT_INTERCEPTED
+        if not kwargs:
+            pending = self.results.get((id(operator), id(inputs)))
+            if pending:
+                node_id, value, snapshot = pending.popleft()
+                if _unchanged(inputs, snapshot):
+                    self.used.add(node_id)
+                    return value
+                logger.debug(
+                    "Inputs of sub-operator %s changed after it ran; calling it "
+                    "directly.",
+                    node_id,
+                )
+        return call_directly(operator, inputs, kwargs)
+
+
+def _offers_concurrency(graph: XCSGraph) -> bool:
+    """Whether some level of the graph holds sub-operators that can run together."""
+    return max((len(level) for level in graph.levels()), default=0) >= 2
+
+
+def _trimmed(graph: XCSGraph, *, keep: Set[str]) -> Optional[XCSGraph]:
+    """Copy of a sub-operator graph restricted to some of its calls.
+
+    Args:
+        graph: The sub-operator graph.
+        keep: IDs of the nodes to keep. Nodes whose source is not kept are
+            dropped as well.
+
+    Returns:
+        The trimmed graph, or None if it offers no concurrency.
+    """
+    trimmed = XCSGraph()
+    for node_id in graph.topological_sort():
+        node_call: SubOperatorCall = graph.nodes[node_id].operator
+        if node_id not in keep or (
+            node_call.source is not None and node_call.source not in trimmed.nodes
+        ):
+            continue
+        trimmed.add_node(operator=node_call, node_id=node_id)
+        if node_call.source is not None:
+            trimmed.add_edge(from_id=node_call.source, to_id=node_id)
+    return trimmed if _offers_concurrency(trimmed) else None
+
+
+def trace_sub_operators(
+    *, operator: Operator, inputs: Any, call: Callable[[], Any]
+) -> Tuple[Any, Optional[XCSGraph]]:
+    """Run a jit-compiled operator while recording its sub-operator calls.
+
+    Args:
+        operator: The jit-compiled operator.
+        inputs: Its validated inputs, the object its forward() receives.
+        call: Runs the operator on those inputs.
+
+    Returns:
+        The operator's output and its sub-operator graph, or None if the graph
+        offers no concurrency and the operator is better executed directly.
+    """
+    recorder = _CallRecorder(owner=operator, inputs=inputs)
+    token = operator_call_interceptor.set(recorder)
+    try:
+        output = call()
+    finally:
+        operator_call_interceptor.reset(token)
+    graph = recorder.graph
+    return output, graph if _offers_concurrency(graph) else None
+
+
+def execute_sub_operators(
+    *, operator: Operator, inputs: Any, graph: XCSGraph, call: Callable[[], Any]
+) -> Tuple[Any, Optional[XCSGraph]]:
+    """Run a jit-compiled operator with its sub-operator graph executed ahead.
+
+    Args:
+        operator: The jit-compiled operator.
+        inputs: Its validated inputs, the object its forward() receives.
+        graph: Its sub-operator graph, from trace_sub_operators.
+        call: Runs the operator on those inputs.
+
+    Returns:
+        The operator's output, and the graph to use for its next call: graph
+        itself if every precomputed result was used, else graph trimmed to the
+        calls that were, or None if those offer no concurrency.
+
+    Raises:
+        Exception: Whatever a failed sub-operator raises when forward() calls
+            it again, or the engine raises for a reason other than failed
+            nodes.
+    """
+    # Imported here to avoid a circular import through the engine.
+    from ember.xcs.engine.xcs_engine import (
+        TopologicalSchedulerWithParallelDispatch,
+        _scheduler_from_options,
+        execute_graph,
+    )
+
+    # Collect failures rather than failing fast, so that the calls that
+    # completed are not lost with the run.
+    scheduler = _scheduler_from_options()
+    collects_failures = isinstance(scheduler, TopologicalSchedulerWithParallelDispatch)
+    try:
+        outputs = execute_graph(
+            graph=graph,
+            global_input={_INPUTS_KEY: inputs},
+            scheduler=scheduler,
+            failure_policy="continue" if collects_failures else None,
+        )
+    except GraphExecutionError as error:
+        # forward() runs the failed and skipped calls directly, which raises
+        # their error the way a direct call would, or succeeds if the failure
+        # was transient.
+        logger.debug(
+            "Sub-operators %s of %s failed; calling them directly.",
+            sorted(error.errors),
+            type(operator).__name__,
+        )
+        outputs = error.results
+
+    # Each call's inputs are copied as the engine saw them, so that a result is
+    # not served once forward() has changed them.
+    values: Dict[str, Any] = {}
+    snapshots: Dict[Optional[str], Any] = {}
+    results: Dict[Tuple[int, int], Deque[Tuple[str, Any, Any]]] = {}
+    for node_id in graph.topological_sort():
+        if node_id not in outputs:
+            continue
+        node_call: SubOperatorCall = graph.nodes[node_id].operator
+        value = values[node_id] = outputs[node_id][node_id]
+        source = inputs if node_call.source is None else values[node_call.source]
+        if node_call.source not in snapshots:
+            snapshots[node_call.source] = _snapshot(source)
+        results.setdefault((id(node_call.operator), id(source)), deque()).append(
+            (node_id, value, snapshots[node_call.source])
+        )
+
+    precomputed = _PrecomputedCalls(owner=operator, results=results)
+    token = operator_call_interceptor.set(precomputed)
+    try:
+        output = call()
+    finally:
+        operator_call_interceptor.reset(token)
+    if len(precomputed.used) == len(values):
+        return output, graph
+    # Calls that failed in the engine had no result to leave unused.
+    failed = set(graph.nodes) - set(values)
+    return output, _trimmed(graph, keep=precomputed.used | failed)
+
+
+__all__ = [
+    "SubOperatorCall",
+    "call_directly",
+    "execute_sub_operators",
+    "trace_sub_operators",
+]
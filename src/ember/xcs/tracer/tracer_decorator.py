@@ -13,6 +13,13 @@ Key features:
 4. Support for pre-compilation with sample inputs 
 5. Configurable tracing and caching behaviors
 
+The first call of a jitted operator traces the sub-operator calls its forward()
+makes. Later calls execute those sub-operators through the XCS engine, running
+independent ones concurrently. Calls the operator stops making are trimmed
+from the trace, and it is executed directly once the trace offers no
+concurrency (see jit_execution). Calls inside a TracerContext or with force_trace always execute
+directly, so that every sub-operator is recorded.
+
 Implementation follows functional programming principles where possible,
 separating concerns between tracing, compilation, and execution. The design
 adheres to the Open/Closed Principle by extending operator behavior without
@@ -37,12 +44,16 @@ from __future__ import annotations
 
 import functools
 import inspect
+import logging
 import time
+import weakref
+from collections import OrderedDict
 from typing import (
     Any,
     Callable,
     Dict,
     List,
+    Mapping,
     Optional,
     Type,
     TypeVar,
@@ -60,13 +71,56 @@ OperatorType = TypeVar("OperatorType", bound="Operator")
 OperatorDecorator = Callable[[Type[OperatorType]], Type[OperatorType]]
 
 # Forward reference to avoid circular imports
-from ember.core.registry.operator.base.operator_base import Operator
+from ember.core.registry.operator.base.operator_base import (
+    CALL_NOT_INTERCEPTED,
+    Operator,
+    operator_call_interceptor,
+)
 
 # Forward import execution components to avoid circular imports
 from ember.xcs.graph.xcs_graph import XCSGraph
+from ember.xcs.tracer.jit_execution import (
+    execute_sub_operators,
+    trace_sub_operators,
+)
+
+logger = logging.getLogger(__name__)
+
+# Attribute of a jit-compiled __call__ holding the method it wraps.
+_ORIGINAL_CALL_ATTRIBUTE = "__xcs_jit_original_call__"
+
+# Sub-operator graph of each traced operator instance, keyed by id(). None marks
+# an operator that is executed directly, because its graph offers no concurrency
+# or its trace is not reusable. Entries are dropped when the operator is
+# garbage collected.
+_COMPILED_GRAPHS: Dict[int, Optional[XCSGraph]] = {}
 
-# Cache to store compiled execution graphs for each operator class instance
-_COMPILED_GRAPHS: Dict[int, XCSGraph] = {}
+# Operators that cannot be weakly referenced, keyed by id(). Holding them keeps
+# their IDs from being reused while their graphs are cached; beyond
+# _MAX_HELD_OPERATORS the oldest are released along with their graphs.
+_HELD_OPERATORS: "OrderedDict[int, Any]" = OrderedDict()
+_MAX_HELD_OPERATORS = 256
+
+
+def _store_graph(operator: Any, graph: Optional[XCSGraph]) -> None:
+    """Cache an operator's sub-operator graph for as long as the operator lives."""
+    key = id(operator)
+    if key not in _COMPILED_GRAPHS:
+        try:
+            weakref.finalize(operator, _COMPILED_GRAPHS.pop, key, None)
+        except TypeError:
+            _HELD_OPERATORS[key] = operator
+            if len(_HELD_OPERATORS) > _MAX_HELD_OPERATORS:
+                released, _ = _HELD_OPERATORS.popitem(last=False)
+                del _COMPILED_GRAPHS[released]
+    _COMPILED_GRAPHS[key] = graph
+
+
+def _forward_inputs(operator: Any, inputs: Any) -> Any:
+    """Validate inputs as Operator.__call__ does, so forward() sees this object."""
+    if isinstance(inputs, Mapping):
+        return operator.specification.validate_inputs(inputs=inputs)
+    return inputs
 
 
 def jit(
@@ -143,7 +197,9 @@ def jit(
                 "@jit decorator can only be applied to an Operator subclass."
             )
 
-        original_call = cls.__call__
+        # Re-decorating a subclass of a jit-compiled class wraps the undecorated
+        # call, so that the subclass's options apply and it is traced only once.
+        original_call = getattr(cls.__call__, _ORIGINAL_CALL_ATTRIBUTE, cls.__call__)
         original_init = cls.__init__
 
         @functools.wraps(original_init)
@@ -152,20 +208,57 @@ def jit(
             # Call the original __init__
             original_init(self, *args, **kwargs)
 
-            # If sample_input is provided, perform pre-tracing during initialization
+            # If sample_input is provided, trace the sub-operator graph now
+            # rather than on the first call
             if sample_input is not None:
-                # Create a tracer context and trace the operator's execution
-                with TracerContext() as tracer:
-                    original_call(self=self, inputs=sample_input)
+                inputs = _forward_inputs(self, sample_input)
+                _, graph = trace_sub_operators(
+                    operator=self,
+                    inputs=inputs,
+                    call=lambda: original_call(self=self, inputs=inputs),
+                )
+                _store_graph(self, graph)
 
-                if tracer.records:
-                    # Import here to avoid circular imports
-                    from ember.xcs.tracer.autograph import AutoGraphBuilder
+        def compiled_call(self: OperatorType, inputs: Any) -> Any:
+            """Runs the operator, executing its sub-operator graph on the engine.
 
-                    # Build and cache the graph
-                    graph_builder = AutoGraphBuilder()
-                    graph = graph_builder.build_graph(tracer.records)
-                    _COMPILED_GRAPHS[id(self)] = graph
+            The first call traces the graph. Operators without a reusable graph
+            are executed directly.
+            """
+            try:
+                forward_inputs = _forward_inputs(self, inputs)
+            except Exception:
+                # Let the operator report invalid inputs itself.
+                return original_call(self=self, inputs=inputs)
+
+            def call() -> Any:
+                return original_call(self=self, inputs=forward_inputs)
+
+            key = id(self)
+            if key not in _COMPILED_GRAPHS:
+                output, graph = trace_sub_operators(
+                    operator=self, inputs=forward_inputs, call=call
+                )
+                _store_graph(self, graph)
+                return output
+            graph = _COMPILED_GRAPHS[key]
+            if graph is None:
+                return call()
+            output, next_graph = execute_sub_operators(
+                operator=self, inputs=forward_inputs, graph=graph, call=call
+            )
+            if next_graph is not graph:
+                logger.debug(
+                    "%s made fewer sub-operator calls than traced; %s.",
+                    cls.__name__,
+                    (
+                        "trimming its graph"
+                        if next_graph is not None
+                        else "executing it directly from now on"
+                    ),
+                )
+                _store_graph(self, next_graph)
+            return output
 
         @functools.wraps(original_call)
         def traced_call(self: OperatorType, *, inputs: Dict[str, Any]) -> Any:
@@ -177,14 +270,24 @@ def jit(
             Returns:
                 The output from the operator execution.
             """
+            # An enclosing jit-compiled operator may have computed this call ahead
+            interceptor = operator_call_interceptor.get()
+            if interceptor is not None:
+                intercepted = interceptor(self, inputs, {})
+                if intercepted is not CALL_NOT_INTERCEPTED:
+                    return intercepted
+
             tracer: Optional[TracerContext] = TracerContext.get_current()
             # For debugging and test purposes
             force_trace_local = getattr(self, "_force_trace", force_trace)
 
-            # Execute the original call - for now, always execute directly
-            # This simplifies the code and avoids test breakage
             start_time = time.time()
-            output = original_call(self=self, inputs=inputs)
+            if tracer is not None or force_trace_local:
+                # Trace records are kept per thread, so sub-operators must run
+                # on this thread to be recorded
+                output = original_call(self=self, inputs=inputs)
+            else:
+                output = compiled_call(self, inputs)
             end_time = time.time()
 
             # Record trace if in a tracer context or force_trace is enabled
@@ -208,6 +311,8 @@ def jit(
             # Return the actual output
             return output
 
+        setattr(traced_call, _ORIGINAL_CALL_ATTRIBUTE, original_call)
+
         # Replace the original methods with our traced versions
         cls.__init__ = cast(Callable, traced_init)
         cls.__call__ = cast(Callable, traced_call)
@@ -215,6 +320,3 @@ def jit(
 
     return decorator
 
-
-# Removed _build_graph_from_trace function since we're not implementing the enhanced
-# JIT capability in this PR. This would be included in a future full implementation.
@@ -9,13 +9,13 @@ import os
 import multiprocessing
 import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from ember.core.registry.operator.base.operator_base import Operator
+from ember.xcs.engine.executor_pool import run_concurrently
 
 
 class DeviceMesh:
@@ -366,19 +366,20 @@ def mesh_sharded(
     ) -> Dict[str, Any]:
         mesh_results: Dict[Tuple[int, ...], Any] = {}
         max_workers: int = min(len(inputs_to_distribute), len(mesh_obj.devices))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_coords: Dict[Any, Tuple[int, ...]] = {
-                executor.submit(op, inputs=device_inputs): coords
-                for coords, device_inputs in inputs_to_distribute.items()
-            }
-            for future in as_completed(future_to_coords):
-                try:
-                    result = future.result()
-                    coords = future_to_coords[future]
-                    mesh_results[coords] = result
-                except Exception as ex:
-                    coords = future_to_coords[future]
-                    logging.exception("Exception occurred on device %s: %s", coords, ex)
+        coords_list: List[Tuple[int, ...]] = list(inputs_to_distribute)
+        futures = run_concurrently(
+            fn=lambda coords: op(inputs=inputs_to_distribute[coords]),
+            items=coords_list,
+            max_concurrency=max_workers,
+        )
+        for coords, future in zip(coords_list, futures):
+            ex = future.exception()
+            if ex is not None:
+                logging.error(
+                    "Exception occurred on device %s: %s", coords, ex, exc_info=ex
+                )
+            else:
+                mesh_results[coords] = future.result()
         return _collect_outputs(mesh_results, mesh_obj, out_spec)
 
     if isinstance(operator_or_fn, Operator):
@@ -9,11 +9,11 @@ execution model.
 import os
 import multiprocessing
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
 
 from ember.core.registry.operator.base.operator_base import Operator
+from ember.xcs.engine.executor_pool import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +73,7 @@ def _shard_inputs(inputs: Dict[str, Any], num_shards: int) -> List[Dict[str, Any
         return [wrapped_inputs]
         
     # Convert non-dict input to dict if necessary (handle edge cases)
-    if not isinstance(inputs, dict):
+    if not isinstance(inputs, Mapping):
         inputs = {"prompts": inputs}
 
     # Identify keys corresponding to shardable inputs.
@@ -210,6 +210,41 @@ def _combine_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     return combined
 
 
+def _execute_shards(
+    fn: Callable[..., Any], sharded_inputs: List[Dict[str, Any]], num_workers: int
+) -> List[Dict[str, Any]]:
+    """Run a callable over every shard on the shared XCS worker pool.
+
+    Shards that raise are logged and omitted from the results.
+
+    Args:
+        fn (Callable[..., Any]): The operator or function to invoke with each shard.
+        sharded_inputs (List[Dict[str, Any]]): Input dictionaries, one per shard.
+        num_workers (int): Maximum number of shards processed concurrently.
+
+    Returns:
+        List[Dict[str, Any]]: Results of the successful shards, in shard order.
+    """
+    futures = run_concurrently(
+        fn=lambda shard: fn(inputs=shard),
+        items=sharded_inputs,
+        max_concurrency=num_workers,
+    )
+    results: List[Dict[str, Any]] = []
+    for shard_index, future in enumerate(futures):
+        exc = future.exception()
+        if exc is not None:
+            logger.error(
+                "Shard %d generated an exception: %s",
+                shard_index,
+                exc,
+                exc_info=exc,
+            )
+        else:
+            results.append(future.result())
+    return results
+
+
 def pmap(
     operator_or_fn: Union[Operator, Callable[..., Any]],
     num_workers: Optional[int] = None,
@@ -246,22 +281,9 @@ def pmap(
                 return operator_or_fn(inputs=input_data)
 
             actual_workers: int = min(resolved_workers, len(sharded_inputs))
-            # Ensure we have at least one worker to avoid ThreadPoolExecutor errors
-            safe_workers: int = max(1, actual_workers)
-            results: List[Dict[str, Any]] = []
-            with ThreadPoolExecutor(max_workers=safe_workers) as executor:
-                future_to_shard: Dict[Any, int] = {
-                    executor.submit(operator_or_fn, inputs=shard): i
-                    for i, shard in enumerate(sharded_inputs)
-                }
-                for future in as_completed(future_to_shard):
-                    try:
-                        result: Dict[str, Any] = future.result()
-                        results.append(result)
-                    except Exception as exc:
-                        shard_index: int = future_to_shard[future]
-                        logger.exception("Shard %d generated an exception: %s", shard_index, exc)
-            return _combine_results(results)
+            return _combine_results(
+                _execute_shards(operator_or_fn, sharded_inputs, max(1, actual_workers))
+            )
 
         # Attach the parallelized function to the operator for direct access.
         operator_or_fn.parallelized = parallelized_operator  # type: ignore[attr-defined]
@@ -278,22 +300,9 @@ def pmap(
                 return operator_or_fn(inputs=input_data)
 
             actual_workers: int = min(resolved_workers, len(sharded_inputs))
-            # Ensure we have at least one worker to avoid ThreadPoolExecutor errors
-            safe_workers: int = max(1, actual_workers)
-            results: List[Dict[str, Any]] = []
-            with ThreadPoolExecutor(max_workers=safe_workers) as executor:
-                future_to_shard: Dict[Any, int] = {
-                    executor.submit(operator_or_fn, inputs=shard): i
-                    for i, shard in enumerate(sharded_inputs)
-                }
-                for future in as_completed(future_to_shard):
-                    try:
-                        result: Dict[str, Any] = future.result()
-                        results.append(result)
-                    except Exception as exc:
-                        shard_index: int = future_to_shard[future]
-                        logger.exception("Shard %d generated an exception: %s", shard_index, exc)
-            return _combine_results(results)
+            return _combine_results(
+                _execute_shards(operator_or_fn, sharded_inputs, max(1, actual_workers))
+            )
 
         return parallelized_fn
 
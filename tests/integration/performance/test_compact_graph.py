@@ -0,0 +1,123 @@
+"""
+Performance benchmark for the compact graph representation.
+
+Run with:
+    python -m pytest tests/integration/performance/test_compact_graph.py -s
+
+Builds the same large layered graph as an XCSGraph and as a CompactXCSGraph
+and compares build time and the memory retained by the finished graph, then
+checks that compiling the compact graph for execution is not slower, and that
+reading edges while the graph is built stays cheap.
+"""
+
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+import pytest
+
+from ember.xcs.engine.xcs_engine import compile_graph
+from ember.xcs.graph.compact_graph import CompactXCSGraph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+LEVELS = 100
+WIDTH = 200
+FAN_IN = 4
+
+
+def identity(*, inputs: Mapping[str, Any]) -> Dict[str, Any]:
+    return dict(inputs)
+
+
+def build_layered(graph_type: type, *, read_edges: bool = False) -> Any:
+    """Build LEVELS x WIDTH nodes, each fed by FAN_IN nodes of the level above.
+
+    With read_edges=True, every node's inbound edges are read once its edges
+    are added, as tracing code that inspects the graph while building does.
+    """
+    graph = graph_type()
+    for level in range(LEVELS):
+        for column in range(WIDTH):
+            node_id = f"n{level}_{column}"
+            graph.add_node(operator=identity, node_id=node_id)
+            if level:
+                for offset in range(FAN_IN):
+                    parent = f"n{level - 1}_{(column + offset) % WIDTH}"
+                    graph.add_edge(from_id=parent, to_id=node_id)
+                if read_edges:
+                    assert len(graph.nodes[node_id].inbound_edges) == FAN_IN
+    return graph
+
+
+def measure_build(graph_type: type, *, repeats: int) -> Tuple[float, int]:
+    """Return the median build seconds and the bytes retained by one graph."""
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build_layered(graph_type)
+        timings.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        graph = build_layered(graph_type)
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del graph
+    return statistics.median(timings), retained
+
+
+def median_seconds(run: Callable[[], Any], *, repeats: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.mark.performance
+def test_compact_graph_is_smaller_and_faster_to_build() -> None:
+    """A 20k-node graph builds faster and retains far less memory when compact."""
+    nodes = LEVELS * WIDTH
+    dict_seconds, dict_bytes = measure_build(XCSGraph, repeats=3)
+    compact_seconds, compact_bytes = measure_build(CompactXCSGraph, repeats=3)
+
+    reference = build_layered(XCSGraph)
+    compact = build_layered(CompactXCSGraph)
+    compile_dict = median_seconds(lambda: compile_graph(graph=reference), repeats=3)
+    compile_compact = median_seconds(lambda: compile_graph(graph=compact), repeats=3)
+
+    print(f"\nLayered graph of {nodes} nodes, fan-in {FAN_IN}")
+    print(f"{'':12} {'build ms':>10} {'bytes/node':>12} {'compile ms':>11}")
+    print(
+        f"{'XCSGraph':12} {dict_seconds * 1e3:10.1f} "
+        f"{dict_bytes / nodes:12.0f} {compile_dict * 1e3:11.1f}"
+    )
+    print(
+        f"{'compact':12} {compact_seconds * 1e3:10.1f} "
+        f"{compact_bytes / nodes:12.0f} {compile_compact * 1e3:11.1f}"
+    )
+
+    assert compact_bytes < dict_bytes / 2
+    assert compact_seconds < dict_seconds
+    assert compile_compact < compile_dict * 1.5
+
+
+@pytest.mark.performance
+def test_compact_graph_reads_between_edits_stay_cheap() -> None:
+    """Reading edges between additions does not rebuild the adjacency each time."""
+    dict_seconds = median_seconds(
+        lambda: build_layered(XCSGraph, read_edges=True), repeats=3
+    )
+    compact_seconds = median_seconds(
+        lambda: build_layered(CompactXCSGraph, read_edges=True), repeats=3
+    )
+
+    print(f"\nInterleaved build and reads of {LEVELS * WIDTH} nodes")
+    print(f"XCSGraph: {dict_seconds * 1e3:8.1f} ms")
+    print(f"compact:  {compact_seconds * 1e3:8.1f} ms")
+
+    assert compact_seconds < dict_seconds * 2
@@ -0,0 +1,87 @@
+"""
+Performance benchmark for the distributed scheduler.
+
+Run with:
+    python -m pytest tests/integration/performance/test_distributed_scaling.py -s
+
+Runs a stream of wide graphs on LocalWorkerPools of 1, 2 and 4 workers and
+reports graph throughput for each. The blocking workload scales on any
+machine; the CPU-bound workload only scales with as many cores as workers, so
+its speedup is reported but asserted only on multi-core machines.
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict
+
+import pytest
+
+from ember.xcs.engine.worker_pool import LocalWorkerPool
+from ember.xcs.engine.xcs_distributed_scheduler import DistributedScheduler
+from ember.xcs.engine.xcs_engine import compile_graph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def blocking_call(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator standing in for a blocking model call."""
+    time.sleep(0.05)
+    return {"done": True}
+
+
+def cpu_bound(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that holds the GIL for a few milliseconds."""
+    return {"total": sum(i * i for i in range(100_000))}
+
+
+def build_wide_graph(*, operator: Callable[..., Any], width: int) -> XCSGraph:
+    """Build ``width`` independent nodes."""
+    graph = XCSGraph()
+    for index in range(width):
+        graph.add_node(operator=operator, node_id=f"n{index}")
+    return graph
+
+
+def graphs_per_second(
+    *, operator: Callable[..., Any], workers: int, width: int, runs: int
+) -> float:
+    """Return the throughput of ``runs`` graph runs on a pool of ``workers``."""
+    graph = build_wide_graph(operator=operator, width=width)
+    plan = compile_graph(graph=graph)
+    with LocalWorkerPool(workers=workers) as pool:
+        scheduler = DistributedScheduler(pool=pool)
+        # Warm-up starts the workers and loads the operator on each of them.
+        scheduler.run_plan(plan=plan, global_input={}, graph=graph)
+        start = time.perf_counter()
+        for _ in range(runs):
+            scheduler.run_plan(plan=plan, global_input={}, graph=graph)
+        return runs / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+def test_throughput_scales_with_workers() -> None:
+    """Four workers run a stream of 16-node graphs at least twice as fast as one."""
+    blocking = {
+        workers: graphs_per_second(
+            operator=blocking_call, workers=workers, width=16, runs=3
+        )
+        for workers in (1, 2, 4)
+    }
+    compute = {
+        workers: graphs_per_second(
+            operator=cpu_bound, workers=workers, width=16, runs=3
+        )
+        for workers in (1, 2, 4)
+    }
+
+    for name, throughput in (("blocking", blocking), ("cpu-bound", compute)):
+        print(
+            f"\n{name}: "
+            + ", ".join(
+                f"{workers} worker(s) {rate:.2f} graphs/s"
+                for workers, rate in throughput.items()
+            )
+            + f" ({throughput[4] / throughput[1]:.1f}x from 1 to 4)"
+        )
+    assert blocking[4] >= 2 * blocking[1]
+    if (os.cpu_count() or 1) >= 4:
+        assert compute[4] >= 2 * compute[1]
@@ -0,0 +1,116 @@
+"""
+Performance benchmark for engine execution of @jit operators.
+
+Run with:
+    python -m pytest tests/integration/performance/test_jit_execution.py -s
+
+Builds a multi-branch NON pipeline (several ensemble -> judge branches whose
+final answers a most-common vote selects) on language models that sleep to
+simulate API latency, and compares calls to the plain pipeline with calls to
+the jit-compiled one, whose branches the XCS engine runs concurrently.
+"""
+
+import statistics
+import time
+from typing import Any, Callable, List
+
+import pytest
+
+from ember.core.registry.operator.base.operator_base import Operator
+from ember.core.registry.operator.core.ensemble import (
+    EnsembleOperator,
+    EnsembleOperatorInputs,
+)
+from ember.core.registry.operator.core.most_common import (
+    MostCommonAnswerSelectorOperator,
+)
+from ember.core.registry.operator.core.synthesis_judge import JudgeSynthesisOperator
+from ember.core.registry.prompt_specification.specification import Specification
+from ember.xcs.engine.executor_pool import configure_shared_executor
+from ember.xcs.tracer.tracer_decorator import jit
+
+BRANCHES = 6
+ENSEMBLE_SIZE = 3
+LATENCY = 0.05
+
+
+class SleepingLM:
+    """Stands in for an LMModule whose provider answers after a fixed latency."""
+
+    def __init__(self, *, answer: str) -> None:
+        self.answer = answer
+
+    def __call__(self, *, prompt: str, **kwargs: Any) -> str:
+        time.sleep(LATENCY)
+        return f"Reasoning: consensus.\nFinal Answer: {self.answer}"
+
+
+class Branch(Operator[EnsembleOperatorInputs, Any]):
+    """One NON branch: an ensemble whose responses a judge synthesizes."""
+
+    specification = Specification(input_model=EnsembleOperatorInputs)
+
+    def __init__(self, *, answer: str) -> None:
+        self.ensemble = EnsembleOperator(
+            lm_modules=[SleepingLM(answer=answer) for _ in range(ENSEMBLE_SIZE)]
+        )
+        self.judge = JudgeSynthesisOperator(lm_module=SleepingLM(answer=answer))
+
+    def forward(self, *, inputs: EnsembleOperatorInputs) -> Any:
+        responses = self.ensemble(inputs=inputs)["responses"]
+        return self.judge(inputs={"query": inputs.query, "responses": responses})
+
+
+class Pipeline(Operator[EnsembleOperatorInputs, Any]):
+    """Independent branches joined by a most-common vote."""
+
+    specification = Specification(input_model=EnsembleOperatorInputs)
+
+    def __init__(self) -> None:
+        self.branches = [
+            Branch(answer="Paris" if index % 3 else "Lyon") for index in range(BRANCHES)
+        ]
+        self.vote = MostCommonAnswerSelectorOperator()
+
+    def forward(self, *, inputs: EnsembleOperatorInputs) -> Any:
+        answers = [branch(inputs=inputs).final_answer for branch in self.branches]
+        return self.vote(inputs={"responses": answers})
+
+
+@jit()
+class JitPipeline(Pipeline):
+    pass
+
+
+def median_seconds(run: Callable[[], Any], *, repeats: int) -> float:
+    """Return the median wall time of ``run`` after one warm-up call."""
+    run()
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+@pytest.mark.performance
+def test_jit_runs_non_branches_concurrently() -> None:
+    """Jitted calls take about one branch's latency instead of all branches'."""
+    plain, jitted = Pipeline(), JitPipeline()
+    inputs = {"query": "What is the capital of France?"}
+
+    # Model calls wait on I/O: size the pool for every concurrent call, as a
+    # deployment would, rather than for this machine's CPUs.
+    configure_shared_executor(max_workers=BRANCHES * (ENSEMBLE_SIZE + 1))
+    try:
+        direct = median_seconds(lambda: plain(inputs=inputs), repeats=3)
+        compiled = median_seconds(lambda: jitted(inputs=inputs), repeats=3)
+    finally:
+        configure_shared_executor(max_workers=None)
+
+    print(f"\nNON pipeline with {BRANCHES} ensemble -> judge branches")
+    print(f"direct: {direct * 1e3:7.1f} ms")
+    print(f"@jit:   {compiled * 1e3:7.1f} ms ({direct / compiled:.1f}x)")
+
+    assert jitted(inputs=inputs) == plain(inputs=inputs)
+    assert compiled < direct / 2
@@ -0,0 +1,45 @@
+"""
+Scheduler benchmark suite over synthetic DAGs.
+
+Run with:
+    python -m pytest tests/integration/performance/test_scheduler_benchmarks.py -s
+
+Runs wide, deep, diamond and random DAGs through the thread-based schedulers
+and prints throughput, latency percentiles and overhead over the ideal
+critical path. Set EMBER_XCS_BENCHMARK_BASELINE to a file written with
+``python -m ember.xcs.benchmarks --save`` on the same machine to also fail on
+regressions against it.
+"""
+
+import os
+
+import pytest
+
+from ember.xcs.benchmarks.dag_generators import SyntheticWork
+from ember.xcs.benchmarks.scheduler_benchmark import (
+    compare_to_baseline,
+    format_results,
+    load_baseline,
+    run_suite,
+)
+
+
+@pytest.mark.performance
+def test_scheduler_benchmark_suite() -> None:
+    """Chains run faster inline, and every result has a measurable overhead."""
+    results = run_suite(
+        schedulers=["parallel", "sequential", "auto", "critical_path"],
+        size=32,
+        work=SyntheticWork(sleep=0.0005),
+        repeats=20,
+    )
+    print("\n" + format_results(results))
+
+    by_key = {result.key: result for result in results}
+    assert all(result.overhead is not None for result in results)
+    assert by_key["deep/sequential"].p50_latency < by_key["deep/parallel"].p50_latency
+
+    baseline_path = os.environ.get("EMBER_XCS_BENCHMARK_BASELINE")
+    if baseline_path:
+        regressions = compare_to_baseline(results, load_baseline(baseline_path))
+        assert not regressions, regressions
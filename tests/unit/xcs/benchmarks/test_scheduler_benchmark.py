@@ -0,0 +1,107 @@
+"""Unit tests for the scheduler benchmark suite.
+
+This module verifies the shapes of the synthetic DAG generators, the metrics
+reported by the benchmark runner, and saving, loading and comparing JSON
+baselines.
+"""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from ember.xcs.benchmarks.dag_generators import (
+    SyntheticWork,
+    deep_dag,
+    diamond_dag,
+    generate_dag,
+    random_dag,
+    wide_dag,
+)
+from ember.xcs.benchmarks.scheduler_benchmark import (
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    run_suite,
+    save_baseline,
+)
+from ember.xcs.engine.xcs_engine import compile_graph
+from ember.xcs.engine.xcs_sequential_scheduler import SequentialScheduler
+
+
+def level_widths(graph) -> list:
+    return [len(level) for level in compile_graph(graph=graph).levels]
+
+
+def test_generators_build_the_requested_shapes() -> None:
+    """Each shape has the expected levels, and random DAGs are reproducible."""
+    assert level_widths(wide_dag(width=5)) == [1, 5, 1]
+    assert level_widths(deep_dag(depth=4)) == [1, 1, 1, 1]
+    assert level_widths(diamond_dag(width=3, layers=2)) == [1, 3, 1, 3, 1]
+
+    def edges(graph) -> dict:
+        return {
+            node_id: sorted(node.inbound_edges) for node_id, node in graph.nodes.items()
+        }
+
+    first = random_dag(nodes=30, edge_probability=0.2, seed=7)
+    assert len(first.nodes) == 30
+    assert edges(first) == edges(random_dag(nodes=30, edge_probability=0.2, seed=7))
+    assert edges(first) != edges(random_dag(nodes=30, edge_probability=0.2, seed=8))
+
+    graph = generate_dag("diamond", size=16, hints={"resource_class": "cpu"})
+    assert {node.get_hint("resource_class") for node in graph.nodes.values()} == {"cpu"}
+    with pytest.raises(ValueError):
+        generate_dag("star", size=4)
+
+
+def test_benchmark_reports_latency_and_overhead() -> None:
+    """Latencies bound the measured critical path of sleeping nodes."""
+    graph = deep_dag(depth=3, work=SyntheticWork(sleep=0.005))
+
+    result = run_benchmark(
+        graph=graph, scheduler=SequentialScheduler(), repeats=3, warmup=0, dag="deep"
+    )
+
+    assert (result.key, result.nodes, result.runs) == (
+        "deep/SequentialScheduler",
+        3,
+        3,
+    )
+    assert result.critical_path >= 0.015
+    assert result.p99_latency >= result.p50_latency >= result.critical_path
+    assert result.overhead >= 1.0
+    assert result.nodes_per_second == pytest.approx(3 / result.p50_latency, rel=0.5)
+
+
+def test_baselines_round_trip_and_flag_regressions(tmp_path: Path) -> None:
+    """Saved results load back unchanged and slower results are flagged."""
+    results = run_suite(
+        shapes=["wide", "deep"], schedulers=["sequential"], size=4, repeats=2
+    )
+    path = tmp_path / "baselines" / "schedulers.json"
+    save_baseline(results, path)
+
+    baseline = load_baseline(path)
+    assert baseline == results
+    assert compare_to_baseline(results, baseline) == []
+
+    slower = [
+        replace(
+            result,
+            nodes_per_second=result.nodes_per_second / 2,
+            p50_latency=result.p50_latency * 2,
+        )
+        for result in results
+    ]
+    regressions = compare_to_baseline(
+        slower, baseline, metrics=["nodes_per_second", "p50_latency"]
+    )
+    assert [(r.key, r.metric) for r in regressions] == [
+        ("wide/sequential", "nodes_per_second"),
+        ("wide/sequential", "p50_latency"),
+        ("deep/sequential", "nodes_per_second"),
+        ("deep/sequential", "p50_latency"),
+    ]
+    assert regressions[0].change == pytest.approx(0.5)
+    assert regressions[1].change == pytest.approx(1.0)
@@ -0,0 +1,200 @@
+"""Unit tests for request coalescing across concurrent graph executions.
+
+This module verifies that identical node invocations in flight at the same time
+share one execution and its outcome, that distinct or opted-out invocations do
+not, that waiting invocations survive the cancellation of the one they share,
+and that the coalescer counts its hits.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.coalescing import RequestCoalescer, get_request_coalescer
+from ember.xcs.engine.execution_policy import (
+    ExecutionPolicy,
+    current_cancellation_token,
+)
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    TopologicalSchedulerWithParallelDispatch,
+    execute_graph,
+    execute_graph_async,
+)
+from ember.xcs.exceptions import NodeTimeoutError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+class SlowCall:
+    """Operator standing in for a provider call; counts its invocations."""
+
+    def __init__(self, *, delay: float = 0.2, error: Exception = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"answer": inputs["question"].upper(), "call": call}
+
+
+def build_graph(operator: Any, **hints: Any) -> XCSGraph:
+    graph = XCSGraph()
+    graph.add_node(operator=operator, node_id="ask", **hints)
+    return graph
+
+
+def run_concurrently(
+    graph: XCSGraph, questions: List[str], coalescer: RequestCoalescer
+) -> List[Any]:
+    """Run one execute_graph per question, all starting together."""
+    barrier = threading.Barrier(len(questions))
+
+    def run(question: str) -> Any:
+        barrier.wait()
+        scheduler = TopologicalSchedulerWithParallelDispatch(coalescer=coalescer)
+        try:
+            return execute_graph(
+                graph=graph, global_input={"question": question}, scheduler=scheduler
+            )
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=len(questions)) as pool:
+        return list(pool.map(run, questions))
+
+
+def test_identical_invocations_share_one_execution() -> None:
+    """Eight concurrent identical runs call the operator once."""
+    operator = SlowCall()
+    coalescer = RequestCoalescer()
+
+    results = run_concurrently(build_graph(operator), ["hi"] * 8, coalescer)
+
+    assert operator.calls == 1
+    assert all(result["ask"] == {"answer": "HI", "call": 1} for result in results)
+    stats = coalescer.stats
+    assert (stats.lookups, stats.hits) == (8, 7)
+    assert stats.hit_rate == pytest.approx(7 / 8)
+
+
+def test_distinct_inputs_are_not_shared() -> None:
+    """Only invocations with equal inputs are coalesced."""
+    operator = SlowCall()
+    coalescer = RequestCoalescer()
+
+    results = run_concurrently(build_graph(operator), ["a", "b", "a", "b"], coalescer)
+
+    assert operator.calls == 2
+    assert [result["ask"]["answer"] for result in results] == ["A", "B", "A", "B"]
+    assert coalescer.stats.hits == 2
+
+
+def test_finished_invocations_are_not_cached() -> None:
+    """A result is shared only while its invocation is in flight."""
+    operator = SlowCall(delay=0.0)
+    scheduler = TopologicalSchedulerWithParallelDispatch(coalescer=RequestCoalescer())
+    graph = build_graph(operator)
+
+    for _ in range(3):
+        execute_graph(graph=graph, global_input={"question": "q"}, scheduler=scheduler)
+
+    assert operator.calls == 3
+
+
+def test_disabled_by_default_and_opt_out_hint() -> None:
+    """The shared coalescer starts disabled, and nodes can opt out."""
+    assert not get_request_coalescer().enabled
+    operator = SlowCall(delay=0.05)
+    run_concurrently(build_graph(operator), ["q"] * 3, get_request_coalescer())
+    assert operator.calls == 3
+
+    opted_out = SlowCall(delay=0.05)
+    coalescer = RequestCoalescer()
+    run_concurrently(build_graph(opted_out, coalesce=False), ["q"] * 3, coalescer)
+    assert opted_out.calls == 3
+    assert coalescer.stats.lookups == 0
+
+
+def test_errors_are_shared() -> None:
+    """Waiting invocations receive the error raised by the shared execution."""
+    operator = SlowCall(error=ValueError("quota exceeded"))
+
+    results = run_concurrently(build_graph(operator), ["q"] * 4, RequestCoalescer())
+
+    assert operator.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_followers_run_themselves_when_the_leader_is_cancelled() -> None:
+    """A run that times out does not take identical invocations down with it."""
+    calls = []
+
+    def cooperative(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(1)
+        if len(calls) == 1:
+            token = current_cancellation_token()
+            while not token.cancelled:
+                time.sleep(0.005)
+            token.raise_if_cancelled()
+        return {"call": len(calls)}
+
+    graph = build_graph(cooperative)
+    coalescer = RequestCoalescer()
+    impatient = TopologicalSchedulerWithParallelDispatch(
+        coalescer=coalescer, policy=ExecutionPolicy(node_timeout=0.2)
+    )
+    patient = TopologicalSchedulerWithParallelDispatch(coalescer=coalescer)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(
+            execute_graph, graph=graph, global_input={}, scheduler=impatient
+        )
+        time.sleep(0.05)
+        follower = execute_graph(graph=graph, global_input={}, scheduler=patient)
+        with pytest.raises(NodeTimeoutError):
+            leader.result()
+
+    assert follower["ask"] == {"call": 2}
+    stats = coalescer.stats
+    assert (stats.hits, stats.fallbacks) == (1, 1)
+
+
+def test_async_runs_share_coroutine_invocations() -> None:
+    """Concurrent runs on an event loop share identical coroutine invocations."""
+    calls = []
+
+    async def ask(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"answer": inputs["question"]}
+
+    graph = build_graph(ask)
+    coalescer = RequestCoalescer()
+
+    async def main() -> List[Dict[str, Any]]:
+        scheduler = AsyncScheduler(coalescer=coalescer)
+        return await asyncio.gather(
+            *(
+                execute_graph_async(
+                    graph=graph, global_input={"question": "q"}, scheduler=scheduler
+                )
+                for _ in range(5)
+            )
+        )
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(result["ask"] == {"answer": "q"} for result in results)
+    assert coalescer.stats.hits == 4
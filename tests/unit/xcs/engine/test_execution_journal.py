@@ -0,0 +1,141 @@
+"""Unit tests for execution journals.
+
+This module verifies that execute_graph records completed nodes as they finish,
+that a resumed run only executes the nodes that had not completed, and that
+journals recorded for other runs or torn by a crash are handled safely.
+"""
+
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.xcs_engine import execute_graph
+from ember.xcs.exceptions import JournalMismatchError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+class CountingOperator:
+    """Operator that counts its calls and can be made to fail."""
+
+    def __init__(self, name: str, calls: Counter, failing: set) -> None:
+        self.name = name
+        self.calls = calls
+        self.failing = failing
+        self.lock = threading.Lock()
+
+    def __call__(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.calls[self.name] += 1
+        if self.name in self.failing:
+            raise RuntimeError(f"{self.name} crashed")
+        return {self.name: inputs.get("seed", 0) + len(inputs)}
+
+
+def build_diamond(calls: Counter, failing: set) -> XCSGraph:
+    """Build a diamond graph: a -> (b, c) -> d."""
+    graph = XCSGraph()
+    for node_id in ("a", "b", "c", "d"):
+        graph.add_node(
+            operator=CountingOperator(node_id, calls, failing), node_id=node_id
+        )
+    graph.add_edge(from_id="a", to_id="b")
+    graph.add_edge(from_id="a", to_id="c")
+    graph.add_edge(from_id="b", to_id="d")
+    graph.add_edge(from_id="c", to_id="d")
+    return graph
+
+
+@pytest.mark.parametrize("concurrency", [True, False])
+def test_resume_runs_only_incomplete_nodes(tmp_path: Path, concurrency: bool) -> None:
+    """After a failed run, resuming skips completed nodes and finishes the rest."""
+    journal = tmp_path / "run.journal"
+    calls: Counter = Counter()
+    failing = {"c"}
+    graph = build_diamond(calls, failing)
+    inputs = {"seed": 1}
+
+    with pytest.raises(RuntimeError, match="c crashed"):
+        execute_graph(
+            graph=graph, global_input=inputs, journal=journal, concurrency=concurrency
+        )
+    failing.clear()
+    calls.clear()
+    resumed = execute_graph(
+        graph=graph,
+        global_input=inputs,
+        journal=journal,
+        resume=True,
+        concurrency=concurrency,
+    )
+
+    expected = execute_graph(graph=build_diamond(Counter(), set()), global_input=inputs)
+    assert resumed == expected
+    assert calls["a"] == 0 and calls["c"] == 1 and calls["d"] == 1
+    assert graph.nodes["a"].captured_outputs == expected["a"]
+
+
+def test_resuming_a_finished_run_calls_nothing(tmp_path: Path) -> None:
+    """A journal of a completed run replays every result."""
+    journal = tmp_path / "nested" / "run.journal"
+    calls: Counter = Counter()
+    graph = build_diamond(calls, set())
+
+    first = execute_graph(graph=graph, global_input={}, journal=journal)
+    calls.clear()
+    second = execute_graph(graph=graph, global_input={}, journal=journal, resume=True)
+
+    assert second == first
+    assert sum(calls.values()) == 0
+
+
+def test_without_resume_the_journal_is_overwritten(tmp_path: Path) -> None:
+    """Starting a journal without resume discards earlier records."""
+    journal = tmp_path / "run.journal"
+    calls: Counter = Counter()
+    graph = build_diamond(calls, set())
+
+    execute_graph(graph=graph, global_input={}, journal=journal)
+    execute_graph(graph=graph, global_input={}, journal=journal)
+
+    assert all(count == 2 for count in calls.values())
+
+
+def test_mismatched_journal_is_rejected(tmp_path: Path) -> None:
+    """Resuming with a different global input raises instead of mixing results."""
+    journal = tmp_path / "run.journal"
+    graph = build_diamond(Counter(), set())
+    execute_graph(graph=graph, global_input={"seed": 1}, journal=journal)
+
+    with pytest.raises(JournalMismatchError):
+        execute_graph(
+            graph=graph, global_input={"seed": 2}, journal=journal, resume=True
+        )
+
+
+def test_torn_record_is_ignored(tmp_path: Path) -> None:
+    """A partially written final record is dropped and its node runs again."""
+    journal = tmp_path / "run.journal"
+    calls: Counter = Counter()
+    graph = build_diamond(calls, set())
+    execute_graph(graph=graph, global_input={}, journal=journal)
+    data = journal.read_bytes()
+    journal.write_bytes(data[:-3])
+
+    calls.clear()
+    execute_graph(graph=graph, global_input={}, journal=journal, resume=True)
+
+    assert sum(calls.values()) == 1
+    calls.clear()
+    execute_graph(graph=graph, global_input={}, journal=journal, resume=True)
+    assert sum(calls.values()) == 0
+
+
+def test_resume_requires_a_journal() -> None:
+    """resume=True without a journal is a usage error."""
+    with pytest.raises(ValueError, match="journal"):
+        execute_graph(
+            graph=build_diamond(Counter(), set()), global_input={}, resume=True
+        )
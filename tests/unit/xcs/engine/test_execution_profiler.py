@@ -0,0 +1,171 @@
+"""Unit tests for the execution profiler and Chrome trace export.
+
+This module verifies that profiled runs record per-node submit/start/finish
+times and worker threads, that profiling is scoped to its context, and that
+the exported document is valid trace-event JSON.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.execution_profiler import ExecutionProfiler
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    execute_graph,
+    execute_graph_iter,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def sleeper(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that sleeps briefly."""
+    time.sleep(0.01)
+    return {}
+
+
+def failing(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that always raises."""
+    raise RuntimeError("boom")
+
+
+def build_diamond(operator=sleeper) -> XCSGraph:
+    """Build a diamond graph: a -> (b, c) -> d."""
+    graph = XCSGraph()
+    for node_id in ("a", "b", "c", "d"):
+        graph.add_node(operator=operator, node_id=node_id)
+    graph.add_edge(from_id="a", to_id="b")
+    graph.add_edge(from_id="a", to_id="c")
+    graph.add_edge(from_id="b", to_id="d")
+    graph.add_edge(from_id="c", to_id="d")
+    return graph
+
+
+def test_records_nodes_and_runs() -> None:
+    """Every node gets ordered timestamps and the thread that ran it."""
+    with ExecutionProfiler() as profiler:
+        execute_graph(graph=build_diamond(), global_input={})
+
+    (run,) = profiler.runs
+    assert run.status == "ok" and run.node_count == 4
+    assert run.scheduler == "TopologicalSchedulerWithParallelDispatch"
+    assert run.thread_id == threading.get_ident()
+    assert sorted(node.node_id for node in profiler.nodes) == ["a", "b", "c", "d"]
+    for node in profiler.nodes:
+        assert node.status == "ok"
+        assert node.submitted <= node.started <= node.finished
+        assert node.finished - node.started >= 0.01
+        assert node.thread_id is not None and node.thread_name
+
+
+def test_profiling_is_opt_in_and_scoped() -> None:
+    """Runs outside the profiler's context are not recorded."""
+    profiler = ExecutionProfiler()
+    execute_graph(graph=build_diamond(), global_input={})
+    with profiler:
+        execute_graph(graph=build_diamond(), global_input={})
+    execute_graph(graph=build_diamond(), global_input={})
+
+    assert len(profiler.runs) == 1
+
+
+def test_profiler_is_shared_between_threads() -> None:
+    """Threads entering one profiler may leave it in any order."""
+    profiler = ExecutionProfiler()
+    entered = threading.Barrier(2)
+    first_left = threading.Event()
+    errors = []
+
+    def record(leave_first: bool) -> None:
+        try:
+            with profiler:
+                entered.wait()
+                if not leave_first:
+                    first_left.wait()
+                execute_graph(graph=build_diamond(), global_input={})
+            first_left.set()
+        except BaseException as error:
+            errors.append(error)
+            first_left.set()
+
+    threads = [
+        threading.Thread(target=record, args=(leave_first,))
+        for leave_first in (True, False)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(profiler.runs) == 2
+
+
+def test_records_failures_and_abandoned_nodes() -> None:
+    """Failed runs are marked incomplete and keep their node statuses."""
+    with ExecutionProfiler() as profiler:
+        with pytest.raises(RuntimeError):
+            execute_graph(graph=build_diamond(operator=failing), global_input={})
+
+    (run,) = profiler.runs
+    assert run.status == "incomplete"
+    assert [(node.node_id, node.status) for node in profiler.nodes] == [("a", "error")]
+
+
+def test_stopped_stream_is_recorded() -> None:
+    """Abandoning a streaming run still closes its trace."""
+    with ExecutionProfiler() as profiler:
+        stream = execute_graph_iter(graph=build_diamond(), global_input={})
+        next(stream)
+        stream.close()
+
+    (run,) = profiler.runs
+    assert run.status == "incomplete"
+    assert {node.status for node in profiler.nodes} <= {"ok", "abandoned"}
+
+
+def test_chrome_trace_export(tmp_path: Path) -> None:
+    """The exported file is trace-event JSON with node, queue and run slices."""
+    with ExecutionProfiler() as profiler:
+        execute_graph(graph=build_diamond(), global_input={})
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(str(path))
+
+    document = json.loads(path.read_text())
+    events = document["traceEvents"]
+    complete = [e for e in events if e["ph"] == "X"]
+    assert {e["name"] for e in complete if e["cat"] == "node"} == {"a", "b", "c", "d"}
+    assert any(e["cat"] == "run" for e in complete)
+    assert all(e["dur"] >= 0 and e["ts"] >= 0 for e in complete)
+    queued = [e for e in events if e.get("cat") == "queue"]
+    assert len(queued) == 8
+    assert {e["name"] for e in events if e["ph"] == "M"} >= {
+        "process_name",
+        "thread_name",
+    }
+
+
+def test_interleaved_coroutines_become_async_slices() -> None:
+    """Overlapping nodes on the event loop thread are exported as async slices."""
+
+    async def wait(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.01)
+        return {}
+
+    graph = XCSGraph()
+    for node_id in ("x", "y", "z"):
+        graph.add_node(operator=wait, node_id=node_id)
+
+    with ExecutionProfiler() as profiler:
+        execute_graph(graph=graph, global_input={}, scheduler=AsyncScheduler())
+
+    node_events = [
+        e for e in profiler.to_chrome_trace()["traceEvents"] if e.get("cat") == "node"
+    ]
+    assert len({node.thread_id for node in profiler.nodes}) == 1
+    assert sorted(e["ph"] for e in node_events) == ["X", "b", "b", "e", "e"]
@@ -0,0 +1,135 @@
+"""Unit tests for the shared XCS worker pool.
+
+This module verifies executor reuse, ordered fan-out with run_concurrently,
+deadlock-free nesting, and that schedulers dispatch to the shared pool.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.executor_pool import (
+    configure_shared_executor,
+    get_shared_executor,
+    is_shared_worker_thread,
+    run_concurrently,
+    shared_pool_size,
+)
+from ember.xcs.engine.xcs_engine import (
+    TopologicalSchedulerWithParallelDispatch,
+    compile_graph,
+    execute_graph,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+@pytest.fixture
+def small_pool():
+    """Shrink the shared pool for the duration of a test."""
+    configure_shared_executor(max_workers=2)
+    yield
+    configure_shared_executor(max_workers=None)
+
+
+def thread_name_operator(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that reports which thread executed it."""
+    return {"thread": threading.current_thread().name}
+
+
+def test_shared_executor_is_reused() -> None:
+    """The same executor instance is returned until it is reconfigured."""
+    first = get_shared_executor()
+    assert get_shared_executor() is first
+
+
+def test_configure_shared_executor_resizes(small_pool) -> None:
+    """Reconfiguring the pool replaces the executor with one of the new size."""
+    assert shared_pool_size() == 2
+    assert get_shared_executor()._max_workers == 2
+
+
+def test_run_concurrently_preserves_order_and_errors() -> None:
+    """Results come back in item order, with exceptions stored on the futures."""
+
+    def work(value: int) -> int:
+        if value == 3:
+            raise ValueError("bad item")
+        time.sleep(0.001 * (5 - value))
+        return value * 10
+
+    futures = run_concurrently(fn=work, items=[0, 1, 2, 3, 4])
+    assert [f.result() for f in futures[:3]] == [0, 10, 20]
+    assert isinstance(futures[3].exception(), ValueError)
+    assert futures[4].result() == 40
+
+
+def test_run_concurrently_nested_does_not_deadlock(small_pool) -> None:
+    """Nested fan-out from saturated pool workers completes on the calling threads."""
+
+    def inner(value: int) -> int:
+        return value + 1
+
+    def outer(value: int) -> List[int]:
+        assert is_shared_worker_thread() or threading.current_thread() is main
+        return [f.result() for f in run_concurrently(fn=inner, items=[value] * 4)]
+
+    main = threading.current_thread()
+    futures = run_concurrently(fn=outer, items=list(range(6)))
+    assert [f.result() for f in futures] == [[v + 1] * 4 for v in range(6)]
+
+
+def test_scheduler_runs_on_shared_pool() -> None:
+    """By default the parallel scheduler dispatches tasks to the shared pool."""
+    graph = XCSGraph()
+    graph.add_node(operator=thread_name_operator, node_id="node1")
+    plan = compile_graph(graph=graph)
+    scheduler = TopologicalSchedulerWithParallelDispatch()
+    results = scheduler.run_plan(plan=plan, global_input={}, graph=graph)
+    assert results["node1"]["thread"].startswith("xcs-worker")
+
+
+def test_scheduler_private_pool_when_shared_disabled() -> None:
+    """Disabling the shared pool restores a private pool per run."""
+    graph = XCSGraph()
+    graph.add_node(operator=thread_name_operator, node_id="node1")
+    plan = compile_graph(graph=graph)
+    scheduler = TopologicalSchedulerWithParallelDispatch(use_shared_executor=False)
+    results = scheduler.run_plan(plan=plan, global_input={}, graph=graph)
+    assert not results["node1"]["thread"].startswith("xcs-worker")
+
+
+def test_scheduler_respects_max_workers_on_shared_pool() -> None:
+    """max_workers caps the number of tasks a run has in flight at once."""
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def tracked(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return {}
+
+    graph = XCSGraph()
+    for i in range(8):
+        graph.add_node(operator=tracked, node_id=f"node{i}")
+    scheduler = TopologicalSchedulerWithParallelDispatch(max_workers=2)
+    scheduler.run_plan(plan=compile_graph(graph=graph), global_input={}, graph=graph)
+    assert peak[0] <= 2
+
+
+def test_execution_options_executor_is_used() -> None:
+    """An executor supplied through execution_options is used by execute_graph."""
+    graph = XCSGraph()
+    graph.add_node(operator=thread_name_operator, node_id="node1")
+    with ThreadPoolExecutor(thread_name_prefix="custom-pool") as executor:
+        with execution_options(executor=executor):
+            results = execute_graph(graph=graph, global_input={})
+    assert results["node1"]["thread"].startswith("custom-pool")
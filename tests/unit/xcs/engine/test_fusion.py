@@ -0,0 +1,183 @@
+"""Unit tests for linear-chain fusion.
+
+This module verifies which nodes fuse_chains merges, that fused graphs produce
+the same results for the nodes they keep, including when a chain runs in a
+worker process, and that per-node outputs can still be captured for debugging.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.fusion import FusedChain, fuse_chains
+from ember.xcs.engine.worker_pool import LocalWorkerPool
+from ember.xcs.engine.xcs_distributed_scheduler import DistributedScheduler
+from ember.xcs.engine.xcs_engine import compile_graph, execute_graph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def make_step(key: str):
+    """Create an operator that appends ``key`` to the incoming trail."""
+
+    def step(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"trail": inputs.get("trail", "") + key}
+
+    return step
+
+
+def emit_root(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Module-level operator, so that chains using it can be pickled."""
+    return {"from_root": True}
+
+
+def emit_middle(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Module-level operator, so that chains using it can be pickled."""
+    return {"from_middle": True}
+
+
+def list_keys(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Report which keys the node received."""
+    return {"keys": sorted(inputs)}
+
+
+def build_pipeline() -> XCSGraph:
+    """source -> a -> b -> c, with c feeding two consumers that join in sink."""
+    graph = XCSGraph()
+    for node_id in ("source", "a", "b", "c", "left", "right", "sink"):
+        graph.add_node(operator=make_step(node_id[0]), node_id=node_id)
+    for from_id, to_id in [
+        ("source", "a"),
+        ("a", "b"),
+        ("b", "c"),
+        ("c", "left"),
+        ("c", "right"),
+        ("left", "sink"),
+        ("right", "sink"),
+    ]:
+        graph.add_edge(from_id=from_id, to_id=to_id)
+    return graph
+
+
+def test_fuses_single_producer_single_consumer_chains() -> None:
+    """Only the linear run source..c is fused; fan-out and fan-in stay separate."""
+    graph = build_pipeline()
+    fused = fuse_chains(graph=graph)
+
+    assert fused.chains == {"c": ("source", "a", "b", "c")}
+    assert fused.removed_node_count == 3
+    assert list(fused.graph.nodes) == ["c", "left", "right", "sink"]
+    assert fused.graph.nodes["left"].inbound_edges == ["c"]
+    assert fused.graph.nodes["c"].outbound_edges == ["left", "right"]
+    assert isinstance(fused.graph.nodes["c"].operator, FusedChain)
+    # The input graph is not modified.
+    assert len(graph.nodes) == 7
+
+
+def test_fused_graph_matches_unfused_results() -> None:
+    """Nodes kept by fusion produce exactly their unfused results."""
+    graph = build_pipeline()
+    expected = execute_graph(graph=graph, global_input={})
+    actual = execute_graph(graph=fuse_chains(graph=graph).graph, global_input={})
+
+    assert set(actual) == {"c", "left", "right", "sink"}
+    assert {node_id: expected[node_id] for node_id in actual} == actual
+
+
+def test_later_steps_see_global_input_not_head_parents() -> None:
+    """Inside a chain, each node sees its producer's output over the global input."""
+    seen: Dict[str, Any] = {}
+
+    def root(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"from_root": True}
+
+    def middle(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"from_middle": True}
+
+    def last(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        seen.update(inputs)
+        return {}
+
+    graph = XCSGraph()
+    graph.add_node(operator=root, node_id="root")
+    graph.add_node(operator=root, node_id="other_root")
+    graph.add_node(operator=middle, node_id="middle", name_hint="m")
+    graph.add_node(operator=last, node_id="last")
+    graph.add_edge(from_id="root", to_id="middle")
+    graph.add_edge(from_id="other_root", to_id="middle")
+    graph.add_edge(from_id="middle", to_id="last")
+
+    execute_graph(
+        graph=compile_graph(graph=graph, fuse=True), global_input={"query": "q"}
+    )
+    assert seen == {"query": "q", "from_middle": True}
+
+
+def test_chains_in_worker_processes_keep_the_global_input_apart() -> None:
+    """A chain run out of process still hides its head's parents from later steps."""
+    graph = XCSGraph()
+    graph.add_node(operator=emit_root, node_id="root")
+    graph.add_node(operator=emit_root, node_id="other_root")
+    graph.add_node(operator=emit_middle, node_id="middle", name_hint="m")
+    graph.add_node(operator=list_keys, node_id="last")
+    graph.add_edge(from_id="root", to_id="middle")
+    graph.add_edge(from_id="other_root", to_id="middle")
+    graph.add_edge(from_id="middle", to_id="last")
+
+    with LocalWorkerPool(workers=1) as pool:
+        results = execute_graph(
+            graph=compile_graph(graph=graph, fuse=True),
+            global_input={"query": "q"},
+            scheduler=DistributedScheduler(pool=pool),
+        )
+
+    assert results["last"] == {"keys": ["from_middle", "query"]}
+
+
+def test_capture_outputs_records_each_node() -> None:
+    """With capture_outputs, every original node keeps its own output."""
+    graph = build_pipeline()
+    execute_graph(
+        graph=fuse_chains(graph=graph, capture_outputs=True).graph, global_input={}
+    )
+
+    assert graph.nodes["source"].captured_outputs == {"trail": "s"}
+    assert graph.nodes["b"].captured_outputs == {"trail": "sab"}
+
+
+def test_hinted_and_async_nodes_are_not_fused() -> None:
+    """Scheduling hints, coroutine operators and fuse=False break chains."""
+
+    async def coroutine_step(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        return {}
+
+    graph = XCSGraph()
+    graph.add_node(operator=make_step("a"), node_id="a")
+    graph.add_node(operator=make_step("b"), node_id="b", timeout=5.0)
+    graph.add_node(operator=make_step("c"), node_id="c")
+    graph.add_node(operator=coroutine_step, node_id="d")
+    graph.add_node(operator=make_step("e"), node_id="e")
+    graph.add_node(operator=make_step("f"), node_id="f", fuse=False)
+    for from_id, to_id in zip("abcde", "bcdef"):
+        graph.add_edge(from_id=from_id, to_id=to_id)
+
+    assert fuse_chains(graph=graph).chains == {}
+
+
+def test_errors_name_the_failing_node() -> None:
+    """An exception raised inside a chain says which original node raised it."""
+
+    def failing(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("boom")
+
+    graph = XCSGraph()
+    graph.add_node(operator=make_step("a"), node_id="a")
+    graph.add_node(operator=failing, node_id="b")
+    graph.add_node(operator=make_step("c"), node_id="c")
+    graph.add_edge(from_id="a", to_id="b")
+    graph.add_edge(from_id="b", to_id="c")
+
+    with pytest.raises(RuntimeError) as excinfo:
+        execute_graph(graph=compile_graph(graph=graph, fuse=True), global_input={})
+    assert "node 'b'" in excinfo.value.__notes__[0]
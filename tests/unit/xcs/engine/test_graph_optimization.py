@@ -0,0 +1,150 @@
+"""Unit tests for dead-node and common-subexpression elimination.
+
+This module verifies which nodes the passes remove, that merges cascade to
+consumers that become identical, that merged parents keep the precedence of
+their outputs, that non-deduplicable operators and nodes are kept apart, and
+that optimized graphs produce the same exit result.
+"""
+
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.graph_optimization import (
+    eliminate_common_subexpressions,
+    eliminate_dead_nodes,
+    non_deduplicable,
+    optimize_graph,
+)
+from ember.xcs.engine.xcs_engine import compile_graph, execute_graph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def make_counter(calls: List[str], name: str):
+    def run(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(name)
+        return {"text": f"{name}({inputs.get('text', inputs.get('query'))})"}
+
+    return run
+
+
+def build_duplicated(calls: List[str]) -> XCSGraph:
+    """Two identical render -> generate branches joined by a judge, plus a dead log."""
+    render, generate = make_counter(calls, "render"), make_counter(calls, "generate")
+    graph = XCSGraph()
+    graph.add_node(operator=render, node_id="render_a")
+    graph.add_node(operator=render, node_id="render_b")
+    graph.add_node(operator=generate, node_id="generate_a")
+    graph.add_node(operator=generate, node_id="generate_b")
+    graph.add_node(operator=make_counter(calls, "log"), node_id="log")
+    graph.add_node(operator=make_counter(calls, "judge"), node_id="judge")
+    graph.add_edge(from_id="render_a", to_id="generate_a")
+    graph.add_edge(from_id="render_b", to_id="generate_b")
+    graph.add_edge(from_id="render_a", to_id="log")
+    graph.add_edge(from_id="generate_a", to_id="judge")
+    graph.add_edge(from_id="generate_b", to_id="judge")
+    graph.exit_node = "judge"
+    return graph
+
+
+def test_dead_nodes_are_removed() -> None:
+    """Only nodes whose output reaches the exit, or a kept node, survive."""
+    graph = build_duplicated([])
+
+    pruned = eliminate_dead_nodes(graph=graph)
+    assert pruned.removed == ("log",)
+    assert "log" not in pruned.graph.nodes
+    assert pruned.graph.nodes["render_a"].outbound_edges == ["generate_a"]
+
+    assert eliminate_dead_nodes(graph=graph, keep=["log"]).removed == ()
+    with pytest.raises(ValueError):
+        eliminate_dead_nodes(graph=graph, keep=["missing"])
+    # The input graph is not modified.
+    assert len(graph.nodes) == 6
+
+
+def test_identical_nodes_merge_and_cascade() -> None:
+    """Merging the renders makes the generations identical, which merge too."""
+    calls: List[str] = []
+    optimized = optimize_graph(graph=build_duplicated(calls))
+
+    assert optimized.merged == {"render_b": "render_a", "generate_b": "generate_a"}
+    assert list(optimized.graph.nodes) == ["render_a", "generate_a", "judge"]
+    assert optimized.graph.nodes["judge"].inbound_edges == ["generate_a"]
+    assert optimized.removed_node_count == 3
+
+    results = execute_graph(graph=optimized.graph, global_input={"query": "q"})
+    assert results["judge"] == {"text": "judge(generate(render(q)))"}
+    assert sorted(calls) == ["generate", "judge", "render"]
+
+
+def test_differing_attributes_and_parents_are_kept_apart() -> None:
+    """Same operator with other attributes or other parent order is not merged."""
+    render = make_counter([], "render")
+    graph = XCSGraph()
+    graph.add_node(operator=render, node_id="a", model="small")
+    graph.add_node(operator=render, node_id="b", model="large")
+    graph.add_node(operator=render, node_id="ab")
+    graph.add_node(operator=render, node_id="ba")
+    graph.add_edge(from_id="a", to_id="ab")
+    graph.add_edge(from_id="b", to_id="ab")
+    graph.add_edge(from_id="b", to_id="ba")
+    graph.add_edge(from_id="a", to_id="ba")
+
+    assert eliminate_common_subexpressions(graph=graph).merged == {}
+
+
+def test_merged_parents_keep_their_last_position() -> None:
+    """A parent merged into an earlier one still overrides the parents between."""
+
+    def emit(value: str):
+        return lambda *, inputs: {"value": value}
+
+    def pick(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"picked": inputs["value"]}
+
+    emit_a = emit("A")
+    graph = XCSGraph()
+    graph.add_node(operator=emit_a, node_id="a1")
+    graph.add_node(operator=emit("B"), node_id="b")
+    graph.add_node(operator=emit_a, node_id="a2")
+    graph.add_node(operator=pick, node_id="aba")
+    graph.add_node(operator=pick, node_id="ab")
+    for parent in ("a1", "b", "a2"):
+        graph.add_edge(from_id=parent, to_id="aba")
+    for parent in ("a1", "b"):
+        graph.add_edge(from_id=parent, to_id="ab")
+
+    before = execute_graph(graph=graph, global_input={})
+    result = optimize_graph(graph=graph, keep=["aba"])
+    after = execute_graph(graph=result.graph, global_input={})
+
+    assert result.merged == {"a2": "a1"}
+    assert result.graph.nodes["aba"].inbound_edges == ["b", "a1"]
+    assert before["aba"] == after["aba"] == {"picked": "A"}
+    assert before["ab"] == after["ab"] == {"picked": "B"}
+
+
+def test_non_deduplicable_operators_are_kept() -> None:
+    """Marked operators and nodes with deduplicate=False are never merged."""
+
+    @non_deduplicable
+    def sample(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"value": random.random()}
+
+    graph = XCSGraph()
+    graph.add_node(operator=sample, node_id="first")
+    graph.add_node(operator=sample, node_id="second")
+    deterministic = make_counter([], "render")
+    graph.add_node(operator=deterministic, node_id="third", deduplicate=False)
+    graph.add_node(operator=deterministic, node_id="fourth", deduplicate=False)
+
+    assert eliminate_common_subexpressions(graph=graph).merged == {}
+
+
+def test_compile_graph_optimize() -> None:
+    """compile_graph(optimize=True) plans only the surviving nodes."""
+    plan = compile_graph(graph=build_duplicated([]), optimize=True)
+
+    assert plan.node_ids == ("render_a", "generate_a", "judge")
@@ -0,0 +1,135 @@
+"""Unit tests for graph partitioning.
+
+This module verifies that independent branches are never split,
+that boundary edges always point to later partitions, that observed output
+sizes steer the cut, and that running the partitions one after another with
+shipped results reproduces an unpartitioned run.
+"""
+
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.graph_partitioning import (
+    observed_output_sizes,
+    partition_graph,
+)
+from ember.xcs.engine.xcs_engine import execute_graph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def append(name: str):
+    def run(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"text": f"{inputs.get('text', inputs.get('query'))}>{name}"}
+
+    return run
+
+
+def join(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return {"text": f"join({inputs['text']})"}
+
+
+def build_branches(width: int, length: int) -> XCSGraph:
+    """Independent chains b{i}_0 -> ... -> b{i}_{length-1}, added level by level."""
+    graph = XCSGraph()
+    for step in range(length):
+        for branch in range(width):
+            node_id = f"b{branch}_{step}"
+            graph.add_node(operator=append(node_id), node_id=node_id)
+            if step:
+                graph.add_edge(from_id=f"b{branch}_{step - 1}", to_id=node_id)
+    return graph
+
+
+def test_independent_branches_are_not_cut() -> None:
+    """Chains stay whole, even though the graph was built level by level."""
+    graph = build_branches(width=4, length=5)
+    costs = {node_id: 1.0 for node_id in graph.nodes}
+
+    result = partition_graph(graph=graph, partitions=2, costs=costs)
+
+    assert result.boundary == ()
+    assert result.cut_weight == 0
+    assert [partition.cost for partition in result.partitions] == [10.0, 10.0]
+    for branch in range(4):
+        chain = {result.assignment[f"b{branch}_{step}"] for step in range(5)}
+        assert len(chain) == 1
+
+
+def test_boundary_edges_point_forward_and_respect_balance() -> None:
+    """Cross edges run to later partitions; no partition exceeds the tolerance."""
+    graph = XCSGraph()
+    graph.add_node(operator=append("source"), node_id="source")
+    graph.add_node(operator=join, node_id="sink")
+    for index in range(30):
+        graph.add_node(operator=append(f"n{index}"), node_id=f"n{index}")
+        graph.add_edge(from_id="source", to_id=f"n{index}")
+        graph.add_edge(from_id=f"n{index}", to_id="sink")
+    costs = {node_id: 1.0 for node_id in graph.nodes}
+
+    result = partition_graph(graph=graph, partitions=3, costs=costs, balance=0.1)
+
+    assert result.boundary
+    assert all(edge.from_partition < edge.to_partition for edge in result.boundary)
+    assert result.imbalance <= 1.1
+    for partition in result.partitions:
+        assert set(partition.depends_on) == set(partition.imports.values())
+        assert all(index < partition.index for index in partition.depends_on)
+        for node_id, targets in partition.exports.items():
+            assert all(
+                result.partitions[target].imports[node_id] == partition.index
+                for target in targets
+            )
+
+    with pytest.raises(ValueError):
+        partition_graph(graph=graph, partitions=0)
+
+
+def test_observed_output_sizes_steer_the_cut() -> None:
+    """A chain is cut after the node with the smallest captured output."""
+    graph = XCSGraph()
+    for index in range(4):
+        graph.add_node(operator=append(f"c{index}"), node_id=f"c{index}")
+        if index:
+            graph.add_edge(from_id=f"c{index - 1}", to_id=f"c{index}")
+    outputs = ["x", "x" * 1000, "x" * 1000, "x" * 1000]
+    for index, output in enumerate(outputs):
+        graph.nodes[f"c{index}"].captured_outputs = {"text": output}
+    costs = {node_id: 1.0 for node_id in graph.nodes}
+
+    sizes = observed_output_sizes(graph=graph)
+    assert sizes["c0"] < sizes["c1"]
+
+    result = partition_graph(graph=graph, partitions=2, costs=costs, balance=0.5)
+
+    assert [(edge.from_id, edge.to_id) for edge in result.boundary] == [("c0", "c1")]
+    assert result.cut_weight == sizes["c0"]
+
+
+def test_partitions_run_in_order_match_whole_graph() -> None:
+    """Shipping exported results between partitions reproduces a full run."""
+    graph = build_branches(width=3, length=4)
+    graph.add_node(operator=join, node_id="join")
+    for branch in range(3):
+        graph.add_edge(from_id=f"b{branch}_3", to_id="join")
+    expected = execute_graph(graph=graph, global_input={"query": "q"})
+
+    result = partition_graph(
+        graph=graph, partitions=3, costs={node_id: 1.0 for node_id in graph.nodes}
+    )
+    assert result.boundary
+
+    with pytest.raises(ValueError, match="missing"):
+        result.partitions[-1].bind_imports(results={})
+
+    shipped: Dict[str, Any] = {}
+    computed: Dict[str, Any] = {}
+    for partition in result.partitions:
+        outputs = execute_graph(
+            graph=partition.bind_imports(results=shipped), global_input={"query": "q"}
+        )
+        for node_id in partition.node_ids:
+            computed[node_id] = outputs[node_id]
+        shipped.update((node_id, outputs[node_id]) for node_id in partition.exports)
+
+    assert computed == expected
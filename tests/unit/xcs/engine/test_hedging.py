@@ -0,0 +1,203 @@
+"""Unit tests for hedged execution of straggling nodes.
+
+This module verifies that hedge delays are learned per latency key, that a
+straggling node gets a duplicate whose result wins, that the losing attempt is
+cancelled and accounted as wasted work, and that hints and budgets limit
+hedging.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.execution_policy import current_cancellation_token
+from ember.xcs.engine.hedging import HedgingPolicy
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    TopologicalSchedulerWithParallelDispatch,
+    execute_graph,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+class SlowFirstCall:
+    """Operator whose first call straggles until cancelled and later calls are fast."""
+
+    def __init__(self, *, stall: float = 2.0) -> None:
+        self.stall = stall
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.calls += 1
+            attempt = self.calls
+        if attempt == 1:
+            token = current_cancellation_token()
+            deadline = time.perf_counter() + self.stall
+            while time.perf_counter() < deadline and not token.cancelled:
+                time.sleep(0.005)
+        return {"attempt": attempt}
+
+
+def trained_policy(key: str, **kwargs: Any) -> HedgingPolicy:
+    """Return a policy that has seen 10 executions of ``key`` taking 10-19ms."""
+    policy = HedgingPolicy(min_samples=10, max_hedge_rate=None, **kwargs)
+    for sample in range(10):
+        policy.observe(key, 0.01 + sample * 0.001)
+    return policy
+
+
+def single_node_graph(operator: Any, **hints: Any) -> XCSGraph:
+    graph = XCSGraph()
+    graph.add_node(operator=operator, node_id="call", **hints)
+    return graph
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_delay_is_learned_per_key() -> None:
+    """No delay until enough samples; then the configured percentile."""
+    policy = HedgingPolicy(percentile=0.9, min_samples=10, max_hedge_rate=None)
+    for sample in range(9):
+        policy.observe("openai:gpt-4o", sample / 100)
+    assert policy.begin("openai:gpt-4o") is None
+    policy.observe("openai:gpt-4o", 0.09)
+
+    assert policy.begin("openai:gpt-4o") == pytest.approx(0.08)
+    assert policy.begin("other") is None
+    assert policy.stats.executions == 3
+
+
+def test_straggler_is_hedged_and_loser_cancelled() -> None:
+    """The duplicate wins, the stalled primary is cancelled and counted as waste."""
+    policy = trained_policy("call")
+    operator = SlowFirstCall()
+    scheduler = TopologicalSchedulerWithParallelDispatch(hedging=policy)
+
+    start = time.perf_counter()
+    results = execute_graph(
+        graph=single_node_graph(operator), global_input={}, scheduler=scheduler
+    )
+
+    assert time.perf_counter() - start < 1.0
+    assert results["call"] == {"attempt": 2}
+    assert wait_for(lambda: policy.stats.wasted_seconds > 0)
+    stats = policy.stats
+    assert (stats.executions, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+    assert stats.hedge_rate == 1.0
+
+
+def test_resource_class_shares_latencies() -> None:
+    """Nodes of one resource class learn from each other's executions."""
+    policy = trained_policy("provider:model")
+    operator = SlowFirstCall()
+    graph = single_node_graph(operator, resource_class="provider:model")
+
+    results = execute_graph(
+        graph=graph,
+        global_input={},
+        scheduler=TopologicalSchedulerWithParallelDispatch(hedging=policy),
+    )
+
+    assert results["call"] == {"attempt": 2}
+    assert policy.stats.hedges == 1
+
+
+def test_opted_out_nodes_are_not_hedged() -> None:
+    """Nodes hinted hedge=False always run once."""
+    policy = trained_policy("call")
+    operator = SlowFirstCall(stall=0.2)
+
+    results = execute_graph(
+        graph=single_node_graph(operator, hedge=False),
+        global_input={},
+        scheduler=TopologicalSchedulerWithParallelDispatch(hedging=policy),
+    )
+
+    assert results["call"] == {"attempt": 1}
+    assert operator.calls == 1
+    assert policy.stats.executions == 0
+
+
+def test_budget_limits_hedges() -> None:
+    """With no hedge budget the straggler runs to completion alone."""
+    policy = trained_policy("call")
+    policy.max_hedge_rate = 0.0
+    operator = SlowFirstCall(stall=0.2)
+
+    results = execute_graph(
+        graph=single_node_graph(operator),
+        global_input={},
+        scheduler=TopologicalSchedulerWithParallelDispatch(hedging=policy),
+    )
+
+    assert results["call"] == {"attempt": 1}
+    assert policy.stats.hedges == 0 and policy.stats.executions == 1
+
+
+def test_failures_are_not_hedged() -> None:
+    """A primary attempt that fails is reported without launching a duplicate."""
+    policy = trained_policy("call")
+    calls = []
+
+    def failing(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError, match="bad request"):
+        execute_graph(
+            graph=single_node_graph(failing),
+            global_input={},
+            scheduler=TopologicalSchedulerWithParallelDispatch(hedging=policy),
+        )
+    time.sleep(0.05)
+    assert len(calls) == 1 and policy.stats.hedges == 0
+
+
+def test_latencies_are_learned_from_unhedged_runs() -> None:
+    """Runs below min_samples are not hedged but teach the policy."""
+    policy = HedgingPolicy(min_samples=3)
+    graph = single_node_graph(lambda *, inputs: {})
+    scheduler = TopologicalSchedulerWithParallelDispatch(hedging=policy)
+
+    for _ in range(3):
+        execute_graph(graph=graph, global_input={}, scheduler=scheduler)
+
+    assert policy.begin("call") is not None
+    assert policy.stats.hedges == 0
+
+
+def test_async_scheduler_hedges_coroutines() -> None:
+    """Coroutine attempts race on the event loop and the loser is cancelled."""
+    policy = trained_policy("call")
+    calls = []
+
+    async def straggler(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(2.0)
+        return {"attempt": len(calls)}
+
+    start = time.perf_counter()
+    results = execute_graph(
+        graph=single_node_graph(straggler),
+        global_input={},
+        scheduler=AsyncScheduler(hedging=policy),
+    )
+
+    assert time.perf_counter() - start < 1.0
+    assert results["call"] == {"attempt": 2}
+    stats = policy.stats
+    assert (stats.hedges, stats.hedge_wins) == (1, 1)
+    assert stats.wasted_seconds > 0
@@ -0,0 +1,129 @@
+"""Unit tests for InputView and copy-free input gathering.
+
+This module verifies the layered lookup semantics of InputView, that writes
+to it stay private, that it flattens like a dictionary, and that schedulers hand
+operators views over the shared global input instead of copies.
+"""
+
+import pickle
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from ember.xcs.engine.input_view import InputView
+from ember.xcs.engine.xcs_engine import execute_graph
+from ember.xcs.graph.xcs_graph import XCSGraph
+from ember.xcs.utils.tree_util import tree_flatten, tree_unflatten
+
+
+def test_layers_shadow_in_order() -> None:
+    """Earlier layers win, and iteration matches an update-built dict."""
+    view = InputView({"a": 3}, {"a": 2, "b": 2}, {"a": 1, "c": 1})
+
+    assert view["a"] == 3
+    assert view["b"] == 2
+    assert view.get("missing", "default") == "default"
+    assert "c" in view and "missing" not in view
+    assert len(view) == 3
+    assert list(view) == ["a", "c", "b"]
+    assert view == {"a": 3, "b": 2, "c": 1}
+    with pytest.raises(KeyError):
+        _ = view["missing"]
+
+
+def test_writes_are_copy_on_write() -> None:
+    """Writes go to a private merged dict; the layers are never modified."""
+    parent, base = {"a": 2}, {"a": 1, "b": 1}
+    view = InputView(parent, base)
+
+    view["c"] = 3
+    view["a"] += 1
+    del view["b"]
+    assert view == {"a": 3, "c": 3}
+    assert parent == {"a": 2} and base == {"a": 1, "b": 1}
+    private = view.copy()
+    private["a"] = 4
+    assert view["a"] == 3
+    assert isinstance(private, dict)
+
+
+def test_view_flattens_like_a_dict() -> None:
+    """Tree utilities see a view's contents, not an opaque leaf."""
+    view = InputView({"b": [1, 2]}, {"a": 0, "b": None})
+
+    leaves, aux = tree_flatten(tree=view)
+    assert leaves == tree_flatten(tree=view.copy())[0] == [0, 1, 2]
+    assert tree_unflatten(aux=aux, children=[5, 6, 7]) == {"a": 5, "b": [6, 7]}
+
+
+def test_from_parts_merges_like_dict_update() -> None:
+    """from_parts reproduces the old global-then-parents merge."""
+    view = InputView.from_parts(
+        global_input={"query": "q", "value": 0},
+        parent_outputs=[{"value": 1}, {"value": 2, "extra": True}],
+        node_attributes={"name": "n"},
+    )
+
+    assert view.copy() == {
+        "query": "q",
+        "value": 2,
+        "extra": True,
+        "node_attributes": {"name": "n"},
+    }
+    assert dict(**view) == view.copy()
+
+
+def test_view_pickles_as_plain_dict() -> None:
+    """Views cross process boundaries as flat dictionaries."""
+    view = InputView({"a": 1}, {"b": 2})
+    assert pickle.loads(pickle.dumps(view)) == {"a": 1, "b": 2}
+
+
+def test_global_input_is_shared_not_copied() -> None:
+    """Every node sees the caller's global input values without a copy."""
+    document: List[str] = ["token"] * 1000
+    global_input = {"document": document}
+    seen: List[Mapping[str, Any]] = []
+
+    def reader(*, inputs: Mapping[str, Any]) -> Dict[str, Any]:
+        seen.append(inputs)
+        return {"length": len(inputs["document"])}
+
+    graph = XCSGraph()
+    graph.add_node(operator=reader, node_id="first")
+    graph.add_node(operator=reader, node_id="second")
+    graph.add_edge(from_id="first", to_id="second")
+    results = execute_graph(graph=graph, global_input=global_input)
+
+    assert results["second"] == {"length": 1000}
+    assert all(isinstance(inputs, InputView) for inputs in seen)
+    assert all(inputs["document"] is document for inputs in seen)
+    assert seen[1]["length"] == 1000
+    assert global_input == {"document": document}
+
+
+def test_operators_may_mutate_their_inputs() -> None:
+    """An operator editing its inputs affects neither siblings nor the caller."""
+    global_input = {"query": "q"}
+
+    def annotate(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        inputs["query"] += "!"
+        inputs.setdefault("notes", []).append("annotated")
+        return {"query": inputs["query"], "notes": inputs["notes"]}
+
+    def read(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"query": inputs["query"]}
+
+    graph = XCSGraph()
+    graph.add_node(operator=read, node_id="root")
+    for node_id in ("left", "right"):
+        graph.add_node(operator=annotate, node_id=node_id)
+        graph.add_edge(from_id="root", to_id=node_id)
+    graph.add_node(operator=read, node_id="sibling")
+    graph.add_edge(from_id="root", to_id="sibling")
+    results = execute_graph(graph=graph, global_input=global_input)
+
+    assert results["left"] == {"query": "q!", "notes": ["annotated"]}
+    assert results["right"] == {"query": "q!", "notes": ["annotated"]}
+    assert results["sibling"] == results["root"] == {"query": "q"}
+    assert global_input == {"query": "q"}
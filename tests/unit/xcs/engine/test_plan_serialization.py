@@ -0,0 +1,146 @@
+"""Unit tests for saving and loading graphs and plans.
+
+This module verifies that saved graphs and plans round-trip their structure,
+attributes and operators by importable name or registry key, that fused plans
+keep their chains, and that unreferenceable operators and foreign files are
+rejected with GraphSerializationError.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.plan_serialization import (
+    load_graph,
+    load_plan,
+    register_operator,
+    save_graph,
+    save_plan,
+)
+from ember.xcs.engine.xcs_engine import compile_graph, execute_graph
+from ember.xcs.exceptions import GraphSerializationError
+from ember.xcs.graph.compact_graph import CompactXCSGraph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def increment(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return {"value": inputs.get("value", 0) + 1}
+
+
+class Scale:
+    """Configured operator instance, only referenceable through the registry."""
+
+    def __init__(self, factor: int) -> None:
+        self.factor = factor
+
+    def __call__(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"value": inputs["value"] * self.factor}
+
+
+TRIPLE = register_operator("tests.serialization.triple", Scale(3))
+
+
+def build_graph() -> XCSGraph:
+    graph = XCSGraph()
+    graph.add_node(operator=increment, node_id="first", resource_class="cpu")
+    graph.add_node(operator=increment, node_id="second", fuse=True)
+    graph.add_node(operator=TRIPLE, node_id="scaled")
+    graph.add_edge(from_id="first", to_id="second")
+    graph.add_edge(from_id="second", to_id="scaled")
+    return graph
+
+
+def test_graph_round_trip(tmp_path: Path) -> None:
+    """Nodes, edges, hints and operators survive a save and load."""
+    graph = build_graph()
+    path = tmp_path / "graph.json"
+
+    save_graph(graph, path)
+    loaded = load_graph(path)
+
+    assert list(loaded.nodes) == list(graph.nodes)
+    assert loaded.nodes["scaled"].inbound_edges == ["second"]
+    assert loaded.nodes["first"].get_hint("resource_class") == "cpu"
+    assert loaded.nodes["second"].operator is increment
+    assert loaded.nodes["scaled"].operator is TRIPLE
+    assert (loaded.entry_node, loaded.exit_node) == ("first", "scaled")
+    assert execute_graph(graph=loaded, global_input={})["scaled"] == {"value": 6}
+
+    document = json.loads(path.read_text())
+    assert len(document["operators"]) == 2
+
+    compact = load_graph(path, graph_type=CompactXCSGraph)
+    assert compact.topological_sort() == graph.topological_sort()
+
+
+def test_loaded_graph_levels_follow_its_edges(tmp_path: Path) -> None:
+    """A chain stored against its order loads with the chain's levels."""
+    graph = XCSGraph()
+    for node_id in ("c", "b", "a"):
+        graph.add_node(operator=increment, node_id=node_id)
+    graph.add_edge(from_id="a", to_id="b")
+    graph.add_edge(from_id="b", to_id="c")
+    path = tmp_path / "chain.json"
+
+    save_graph(graph, path)
+    for graph_type in (XCSGraph, CompactXCSGraph):
+        loaded = load_graph(path, graph_type=graph_type)
+        assert loaded.levels() == (("a",), ("b",), ("c",))
+        assert loaded.topological_sort() == ["a", "b", "c"]
+
+
+def test_plan_round_trip_keeps_levels_and_fusion(tmp_path: Path) -> None:
+    """A fused plan loads with the same order and runs its chains."""
+    graph = XCSGraph()
+    for index in range(4):
+        graph.add_node(operator=increment, node_id=f"n{index}")
+        if index:
+            graph.add_edge(from_id=f"n{index - 1}", to_id=f"n{index}")
+    plan = compile_graph(graph=graph, fuse=True)
+    path = tmp_path / "plan.json"
+
+    save_plan(plan, path)
+    loaded = load_plan(path)
+
+    assert loaded.levels == plan.levels
+    assert loaded.tasks["n3"].operator.node_ids == ("n0", "n1", "n2", "n3")
+    assert execute_graph(graph=loaded, global_input={}) == {"n3": {"value": 4}}
+
+
+def test_unreferenceable_operators_are_rejected(tmp_path: Path) -> None:
+    """Lambdas, unregistered instances and unknown keys raise clear errors."""
+    graph = XCSGraph()
+    graph.add_node(operator=lambda *, inputs: {}, node_id="anonymous")
+    with pytest.raises(GraphSerializationError, match="register_operator"):
+        save_graph(graph, tmp_path / "lambda.json")
+
+    graph = XCSGraph()
+    graph.add_node(operator=increment, node_id="node", payload=object())
+    with pytest.raises(GraphSerializationError, match="node 'node'"):
+        save_graph(graph, tmp_path / "attributes.json")
+    assert not (tmp_path / "attributes.json").exists()
+
+    path = tmp_path / "registered.json"
+    save_graph(build_graph(), path)
+    document = json.loads(path.read_text())
+    document["operators"][1] = {"key": "tests.serialization.missing"}
+    path.write_text(json.dumps(document))
+    with pytest.raises(GraphSerializationError, match="No operator is registered"):
+        load_graph(path)
+
+
+def test_foreign_files_are_rejected(tmp_path: Path) -> None:
+    """Files that are not saved graphs, or are from another version, fail to load."""
+    path = tmp_path / "other.json"
+    path.write_text(json.dumps({"nodes": []}))
+    with pytest.raises(GraphSerializationError, match="not a saved graph"):
+        load_plan(path)
+
+    save_graph(build_graph(), path)
+    document = json.loads(path.read_text())
+    document["version"] = 99
+    path.write_text(json.dumps(document))
+    with pytest.raises(GraphSerializationError, match="version 99"):
+        load_graph(path)
@@ -0,0 +1,208 @@
+"""Unit tests for resource-class concurrency limits.
+
+This module verifies ResourceLimits accounting and that the schedulers hold
+nodes of a saturated resource class back without delaying other classes, within
+a run and across concurrent runs.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.resource_limits import (
+    ResourceLimits,
+    configure_resource_limits,
+    get_resource_limits,
+)
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    TopologicalSchedulerWithParallelDispatch,
+    execute_graph,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+class ConcurrencyProbe:
+    """Records the peak number of concurrently running calls per class."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.running: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+        self.finished: List[str] = []
+
+    def operator(self, resource_class: str, delay: float):
+        """Create an operator that sleeps while counted as running."""
+
+        def run(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            self.enter(resource_class)
+            try:
+                time.sleep(delay)
+            finally:
+                self.exit(resource_class)
+            return {}
+
+        return run
+
+    def enter(self, resource_class: str) -> None:
+        with self._lock:
+            self.running[resource_class] = self.running.get(resource_class, 0) + 1
+            self.peak[resource_class] = max(
+                self.peak.get(resource_class, 0), self.running[resource_class]
+            )
+
+    def exit(self, resource_class: str) -> None:
+        with self._lock:
+            self.running[resource_class] -= 1
+            self.finished.append(resource_class)
+
+
+def build_mixed_graph(probe: ConcurrencyProbe, *, prefix: str = "") -> XCSGraph:
+    """Eight slow "openai:gpt-4o" nodes next to four fast "anthropic" nodes."""
+    graph = XCSGraph()
+    for i in range(8):
+        graph.add_node(
+            operator=probe.operator("openai:gpt-4o", 0.05),
+            node_id=f"{prefix}gpt_{i}",
+            resource_class="openai:gpt-4o",
+        )
+    for i in range(4):
+        graph.add_node(
+            operator=probe.operator("anthropic", 0.01),
+            node_id=f"{prefix}claude_{i}",
+            resource_class="anthropic",
+        )
+    return graph
+
+
+def test_limits_are_hierarchical() -> None:
+    """A model class counts against its provider's limit as well as its own."""
+    limits = ResourceLimits({"openai": 2, "openai:gpt-4o": 1})
+
+    assert limits.try_acquire("openai:gpt-4o")
+    assert not limits.try_acquire("openai:gpt-4o")
+    assert limits.try_acquire("openai:o1")
+    assert not limits.try_acquire("openai:o1")
+    assert limits.try_acquire("anthropic")
+    assert limits.in_use("openai") == 2
+
+    limits.release("openai:gpt-4o")
+    assert limits.in_use("openai:gpt-4o") == 0
+    assert limits.try_acquire("openai:o1")
+
+
+def test_limits_reject_non_positive_capacity() -> None:
+    """Limits must allow at least one running node."""
+    with pytest.raises(ValueError):
+        ResourceLimits({"openai": 0})
+
+
+def test_parallel_scheduler_enforces_class_limit() -> None:
+    """A saturated class waits without holding back other classes."""
+    probe = ConcurrencyProbe()
+    limits = ResourceLimits({"openai:gpt-4o": 2})
+    scheduler = TopologicalSchedulerWithParallelDispatch(
+        max_workers=8, resource_limits=limits
+    )
+
+    results = execute_graph(
+        graph=build_mixed_graph(probe), global_input={}, scheduler=scheduler
+    )
+
+    assert len(results) == 12
+    assert probe.peak["openai:gpt-4o"] == 2
+    # The fast class is not queued behind the slow one.
+    assert probe.finished[:4] == ["anthropic"] * 4
+    assert limits.in_use("openai:gpt-4o") == 0
+
+
+def test_limits_are_shared_across_concurrent_runs() -> None:
+    """Two runs sharing limits never exceed the class capacity together."""
+    probe = ConcurrencyProbe()
+    limits = ResourceLimits({"openai": 3})
+    errors: List[BaseException] = []
+
+    def run(prefix: str) -> None:
+        try:
+            execute_graph(
+                graph=build_mixed_graph(probe, prefix=prefix),
+                global_input={},
+                scheduler=TopologicalSchedulerWithParallelDispatch(
+                    resource_limits=limits, use_shared_executor=False
+                ),
+            )
+        except BaseException as error:  # pragma: no cover - reported below
+            errors.append(error)
+
+    threads = [threading.Thread(target=run, args=(p,)) for p in ("a_", "b_")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not errors
+    assert probe.finished.count("openai:gpt-4o") == 16
+    assert probe.peak["openai:gpt-4o"] <= 3
+    assert limits.in_use("openai") == 0
+
+
+def test_fail_fast_drops_parked_nodes_and_releases_slots() -> None:
+    """A failing run leaves no slots reserved behind it."""
+    limits = ResourceLimits({"flaky": 1})
+
+    def failing(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("boom")
+
+    graph = XCSGraph()
+    for i in range(4):
+        graph.add_node(operator=failing, node_id=f"n{i}", resource_class="flaky")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        execute_graph(
+            graph=graph,
+            global_input={},
+            scheduler=TopologicalSchedulerWithParallelDispatch(resource_limits=limits),
+        )
+    assert limits.in_use("flaky") == 0
+
+
+def test_async_scheduler_enforces_class_limit() -> None:
+    """Coroutine operators are held to their class capacity too."""
+    running = 0
+    peak = 0
+
+    async def call(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    graph = XCSGraph()
+    for i in range(20):
+        graph.add_node(operator=call, node_id=f"n{i}", resource_class="openai")
+
+    scheduler = AsyncScheduler(resource_limits=ResourceLimits({"openai": 3}))
+    results = execute_graph(graph=graph, global_input={}, scheduler=scheduler)
+
+    assert len(results) == 20
+    assert peak == 3
+
+
+def test_process_wide_limits_via_execution_options() -> None:
+    """Schedulers built from execution_options use the process-wide limits."""
+    probe = ConcurrencyProbe()
+    configure_resource_limits({"openai:gpt-4o": 1})
+    try:
+        with execution_options(max_workers=8):
+            execute_graph(graph=build_mixed_graph(probe), global_input={})
+    finally:
+        configure_resource_limits({"openai:gpt-4o": None})
+
+    assert probe.peak["openai:gpt-4o"] == 1
+    assert get_resource_limits().limit("openai:gpt-4o") is None
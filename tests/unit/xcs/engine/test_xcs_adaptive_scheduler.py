@@ -0,0 +1,125 @@
+"""Unit tests for AdaptiveScheduler.
+
+This module verifies that the "auto" scheduler runs chains and cheap graphs
+inline, parallelizes wide graphs of unknown or expensive nodes, sends
+coroutine operators to the event loop, keeps deadlines enforceable, and learns
+node durations across runs, and that unknown scheduler names are rejected.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.coalescing import RequestCoalescer
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.execution_policy import ExecutionPolicy
+from ember.xcs.engine.xcs_adaptive_scheduler import AdaptiveScheduler
+from ember.xcs.engine.xcs_critical_path_scheduler import NodeCostModel
+from ember.xcs.engine.xcs_engine import (
+    compile_graph,
+    execute_graph,
+    execute_graph_iter,
+)
+from ember.xcs.engine.xcs_sequential_scheduler import SequentialScheduler
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def record_thread(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return {"thread": threading.get_ident()}
+
+
+def build_chain(length: int) -> XCSGraph:
+    graph = XCSGraph()
+    for index in range(length):
+        graph.add_node(operator=record_thread, node_id=f"n{index}")
+        if index:
+            graph.add_edge(from_id=f"n{index - 1}", to_id=f"n{index}")
+    return graph
+
+
+def build_fan_out(width: int, **hints: Any) -> XCSGraph:
+    graph = XCSGraph()
+    graph.add_node(operator=record_thread, node_id="root", **hints)
+    for index in range(width):
+        graph.add_node(operator=record_thread, node_id=f"leaf{index}", **hints)
+        graph.add_edge(from_id="root", to_id=f"leaf{index}")
+    return graph
+
+
+def choose(scheduler: AdaptiveScheduler, graph: XCSGraph) -> str:
+    return scheduler.choose(plan=compile_graph(graph=graph), graph=graph)
+
+
+def test_chains_run_inline() -> None:
+    """A graph without two nodes on one level runs on the calling thread."""
+    graph = build_chain(4)
+
+    results = execute_graph(graph=graph, global_input={}, scheduler="auto")
+
+    assert {result["thread"] for result in results.values()} == {threading.get_ident()}
+
+
+def test_unknown_scheduler_names_are_rejected() -> None:
+    """A misspelled scheduler name fails instead of running another scheduler."""
+    graph = build_chain(2)
+
+    with pytest.raises(ValueError, match="'atuo'.*'auto'"):
+        execute_graph(graph=graph, global_input={}, scheduler="atuo")
+    with pytest.raises(ValueError, match="'atuo'"):
+        list(execute_graph_iter(graph=graph, global_input={}, scheduler="atuo"))
+
+
+def test_wide_graphs_are_parallel_unless_known_to_be_cheap() -> None:
+    """Expected durations decide whether a fan-out is worth dispatching."""
+    scheduler = AdaptiveScheduler(cost_model=NodeCostModel())
+
+    assert choose(scheduler, build_fan_out(4)) == "parallel"
+    assert choose(scheduler, build_fan_out(4, expected_duration=1e-5)) == "sequential"
+    assert choose(scheduler, build_fan_out(4, expected_duration=0.5)) == "parallel"
+
+
+def test_observed_durations_are_learned() -> None:
+    """After a run of cheap nodes, the same graph runs inline."""
+    scheduler = AdaptiveScheduler(cost_model=NodeCostModel())
+    graph = build_fan_out(4)
+
+    first = scheduler.select(plan=compile_graph(graph=graph), graph=graph)
+    execute_graph(graph=graph, global_input={}, scheduler=scheduler)
+    second = scheduler.select(plan=compile_graph(graph=graph), graph=graph)
+
+    assert not isinstance(first, SequentialScheduler)
+    assert isinstance(second, SequentialScheduler)
+    assert set(scheduler.cost_model.observed(graph=graph)) == set(graph.nodes)
+
+
+def test_coroutine_operators_run_on_the_event_loop() -> None:
+    """Graphs containing coroutine operators are awaited by the async scheduler."""
+
+    async def answer(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0)
+        return {"answer": 42}
+
+    graph = build_chain(2)
+    graph.add_node(operator=answer, node_id="answer")
+    graph.add_edge(from_id="n1", to_id="answer")
+
+    with execution_options(scheduler="auto"):
+        results = execute_graph(graph=graph, global_input={})
+
+    assert choose(AdaptiveScheduler(), graph) == "async"
+    assert results["answer"] == {"answer": 42}
+
+
+def test_features_needing_a_dispatcher_stay_parallel() -> None:
+    """Deadlines, hedging and coalescing keep even a chain off the inline path."""
+    chain = build_chain(3)
+
+    assert choose(AdaptiveScheduler(), chain) == "sequential"
+    assert choose(AdaptiveScheduler(), build_chain(1)) == "sequential"
+    assert (
+        choose(AdaptiveScheduler(policy=ExecutionPolicy(node_timeout=1.0)), chain)
+        == "parallel"
+    )
+    assert choose(AdaptiveScheduler(coalescer=RequestCoalescer()), chain) == "parallel"
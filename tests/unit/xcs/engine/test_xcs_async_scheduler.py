@@ -0,0 +1,171 @@
+"""Unit tests for AsyncScheduler and execute_graph_async.
+
+This module verifies that coroutine operators run on the event loop, synchronous
+operators are offloaded to threads, dependencies are honored, and many nodes can
+be in flight at once.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    compile_graph,
+    execute_graph,
+    execute_graph_async,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+async def async_double(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Coroutine operator doubling the 'value' input."""
+    await asyncio.sleep(0)
+    return {"value": inputs["value"] * 2}
+
+
+def sync_increment(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Synchronous operator incrementing 'value' and reporting its thread."""
+    return {"value": inputs["value"] + 1, "thread": threading.current_thread().name}
+
+
+class FakeModelService:
+    """Stand-in for ModelService exposing only invoke_model_async."""
+
+    async def invoke_model_async(
+        self, model_id: str, prompt: str, **kwargs: Any
+    ) -> str:
+        await asyncio.sleep(0.01)
+        return f"{model_id}:{prompt}"
+
+
+class ModelLeaf:
+    """Operator object with an async __call__ wrapping invoke_model_async."""
+
+    def __init__(self, service: FakeModelService, model_id: str) -> None:
+        self.service = service
+        self.model_id = model_id
+
+    async def __call__(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.service.invoke_model_async(self.model_id, inputs["query"])
+        return {"response": response}
+
+
+def build_mixed_chain() -> XCSGraph:
+    """Build async -> sync -> async chain."""
+    graph = XCSGraph()
+    graph.add_node(operator=async_double, node_id="first")
+    graph.add_node(operator=sync_increment, node_id="second")
+    graph.add_node(operator=async_double, node_id="third")
+    graph.add_edge(from_id="first", to_id="second")
+    graph.add_edge(from_id="second", to_id="third")
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_execute_graph_async_mixed_operators() -> None:
+    """Async and sync operators compose and respect dependencies."""
+    graph = build_mixed_chain()
+    results = await execute_graph_async(graph=graph, global_input={"value": 1})
+    assert results["first"]["value"] == 2
+    assert results["second"]["value"] == 3
+    assert results["third"]["value"] == 6
+    # The synchronous operator ran on a worker thread, not the event loop thread.
+    assert results["second"]["thread"] != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_many_concurrent_coroutine_nodes() -> None:
+    """Thousands of sleeping coroutine nodes overlap instead of running serially."""
+    graph = XCSGraph()
+
+    async def sleeper(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.05)
+        return {}
+
+    for i in range(2000):
+        graph.add_node(operator=sleeper, node_id=f"node{i}")
+    start = time.perf_counter()
+    results = await execute_graph_async(graph=graph, global_input={})
+    assert len(results) == 2000
+    assert time.perf_counter() - start < 5.0
+
+
+@pytest.mark.asyncio
+async def test_model_service_leaf_node() -> None:
+    """An operator awaiting ModelService.invoke_model_async works as a leaf."""
+    service = FakeModelService()
+    graph = XCSGraph()
+    graph.add_node(operator=ModelLeaf(service, "openai:gpt-4o"), node_id="a")
+    graph.add_node(operator=ModelLeaf(service, "anthropic:claude"), node_id="b")
+    results = await execute_graph_async(graph=graph, global_input={"query": "hi"})
+    assert results["a"] == {"response": "openai:gpt-4o:hi"}
+    assert results["b"] == {"response": "anthropic:claude:hi"}
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates_and_cancels_in_flight() -> None:
+    """A failing node raises and remaining coroutine nodes are cancelled."""
+    cancelled = asyncio.Event()
+
+    async def fail(*, inputs: Dict[str, Any]) -> None:
+        raise ValueError("boom")
+
+    async def slow(*, inputs: Dict[str, Any]) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    graph = XCSGraph()
+    graph.add_node(operator=slow, node_id="slow")
+    graph.add_node(operator=fail, node_id="fail")
+    with pytest.raises(ValueError, match="boom"):
+        await execute_graph_async(graph=graph, global_input={})
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_bounds_in_flight_nodes() -> None:
+    """max_concurrency caps how many nodes run at once."""
+    active = 0
+    peak = 0
+
+    async def tracked(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {}
+
+    graph = XCSGraph()
+    for i in range(20):
+        graph.add_node(operator=tracked, node_id=f"node{i}")
+    await execute_graph_async(
+        graph=graph, global_input={}, scheduler=AsyncScheduler(max_concurrency=3)
+    )
+    assert peak == 3
+
+
+def test_run_plan_from_sync_code() -> None:
+    """AsyncScheduler can be used through the synchronous execute_graph."""
+    graph = build_mixed_chain()
+    with execution_options(scheduler="async"):
+        results = execute_graph(graph=graph, global_input={"value": 1})
+    assert results["third"]["value"] == 6
+
+
+@pytest.mark.asyncio
+async def test_run_plan_inside_event_loop_raises() -> None:
+    """Blocking run_plan refuses to run on a thread with a running loop."""
+    graph = build_mixed_chain()
+    with pytest.raises(RuntimeError, match="execute_graph_async"):
+        AsyncScheduler().run_plan(
+            plan=compile_graph(graph=graph), global_input={"value": 1}, graph=graph
+        )
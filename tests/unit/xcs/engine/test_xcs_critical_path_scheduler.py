@@ -0,0 +1,113 @@
+"""Unit tests for CriticalPathScheduler.
+
+This module verifies critical-path ranking, cost learning across runs, hint
+handling, and dispatch order under constrained concurrency.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.xcs_critical_path_scheduler import (
+    CriticalPathScheduler,
+    NodeCostModel,
+    compute_critical_path_ranks,
+)
+from ember.xcs.engine.xcs_engine import compile_graph, execute_graph
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def make_recorder(order: List[str], lock: threading.Lock) -> Callable[..., Any]:
+    """Create an operator factory that appends node names to ``order`` when run."""
+
+    def factory(name: str, delay: float = 0.0) -> Callable[..., Dict[str, Any]]:
+        def operator(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            with lock:
+                order.append(name)
+            if delay:
+                time.sleep(delay)
+            return {}
+
+        return operator
+
+    return factory
+
+
+def build_chain_vs_leaves(factory: Callable[..., Any]) -> XCSGraph:
+    """Build a graph with a three-node chain and three independent leaves."""
+    graph = XCSGraph()
+    graph.add_node(operator=factory("chain0"), node_id="chain0")
+    graph.add_node(operator=factory("chain1"), node_id="chain1")
+    graph.add_node(operator=factory("chain2"), node_id="chain2")
+    graph.add_edge(from_id="chain0", to_id="chain1")
+    graph.add_edge(from_id="chain1", to_id="chain2")
+    for i in range(3):
+        graph.add_node(operator=factory(f"leaf{i}"), node_id=f"leaf{i}")
+    return graph
+
+
+def test_ranks_follow_longest_remaining_path() -> None:
+    """Rank equals own cost plus the longest downstream path."""
+    graph = build_chain_vs_leaves(make_recorder([], threading.Lock()))
+    plan = compile_graph(graph=graph)
+    ranks = compute_critical_path_ranks(
+        plan=plan, costs={node_id: 1.0 for node_id in graph.nodes}
+    )
+    assert ranks["chain0"] == 3.0
+    assert ranks["chain2"] == 1.0
+    assert ranks["leaf0"] == 1.0
+
+
+def test_chain_head_dispatched_first() -> None:
+    """With a single worker the head of the longest chain runs first."""
+    order: List[str] = []
+    graph = build_chain_vs_leaves(make_recorder(order, threading.Lock()))
+    scheduler = CriticalPathScheduler(max_workers=1, cost_model=NodeCostModel())
+    scheduler.run_plan(plan=compile_graph(graph=graph), global_input={}, graph=graph)
+    assert order[0] == "chain0"
+    assert sorted(order) == sorted(graph.nodes)
+
+
+def test_expected_duration_hint_outranks_chain() -> None:
+    """A leaf hinted as slow outranks a chain of cheap nodes."""
+    order: List[str] = []
+    factory = make_recorder(order, threading.Lock())
+    graph = build_chain_vs_leaves(factory)
+    for node_id in ("chain0", "chain1", "chain2"):
+        graph.nodes[node_id].attributes["expected_duration"] = 0.1
+    graph.add_node(
+        operator=factory("slow_leaf"), node_id="slow_leaf", expected_duration=60
+    )
+    scheduler = CriticalPathScheduler(max_workers=1, cost_model=NodeCostModel())
+    scheduler.run_plan(plan=compile_graph(graph=graph), global_input={}, graph=graph)
+    assert order[0] == "slow_leaf"
+
+
+def test_durations_learned_across_runs() -> None:
+    """Observed durations are recorded and used to rank later runs."""
+    order: List[str] = []
+    factory = make_recorder(order, threading.Lock())
+    graph = XCSGraph()
+    graph.add_node(operator=factory("fast"), node_id="fast")
+    graph.add_node(operator=factory("slow", delay=0.05), node_id="slow")
+    cost_model = NodeCostModel()
+    scheduler = CriticalPathScheduler(max_workers=1, cost_model=cost_model)
+    plan = compile_graph(graph=graph)
+
+    scheduler.run_plan(plan=plan, global_input={}, graph=graph)
+    observed = cost_model.observed(graph=graph)
+    assert observed["slow"] > observed["fast"]
+
+    order.clear()
+    scheduler.run_plan(plan=plan, global_input={}, graph=graph)
+    assert order[0] == "slow"
+
+
+def test_selectable_through_execution_options() -> None:
+    """execution_options(scheduler="critical_path") selects the scheduler."""
+    with execution_options(scheduler="critical_path") as options:
+        assert isinstance(options.get_scheduler(), CriticalPathScheduler)
+        graph = XCSGraph()
+        graph.add_node(operator=lambda *, inputs: {"out": inputs["x"] + 1}, node_id="n")
+        assert execute_graph(graph=graph, global_input={"x": 1})["n"] == {"out": 2}
@@ -0,0 +1,170 @@
+"""Unit tests for DistributedScheduler and LocalWorkerPool.
+
+This module verifies that nodes run on local worker processes, that results
+and operator errors come back to the caller, that unpicklable nodes fail under
+the failure policy, and that tasks survive the death of the worker running
+them.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.execution_policy import ExecutionPolicy
+from ember.xcs.engine.resource_limits import ResourceLimits
+from ember.xcs.engine.worker_pool import LocalWorkerPool
+from ember.xcs.engine.xcs_distributed_scheduler import DistributedScheduler
+from ember.xcs.engine.xcs_engine import execute_graph
+from ember.xcs.exceptions import (
+    GraphExecutionError,
+    OperatorNotPicklableError,
+    WorkerCrashedError,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def square(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Square the incoming value and report the process it ran in."""
+    return {"value": inputs["value"] ** 2, "pid": os.getpid()}
+
+
+def reject(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that always raises."""
+    raise KeyError("missing field")
+
+
+def crash_once(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Kill the worker the first time it runs, then succeed."""
+    marker = Path(inputs["marker"])
+    if not marker.exists():
+        marker.write_text("crashed")
+        os._exit(1)
+    return {"survived": True}
+
+
+def crash_always(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Kill the worker every time it runs."""
+    os._exit(1)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """A two-worker pool shared by the tests in this module."""
+    with LocalWorkerPool(workers=2, max_retries=1) as worker_pool:
+        yield worker_pool
+
+
+def test_nodes_run_on_worker_processes(pool: LocalWorkerPool) -> None:
+    """Every node runs out of process and results flow between nodes."""
+    graph = XCSGraph()
+    graph.add_node(operator=square, node_id="first")
+    graph.add_node(operator=square, node_id="second")
+    graph.add_edge(from_id="first", to_id="second")
+
+    results = execute_graph(
+        graph=graph,
+        global_input={"value": 3},
+        scheduler=DistributedScheduler(pool=pool),
+    )
+
+    assert results["first"]["value"] == 9
+    assert results["second"]["value"] == 81
+    assert results["first"]["pid"] in pool.worker_pids
+    assert results["first"]["pid"] != os.getpid()
+    assert graph.nodes["second"].captured_outputs == results["second"]
+
+
+def test_operator_errors_are_returned_unchanged(pool: LocalWorkerPool) -> None:
+    """Exceptions raised by operators keep their type and carry the remote traceback."""
+    graph = XCSGraph()
+    graph.add_node(operator=reject, node_id="reject")
+
+    with pytest.raises(KeyError) as excinfo:
+        execute_graph(
+            graph=graph, global_input={}, scheduler=DistributedScheduler(pool=pool)
+        )
+    assert any("Remote traceback" in note for note in excinfo.value.__notes__)
+
+
+def test_crashed_worker_is_restarted_and_task_retried(
+    pool: LocalWorkerPool, tmp_path: Path
+) -> None:
+    """A task whose worker dies runs again on a fresh worker."""
+    graph = XCSGraph()
+    graph.add_node(operator=crash_once, node_id="fragile")
+    restarts = pool.restarts
+
+    results = execute_graph(
+        graph=graph,
+        global_input={"marker": str(tmp_path / "marker")},
+        scheduler=DistributedScheduler(pool=pool),
+    )
+
+    assert results["fragile"] == {"survived": True}
+    assert pool.restarts == restarts + 1
+
+
+def test_repeated_crashes_fail_the_task(pool: LocalWorkerPool) -> None:
+    """Retries are bounded; the pool keeps working afterwards."""
+    graph = XCSGraph()
+    graph.add_node(operator=crash_always, node_id="doomed")
+
+    with pytest.raises(WorkerCrashedError):
+        execute_graph(
+            graph=graph, global_input={}, scheduler=DistributedScheduler(pool=pool)
+        )
+
+    healthy = XCSGraph()
+    healthy.add_node(operator=square, node_id="square")
+    results = execute_graph(
+        graph=healthy,
+        global_input={"value": 2},
+        scheduler=DistributedScheduler(pool=pool),
+    )
+    assert results["square"]["value"] == 4
+
+
+def test_unpicklable_operator_raises_clear_error(pool: LocalWorkerPool) -> None:
+    """Lambdas cannot be shipped to workers and fail before dispatch."""
+    graph = XCSGraph()
+    graph.add_node(operator=lambda *, inputs: inputs, node_id="local")
+
+    with pytest.raises(OperatorNotPicklableError, match="local"):
+        execute_graph(
+            graph=graph, global_input={}, scheduler=DistributedScheduler(pool=pool)
+        )
+
+
+def test_unpicklable_operator_is_collected_under_continue(
+    pool: LocalWorkerPool,
+) -> None:
+    """Serialization failures follow the failure policy and free their slot."""
+    limits = ResourceLimits({"cpu": 1})
+    graph = XCSGraph()
+    graph.add_node(
+        operator=lambda *, inputs: inputs, node_id="local", resource_class="cpu"
+    )
+    graph.add_node(operator=square, node_id="square", resource_class="cpu")
+    scheduler = DistributedScheduler(
+        pool=pool,
+        resource_limits=limits,
+        policy=ExecutionPolicy(failure_policy="continue"),
+    )
+
+    with pytest.raises(GraphExecutionError) as excinfo:
+        execute_graph(graph=graph, global_input={"value": 3}, scheduler=scheduler)
+
+    assert isinstance(excinfo.value.errors["local"], OperatorNotPicklableError)
+    assert excinfo.value.results["square"]["value"] == 9
+    assert limits.try_acquire("cpu")
+
+
+def test_pool_rejects_work_after_shutdown() -> None:
+    """A shut-down pool refuses new tasks."""
+    worker_pool = LocalWorkerPool(workers=1)
+    worker_pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        worker_pool.submit(operator_payload=b"", inputs_payload=b"")
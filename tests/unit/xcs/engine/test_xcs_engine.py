@@ -9,7 +9,13 @@ from typing import Any, Dict
 
 import pytest
 
-from ember.xcs.engine.xcs_engine import XCSPlan, compile_graph
+from ember.xcs.engine.xcs_engine import (
+    XCSPlan,
+    XCSPlanCache,
+    compile_graph,
+    execute_graph,
+    get_plan_cache,
+)
 from ember.xcs.graph.xcs_graph import XCSGraph
 
 
@@ -103,3 +109,140 @@ def test_plan_immutability() -> None:
     with pytest.raises(AttributeError):
         # Attempting to modify an immutable attribute should result in an error.
         plan.tasks = {}  # type: ignore
+
+
+def build_diamond() -> XCSGraph:
+    """Build a diamond graph: a -> (b, c) -> d."""
+    graph: XCSGraph = XCSGraph()
+    for node_id in ("a", "b", "c", "d"):
+        graph.add_node(operator=dummy_operator, node_id=node_id)
+    graph.add_edge(from_id="a", to_id="b")
+    graph.add_edge(from_id="a", to_id="c")
+    graph.add_edge(from_id="b", to_id="d")
+    graph.add_edge(from_id="c", to_id="d")
+    return graph
+
+
+def test_compiled_topology() -> None:
+    """Plans carry integer-indexed adjacency, in-degrees and levels."""
+    plan = compile_graph(graph=build_diamond())
+
+    assert plan.node_ids == ("a", "b", "c", "d")
+    assert plan.get_execution_order() == ["a", "b", "c", "d"]
+    assert plan.levels == (("a",), ("b", "c"), ("d",))
+    assert plan.in_degree == (0, 1, 1, 2)
+    d = plan.index_of["d"]
+    assert plan.parent_indices[d] == (plan.index_of["b"], plan.index_of["c"])
+    assert plan.child_indices[plan.index_of["a"]] == (
+        plan.index_of["b"],
+        plan.index_of["c"],
+    )
+    assert plan.input_recipes[d].parent_ids == ("b", "c")
+
+
+def test_compiled_plan_snapshots_edges() -> None:
+    """Edges added after compilation do not alter an existing plan."""
+    graph = build_diamond()
+    plan = compile_graph(graph=graph)
+    graph.add_node(operator=dummy_operator, node_id="e")
+    graph.add_edge(from_id="d", to_id="e")
+
+    assert plan.tasks["d"].inbound_nodes == ["b", "c"]
+    assert "e" not in plan.index_of
+
+
+def test_compile_graph_rejects_cycles() -> None:
+    """Cyclic graphs fail at compile time instead of hanging at run time."""
+    graph: XCSGraph = XCSGraph()
+    graph.add_node(operator=dummy_operator, node_id="x")
+    graph.add_node(operator=dummy_operator, node_id="y")
+    graph.add_edge(from_id="x", to_id="y")
+    graph.add_edge(from_id="y", to_id="x")
+
+    with pytest.raises(ValueError, match="cycle"):
+        compile_graph(graph=graph)
+
+
+def test_plan_cache_reuses_plans() -> None:
+    """Repeat lookups of an unchanged graph return the cached plan."""
+    cache = XCSPlanCache()
+    graph = build_diamond()
+
+    first = cache.get_or_compile(graph=graph)
+    second = cache.get_or_compile(graph=graph)
+
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_plan_cache_detects_mutation() -> None:
+    """Changing edges or operators changes the fingerprint and recompiles."""
+    cache = XCSPlanCache()
+    graph = build_diamond()
+    first = cache.get_or_compile(graph=graph)
+
+    graph.add_edge(from_id="a", to_id="d")
+    second = cache.get_or_compile(graph=graph)
+    assert second is not first
+    assert second.tasks["d"].inbound_nodes == ["b", "c", "a"]
+
+    graph.nodes["d"].operator = lambda *, inputs: inputs
+    third = cache.get_or_compile(graph=graph)
+    assert third.tasks["d"].operator is graph.nodes["d"].operator
+    assert cache.misses == 3
+
+
+def test_plan_cache_binds_equivalent_graphs() -> None:
+    """A structurally identical graph shares topology but gets its own bindings."""
+    cache = XCSPlanCache()
+    graph = build_diamond()
+    other = build_diamond()
+    other.nodes["d"].attributes["name"] = "sink"
+
+    plan = cache.get_or_compile(graph=graph)
+    bound = cache.get_or_compile(graph=other)
+
+    assert bound.original_graph is other
+    assert bound.child_indices is plan.child_indices
+    assert bound.input_recipes[bound.index_of["d"]].node_attributes == {"name": "sink"}
+    assert plan.input_recipes[plan.index_of["d"]].node_attributes == {}
+
+
+def test_plan_cache_sees_replaced_attributes() -> None:
+    """Replacing a node's attributes dictionary is seen by the cached plan."""
+    cache = XCSPlanCache()
+    graph = build_diamond()
+    plan = cache.get_or_compile(graph=graph)
+
+    graph.nodes["d"].attributes = {"name": "sink"}
+    bound = cache.get_or_compile(graph=graph)
+
+    assert cache.hits == 1
+    assert bound.input_recipes[bound.index_of["d"]].node_attributes == {"name": "sink"}
+    assert plan.input_recipes[plan.index_of["d"]].node_attributes == {}
+    assert cache.get_or_compile(graph=graph).input_recipes == bound.input_recipes
+
+
+def test_plan_cache_evicts_least_recently_used() -> None:
+    """The cache holds at most max_size plans."""
+    cache = XCSPlanCache(max_size=1)
+    cache.get_or_compile(graph=build_diamond())
+    graph: XCSGraph = XCSGraph()
+    graph.add_node(operator=dummy_operator, node_id="solo")
+    cache.get_or_compile(graph=graph)
+
+    assert len(cache) == 1
+
+
+def test_execute_graph_uses_plan_cache() -> None:
+    """execute_graph compiles a graph once and reuses the plan afterwards."""
+    cache = get_plan_cache()
+    cache.clear()
+    graph = build_diamond()
+
+    first = execute_graph(graph=graph, global_input={"value": 1})
+    second = execute_graph(graph=graph, global_input={"value": 2})
+
+    assert first["d"]["value"] == 1
+    assert second["d"]["value"] == 2
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,276 @@
+"""Unit tests for deadlines, cancellation and failure policies.
+
+This module verifies that graph runs fail fast by default, can instead collect
+errors and skip dependents, enforce per-node and per-run deadlines, and expose
+a cancellation token that running operators can poll.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.execution_policy import (
+    ExecutionPolicy,
+    current_cancellation_token,
+)
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    execute_graph,
+    execute_graph_async,
+    execute_graph_iter,
+    TopologicalSchedulerWithParallelDispatch,
+)
+from ember.xcs.exceptions import (
+    GraphExecutionError,
+    GraphTimeoutError,
+    NodeTimeoutError,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def failing(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that always raises."""
+    raise RuntimeError("boom")
+
+
+def passthrough(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator that succeeds immediately."""
+    return {"ok": True}
+
+
+def make_sleeper(delay: float):
+    """Create an operator that sleeps for ``delay`` seconds."""
+
+    def sleeper(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(delay)
+        return {"slept": delay}
+
+    return sleeper
+
+
+def build_failing_graph() -> XCSGraph:
+    """A failing root with a dependent, next to an independent healthy branch."""
+    graph = XCSGraph()
+    graph.add_node(operator=failing, node_id="bad")
+    graph.add_node(operator=passthrough, node_id="after_bad")
+    graph.add_node(operator=passthrough, node_id="good")
+    graph.add_node(operator=passthrough, node_id="after_good")
+    graph.add_edge(from_id="bad", to_id="after_bad")
+    graph.add_edge(from_id="good", to_id="after_good")
+    return graph
+
+
+def test_policy_rejects_invalid_values() -> None:
+    """Unknown failure policies and non-positive deadlines are rejected."""
+    with pytest.raises(ValueError, match="failure policy"):
+        ExecutionPolicy(failure_policy="ignore")
+    with pytest.raises(ValueError, match="timeout"):
+        ExecutionPolicy(timeout=0)
+
+
+def test_fail_fast_raises_original_error_and_skips_dependents() -> None:
+    """By default the first node error propagates and nothing runs after it."""
+    ran: List[str] = []
+
+    def recorder(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        ran.append("after")
+        return {}
+
+    graph = XCSGraph()
+    graph.add_node(operator=failing, node_id="bad")
+    graph.add_node(operator=recorder, node_id="after")
+    graph.add_edge(from_id="bad", to_id="after")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        execute_graph(graph=graph, global_input={})
+    assert ran == []
+
+
+def test_fail_fast_cancels_running_siblings() -> None:
+    """Running nodes see their cancellation token flip when a sibling fails."""
+    observed = threading.Event()
+
+    def cooperative(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        token = current_cancellation_token()
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            if token.cancelled:
+                observed.set()
+                token.raise_if_cancelled()
+            time.sleep(0.005)
+        return {}
+
+    def late_failure(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    graph = XCSGraph()
+    graph.add_node(operator=cooperative, node_id="worker")
+    graph.add_node(operator=late_failure, node_id="bad")
+
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError, match="boom"):
+        execute_graph(graph=graph, global_input={})
+    assert time.perf_counter() - start < 1.0
+    assert observed.wait(timeout=1.0)
+
+
+def test_continue_collects_errors_and_partial_results() -> None:
+    """With "continue", healthy branches finish and failures are reported together."""
+    with pytest.raises(GraphExecutionError) as excinfo:
+        execute_graph(
+            graph=build_failing_graph(),
+            global_input={},
+            failure_policy="continue",
+        )
+
+    error = excinfo.value
+    assert set(error.errors) == {"bad"}
+    assert isinstance(error.errors["bad"], RuntimeError)
+    assert set(error.results) == {"good", "after_good"}
+    assert error.skipped == ["after_bad"]
+
+
+def test_continue_returns_results_when_nothing_fails() -> None:
+    """The continue policy changes nothing for a healthy graph."""
+    graph = XCSGraph()
+    graph.add_node(operator=passthrough, node_id="only")
+
+    results = execute_graph(graph=graph, global_input={}, failure_policy="continue")
+    assert results == {"only": {"ok": True}}
+
+
+def test_node_timeout_hint() -> None:
+    """A node's ``timeout`` hint bounds how long the scheduler waits for it."""
+    graph = XCSGraph()
+    graph.add_node(operator=make_sleeper(1.0), node_id="slow", timeout=0.05)
+
+    start = time.perf_counter()
+    with pytest.raises(NodeTimeoutError) as excinfo:
+        execute_graph(graph=graph, global_input={})
+    assert excinfo.value.node_id == "slow"
+    assert time.perf_counter() - start < 0.8
+
+
+def test_default_node_timeout_with_continue() -> None:
+    """A timed-out node counts as a failure under the continue policy."""
+    graph = XCSGraph()
+    graph.add_node(operator=make_sleeper(1.0), node_id="slow")
+    graph.add_node(operator=passthrough, node_id="fast")
+
+    with pytest.raises(GraphExecutionError) as excinfo:
+        execute_graph(
+            graph=graph,
+            global_input={},
+            node_timeout=0.05,
+            failure_policy="continue",
+        )
+    assert isinstance(excinfo.value.errors["slow"], NodeTimeoutError)
+    assert excinfo.value.results == {"fast": {"ok": True}}
+
+
+def test_graph_timeout() -> None:
+    """A run that overruns its deadline raises GraphTimeoutError."""
+    graph = XCSGraph()
+    graph.add_node(operator=make_sleeper(1.0), node_id="slow")
+
+    start = time.perf_counter()
+    with pytest.raises(GraphTimeoutError):
+        execute_graph(graph=graph, global_input={}, timeout=0.05)
+    assert time.perf_counter() - start < 0.8
+
+
+def test_scheduler_policy_and_overrides() -> None:
+    """Call-site arguments override the scheduler's own policy."""
+    scheduler = TopologicalSchedulerWithParallelDispatch(
+        policy=ExecutionPolicy(failure_policy="continue")
+    )
+    with pytest.raises(GraphExecutionError):
+        execute_graph(graph=build_failing_graph(), global_input={}, scheduler=scheduler)
+    with pytest.raises(RuntimeError, match="boom"):
+        execute_graph(
+            graph=build_failing_graph(),
+            global_input={},
+            scheduler=scheduler,
+            failure_policy="fail_fast",
+        )
+
+
+def test_execution_options_policy() -> None:
+    """execution_options carries the policy to the schedulers it builds."""
+    with execution_options(failure_policy="continue"):
+        with pytest.raises(GraphExecutionError):
+            execute_graph(graph=build_failing_graph(), global_input={})
+
+
+def test_streaming_honors_policy() -> None:
+    """execute_graph_iter yields healthy nodes before reporting collected errors."""
+    seen: List[str] = []
+    with pytest.raises(GraphExecutionError):
+        for completion in execute_graph_iter(
+            graph=build_failing_graph(),
+            global_input={},
+            failure_policy="continue",
+        ):
+            seen.append(completion.node_id)
+    assert sorted(seen) == ["after_good", "good"]
+
+
+def test_sequential_path_rejects_policy_overrides() -> None:
+    """The sequential path does not enforce policies, so it refuses them."""
+    graph = XCSGraph()
+    graph.add_node(operator=passthrough, node_id="only")
+
+    with pytest.raises(ValueError):
+        execute_graph(graph=graph, global_input={}, concurrency=False, timeout=1.0)
+
+
+def test_async_continue_and_node_timeout() -> None:
+    """The async scheduler applies the same policies to coroutine operators."""
+
+    async def slow(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(1.0)
+        return {}
+
+    graph = build_failing_graph()
+    graph.add_node(operator=slow, node_id="slow", timeout=0.05)
+
+    async def run() -> GraphExecutionError:
+        with pytest.raises(GraphExecutionError) as excinfo:
+            await execute_graph_async(
+                graph=graph,
+                global_input={},
+                scheduler=AsyncScheduler(),
+                failure_policy="continue",
+            )
+        return excinfo.value
+
+    error = asyncio.run(run())
+    assert set(error.errors) == {"bad", "slow"}
+    assert isinstance(error.errors["slow"], NodeTimeoutError)
+    assert set(error.results) == {"good", "after_good"}
+
+
+def test_async_graph_timeout() -> None:
+    """The async scheduler enforces the run deadline."""
+
+    async def slow(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(1.0)
+        return {}
+
+    graph = XCSGraph()
+    graph.add_node(operator=slow, node_id="slow")
+
+    with pytest.raises(GraphTimeoutError):
+        asyncio.run(
+            execute_graph_async(
+                graph=graph,
+                global_input={},
+                scheduler=AsyncScheduler(),
+                timeout=0.05,
+            )
+        )
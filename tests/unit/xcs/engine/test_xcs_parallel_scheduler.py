@@ -3,6 +3,8 @@
 This module verifies parallel execution using the TopologicalSchedulerWithParallelDispatch scheduler.
 """
 
+import threading
+import time
 from typing import Any, Dict
 
 from ember.xcs.engine.xcs_engine import (
@@ -45,3 +47,37 @@ def test_parallel_scheduler() -> None:
         plan=plan, global_input={"value": 3}, graph=graph
     )
     assert results["node1"] == {"out": 6}
+
+
+def test_children_dispatched_while_siblings_run() -> None:
+    """Tests that a ready child starts without waiting for unrelated in-flight tasks.
+
+    The graph has a slow root and a fast root whose child records when it starts.
+    The child must start before the slow root finishes.
+
+    Returns:
+        None
+    """
+    slow_done = threading.Event()
+
+    def slow(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(0.3)
+        slow_done.set()
+        return {}
+
+    def fast(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def child(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"started_before_slow_finished": not slow_done.is_set()}
+
+    graph: XCSGraph = XCSGraph()
+    graph.add_node(operator=slow, node_id="slow")
+    graph.add_node(operator=fast, node_id="fast")
+    graph.add_node(operator=child, node_id="child")
+    graph.add_edge(from_id="fast", to_id="child")
+    scheduler = TopologicalSchedulerWithParallelDispatch(max_workers=4)
+    results = scheduler.run_plan(
+        plan=compile_graph(graph=graph), global_input={}, graph=graph
+    )
+    assert results["child"]["started_before_slow_finished"]
@@ -0,0 +1,113 @@
+"""Unit tests for ProcessPoolScheduler.
+
+This module verifies that hinted nodes run in worker processes, that other nodes
+stay on threads, that a node's outputs are captured by the time it is reported
+complete, and that unpicklable operators fail with a clear error that
+the failure policy collects like any other node failure.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.execution_policy import ExecutionPolicy
+from ember.xcs.engine.xcs_engine import compile_graph
+from ember.xcs.engine.xcs_process_scheduler import ProcessPoolScheduler
+from ember.xcs.exceptions import GraphExecutionError, OperatorNotPicklableError
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def square_in_process(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """CPU-style operator reporting the process it ran in."""
+    return {"value": inputs["value"] ** 2, "pid": os.getpid()}
+
+
+def report_pid(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Operator reporting the process it ran in and the upstream value."""
+    return {"upstream": inputs["value"], "pid": os.getpid()}
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    """A small process pool shared by the tests in this module."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        yield pool
+
+
+def test_process_nodes_run_in_worker_processes(process_pool) -> None:
+    """Hinted nodes run out of process; their results feed thread nodes."""
+    graph = XCSGraph()
+    graph.add_node(operator=square_in_process, node_id="square", executor="process")
+    graph.add_node(operator=report_pid, node_id="report")
+    graph.add_edge(from_id="square", to_id="report")
+
+    scheduler = ProcessPoolScheduler(process_executor=process_pool)
+    results = scheduler.run_plan(
+        plan=compile_graph(graph=graph), global_input={"value": 4}, graph=graph
+    )
+
+    assert results["square"]["value"] == 16
+    assert results["square"]["pid"] != os.getpid()
+    assert results["report"] == {"upstream": 16, "pid": os.getpid()}
+    assert graph.nodes["square"].captured_outputs == results["square"]
+
+
+def test_outputs_are_captured_before_completion(process_pool) -> None:
+    """A process node's outputs are on the graph when its future resolves."""
+    seen: Dict[str, Any] = {}
+
+    class RecordingScheduler(ProcessPoolScheduler):
+        def _submit_task(self, *, node_id: str, graph: XCSGraph, **kwargs: Any):
+            future = super()._submit_task(node_id=node_id, graph=graph, **kwargs)
+            future.add_done_callback(
+                lambda _: seen.setdefault(
+                    node_id, graph.nodes[node_id].captured_outputs
+                )
+            )
+            return future
+
+    graph = XCSGraph()
+    graph.add_node(operator=square_in_process, node_id="square", executor="process")
+
+    scheduler = RecordingScheduler(process_executor=process_pool)
+    results = scheduler.run_plan(
+        plan=compile_graph(graph=graph), global_input={"value": 2}, graph=graph
+    )
+
+    assert seen["square"] == results["square"]
+
+
+def test_unpicklable_operator_raises_clear_error(process_pool) -> None:
+    """A lambda routed to a process fails before dispatch with a named error."""
+    graph = XCSGraph()
+    graph.add_node(
+        operator=lambda *, inputs: inputs, node_id="local", executor="process"
+    )
+    scheduler = ProcessPoolScheduler(process_executor=process_pool)
+    with pytest.raises(OperatorNotPicklableError, match="Node 'local'"):
+        scheduler.run_plan(
+            plan=compile_graph(graph=graph), global_input={}, graph=graph
+        )
+
+
+def test_unpicklable_operator_is_collected_under_continue(process_pool) -> None:
+    """Serialization failures count as node failures under the continue policy."""
+    graph = XCSGraph()
+    graph.add_node(
+        operator=lambda *, inputs: inputs, node_id="local", executor="process"
+    )
+    graph.add_node(operator=square_in_process, node_id="square", executor="process")
+
+    scheduler = ProcessPoolScheduler(process_executor=process_pool)
+    with pytest.raises(GraphExecutionError) as excinfo:
+        scheduler.run_plan(
+            plan=compile_graph(graph=graph),
+            global_input={"value": 3},
+            graph=graph,
+            policy=ExecutionPolicy(failure_policy="continue"),
+        )
+
+    assert isinstance(excinfo.value.errors["local"], OperatorNotPicklableError)
+    assert excinfo.value.results["square"]["value"] == 9
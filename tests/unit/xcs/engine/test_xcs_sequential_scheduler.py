@@ -0,0 +1,157 @@
+"""Unit tests for SequentialScheduler.
+
+This module verifies that the zero-thread scheduler runs nodes on the calling
+thread in dependency order with upstream outputs as inputs, and that it honors
+failure policies, deadlines and resource limits.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.execution_options import execution_options
+from ember.xcs.engine.execution_policy import ExecutionPolicy
+from ember.xcs.engine.resource_limits import ResourceLimits
+from ember.xcs.engine.xcs_engine import execute_graph, execute_graph_iter
+from ember.xcs.engine.xcs_sequential_scheduler import SequentialScheduler
+from ember.xcs.exceptions import (
+    GraphExecutionError,
+    GraphTimeoutError,
+    NodeTimeoutError,
+)
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def build_diamond(threads: List[int]) -> XCSGraph:
+    """Build a diamond a -> (b, c) -> d whose nodes add up upstream values."""
+
+    def make(name: str, value: int):
+        def run(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            threads.append(threading.get_ident())
+            upstream = sum(inputs.get(parent, 0) for parent in "abc")
+            return {name: upstream + value}
+
+        return run
+
+    graph = XCSGraph()
+    for name, value in (("a", 1), ("b", 10), ("c", 100), ("d", 1000)):
+        graph.add_node(operator=make(name, value), node_id=name)
+    graph.add_edge(from_id="a", to_id="b")
+    graph.add_edge(from_id="a", to_id="c")
+    graph.add_edge(from_id="b", to_id="d")
+    graph.add_edge(from_id="c", to_id="d")
+    return graph
+
+
+def test_runs_dependencies_on_the_calling_thread() -> None:
+    """Every node sees its parents' outputs and runs on the caller's thread."""
+    threads: List[int] = []
+    graph = build_diamond(threads)
+
+    results = execute_graph(
+        graph=graph, global_input={}, scheduler=SequentialScheduler()
+    )
+
+    assert results["b"] == {"b": 11} and results["c"] == {"c": 101}
+    assert results["d"] == {"d": 1112}
+    assert set(threads) == {threading.get_ident()}
+    assert graph.nodes["d"].captured_outputs == {"d": 1112}
+
+
+def test_sequential_option_is_dependency_correct() -> None:
+    """execution_options(scheduler="sequential") selects this scheduler."""
+    with execution_options(scheduler="sequential"):
+        completions = list(execute_graph_iter(graph=build_diamond([]), global_input={}))
+
+    assert [completion.node_id for completion in completions] == ["a", "b", "c", "d"]
+    assert completions[-1].result == {"d": 1112}
+
+
+def test_continue_policy_skips_dependents() -> None:
+    """Failures are collected and only their dependents are skipped."""
+
+    def failing(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("boom")
+
+    graph = XCSGraph()
+    graph.add_node(operator=failing, node_id="bad")
+    graph.add_node(operator=lambda *, inputs: {"ok": True}, node_id="after_bad")
+    graph.add_node(operator=lambda *, inputs: {"ok": True}, node_id="good")
+    graph.add_edge(from_id="bad", to_id="after_bad")
+
+    with pytest.raises(GraphExecutionError) as excinfo:
+        execute_graph(
+            graph=graph,
+            global_input={},
+            scheduler=SequentialScheduler(),
+            failure_policy="continue",
+        )
+
+    assert list(excinfo.value.errors) == ["bad"]
+    assert excinfo.value.skipped == ["after_bad"]
+    assert excinfo.value.results == {"good": {"ok": True}}
+
+
+def test_deadlines_are_checked_when_nodes_return() -> None:
+    """An overrunning node fails, and an overrunning run stops before the next node."""
+    calls: List[str] = []
+
+    def slow(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append("slow")
+        time.sleep(0.1)
+        return {}
+
+    def after(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append("after")
+        return {}
+
+    def build(**hints: Any) -> XCSGraph:
+        graph = XCSGraph()
+        graph.add_node(operator=slow, node_id="slow", **hints)
+        graph.add_node(operator=after, node_id="after")
+        graph.add_edge(from_id="slow", to_id="after")
+        return graph
+
+    with pytest.raises(NodeTimeoutError):
+        execute_graph(
+            graph=build(timeout=0.05),
+            global_input={},
+            scheduler=SequentialScheduler(),
+        )
+    assert calls == ["slow"]
+
+    calls.clear()
+    with pytest.raises(GraphTimeoutError):
+        execute_graph(
+            graph=build(),
+            global_input={},
+            scheduler=SequentialScheduler(policy=ExecutionPolicy(timeout=0.05)),
+        )
+    assert calls == ["slow"]
+
+
+def test_waits_for_resource_slots() -> None:
+    """A node whose class is saturated by another run waits for a free slot."""
+    limits = ResourceLimits({"provider": 1})
+    assert limits.try_acquire("provider")
+    graph = XCSGraph()
+    graph.add_node(
+        operator=lambda *, inputs: {"in_use": limits.in_use("provider")},
+        node_id="call",
+        resource_class="provider",
+    )
+    releaser = threading.Timer(0.1, limits.release, args=("provider",))
+    releaser.start()
+
+    start = time.perf_counter()
+    results = execute_graph(
+        graph=graph,
+        global_input={},
+        scheduler=SequentialScheduler(resource_limits=limits),
+    )
+
+    assert time.perf_counter() - start >= 0.09
+    assert results["call"] == {"in_use": 1}
+    assert limits.in_use("provider") == 0
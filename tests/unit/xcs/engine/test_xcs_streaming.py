@@ -0,0 +1,224 @@
+"""Unit tests for streaming graph execution.
+
+This module verifies that execute_graph_iter and execute_graph_iter_async yield
+node results in completion order, honor dependencies, report timings, and fall
+back gracefully for schedulers that cannot stream.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from ember.xcs.engine.xcs_async_scheduler import AsyncScheduler
+from ember.xcs.engine.xcs_engine import (
+    execute_graph,
+    execute_graph_iter,
+    execute_graph_iter_async,
+    TopologicalSchedulerWithParallelDispatch,
+)
+from ember.xcs.engine.xcs_noop_scheduler import XCSNoOpScheduler
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def make_sleeper(delay: float, label: str):
+    """Create an operator that sleeps for ``delay`` seconds and returns its label."""
+
+    def sleeper(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(delay)
+        return {"label": label, "seen": sorted(k for k in inputs if k != "seed")}
+
+    return sleeper
+
+
+def build_fast_slow_graph() -> XCSGraph:
+    """A slow root and a fast root feeding a join node."""
+    graph = XCSGraph()
+    graph.add_node(operator=make_sleeper(0.2, "slow"), node_id="slow")
+    graph.add_node(operator=make_sleeper(0.01, "fast"), node_id="fast")
+    graph.add_node(operator=make_sleeper(0.0, "join"), node_id="join")
+    graph.add_edge(from_id="slow", to_id="join")
+    graph.add_edge(from_id="fast", to_id="join")
+    return graph
+
+
+def test_results_stream_in_completion_order() -> None:
+    """The fast node is yielded first and the join only after both parents."""
+    graph = build_fast_slow_graph()
+    order = [
+        node_id
+        for node_id, _, _ in execute_graph_iter(
+            graph=graph,
+            global_input={"seed": 1},
+            scheduler=TopologicalSchedulerWithParallelDispatch(max_workers=4),
+        )
+    ]
+    assert order == ["fast", "slow", "join"]
+
+
+def test_first_result_arrives_before_graph_finishes() -> None:
+    """A fast root is available well before the slow branch completes."""
+    graph = build_fast_slow_graph()
+    start = time.perf_counter()
+    stream = execute_graph_iter(graph=graph, global_input={"seed": 1})
+    node_id, result, _ = next(stream)
+    first_latency = time.perf_counter() - start
+    remaining = list(stream)
+
+    assert node_id == "fast"
+    assert result["label"] == "fast"
+    assert first_latency < 0.15
+    assert [completion.node_id for completion in remaining] == ["slow", "join"]
+
+
+def test_streamed_results_match_execute_graph() -> None:
+    """Collecting the stream gives the same results as execute_graph."""
+    graph = build_fast_slow_graph()
+    streamed = {
+        completion.node_id: completion.result
+        for completion in execute_graph_iter(graph=graph, global_input={"seed": 1})
+    }
+    assert streamed == execute_graph(graph=graph, global_input={"seed": 1})
+
+
+def test_timings_are_recorded() -> None:
+    """Each completion carries ordered submit, start and finish timestamps."""
+    graph = build_fast_slow_graph()
+    timings = {
+        node_id: timing
+        for node_id, _, timing in execute_graph_iter(
+            graph=graph, global_input={"seed": 1}
+        )
+    }
+    for timing in timings.values():
+        assert timing.submitted <= timing.started <= timing.finished
+        assert timing.queue_time >= 0
+    assert timings["slow"].run_time >= 0.2
+    assert timings["join"].submitted >= timings["slow"].finished
+
+
+def test_children_dispatched_before_consumer_resumes() -> None:
+    """A slow consumer does not hold back a completed node's children."""
+    child_started = threading.Event()
+
+    def child(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        child_started.set()
+        return {}
+
+    graph = XCSGraph()
+    graph.add_node(operator=make_sleeper(0.0, "root"), node_id="root")
+    graph.add_node(operator=child, node_id="child")
+    graph.add_edge(from_id="root", to_id="child")
+
+    stream = execute_graph_iter(graph=graph, global_input={})
+    assert next(stream).node_id == "root"
+    assert child_started.wait(timeout=1.0)
+    assert [completion.node_id for completion in stream] == ["child"]
+
+
+def test_early_exit_skips_unstarted_nodes() -> None:
+    """Breaking out of the stream prevents queued nodes from starting."""
+    started: List[str] = []
+
+    def record(name: str):
+        def op(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            started.append(name)
+            time.sleep(0.05)
+            return {}
+
+        return op
+
+    graph = XCSGraph()
+    for index in range(6):
+        graph.add_node(operator=record(f"n{index}"), node_id=f"n{index}")
+
+    scheduler = TopologicalSchedulerWithParallelDispatch(
+        max_workers=1, use_shared_executor=False
+    )
+    for _ in execute_graph_iter(graph=graph, global_input={}, scheduler=scheduler):
+        break
+    assert len(started) < 6
+
+
+def test_non_streaming_scheduler_falls_back() -> None:
+    """Schedulers without iter_plan still produce one completion per node."""
+    graph = XCSGraph()
+    graph.add_node(operator=make_sleeper(0.0, "a"), node_id="a")
+    graph.add_node(operator=make_sleeper(0.0, "b"), node_id="b")
+    completions = list(
+        execute_graph_iter(graph=graph, global_input={}, scheduler=XCSNoOpScheduler())
+    )
+    assert sorted(completion.node_id for completion in completions) == ["a", "b"]
+    assert all(completion.timing.finished is not None for completion in completions)
+
+
+def test_async_scheduler_streams_synchronously() -> None:
+    """AsyncScheduler can also be consumed from synchronous code."""
+
+    async def slow(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.1)
+        return {"label": "slow"}
+
+    async def fast(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"label": "fast"}
+
+    graph = XCSGraph()
+    graph.add_node(operator=slow, node_id="slow")
+    graph.add_node(operator=fast, node_id="fast")
+    order = [
+        completion.node_id
+        for completion in execute_graph_iter(
+            graph=graph, global_input={}, scheduler=AsyncScheduler()
+        )
+    ]
+    assert order == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_in_completion_order() -> None:
+    """execute_graph_iter_async yields from the running loop in completion order."""
+
+    async def slow(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.1)
+        return {"label": "slow"}
+
+    async def fast(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"label": "fast"}
+
+    def join(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"label": "join"}
+
+    graph = XCSGraph()
+    graph.add_node(operator=slow, node_id="slow")
+    graph.add_node(operator=fast, node_id="fast")
+    graph.add_node(operator=join, node_id="join")
+    graph.add_edge(from_id="slow", to_id="join")
+    graph.add_edge(from_id="fast", to_id="join")
+
+    completions = [
+        completion
+        async for completion in execute_graph_iter_async(graph=graph, global_input={})
+    ]
+    assert [completion.node_id for completion in completions] == [
+        "fast",
+        "slow",
+        "join",
+    ]
+    assert completions[1].timing.run_time >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_async_stream_relays_thread_scheduler() -> None:
+    """A thread-based scheduler streams through execute_graph_iter_async too."""
+    graph = build_fast_slow_graph()
+    order = [
+        completion.node_id
+        async for completion in execute_graph_iter_async(
+            graph=graph,
+            global_input={"seed": 1},
+            scheduler=TopologicalSchedulerWithParallelDispatch(),
+        )
+    ]
+    assert order == ["fast", "slow", "join"]
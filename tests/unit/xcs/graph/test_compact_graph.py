@@ -0,0 +1,162 @@
+"""Unit tests for CompactXCSGraph.
+
+This module verifies that the array-backed graph behaves like XCSGraph: the
+same node and edge bookkeeping, duplicate-edge handling, topological order,
+hint lookup and validation errors, node stores and merges, and identical
+results when executed.
+"""
+
+import copy
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.engine.xcs_engine import execute_graph
+from ember.xcs.graph.compact_graph import CompactXCSGraph
+from ember.xcs.graph.xcs_graph import XCSGraph, XCSNode, merge_xcs_graphs
+
+
+def make_adder(name: str):
+    def run(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        upstream = sum(value for value in inputs.values() if isinstance(value, int))
+        return {name: upstream + 1}
+
+    return run
+
+
+def build(graph_type: type) -> Any:
+    """Build a diamond with a repeated edge and a hinted node."""
+    graph = graph_type()
+    for name in "abcd":
+        graph.add_node(operator=make_adder(name), node_id=name)
+    graph.add_node(operator=make_adder("e"), node_id="e", resource_class="cpu")
+    for from_id, to_id in (("a", "c"), ("a", "b"), ("b", "d"), ("c", "d"), ("a", "c")):
+        graph.add_edge(from_id=from_id, to_id=to_id)
+    graph.add_edge(from_id="d", to_id="e")
+    return graph
+
+
+def test_structure_matches_xcs_graph() -> None:
+    """Edges, ordering, entry and exit agree with an XCSGraph built the same way."""
+    reference, compact = build(XCSGraph), build(CompactXCSGraph)
+
+    assert list(compact.nodes) == list(reference.nodes)
+    for node_id, node in reference.nodes.items():
+        view = compact.nodes[node_id]
+        assert view.inbound_edges == node.inbound_edges
+        assert view.outbound_edges == node.outbound_edges
+        assert compact.get_predecessors(node_id) == reference.get_predecessors(node_id)
+        assert compact.get_successors(node_id) == reference.get_successors(node_id)
+    assert compact.topological_sort() == reference.topological_sort()
+    assert compact.levels() == reference.levels()
+    assert compact.level_of("e") == 3
+    assert (compact.entry_node, compact.exit_node) == ("a", "e")
+    assert [node.node_id for node in compact] == compact.all_node_ids()
+
+
+def test_attributes_are_created_lazily() -> None:
+    """Hints are readable without creating attributes for plain nodes."""
+    graph = build(CompactXCSGraph)
+
+    assert graph.get_node("e").get_hint("resource_class") == "cpu"
+    assert graph.get_node("a").get_hint("resource_class", "default") == "default"
+    assert graph._attributes[0] is None and graph._captured_inputs[0] is None
+
+    graph.nodes["a"].attributes["name"] = "first"
+    assert graph.get_node(node_id="a").attrs == {"name": "first"}
+    assert graph.nodes["a"].captured_inputs == {"prompts": None}
+
+
+def test_validation_errors() -> None:
+    """Unknown and duplicate node IDs raise ValueError as in XCSGraph."""
+    graph = build(CompactXCSGraph)
+
+    with pytest.raises(ValueError, match="already exists"):
+        graph.add_node(operator=make_adder("a"), node_id="a")
+    with pytest.raises(ValueError, match="Source node"):
+        graph.add_edge(from_id="missing", to_id="a")
+    with pytest.raises(ValueError, match="not present"):
+        graph.get_successors("missing")
+
+    graph.add_edge(from_id="e", to_id="a")
+    with pytest.raises(ValueError, match="cycle"):
+        graph.topological_sort()
+
+
+def test_executes_like_xcs_graph() -> None:
+    """Execution results and captured outputs match across representations."""
+    reference, compact = build(XCSGraph), build(CompactXCSGraph)
+
+    expected = execute_graph(graph=reference, global_input={})
+    for scheduler in ("parallel", "sequential"):
+        assert execute_graph(graph=compact, global_input={}, scheduler=scheduler) == (
+            expected
+        )
+    assert compact.nodes["e"].captured_outputs == {"e": 6}
+
+
+def test_from_graph_and_copy() -> None:
+    """A converted graph keeps its structure; copied views are standalone nodes."""
+    reference = build(XCSGraph)
+    compact = CompactXCSGraph.from_graph(reference)
+
+    assert compact.topological_sort() == reference.topological_sort()
+    assert compact.get_node("e").get_hint("resource_class") == "cpu"
+
+    detached = copy.copy(compact.nodes["d"])
+    detached.operator = make_adder("replaced")
+    assert isinstance(detached, XCSNode)
+    assert detached.inbound_edges == ["b", "c"]
+    assert compact.nodes["d"].operator is not detached.operator
+
+
+def test_is_an_xcs_graph_without_duplicate_edges() -> None:
+    """The compact graph is an XCSGraph and keeps a repeated edge once."""
+    graph = build(CompactXCSGraph)
+
+    assert isinstance(graph, XCSGraph)
+    assert graph.nodes["c"].inbound_edges == ["a"]
+    assert len(graph._edge_sources) == 5
+    graph.add_edge(from_id="b", to_id="d")
+    assert len(graph._edge_sources) == 5
+
+
+def test_interleaved_edits_and_reads() -> None:
+    """Reads between edge additions see every edge, before and after folding."""
+    reference, compact = XCSGraph(), CompactXCSGraph()
+    for graph in (reference, compact):
+        for index in range(3000):
+            graph.add_node(operator=make_adder(str(index)), node_id=f"n{index}")
+            if index:
+                graph.add_edge(from_id=f"n{index // 2}", to_id=f"n{index}")
+                graph.add_edge(from_id=f"n{index - 1}", to_id=f"n{index}")
+                graph.add_edge(from_id=f"n{index // 2}", to_id=f"n{index}")
+                assert graph.nodes[f"n{index}"].inbound_edges
+
+    for node_id, node in reference.nodes.items():
+        assert compact.nodes[node_id].inbound_edges == node.inbound_edges
+        assert compact.get_successors(node_id) == reference.get_successors(node_id)
+    assert compact.levels() == reference.levels()
+
+
+def test_stored_and_merged_nodes() -> None:
+    """Nodes stored through graph.nodes keep their edges, as merges rely on."""
+    base = build(CompactXCSGraph)
+    stored = XCSNode(operator=make_adder("f"), node_id="f")
+    stored.inbound_edges = ["e", "missing"]
+    base.nodes["f"] = stored
+
+    assert base.nodes["e"].outbound_edges == ["f"]
+    assert base.nodes["f"].inbound_edges == ["e"]
+    with pytest.raises(TypeError):
+        del base.nodes["f"]
+
+    additional = XCSGraph()
+    additional.add_node(operator=make_adder("g"), node_id="g")
+    additional.add_node(operator=make_adder("h"), node_id="h")
+    additional.add_edge(from_id="g", to_id="h")
+    merged = merge_xcs_graphs(base=base, additional=additional)
+    assert merged is base
+    assert base.nodes["h"].inbound_edges == ["g"]
+    assert base.nodes["e"].inbound_edges == ["d", "h"]
+    assert base.topological_sort()[-2:] == ["e", "f"]
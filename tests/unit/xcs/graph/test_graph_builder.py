@@ -0,0 +1,86 @@
+"""Unit tests for XCSGraphBuilder and merge_graphs.
+
+This module verifies that bulk-built graphs match graphs built node by node,
+that validation is deferred to freeze(), and that merging namespaces the
+additional graph's nodes and edges without modifying either input.
+"""
+
+from typing import Any, Dict
+
+import pytest
+
+from ember.xcs.graph.graph_builder import XCSGraphBuilder, merge_graphs
+from ember.xcs.graph.xcs_graph import XCSGraph
+
+
+def identity(*, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(inputs)
+
+
+def test_bulk_build_matches_incremental_build() -> None:
+    """Edges may precede their nodes; duplicates are dropped; hints are kept."""
+    builder = XCSGraphBuilder()
+    builder.add_edges([("a", "b"), ("a", "c"), ("b", "c"), ("a", "b")])
+    builder.add_nodes([("a", identity), ("b", identity, {"timeout": 2.0})])
+    node_id = builder.add_node(identity, node_id="c", tags=["join"])
+    graph = builder.freeze()
+
+    reference = XCSGraph()
+    reference.add_node(operator=identity, node_id="a")
+    reference.add_node(operator=identity, node_id="b", timeout=2.0)
+    reference.add_node(operator=identity, node_id="c", tags=["join"])
+    for from_id, to_id in [("a", "b"), ("a", "c"), ("b", "c")]:
+        reference.add_edge(from_id=from_id, to_id=to_id)
+
+    assert node_id == "c"
+    assert list(graph.nodes) == list(reference.nodes)
+    for node_id, node in reference.nodes.items():
+        assert graph.nodes[node_id].inbound_edges == node.inbound_edges
+        assert graph.nodes[node_id].outbound_edges == node.outbound_edges
+        assert graph.nodes[node_id].attributes == node.attributes
+    assert (graph.entry_node, graph.exit_node) == ("a", "c")
+
+
+def test_validation_happens_at_freeze() -> None:
+    """Unknown endpoints and duplicate IDs are reported by freeze()."""
+    builder = XCSGraphBuilder()
+    builder.add_nodes([("a", identity)])
+    builder.add_edge("a", "missing")
+    with pytest.raises(ValueError, match="Destination node"):
+        builder.freeze()
+
+    builder = XCSGraphBuilder()
+    builder.add_nodes([("a", identity), ("a", identity)])
+    with pytest.raises(ValueError, match="already exists"):
+        builder.freeze()
+
+    builder = XCSGraphBuilder()
+    builder.freeze()
+    with pytest.raises(ValueError, match="frozen"):
+        builder.add_edge("a", "b")
+
+
+def test_merge_graphs_namespaces_without_mutating() -> None:
+    """Additional nodes and their edges are renamed; inputs stay unchanged."""
+    base = XCSGraph()
+    base.add_node(operator=identity, node_id="shared")
+    base.add_node(operator=identity, node_id="Ns_shared")
+    base.add_edge(from_id="shared", to_id="Ns_shared")
+    additional = XCSGraph()
+    additional.add_node(operator=identity, node_id="shared")
+    additional.add_node(operator=identity, node_id="tail")
+    additional.add_edge(from_id="shared", to_id="tail")
+
+    merged = merge_graphs(base=base, additional=additional, namespace="Ns")
+
+    assert list(merged.nodes) == ["shared", "Ns_shared", "Ns_shared_dup", "Ns_tail"]
+    assert merged.nodes["Ns_tail"].inbound_edges == ["Ns_shared_dup"]
+    assert merged.nodes["shared"].inbound_edges == ["Ns_tail"]
+    assert (merged.entry_node, merged.exit_node) == ("Ns_shared_dup", "Ns_shared")
+    assert list(additional.nodes) == ["shared", "tail"]
+    assert additional.nodes["shared"].node_id == "shared"
+    assert base.nodes["shared"].inbound_edges == []
+
+    side_by_side = merge_graphs(base=base, additional=additional, connect=False)
+    assert side_by_side.nodes["shared"].inbound_edges == []
+    assert list(side_by_side.nodes)[2:] == ["shared_dup", "tail"]
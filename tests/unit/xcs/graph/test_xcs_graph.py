@@ -172,3 +172,52 @@ def test_merge_with_duplicates() -> None:
     assert any(
         node_id.startswith("Ns_shared") for node_id in merged_graph.nodes
     ), "Merged graph must include a namespaced version of the duplicate node from the additional graph."
+
+
+def test_levels_are_cached_and_updated_incrementally() -> None:
+    """Levels follow the deepest predecessor and survive edits that keep them valid."""
+    graph: XCSGraph = XCSGraph()
+    for node_id in ("A", "B", "C", "D"):
+        graph.add_node(operator=dummy_operator, node_id=node_id)
+    graph.add_edge(from_id="A", to_id="B")
+    graph.add_edge(from_id="B", to_id="D")
+    graph.add_edge(from_id="A", to_id="C")
+
+    levels = graph.levels()
+    assert levels == (("A",), ("B", "C"), ("D",))
+    assert graph.topological_sort() == ["A", "B", "C", "D"]
+    assert graph.levels() is levels
+
+    # D is already deeper than C, so nothing moves.
+    graph.add_edge(from_id="C", to_id="D")
+    assert graph.levels() is levels
+
+    # Deepening C pushes its descendant D down as well.
+    graph.add_edge(from_id="B", to_id="C")
+    assert graph.levels() == (("A",), ("B",), ("C",), ("D",))
+    assert graph.level_of("D") == 3
+
+    graph.add_edge(from_id="D", to_id="A")
+    with pytest.raises(ValueError, match="Graph contains a cycle"):
+        graph.levels()
+
+
+def test_levels_notice_direct_edits() -> None:
+    """Nodes stored and edge lists edited directly are picked up."""
+    graph: XCSGraph = XCSGraph()
+    graph.add_node(operator=dummy_operator, node_id="A")
+    graph.add_node(operator=dummy_operator, node_id="B")
+    assert graph.levels() == (("A", "B"),)
+
+    graph.nodes["A"].add_outbound_edge(to_id="B")
+    graph.nodes["B"].add_inbound_edge(from_id="A")
+    assert graph.levels() == (("A",), ("B",))
+
+    graph.nodes["A"].outbound_edges = []
+    graph.nodes["B"].inbound_edges.clear()
+    assert graph.levels() == (("A", "B"),)
+
+    other: XCSGraph = XCSGraph()
+    other.add_node(operator=dummy_operator, node_id="C")
+    merge_xcs_graphs(base=graph, additional=other)
+    assert graph.level_of("C") == 0 and graph.level_of("B") == 1
@@ -0,0 +1,290 @@
+"""Unit tests for engine execution of jit-compiled operators.
+
+This module verifies that after the tracing call a jitted operator runs its
+independent sub-operators concurrently and each of them exactly once, that
+chained sub-operators become graph edges, that calls an operator stops making
+are trimmed from its graph, that results are not served for inputs forward()
+changed, that failed sub-operators do not repeat completed ones, and that tracing contexts and garbage collection are respected.
+"""
+
+import gc
+import threading
+import time
+from typing import Any, Dict, List
+
+from ember.core.registry.operator.base.operator_base import Operator
+from ember.xcs.tracer import tracer_decorator
+from ember.xcs.tracer.tracer_decorator import _COMPILED_GRAPHS, _store_graph, jit
+from ember.xcs.tracer.xcs_tracing import TracerContext
+
+
+class PassThroughSpecification:
+    """Specification without input or output models."""
+
+    def validate_inputs(self, *, inputs: Any) -> Any:
+        return inputs
+
+    def validate_output(self, *, output: Any) -> Any:
+        return output
+
+
+class Concurrency:
+    """Counts calls and the largest number of calls in progress at once."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls: List[str] = []
+
+    def enter(self, name: str) -> None:
+        with self.lock:
+            self.calls.append(name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def leave(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+class Step(Operator[Dict[str, Any], Dict[str, Any]]):
+    """Appends its name to the input text after a short delay."""
+
+    specification = PassThroughSpecification()
+
+    def __init__(self, *, name: str, tracker: Concurrency) -> None:
+        self.name = name
+        self.tracker = tracker
+
+    def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        self.tracker.enter(self.name)
+        try:
+            time.sleep(0.02)
+            return {"text": f"{inputs['text']}>{self.name}"}
+        finally:
+            self.tracker.leave()
+
+
+@jit()
+class Branches(Operator[Dict[str, Any], Dict[str, Any]]):
+    """Two independent first -> second branches whose results are joined."""
+
+    specification = PassThroughSpecification()
+
+    def __init__(self, *, tracker: Concurrency) -> None:
+        self.first = [Step(name=f"first{i}", tracker=tracker) for i in range(2)]
+        self.second = [Step(name=f"second{i}", tracker=tracker) for i in range(2)]
+        self.join = Step(name="join", tracker=tracker)
+
+    def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        texts = [
+            second(inputs=first(inputs=inputs))["text"]
+            for first, second in zip(self.first, self.second)
+        ]
+        return self.join(inputs={"text": "+".join(texts)})
+
+
+def test_sub_operators_run_concurrently_once_each() -> None:
+    """Branches run side by side; every sub-operator runs once per call."""
+    tracker = Concurrency()
+    operator = Branches(tracker=tracker)
+
+    traced = operator(inputs={"text": "a"})
+    assert tracker.peak == 1
+    graph = _COMPILED_GRAPHS[id(operator)]
+    assert graph.levels() == (
+        ("first0_0", "first1_2"),
+        ("second0_1", "second1_3"),
+    )
+
+    tracker.calls.clear()
+    compiled = operator(inputs={"text": "b"})
+
+    assert traced == {"text": "a>first0>second0+a>first1>second1>join"}
+    assert compiled == {"text": "b>first0>second0+b>first1>second1>join"}
+    assert sorted(tracker.calls) == sorted(
+        ["first0", "first1", "second0", "second1", "join"]
+    )
+    assert tracker.peak == 2
+
+
+def test_varying_calls_fall_back_to_direct_execution() -> None:
+    """An operator that skips a traced call is executed directly afterwards."""
+
+    @jit()
+    class Conditional(Operator[Dict[str, Any], Dict[str, Any]]):
+        specification = PassThroughSpecification()
+
+        def __init__(self, *, tracker: Concurrency) -> None:
+            self.steps = [Step(name=f"s{i}", tracker=tracker) for i in range(3)]
+
+        def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            steps = self.steps if inputs["text"] == "all" else self.steps[:1]
+            return {"texts": [step(inputs=inputs)["text"] for step in steps]}
+
+    operator = Conditional(tracker=Concurrency())
+    operator(inputs={"text": "all"})
+    assert _COMPILED_GRAPHS[id(operator)] is not None
+
+    assert operator(inputs={"text": "one"}) == {"texts": ["one>s0"]}
+    assert _COMPILED_GRAPHS[id(operator)] is None
+    assert operator(inputs={"text": "all"})["texts"][2] == "all>s2"
+
+
+def test_calls_no_longer_made_are_trimmed() -> None:
+    """Unused results are not computed again; the rest still run concurrently."""
+
+    @jit()
+    class Prefix(Operator[Dict[str, Any], Dict[str, Any]]):
+        specification = PassThroughSpecification()
+
+        def __init__(self, *, tracker: Concurrency) -> None:
+            self.steps = [Step(name=f"s{i}", tracker=tracker) for i in range(4)]
+
+        def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            count = len(self.steps) if inputs["text"] == "all" else 2
+            return {
+                "texts": [step(inputs=inputs)["text"] for step in self.steps[:count]]
+            }
+
+    tracker = Concurrency()
+    operator = Prefix(tracker=tracker)
+    operator(inputs={"text": "all"})
+
+    assert operator(inputs={"text": "two"}) == {"texts": ["two>s0", "two>s1"]}
+    assert set(_COMPILED_GRAPHS[id(operator)].nodes) == {"s0_0", "s1_1"}
+
+    tracker.calls.clear()
+    tracker.peak = 0
+    assert operator(inputs={"text": "two"}) == {"texts": ["two>s0", "two>s1"]}
+    assert sorted(tracker.calls) == ["s0", "s1"]
+    assert tracker.peak == 2
+
+
+def test_changed_intermediate_outputs_are_not_served_stale() -> None:
+    """A call whose inputs forward() changed runs again on the changed inputs."""
+
+    @jit()
+    class Shouting(Operator[Dict[str, Any], Dict[str, Any]]):
+        specification = PassThroughSpecification()
+
+        def __init__(self, *, tracker: Concurrency) -> None:
+            self.first = [Step(name=f"a{i}", tracker=tracker) for i in range(2)]
+            self.second = [Step(name=f"b{i}", tracker=tracker) for i in range(2)]
+
+        def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            texts = []
+            for first, second in zip(self.first, self.second):
+                x = first(inputs=inputs)
+                x["text"] = x["text"].upper()
+                texts.append(second(inputs=x)["text"])
+            return {"texts": texts}
+
+    operator = Shouting(tracker=Concurrency())
+    operator(inputs={"text": "a"})
+
+    assert operator(inputs={"text": "b"}) == {"texts": ["B>A0>b0", "B>A1>b1"]}
+    assert set(_COMPILED_GRAPHS[id(operator)].nodes) == {"a0_0", "a1_2"}
+    assert operator(inputs={"text": "c"}) == {"texts": ["C>A0>b0", "C>A1>b1"]}
+
+
+def test_changed_operator_inputs_are_not_served_stale() -> None:
+    """Calls made after forward() changes its own inputs see the change."""
+
+    @jit()
+    class Marking(Operator[Dict[str, Any], Dict[str, Any]]):
+        specification = PassThroughSpecification()
+
+        def __init__(self, *, tracker: Concurrency) -> None:
+            self.steps = [Step(name=f"s{i}", tracker=tracker) for i in range(2)]
+
+        def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            inputs["text"] += "!"
+            return {"texts": [step(inputs=inputs)["text"] for step in self.steps]}
+
+    operator = Marking(tracker=Concurrency())
+    operator(inputs={"text": "a"})
+
+    assert operator(inputs={"text": "b"}) == {"texts": ["b!>s0", "b!>s1"]}
+
+
+def test_failed_sub_operator_does_not_rerun_completed_ones() -> None:
+    """Only the failed call runs again, inside forward(), after an engine failure."""
+
+    class Flaky(Step):
+        fail_next = False
+
+        def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            if self.fail_next:
+                self.fail_next = False
+                self.tracker.calls.append(self.name)
+                raise RuntimeError("transient")
+            return super().forward(inputs=inputs)
+
+    tracker = Concurrency()
+    operator = Branches(tracker=tracker)
+    flaky = operator.second[1] = Flaky(name="second1", tracker=tracker)
+    operator(inputs={"text": "a"})
+
+    tracker.calls.clear()
+    flaky.fail_next = True
+    result = operator(inputs={"text": "b"})
+
+    assert result == {"text": "b>first0>second0+b>first1>second1>join"}
+    assert sorted(tracker.calls) == sorted(
+        ["first0", "first1", "second0", "second1", "second1", "join"]
+    )
+    assert _COMPILED_GRAPHS[id(operator)] is not None
+
+
+def test_operators_without_weak_references_are_held_boundedly(monkeypatch) -> None:
+    """Graphs of operators that cannot be weakly referenced are evicted oldest first."""
+    monkeypatch.setattr(tracer_decorator, "_MAX_HELD_OPERATORS", 2)
+    operators = [object() for _ in range(3)]
+    for operator in operators:
+        _store_graph(operator, None)
+
+    assert id(operators[0]) not in _COMPILED_GRAPHS
+    assert all(id(operator) in _COMPILED_GRAPHS for operator in operators[1:])
+    for operator in operators[1:]:
+        del _COMPILED_GRAPHS[id(operator)]
+        del tracer_decorator._HELD_OPERATORS[id(operator)]
+
+
+def test_tracer_context_runs_directly_and_records() -> None:
+    """Inside a TracerContext the operator and its jitted children are recorded."""
+
+    @jit()
+    class Leaf(Step):
+        pass
+
+    @jit()
+    class Parent(Branches):
+        def __init__(self, *, tracker: Concurrency) -> None:
+            super().__init__(tracker=tracker)
+            self.first = [Leaf(name=f"leaf{i}", tracker=tracker) for i in range(2)]
+
+    tracker = Concurrency()
+    operator = Parent(tracker=tracker)
+    operator(inputs={"text": "a"})
+    tracker.peak = 0
+
+    with TracerContext() as tracer:
+        operator(inputs={"text": "b"})
+
+    names = [record.operator_name for record in tracer.records]
+    assert names == ["leaf0", "leaf1", "Parent"]
+    assert tracker.peak == 1
+
+
+def test_compiled_graph_is_dropped_with_its_operator() -> None:
+    """Cached graphs do not outlive, or get reused after, their operator."""
+    operator = Branches(tracker=Concurrency())
+    operator(inputs={"text": "a"})
+    key = id(operator)
+    assert key in _COMPILED_GRAPHS
+
+    del operator
+    gc.collect()
+    assert key not in _COMPILED_GRAPHS